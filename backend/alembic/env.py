@@ -7,7 +7,16 @@ from sqlalchemy import engine_from_config, pool
 
 from app.config import settings
 from app.database import Base
-from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.models import (
+    ArchivedPipelineRun,
+    Candidate,
+    InterviewTurn,
+    Job,
+    JobProfile,
+    PipelineRun,
+    PipelineStageState,
+    StageResult,
+)
 
 # this is the Alembic Config object
 config = context.config
@@ -0,0 +1,94 @@
+"""Add integer stage cursor to pipeline runs
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column("pipeline_runs", sa.Column("current_stage_index", sa.Integer(), nullable=True))
+    op.add_column(
+        "pipeline_runs",
+        sa.Column("stage_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # Set-based backfill: position of current_stage within the stages JSON array
+        op.execute(
+            """
+            UPDATE pipeline_runs
+            SET stage_count = json_array_length(stages),
+                current_stage_index = (
+                    SELECT s.ord - 1
+                    FROM json_array_elements_text(stages) WITH ORDINALITY AS s(name, ord)
+                    WHERE s.name = pipeline_runs.current_stage
+                    ORDER BY s.ord
+                    LIMIT 1
+                )
+            """
+        )
+    else:
+        _backfill_in_batches(bind)
+
+    op.create_index(
+        "ix_pipeline_runs_job_profile_stage_index",
+        "pipeline_runs",
+        ["job_profile_id", "current_stage_index"],
+        unique=False,
+    )
+
+
+def _backfill_in_batches(bind) -> None:
+    """Portable backfill for databases without JSON set-returning functions."""
+    pipeline_runs = sa.table(
+        "pipeline_runs",
+        sa.column("id", sa.Integer()),
+        sa.column("stages", sa.JSON()),
+        sa.column("current_stage", sa.String()),
+        sa.column("current_stage_index", sa.Integer()),
+        sa.column("stage_count", sa.Integer()),
+    )
+    update = (
+        sa.update(pipeline_runs)
+        .where(pipeline_runs.c.id == sa.bindparam("run_id"))
+        .values(current_stage_index=sa.bindparam("cursor"), stage_count=sa.bindparam("count"))
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(pipeline_runs.c.id, pipeline_runs.c.stages, pipeline_runs.c.current_stage)
+            .where(pipeline_runs.c.id > last_id)
+            .order_by(pipeline_runs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        params = []
+        for run_id, stages, current_stage in rows:
+            stages = stages or []
+            cursor = stages.index(current_stage) if current_stage in stages else None
+            params.append({"run_id": run_id, "cursor": cursor, "count": len(stages)})
+        bind.execute(update, params)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_runs_job_profile_stage_index", table_name="pipeline_runs")
+    op.drop_column("pipeline_runs", "stage_count")
+    op.drop_column("pipeline_runs", "current_stage_index")
@@ -0,0 +1,134 @@
+"""Move stage progress from a JSON dict into pipeline_stage_states
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+STAGE_STATES = ("CREATED", "IN_PROGRESS", "COMPLETED", "GATED")
+
+
+def upgrade() -> None:
+    stagestate_enum = sa.Enum(*STAGE_STATES, name="stagestate")
+    stagestate_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "pipeline_stage_states",
+        sa.Column("pipeline_run_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.SmallInteger(), nullable=False),
+        sa.Column("stage_name", sa.String(length=100), nullable=False),
+        sa.Column(
+            "state",
+            postgresql.ENUM(*STAGE_STATES, name="stagestate", create_type=False),
+            nullable=False,
+            server_default=sa.text("'CREATED'"),
+        ),
+        sa.ForeignKeyConstraint(["pipeline_run_id"], ["pipeline_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("pipeline_run_id", "position"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            INSERT INTO pipeline_stage_states (pipeline_run_id, position, stage_name, state)
+            SELECT r.id,
+                   s.ord - 1,
+                   s.name,
+                   UPPER(COALESCE(r.stage_progress ->> s.name, 'created'))::stagestate
+            FROM pipeline_runs r
+            CROSS JOIN LATERAL json_array_elements_text(r.stages) WITH ORDINALITY AS s(name, ord)
+            """
+        )
+    else:
+        _backfill_in_batches(bind)
+
+    op.create_index(
+        "ix_pipeline_stage_states_stage_state",
+        "pipeline_stage_states",
+        ["stage_name", "state", "pipeline_run_id"],
+        unique=False,
+    )
+    op.drop_column("pipeline_runs", "stage_progress")
+
+
+def _backfill_in_batches(bind) -> None:
+    """Portable backfill for databases without JSON set-returning functions."""
+    pipeline_runs = sa.table(
+        "pipeline_runs",
+        sa.column("id", sa.Integer()),
+        sa.column("stages", sa.JSON()),
+        sa.column("stage_progress", sa.JSON()),
+    )
+    stage_states = sa.table(
+        "pipeline_stage_states",
+        sa.column("pipeline_run_id", sa.Integer()),
+        sa.column("position", sa.SmallInteger()),
+        sa.column("stage_name", sa.String()),
+        sa.column("state", sa.String()),
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(pipeline_runs.c.id, pipeline_runs.c.stages, pipeline_runs.c.stage_progress)
+            .where(pipeline_runs.c.id > last_id)
+            .order_by(pipeline_runs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+
+        params = [
+            {
+                "pipeline_run_id": run_id,
+                "position": position,
+                "stage_name": stage_name,
+                "state": (stage_progress or {}).get(stage_name, "created").upper(),
+            }
+            for run_id, stages, stage_progress in rows
+            for position, stage_name in enumerate(stages or [])
+        ]
+        if params:
+            bind.execute(sa.insert(stage_states), params)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "stage_progress",
+            postgresql.JSON(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::json"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE pipeline_runs r
+        SET stage_progress = s.progress
+        FROM (
+            SELECT pipeline_run_id, json_object_agg(stage_name, LOWER(state::text) ORDER BY position) AS progress
+            FROM pipeline_stage_states
+            GROUP BY pipeline_run_id
+        ) s
+        WHERE s.pipeline_run_id = r.id
+        """
+    )
+    op.drop_index("ix_pipeline_stage_states_stage_state", table_name="pipeline_stage_states")
+    op.drop_table("pipeline_stage_states")
+    sa.Enum(name="stagestate").drop(op.get_bind(), checkfirst=True)
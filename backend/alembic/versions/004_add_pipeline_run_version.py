@@ -0,0 +1,27 @@
+"""Add optimistic concurrency version to pipeline runs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("1")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "version")
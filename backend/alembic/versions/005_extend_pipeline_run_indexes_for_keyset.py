@@ -0,0 +1,73 @@
+"""Extend pipeline run filter indexes with (created_at, id) for keyset pagination
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+# (old index, new index, new columns)
+SINGLE_COLUMN_INDEXES = [
+    (
+        "ix_pipeline_runs_candidate_id",
+        "ix_pipeline_runs_candidate_created",
+        ["candidate_id", "created_at", "id"],
+    ),
+    (
+        "ix_pipeline_runs_job_profile_id",
+        "ix_pipeline_runs_job_profile_created",
+        ["job_profile_id", "created_at", "id"],
+    ),
+    ("ix_pipeline_runs_status", "ix_pipeline_runs_status_created", ["status", "created_at", "id"]),
+    (
+        "ix_pipeline_runs_current_stage",
+        "ix_pipeline_runs_current_stage_created",
+        ["current_stage", "created_at", "id"],
+    ),
+]
+
+COMPOSITE_INDEXES = [
+    ("ix_pipeline_runs_candidate_status", ["candidate_id", "status"]),
+    ("ix_pipeline_runs_job_profile_status", ["job_profile_id", "status"]),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        # Rows written by CURRENT_TIMESTAMP lack the fractional seconds that
+        # SQLAlchemy's DateTime stores, so they would sort below cursor values
+        # for the same instant
+        op.execute(
+            "UPDATE pipeline_runs SET created_at = created_at || '.000000' "
+            "WHERE length(created_at) = 19"
+        )
+
+    op.create_index("ix_pipeline_runs_created", "pipeline_runs", ["created_at", "id"], unique=False)
+
+    for old_name, new_name, columns in SINGLE_COLUMN_INDEXES:
+        op.create_index(new_name, "pipeline_runs", columns, unique=False)
+        op.drop_index(old_name, table_name="pipeline_runs")
+
+    for name, columns in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name="pipeline_runs")
+        op.create_index(name, "pipeline_runs", columns + ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    for name, columns in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name="pipeline_runs")
+        op.create_index(name, "pipeline_runs", columns, unique=False)
+
+    for old_name, new_name, columns in SINGLE_COLUMN_INDEXES:
+        op.create_index(old_name, "pipeline_runs", columns[:1], unique=False)
+        op.drop_index(new_name, table_name="pipeline_runs")
+
+    op.drop_index("ix_pipeline_runs_created", table_name="pipeline_runs")
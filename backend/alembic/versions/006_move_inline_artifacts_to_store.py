@@ -0,0 +1,83 @@
+"""Move inline stage result artifacts into the content-addressed artifact store
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.services.artifact_store import (
+    ArtifactRef,
+    decode_artifact,
+    get_artifact_store,
+    is_artifact_ref,
+)
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+stage_results = sa.table(
+    "stage_results",
+    sa.column("id", sa.Integer()),
+    sa.column("artifacts", sa.JSON()),
+)
+
+
+def _rewrite_artifacts(convert) -> None:
+    """Walk stage_results in id order, rewriting artifacts where convert changes them."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(stage_results.c.id, stage_results.c.artifacts)
+            .where(stage_results.c.id > last_id)
+            .order_by(stage_results.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            artifacts = row.artifacts or {}
+            converted = convert(artifacts)
+            if converted != artifacts:
+                updates.append({"row_id": row.id, "artifacts": converted})
+        if updates:
+            bind.execute(
+                stage_results.update()
+                .where(stage_results.c.id == sa.bindparam("row_id"))
+                .values(artifacts=sa.bindparam("artifacts")),
+                updates,
+            )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    # Blobs are written before the row update commits; a failed migration can
+    # leave unreferenced blobs behind, which are harmless (content-addressed)
+    _rewrite_artifacts(get_artifact_store().put_artifacts)
+
+
+def downgrade() -> None:
+    store = get_artifact_store()
+
+    def inline(artifacts):
+        result = {}
+        for name, value in artifacts.items():
+            if is_artifact_ref(value):
+                ref = ArtifactRef.from_json(value)
+                value = decode_artifact(store.get(ref.digest), ref.media_type)
+                if isinstance(value, bytes):
+                    raise RuntimeError(f"Cannot inline binary artifact {name!r} into a JSON column")
+            result[name] = value
+        return result
+
+    _rewrite_artifacts(inline)
@@ -0,0 +1,64 @@
+"""Add durable jobs table for the background job queue
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+JOB_STATUSES = ("QUEUED", "RUNNING", "SUCCEEDED", "FAILED")
+
+
+def upgrade() -> None:
+    jobstatus_enum = sa.Enum(*JOB_STATUSES, name="jobstatus")
+    jobstatus_enum.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=100), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False, server_default="{}"),
+        sa.Column("pipeline_run_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            postgresql.ENUM(*JOB_STATUSES, name="jobstatus", create_type=False),
+            nullable=False,
+            server_default=sa.text("'QUEUED'"),
+        ),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default=sa.text("5")),
+        sa.Column("run_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["pipeline_run_id"], ["pipeline_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_jobs_status_priority", "jobs", ["status", "priority", "id"], unique=False)
+    op.create_index("ix_jobs_pipeline_run_id", "jobs", ["pipeline_run_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_pipeline_run_id", table_name="jobs")
+    op.drop_index("ix_jobs_status_priority", table_name="jobs")
+    op.drop_table("jobs")
+    sa.Enum(name="jobstatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,60 @@
+"""Add interview_turns table for write-behind session persistence
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "interview_turns",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("pipeline_run_id", sa.Integer(), nullable=False),
+        sa.Column("session_id", sa.String(length=64), nullable=False),
+        sa.Column("stage_name", sa.String(length=100), nullable=False),
+        sa.Column("turn_index", sa.Integer(), nullable=False),
+        sa.Column("role", sa.String(length=20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("elapsed_seconds", sa.Float(), nullable=False),
+        sa.Column("hints_used", sa.Integer(), nullable=False),
+        sa.Column("turn_metadata", sa.JSON(), nullable=False, server_default="{}"),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["pipeline_run_id"], ["pipeline_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ux_interview_turns_session_turn",
+        "interview_turns",
+        ["session_id", "turn_index"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_interview_turns_pipeline_stage",
+        "interview_turns",
+        ["pipeline_run_id", "stage_name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_interview_turns_pipeline_stage", table_name="interview_turns")
+    op.drop_index("ux_interview_turns_session_turn", table_name="interview_turns")
+    op.drop_table("interview_turns")
@@ -0,0 +1,29 @@
+"""Add covering index for pipeline run cache validators
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Conditional GETs read (version, updated_at) by id as an index-only scan
+    op.create_index(
+        "ix_pipeline_runs_validators",
+        "pipeline_runs",
+        ["id", "version", "updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pipeline_runs_validators", table_name="pipeline_runs")
@@ -0,0 +1,61 @@
+"""Add archived_pipeline_runs table locating runs moved to the cold archive
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+PIPELINE_STATUSES = ("CREATED", "IN_PROGRESS", "COMPLETED", "FAILED", "CANCELLED")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archived_pipeline_runs",
+        sa.Column("pipeline_run_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("candidate_id", sa.Integer(), nullable=False),
+        sa.Column("job_profile_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(*PIPELINE_STATUSES, name="pipelinestatus", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("path", sa.String(length=255), nullable=False),
+        sa.Column("byte_offset", sa.BigInteger(), nullable=False),
+        sa.Column("byte_length", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("pipeline_run_id"),
+    )
+    op.create_index(
+        "ix_archived_pipeline_runs_candidate",
+        "archived_pipeline_runs",
+        ["candidate_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_archived_pipeline_runs_job_profile",
+        "archived_pipeline_runs",
+        ["job_profile_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archived_pipeline_runs_job_profile", table_name="archived_pipeline_runs")
+    op.drop_index("ix_archived_pipeline_runs_candidate", table_name="archived_pipeline_runs")
+    op.drop_table("archived_pipeline_runs")
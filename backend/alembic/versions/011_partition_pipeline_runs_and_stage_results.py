@@ -0,0 +1,159 @@
+"""Range-partition pipeline_runs and stage_results by created_at (Postgres)
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+Each table is rebuilt as a table partitioned by RANGE (created_at) with
+one partition per month (see app.services.partitions): the rows are
+copied into the new table, which takes over the old one's name, columns,
+defaults, id sequence and indexes. CREATE TABLE ... LIKE copies no
+foreign keys, so the outbound ones of pipeline_runs (candidate_id and
+job_profile_id, ON DELETE CASCADE) are re-created on the new table; a
+partitioned table may reference others. The copy rewrites both tables
+under an exclusive lock, so run it in a maintenance window.
+
+A partitioned table's primary key must include the partition key, so the
+primary keys become (id, created_at) and no foreign key can reference
+pipeline_runs(id) any more: the foreign keys of pipeline_stage_states,
+stage_results, interview_turns and jobs to pipeline_runs are dropped
+(downgrade restores them). The archival job deletes an archived run's
+rows in those tables itself; a run deleted by the cascade from its
+candidate or job profile leaves them behind.
+
+SQLite keeps plain tables.
+"""
+
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.services.partitions import (
+    add_months,
+    create_default_partition,
+    create_month_partitions,
+    month_start,
+)
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = ("pipeline_runs", "stage_results")
+REFERENCING_TABLES = ("pipeline_stage_states", "stage_results", "interview_turns", "jobs")
+# Foreign keys of the rebuilt tables themselves: table -> (column, referenced table)
+OUTBOUND_FOREIGN_KEYS = {
+    "pipeline_runs": (("candidate_id", "candidates"), ("job_profile_id", "job_profiles")),
+}
+
+# Month partitions created past the newest row (the archival job keeps adding them)
+MONTHS_AHEAD = 3
+
+
+def _rebuild(bind, table: str, partitioned: bool) -> None:
+    """
+    Replace table with a copy that is (or is no longer) partitioned by
+    created_at, keeping its indexes and outbound foreign keys.
+    """
+    indexes = bind.execute(
+        sa.text(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table"
+        ),
+        {"table": table},
+    ).all()
+    primary_key = bind.execute(
+        sa.text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = CAST(:table AS regclass) AND contype = 'p'"
+        ),
+        {"table": table},
+    ).scalar_one()
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}
+    ).scalar_one()
+    old = f"{table}_unpartitioned" if partitioned else f"{table}_partitioned"
+
+    # Index names are schema-wide: free them for the new table. The copy
+    # reads the whole table, so the old one needs no indexes.
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT {primary_key}")
+    for name, _ in indexes:
+        if name != primary_key:
+            op.execute(f"DROP INDEX {name}")
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        + (" PARTITION BY RANGE (created_at)" if partitioned else "")
+    )
+    # Keeps the sequence (and the next id) when the old table is dropped
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+    if partitioned:
+        first, last = bind.execute(
+            sa.text(f"SELECT min(created_at), max(created_at) FROM {old}")
+        ).one()
+        now = datetime.now(timezone.utc)
+        last = max(last, now) if last is not None else now
+        create_month_partitions(
+            bind, table, first or now, add_months(month_start(last), MONTHS_AHEAD)
+        )
+        create_default_partition(bind, table)
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {primary_key} "
+        f"PRIMARY KEY ({'id, created_at' if partitioned else 'id'})"
+    )
+    for name, definition in indexes:
+        if name != primary_key:
+            op.execute(definition)
+    for column, referenced in OUTBOUND_FOREIGN_KEYS.get(table, ()):
+        op.create_foreign_key(
+            f"{table}_{column}_fkey", table, referenced, [column], ["id"], ondelete="CASCADE"
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    foreign_keys = bind.execute(
+        sa.text(
+            "SELECT CAST(conrelid AS regclass), conname FROM pg_constraint "
+            "WHERE confrelid = CAST('pipeline_runs' AS regclass) AND contype = 'f'"
+        )
+    ).all()
+    for table, name in foreign_keys:
+        op.drop_constraint(name, str(table), type_="foreignkey")
+
+    for table in PARTITIONED_TABLES:
+        _rebuild(bind, table, partitioned=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for table in reversed(PARTITIONED_TABLES):
+        _rebuild(bind, table, partitioned=False)
+
+    # Rows of runs deleted while there were no foreign keys would block them
+    for table in REFERENCING_TABLES:
+        op.execute(
+            f"DELETE FROM {table} t WHERE t.pipeline_run_id IS NOT NULL AND NOT EXISTS "
+            f"(SELECT 1 FROM pipeline_runs r WHERE r.id = t.pipeline_run_id)"
+        )
+        op.create_foreign_key(
+            f"{table}_pipeline_run_id_fkey",
+            table,
+            "pipeline_runs",
+            ["pipeline_run_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
@@ -1,21 +1,259 @@
 """Database configuration and session management."""
 
-from sqlalchemy import create_engine
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
+from app.metrics import instrument_engine
+
+# Async driver used for each supported database backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Derive the async driver URL for a database URL.
+
+    Args:
+        database_url: SQLAlchemy URL, e.g. "postgresql://..." or "sqlite:///./app.db"
+
+    Returns:
+        The same URL with the backend's async driver (asyncpg / aiosqlite)
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(hide_password=False)
+
+
+class PoolStats:
+    """Checkout wait time, timeout and connect error counters for one pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connect_errors = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, waited: float, error: BaseException | None = None) -> None:
+        """Record one checkout attempt."""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            if isinstance(error, exc.TimeoutError):
+                self.timeouts += 1
+            elif error is not None:
+                self.connect_errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counter values."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connect_errors": self.connect_errors,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout; errors raised while waiting or connecting are counted."""
+
+    stats: PoolStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except Exception as error:
+            self.stats.record(time.perf_counter() - start, error)
+            raise
+        self.stats.record(time.perf_counter() - start)
+        return record
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool that reports PoolStats."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports PoolStats."""
+
+
+def engine_options(database_url: str, poolclass: type) -> Dict[str, Any]:
+    """
+    Build create_engine() pool options from settings.
+
+    Args:
+        database_url: URL the engine will connect to
+        poolclass: Queue pool class to use (sync or async variant)
+
+    Returns:
+        Keyword arguments for create_engine / create_async_engine
+    """
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite keeps its single-connection pool; sizing does not apply
+        return options
+
+    options.update(
+        poolclass=poolclass,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    return options
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """
+    Report pool occupancy and checkout statistics for an engine.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+
+    Returns:
+        Dict with pool class, sizing, checked out / overflow counts and PoolStats
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+        status["saturated"] = status["max_overflow"] >= 0 and (
+            status["checked_out"] >= status["size"] + status["max_overflow"]
+        )
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Process-wide sync engine, created on first use.
+
+    Engines are built lazily so that importing the app does not load a
+    database driver; create_app's lifespan opens the pooled connections.
+    """
+    engine = create_engine(
+        settings.database_url, **engine_options(settings.database_url, InstrumentedQueuePool)
+    )
+    instrument_engine(engine, "sync")
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Process-wide async engine, created on first use."""
+    async_url = settings.async_database_url or to_async_url(settings.database_url)
+    async_engine = create_async_engine(
+        async_url, **engine_options(async_url, InstrumentedAsyncAdaptedQueuePool)
+    )
+    instrument_engine(async_engine.sync_engine, "async")
+    return async_engine
+
+
+@lru_cache(maxsize=1)
+def get_session_local() -> sessionmaker:
+    """Session factory bound to the sync engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Python-side timestamp default for columns that are range-compared.
+
+    Values go through the column's DateTime type like bound query values
+    do; on SQLite, CURRENT_TIMESTAMP omits fractional seconds and would
+    compare as text below the same instant bound from Python.
+    """
+    return datetime.now(timezone.utc)
+
+
 def get_db():
     """Dependency for getting database session."""
-    db = SessionLocal()
+    db = get_session_local()()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Process-wide async session factory, created on first use.
+
+    Also a dependency for endpoints that manage their own session lifetime.
+    Streaming responses are sent after yield-dependencies are torn down, so
+    they open a session from this factory inside the response body instead
+    of using get_async_db.
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
+# Module attributes kept for callers that import the engines directly; each
+# is built on first access
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "SessionLocal": get_session_local,
+    "AsyncSessionLocal": get_async_session_factory,
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
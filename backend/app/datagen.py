@@ -0,0 +1,633 @@
+"""
+Deterministic synthetic data at production scale.
+
+Generates job profiles, candidates, pipeline runs (with their stage states)
+and stage results whose shape follows the real pipeline: every run walks
+PipelinePlanner.STANDARD_STAGES, each stage takes a random number of days
+and passes with a per-stage rate, so old runs have finished (COMPLETED,
+FAILED at the stage that rejected them, or CANCELLED when the candidate
+withdrew) and recent ones are still in flight. Interview scorecards carry
+the raw_scores the debrief engine reads; OA and interview results
+reference realistically sized code and transcript artifacts in the
+artifact store.
+
+The same config (seed and until included) on an empty database produces
+identical rows. Each table draws from its own random stream, so the data
+does not depend on batch size.
+
+Rows are encoded once in Python (JSON with orjson, enums by name,
+timestamps as text) and written in batches, bypassing per-value type
+processing: an insert() executemany on SQLite and COPY ... FROM STDIN on
+Postgres. Secondary indexes are dropped for the load and rebuilt once at
+the end, and the tables are analyzed so query plans see the new sizes.
+"""
+
+import csv
+import io
+import itertools
+import math
+import random
+import time
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Connection, Engine, Table, column, func, insert, select, table, text
+
+from app.models import Candidate, JobProfile, PipelineRun, PipelineStageState, StageResult
+from app.models.pipeline_run import PipelineStatus
+from app.models.pipeline_stage_state import StageState
+from app.models.stage_result import StageDecision
+from app.responses import json_dumps
+from app.services.artifact_store import ArtifactStore
+from app.services.pipeline_planner import PipelinePlanner
+
+Row = Dict[str, Any]
+
+# Tables in load (foreign key) order
+TABLES: Tuple[Table, ...] = (
+    JobProfile.__table__,
+    Candidate.__table__,
+    PipelineRun.__table__,
+    PipelineStageState.__table__,
+    StageResult.__table__,
+)
+
+STAGES = tuple(PipelinePlanner.STANDARD_STAGES)
+
+# Enum columns store member names; looked up once rather than per row
+CREATED, IN_PROGRESS, COMPLETED, GATED = (
+    state.name
+    for state in (
+        StageState.CREATED,
+        StageState.IN_PROGRESS,
+        StageState.COMPLETED,
+        StageState.GATED,
+    )
+)
+RUN_CREATED, RUN_IN_PROGRESS, RUN_COMPLETED, RUN_FAILED, RUN_CANCELLED = (
+    status.name
+    for status in (
+        PipelineStatus.CREATED,
+        PipelineStatus.IN_PROGRESS,
+        PipelineStatus.COMPLETED,
+        PipelineStatus.FAILED,
+        PipelineStatus.CANCELLED,
+    )
+)
+PROCEED, REJECT, PASS, FAIL = (
+    decision.name
+    for decision in (
+        StageDecision.PROCEED,
+        StageDecision.REJECT,
+        StageDecision.PASS,
+        StageDecision.FAIL,
+    )
+)
+
+# Share of runs that pass each stage they finish
+STAGE_PASS_RATES: Dict[str, float] = {
+    "resume_screen": 0.4,
+    "oa": 0.55,
+    "phone_screen": 0.5,
+    "onsite_coding_1": 0.75,
+    "onsite_coding_2": 0.75,
+    "onsite_behavioral": 0.85,
+    "onsite_design_lite": 0.8,
+    "debrief": 0.55,
+}
+
+# Mean days a run spends in each stage
+STAGE_DAYS: Dict[str, float] = {
+    "resume_screen": 2.0,
+    "oa": 5.0,
+    "phone_screen": 7.0,
+    "onsite_coding_1": 10.0,
+    "onsite_coding_2": 0.2,
+    "onsite_behavioral": 0.2,
+    "onsite_design_lite": 0.2,
+    "debrief": 4.0,
+}
+
+# Chance a candidate withdraws after finishing a stage they passed
+WITHDRAW_RATE = 0.03
+
+# Median artifact size in bytes by artifact name (sizes are log-normal)
+ARTIFACT_BYTES: Dict[str, int] = {"code": 3 * 1024, "transcript": 40 * 1024}
+STAGE_ARTIFACTS: Dict[str, str] = {
+    "oa": "code",
+    "phone_screen": "transcript",
+    "onsite_coding_1": "transcript",
+    "onsite_coding_2": "transcript",
+    "onsite_behavioral": "transcript",
+    "onsite_design_lite": "transcript",
+}
+
+ROLES = (
+    "Software Engineer I",
+    "Software Engineer II",
+    "Backend Engineer",
+    "Frontend Engineer",
+    "Full Stack Engineer",
+    "Data Engineer",
+    "Machine Learning Engineer",
+    "Site Reliability Engineer",
+)
+COMPANIES = ("Meta", "Google", "Amazon", "Apple", "Netflix", "Microsoft", "Stripe", "Uber")
+SKILLS = (
+    "python",
+    "java",
+    "c++",
+    "golang",
+    "javascript",
+    "typescript",
+    "react",
+    "node.js",
+    "postgresql",
+    "kubernetes",
+    "amazon web services",
+    "distributed systems",
+    "machine learning",
+    "data structures",
+    "algorithms",
+    "system design",
+    "continuous integration",
+    "object oriented programming",
+)
+COMPETENCIES = ("Algorithms", "Coding", "Communication", "Problem Solving", "System Design")
+FIRST_NAMES = ("Alice", "Bob", "Carol", "Dev", "Elena", "Farid", "Grace", "Hiro", "Ines", "Jamal")
+LAST_NAMES = ("Johnson", "Smith", "Brown", "Garcia", "Kim", "Nguyen", "Patel", "Rossi", "Silva")
+WORDS = (
+    "the candidate explained approach complexity tradeoff hash map array pointer queue "
+    "stack graph tree recursion edge case test input output scale cache database index "
+    "latency throughput request service design interviewer asked follow up clarified "
+    "optimized solution runtime memory linear logarithmic constant worked example"
+).split()
+
+
+def _today() -> datetime:
+    return datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@dataclass(frozen=True)
+class DatagenConfig:
+    """What to generate; equal configs generate equal data."""
+
+    candidates: int = 1000
+    job_profiles: int = 20
+    runs: int = 2000
+    seed: int = 0
+    days: int = 365  # Runs are created over the days before until
+    until: datetime = field(default_factory=_today)  # "Now" for the generated timeline
+    resume_kb: float = 2.0  # Resume text per candidate; 0 leaves it empty
+    artifact_scale: float = 1.0  # Multiplies ARTIFACT_BYTES; 0 disables artifacts
+    artifact_pool: int = 64  # Distinct blobs per artifact name (content-addressed)
+    batch_size: int = 20000  # Rows per executemany / COPY
+
+
+# Timestamp encoders take naive UTC datetimes
+
+
+def sqlite_timestamp(value: datetime) -> str:
+    """Timestamp text as SQLAlchemy's SQLite DateTime stores it (always with microseconds)."""
+    return value.isoformat(sep=" ", timespec="microseconds")
+
+
+def postgres_timestamp(value: datetime) -> str:
+    """Timestamp text for timestamptz input."""
+    return value.isoformat(sep=" ", timespec="microseconds") + "+00"
+
+
+def _json(value: Any) -> str:
+    return json_dumps(value).decode()
+
+
+class SyntheticDataGenerator:
+    """Builds encoded rows for TABLES from a DatagenConfig."""
+
+    def __init__(
+        self,
+        config: DatagenConfig,
+        format_timestamp: Callable[[datetime], str] = sqlite_timestamp,
+        artifact_store: Optional[ArtifactStore] = None,
+    ):
+        """
+        Args:
+            config: What to generate
+            format_timestamp: Encodes datetimes for the target database
+            artifact_store: Where artifact blobs go; None generates no artifacts
+        """
+        self.config = config
+        self.format_timestamp = format_timestamp
+        self.artifact_store = artifact_store
+        until = config.until
+        self.until = until.astimezone(timezone.utc).replace(tzinfo=None) if until.tzinfo else until
+        self.start = self.until - timedelta(days=config.days)
+        corpus_rng = self._rng("corpus")
+        self._corpus = " ".join(corpus_rng.choice(WORDS) for _ in range(16384))
+        self._stages_json = _json(list(STAGES))
+        self._empty_list = _json([])
+        self._empty_dict = _json({})
+        notes_rng = self._rng("notes")
+        self._notes = [self._text(notes_rng, notes_rng.randint(200, 600)) for _ in range(256)]
+
+    def _rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.config.seed}:{stream}")
+
+    def _text(self, rng: random.Random, size: int) -> str:
+        """size characters of words from a random point of the corpus."""
+        repeats = size // len(self._corpus) + 2
+        start = rng.randrange(len(self._corpus))
+        return (self._corpus * repeats)[start : start + size]
+
+    def _lognormal_size(self, rng: random.Random, median: float) -> int:
+        return max(64, int(rng.lognormvariate(math.log(median), 0.6)))
+
+    def artifact_pools(self) -> Dict[str, List[str]]:
+        """
+        Store the artifact blobs rows will reference.
+
+        Returns:
+            {artifact name: encoded artifacts column values}
+        """
+        if self.artifact_store is None or self.config.artifact_scale <= 0:
+            return {}
+        rng = self._rng("artifacts")
+        pools = {}
+        for name, median in ARTIFACT_BYTES.items():
+            pools[name] = []
+            for _ in range(self.config.artifact_pool):
+                size = self._lognormal_size(rng, median * self.config.artifact_scale)
+                ref = self.artifact_store.put(
+                    self._text(rng, size).encode(), "text/plain; charset=utf-8"
+                )
+                pools[name].append(_json({name: ref.to_json()}))
+        return pools
+
+    def job_profiles(self, first_id: int) -> Iterator[Row]:
+        rng = self._rng("job_profiles")
+        created_at = self.format_timestamp(self.start - timedelta(days=30))
+        for job_profile_id in range(first_id, first_id + self.config.job_profiles):
+            skills = rng.sample(SKILLS, 7)
+            yield {
+                "id": job_profile_id,
+                "role": rng.choice(ROLES),
+                "company": rng.choice(COMPANIES),
+                "company_style": None,
+                "raw_description": self._text(rng, rng.randint(800, 3000)),
+                "must_haves": _json(skills[:3]),
+                "nice_to_haves": _json(skills[3:]),
+                "core_competencies": _json(rng.sample(COMPETENCIES, 3)),
+                "interview_style_bias": _json(
+                    {
+                        "speed": round(rng.random(), 2),
+                        "communication": round(rng.random(), 2),
+                        "system_design": round(rng.random(), 2),
+                    }
+                ),
+                "source_url": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def candidates(self, first_id: int, joined: array) -> Iterator[Row]:
+        """
+        Candidate rows; joined receives each candidate's creation time
+        (seconds after the start of the window) for run generation.
+        """
+        rng = self._rng("candidates")
+        resumes = [
+            self._text(rng, self._lognormal_size(rng, self.config.resume_kb * 1024))
+            for _ in range(256 if self.config.resume_kb > 0 else 0)
+        ]
+        window = self.config.days * 86400.0
+        for candidate_id in range(first_id, first_id + self.config.candidates):
+            offset = rng.random() * window
+            joined.append(offset)
+            created_at = self.format_timestamp(self.start + timedelta(seconds=offset))
+            yield {
+                "id": candidate_id,
+                "email": f"candidate{candidate_id}@example.com",
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "resume_text": rng.choice(resumes) if resumes else None,
+                "resume_url": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def _stage_result(
+        self,
+        rng: random.Random,
+        result_id: int,
+        run_id: int,
+        stage: str,
+        passed: bool,
+        started_at: str,
+        completed_at: str,
+        artifacts: Dict[str, List[str]],
+    ) -> Row:
+        strengths = concerns = self._empty_list
+        notes = None
+        if stage == "resume_screen":
+            stage_type = stage
+            decision = PROCEED if passed else REJECT
+            raw_scores = {"method": "prescreen", "score": round(rng.uniform(0.35, 1.0), 4)}
+        elif stage == "oa":
+            stage_type = stage
+            decision = PASS if passed else FAIL
+            total = 12
+            passed_tests = rng.randint(10, 12) if passed else rng.randint(0, 9)
+            raw_scores = {
+                "passed": passed_tests,
+                "total": total,
+                "pass_rate": round(passed_tests / total, 4),
+            }
+        elif stage == "debrief":
+            stage_type = stage
+            decision = PASS if passed else FAIL
+            raw_scores = {"decision": "hire" if passed else "no_hire"}
+        else:
+            stage_type = "interview"
+            decision = PASS if passed else FAIL
+            rating = rng.choice((3, 3, 4)) if passed else rng.choice((1, 2, 2))
+            raw_scores = {
+                "overall_rating": rating,
+                "confidence": round(rng.uniform(0.5, 1.0), 2),
+                "killer_signals": [] if passed or rng.random() > 0.05 else ["integrity"],
+            }
+            strengths = _json(rng.sample(COMPETENCIES, 2))
+            concerns = _json(rng.sample(COMPETENCIES, 1) if not passed else [])
+            notes = rng.choice(self._notes)
+        pool = artifacts.get(STAGE_ARTIFACTS.get(stage, ""))
+        return {
+            "id": result_id,
+            "pipeline_run_id": run_id,
+            "stage_name": stage,
+            "stage_type": stage_type,
+            "decision": decision,
+            "raw_scores": _json(raw_scores),
+            "strengths": strengths,
+            "concerns": concerns,
+            "artifacts": rng.choice(pool) if pool else self._empty_dict,
+            "notes": notes,
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "created_at": completed_at,
+            "updated_at": completed_at,
+        }
+
+    def pipeline_runs(
+        self,
+        first_ids: Dict[str, int],
+        candidate_ids: Tuple[int, int],
+        job_profile_ids: Tuple[int, int],
+        joined: Sequence[float],
+    ) -> Iterator[Tuple[Row, List[Row], List[Row]]]:
+        """
+        Yield (run, stage state rows, stage result rows) per run.
+
+        Args:
+            first_ids: First free ID of pipeline_runs and stage_results
+            candidate_ids: [first, last] candidate IDs to draw from
+            job_profile_ids: [first, last] job profile IDs to draw from
+            joined: Candidate creation offsets from candidates()
+        """
+        rng = self._rng("pipeline_runs")
+        artifacts = self.artifact_pools()
+        fmt = self.format_timestamp
+        window = self.config.days * 86400.0
+        until = self.until
+        result_id = first_ids["stage_results"]
+        first_job_profile, last_job_profile = job_profile_ids
+        # Popular roles get most applicants: the k-th profile is weighted 1/k
+        profile_weights = list(
+            itertools.accumulate(
+                1.0 / rank for rank in range(1, last_job_profile - first_job_profile + 2)
+            )
+        )
+        profile_ids = range(first_job_profile, last_job_profile + 1)
+        for run_id in range(
+            first_ids["pipeline_runs"], first_ids["pipeline_runs"] + self.config.runs
+        ):
+            candidate_index = rng.randrange(candidate_ids[1] - candidate_ids[0] + 1)
+            job_profile_id = rng.choices(profile_ids, cum_weights=profile_weights)[0]
+            offset = joined[candidate_index] + rng.random() * (window - joined[candidate_index])
+            created = self.start + timedelta(seconds=offset)
+            states = [CREATED] * len(STAGES)
+            results = []
+            status, index, current_stage = RUN_CREATED, None, None
+            started = completed = None
+            at = created + timedelta(days=rng.expovariate(1.0))
+            if at < until:
+                started = at
+                for position, stage in enumerate(STAGES):
+                    index, current_stage = position, stage
+                    status = RUN_IN_PROGRESS
+                    states[position] = IN_PROGRESS
+                    done = at + timedelta(days=rng.expovariate(1.0 / STAGE_DAYS[stage]))
+                    if done >= until:
+                        break
+                    passed = rng.random() < STAGE_PASS_RATES[stage]
+                    results.append(
+                        self._stage_result(
+                            rng, result_id, run_id, stage, passed, fmt(at), fmt(done), artifacts
+                        )
+                    )
+                    result_id += 1
+                    at = done
+                    if not passed:
+                        states[position] = GATED
+                        status, completed = RUN_FAILED, at
+                        break
+                    states[position] = COMPLETED
+                    if position == len(STAGES) - 1:
+                        status, completed = RUN_COMPLETED, at
+                    elif rng.random() < WITHDRAW_RATE:
+                        status, completed = RUN_CANCELLED, at
+                        break
+            run = {
+                "id": run_id,
+                "candidate_id": candidate_ids[0] + candidate_index,
+                "job_profile_id": job_profile_id,
+                "status": status,
+                "current_stage": current_stage,
+                "current_stage_index": index,
+                "stage_count": len(STAGES),
+                "version": 1 if index is None else index + 2,
+                "stages": self._stages_json,
+                "started_at": None if started is None else fmt(started),
+                "completed_at": None if completed is None else fmt(completed),
+                "created_at": fmt(created),
+                "updated_at": fmt(at if started else created),
+            }
+            stage_states = [
+                {
+                    "pipeline_run_id": run_id,
+                    "position": position,
+                    "stage_name": stage,
+                    "state": states[position],
+                }
+                for position, stage in enumerate(STAGES)
+            ]
+            yield run, stage_states, results
+
+
+class BulkWriter:
+    """Writes batches of encoded rows to one table."""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+
+    def write(self, target: Table, rows: List[Row]) -> None:
+        raise NotImplementedError
+
+
+class InsertWriter(BulkWriter):
+    """
+    insert() executemany with pre-encoded values.
+
+    The statement is compiled once per table against an untyped copy of
+    it and run on the DBAPI cursor with plain tuples: no per-value bind
+    processing, which otherwise costs more than SQLite's own insert.
+    """
+
+    def __init__(self, conn: Connection):
+        super().__init__(conn)
+        self._statements: Dict[Tuple[str, ...], str] = {}
+
+    def write(self, target: Table, rows: List[Row]) -> None:
+        if not rows:
+            return
+        columns = tuple(rows[0])
+        statement = self._statements.get((target.name, *columns))
+        if statement is None:
+            untyped = table(target.name, *(column(name) for name in columns))
+            statement = str(insert(untyped).compile(dialect=self.conn.dialect))
+            self._statements[(target.name, *columns)] = statement
+        self.conn.exec_driver_sql(statement, [tuple(row.values()) for row in rows])
+
+
+class CopyWriter(BulkWriter):
+    """COPY ... FROM STDIN (CSV) through psycopg2."""
+
+    def write(self, target: Table, rows: List[Row]) -> None:
+        if not rows:
+            return
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        # None is written as an unquoted empty field, which CSV COPY reads as NULL
+        csv.writer(buffer, lineterminator="\n").writerows(
+            [row[name] for name in columns] for row in rows
+        )
+        buffer.seek(0)
+        cursor = self.conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {target.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+
+
+@contextmanager
+def deferred_indexes(conn: Connection, tables: Sequence[Table]) -> Iterator[None]:
+    """Drop the tables' secondary indexes for a bulk load and rebuild them afterwards."""
+    indexes = [index for target in tables for index in target.indexes]
+    for index in indexes:
+        index.drop(conn, checkfirst=True)
+    yield
+    for index in indexes:
+        index.create(conn, checkfirst=True)
+
+
+def _next_ids(conn: Connection) -> Dict[str, int]:
+    return {
+        target.name: conn.execute(select(func.coalesce(func.max(target.c.id), 0))).scalar_one() + 1
+        for target in TABLES
+        if "id" in target.c
+    }
+
+
+def load(
+    engine: Engine,
+    config: DatagenConfig,
+    artifact_store: Optional[ArtifactStore] = None,
+    defer_indexes: bool = True,
+) -> Dict[str, Any]:
+    """
+    Generate data and bulk-load it, appending to any rows already present.
+
+    Args:
+        engine: Sync engine of the target database (tables must exist)
+        config: What to generate
+        artifact_store: Where artifact blobs go; None generates no artifacts
+        defer_indexes: Rebuild secondary indexes once after the load
+
+    Returns:
+        Rows written per table, total rows, and seconds spent loading and indexing
+    """
+    postgres = engine.dialect.name == "postgresql"
+    generator = SyntheticDataGenerator(
+        config, postgres_timestamp if postgres else sqlite_timestamp, artifact_store
+    )
+    counts = {target.name: 0 for target in TABLES}
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if not postgres:
+            conn.exec_driver_sql("PRAGMA cache_size = -262144")
+        writer = CopyWriter(conn) if postgres else InsertWriter(conn)
+        pending: Dict[str, List[Row]] = {target.name: [] for target in TABLES}
+
+        def flush(*names: str) -> None:
+            # In foreign key order: COPY checks references row by row
+            for target in TABLES:
+                if target.name in names:
+                    writer.write(target, pending[target.name])
+                    counts[target.name] += len(pending[target.name])
+                    pending[target.name] = []
+
+        first_ids = _next_ids(conn)
+        with deferred_indexes(conn, TABLES if defer_indexes else ()):
+            for name, rows in (
+                ("job_profiles", generator.job_profiles(first_ids["job_profiles"])),
+                ("candidates", generator.candidates(first_ids["candidates"], joined := array("d"))),
+            ):
+                for row in rows:
+                    pending[name].append(row)
+                    if len(pending[name]) >= config.batch_size:
+                        flush(name)
+                flush(name)
+            run_tables = ("pipeline_runs", "pipeline_stage_states", "stage_results")
+            for run, stage_states, results in generator.pipeline_runs(
+                first_ids,
+                (first_ids["candidates"], first_ids["candidates"] + config.candidates - 1),
+                (first_ids["job_profiles"], first_ids["job_profiles"] + config.job_profiles - 1),
+                joined,
+            ):
+                pending["pipeline_runs"].append(run)
+                pending["pipeline_stage_states"].extend(stage_states)
+                pending["stage_results"].extend(results)
+                if sum(len(pending[name]) for name in run_tables) >= config.batch_size:
+                    flush(*run_tables)
+            flush(*run_tables)
+            loaded = time.perf_counter()
+        if postgres:
+            for target in TABLES:
+                if "id" in target.c:
+                    conn.execute(
+                        text(
+                            f"SELECT setval(pg_get_serial_sequence('{target.name}', 'id'), "
+                            f"(SELECT max(id) FROM {target.name}))"
+                        )
+                    )
+        for target in TABLES:
+            conn.exec_driver_sql(f"ANALYZE {target.name}")
+    finished = time.perf_counter()
+    return {
+        "rows": counts,
+        "total_rows": sum(counts.values()),
+        "load_seconds": round(loaded - started, 3),
+        "index_seconds": round(finished - loaded, 3),
+    }
@@ -1,31 +1,74 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import logging
+from contextlib import asynccontextmanager
 
-from app.routers import health, pipeline
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
-app = FastAPI(
-    title="FAANG Interview Simulation System",
-    description="AI-driven interview simulation system with realistic FAANG-style interviews",
-    version="0.1.0",
+from app.config import settings
+from app.database import get_async_engine, get_async_session_factory
+from app.metrics import MetricsMiddleware
+from app.responses import FastJSONResponse
+from app.routers import (
+    debrief,
+    export,
+    health,
+    interview,
+    jobs,
+    metrics,
+    oa,
+    pipeline,
+    resume,
+    stage_results,
 )
+from app.services.archive import schedule_archival
+from app.services.interview_sessions import get_session_store
+from app.services.job_queue import get_job_queue
+from app.warmup import warm_up
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],  # React dev servers
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the process up, then run the background job queue (with its
+    recurring archival pass) and the interview turn flusher for the
+    lifetime of the app.
+    """
+    if settings.warmup_enabled:
+        await warm_up(app)
+    queue = get_job_queue() if settings.job_queue_enabled else None
+    if queue is not None:
+        await queue.start()
+        if settings.archive_enabled:
+            try:
+                await schedule_archival(get_async_session_factory())
+            except Exception:
+                # The app serves without it; the next start schedules it
+                logger.warning("Could not schedule pipeline run archival", exc_info=True)
+    session_store = get_session_store()
+    await session_store.start()
+    yield
+    # Pending interview turns are written (or spilled to disk) before exit
+    await session_store.stop()
+    if queue is not None:
+        await queue.stop()
+    await get_async_engine().dispose()
 
-# Include routers
-app.include_router(health.router)
-app.include_router(pipeline.router)
+
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Fail fast with 503 when no pooled connection frees up within db_pool_timeout."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database connection pool exhausted"},
+        headers={"Retry-After": "1"},
+    )
 
 
-@app.get("/")
 async def root():
     """Root endpoint."""
     return {
@@ -33,3 +76,56 @@ async def root():
         "version": "0.1.0",
         "docs": "/docs",
     }
+
+
+def create_app() -> FastAPI:
+    """
+    Build the application.
+
+    Nothing here touches the database: engines are created on first use
+    and the lifespan warms them up before traffic is served. Serve with
+    `uvicorn app.main:app`, or `uvicorn --factory app.main:create_app` to
+    build the app in the server process.
+
+    Returns:
+        A new FastAPI application
+    """
+    app = FastAPI(
+        title="FAANG Interview Simulation System",
+        description="AI-driven interview simulation system with realistic FAANG-style interviews",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
+    )
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173", "http://localhost:3000"],  # React dev servers
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Request metrics (outermost, so it times CORS handling too)
+    app.add_middleware(MetricsMiddleware)
+
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+
+    # Include routers
+    app.include_router(health.router)
+    app.include_router(metrics.router)
+    app.include_router(pipeline.router)
+    app.include_router(stage_results.router)
+    app.include_router(export.router)
+    app.include_router(jobs.router)
+    app.include_router(resume.router)
+    app.include_router(debrief.router)
+    app.include_router(oa.router)
+    app.include_router(interview.router)
+
+    app.add_api_route("/", root, methods=["GET"])
+    return app
+
+
+app = create_app()
@@ -1,8 +1,21 @@
 """Database models."""
 
+from app.models.archived_pipeline_run import ArchivedPipelineRun
 from app.models.candidate import Candidate
+from app.models.interview_turn import InterviewTurn
+from app.models.job import Job
 from app.models.job_profile import JobProfile
 from app.models.pipeline_run import PipelineRun
+from app.models.pipeline_stage_state import PipelineStageState
 from app.models.stage_result import StageResult
 
-__all__ = ["Candidate", "JobProfile", "PipelineRun", "StageResult"]
+__all__ = [
+    "ArchivedPipelineRun",
+    "Candidate",
+    "InterviewTurn",
+    "Job",
+    "JobProfile",
+    "PipelineRun",
+    "PipelineStageState",
+    "StageResult",
+]
@@ -0,0 +1,45 @@
+"""ArchivedPipelineRun model."""
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy import Enum as SQLEnum
+
+from app.database import Base
+from app.models.pipeline_run import PipelineStatus
+
+
+class ArchivedPipelineRun(Base):
+    """
+    ArchivedPipelineRun entity: where a run moved to the cold archive lives.
+
+    The run itself (with its stage states, stage results and interview
+    turns) is one gzip member of an archive file; this row locates it by
+    byte range and keeps the columns needed to answer conditional GETs
+    and per-candidate lookups without opening the file. There is no
+    foreign key to pipeline_runs: the live row is deleted when the run is
+    archived.
+    """
+
+    __tablename__ = "archived_pipeline_runs"
+
+    pipeline_run_id = Column(Integer, primary_key=True, autoincrement=False)
+    candidate_id = Column(Integer, nullable=False)
+    job_profile_id = Column(Integer, nullable=False)
+    status = Column(SQLEnum(PipelineStatus, name="pipelinestatus"), nullable=False)
+    version = Column(Integer, nullable=False)
+
+    # Location in the archive: a gzip member of path (relative to the archive root)
+    path = Column(String(255), nullable=False)
+    byte_offset = Column(BigInteger, nullable=False)
+    byte_length = Column(Integer, nullable=False)
+
+    # Copied from the run
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Composite indexes
+    __table_args__ = (
+        Index("ix_archived_pipeline_runs_candidate", "candidate_id", "created_at"),
+        Index("ix_archived_pipeline_runs_job_profile", "job_profile_id", "created_at"),
+    )
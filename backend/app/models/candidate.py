@@ -1,7 +1,7 @@
 """Candidate model."""
 
 from sqlalchemy import Column, DateTime, Integer, String, Text, func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, undefer
 
 from app.database import Base
 
@@ -18,7 +18,8 @@ class Candidate(Base):
     name = Column(String(255), nullable=False)
     
     # Resume information
-    resume_text = Column(Text, nullable=True)
+    # Deferred: loaded only by queries that opt in with load_resume_text()
+    resume_text = deferred(Column(Text, nullable=True))
     resume_url = Column(String(500), nullable=True)
     
     # Metadata
@@ -36,3 +37,8 @@ class Candidate(Base):
     
     # Relationships
     pipeline_runs = relationship("PipelineRun", back_populates="candidate", passive_deletes=True)
+
+
+def load_resume_text():
+    """Loader option that fetches the deferred resume_text with the candidate row."""
+    return undefer(Candidate.resume_text)
@@ -0,0 +1,46 @@
+"""InterviewTurn model."""
+
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
+
+from app.database import Base, utcnow
+
+
+class InterviewTurn(Base):
+    """
+    InterviewTurn entity: one message in a live interview session.
+
+    Written behind the hot session store in batches, so rows can land a
+    little after the turn happened (see created_at vs recorded_at). The
+    (session_id, turn_index) key makes replaying a batch harmless.
+    """
+
+    __tablename__ = "interview_turns"
+
+    id = Column(Integer, primary_key=True)
+    pipeline_run_id = Column(
+        Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    session_id = Column(String(64), nullable=False)
+    stage_name = Column(String(100), nullable=False)  # e.g., "onsite_coding_1"
+    turn_index = Column(Integer, nullable=False)  # 0-based position in the session
+
+    role = Column(String(20), nullable=False)  # "interviewer" or "candidate"
+    content = Column(Text, nullable=False)
+    elapsed_seconds = Column(Float, nullable=False)  # Session timer at this turn
+    hints_used = Column(Integer, nullable=False, default=0)  # Hint budget spent so far
+    turn_metadata = Column(JSON, nullable=False, default=dict, server_default="{}")
+
+    # When the turn happened (set by the session store) vs when the row was written
+    recorded_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    # Composite indexes
+    __table_args__ = (
+        Index("ux_interview_turns_session_turn", "session_id", "turn_index", unique=True),
+        Index("ix_interview_turns_pipeline_stage", "pipeline_run_id", "stage_name"),
+    )
@@ -0,0 +1,72 @@
+"""Job model."""
+
+from enum import Enum
+
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text, func, text
+from sqlalchemy import Enum as SQLEnum
+
+from app.database import Base, utcnow
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a queued job."""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"  # Gave up after max_attempts
+
+
+class Job(Base):
+    """
+    Job entity: one unit of background work for the job queue.
+
+    Rows are the source of truth for the in-process queue, so queued and
+    retrying work survives restarts. A worker claims a job by flipping it
+    to RUNNING and stamping locked_at; a RUNNING job whose lease expires
+    (its worker died) is put back in the queue.
+    """
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(100), nullable=False)  # Registered handler name, e.g. "stage.execute"
+    payload = Column(JSON, nullable=False, default=dict, server_default="{}")
+
+    # Optional link to the pipeline run the job works on
+    pipeline_run_id = Column(
+        Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), nullable=True
+    )
+
+    status = Column(
+        SQLEnum(JobStatus, name="jobstatus"),
+        nullable=False,
+        default=JobStatus.QUEUED,
+        server_default=text("'QUEUED'"),
+    )
+    priority = Column(Integer, nullable=False, default=0, server_default=text("0"))  # Higher first
+    attempts = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    max_attempts = Column(Integer, nullable=False, default=5, server_default=text("5"))
+    # Not claimable before this time (retry backoff); compared against utcnow()
+    run_after = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    last_error = Column(Text, nullable=True)
+
+    # Worker lease
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Metadata
+    created_at = Column(
+        DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Composite indexes
+    __table_args__ = (
+        # Claim query: WHERE status = 'QUEUED' ORDER BY priority DESC, id
+        Index("ix_jobs_status_priority", "status", "priority", "id"),
+        Index("ix_jobs_pipeline_run_id", "pipeline_run_id"),
+    )
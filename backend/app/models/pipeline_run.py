@@ -1,11 +1,18 @@
 """PipelineRun model."""
 
 from enum import Enum
+from typing import Dict, List
 
 from sqlalchemy import JSON, Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String, func, Index, text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
-from app.database import Base
+from app.database import Base, utcnow
+from app.models.pipeline_stage_state import PipelineStageState, StageState
+
+
+def _default_stage_count(context) -> int:
+    """Core inserts that omit stage_count get it from the row's stages."""
+    return len(context.get_current_parameters().get("stages") or [])
 
 
 class PipelineStatus(str, Enum):
@@ -30,8 +37,8 @@ class PipelineRun(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign keys
-    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False, index=True)
-    job_profile_id = Column(Integer, ForeignKey("job_profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    candidate_id = Column(Integer, ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
+    job_profile_id = Column(Integer, ForeignKey("job_profiles.id", ondelete="CASCADE"), nullable=False)
     
     # Status
     status = Column(
@@ -39,20 +46,27 @@ class PipelineRun(Base):
         nullable=False,
         default=PipelineStatus.CREATED,
         server_default=text("'CREATED'"),
-        index=True,
     )
-    current_stage = Column(String(100), nullable=True, index=True)  # e.g., "resume_screen", "oa", "phone_screen"
+    current_stage = Column(String(100), nullable=True)  # e.g., "resume_screen", "oa", "phone_screen"
+    # Stage cursor: position of current_stage in stages (None before the first advance)
+    current_stage_index = Column(Integer, nullable=True)
+    # Always len(stages): kept in sync by _sync_stages / _default_stage_count
+    stage_count = Column(
+        Integer, nullable=False, default=_default_stage_count, server_default=text("0")
+    )
+    # Optimistic concurrency counter, bumped on every update
+    version = Column(Integer, nullable=False, server_default=text("1"))
     
     # Stage tracking
     stages = Column(JSON, nullable=False, default=list, server_default="[]")  # List of stage names in order
-    stage_progress = Column(JSON, nullable=False, default=dict, server_default="{}")  # Dict[stage_name, state]
-    # state: "created", "in_progress", "completed", "gated"
+    # Per-stage state lives in pipeline_stage_states; see stage_progress below
     
     # Metadata
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
         DateTime(timezone=True),
+        default=utcnow,  # Keyset cursors compare against it; see utcnow
         server_default=func.now(),
         nullable=False,
     )
@@ -67,9 +81,86 @@ class PipelineRun(Base):
     candidate = relationship("Candidate", back_populates="pipeline_runs")
     job_profile = relationship("JobProfile", back_populates="pipeline_runs")
     stage_results = relationship("StageResult", back_populates="pipeline_run", cascade="all, delete-orphan")
+    stage_states = relationship(
+        "PipelineStageState",
+        back_populates="pipeline_run",
+        order_by="PipelineStageState.position",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
     
     # Composite indexes
+    # Every filterable column's index ends in (created_at, id) so filtered
+    # listings are ordered range scans that keyset pagination can seek into.
     __table_args__ = (
-        Index("ix_pipeline_runs_candidate_status", "candidate_id", "status"),
-        Index("ix_pipeline_runs_job_profile_status", "job_profile_id", "status"),
+        Index("ix_pipeline_runs_created", "created_at", "id"),
+        Index("ix_pipeline_runs_candidate_created", "candidate_id", "created_at", "id"),
+        Index("ix_pipeline_runs_job_profile_created", "job_profile_id", "created_at", "id"),
+        Index("ix_pipeline_runs_status_created", "status", "created_at", "id"),
+        Index("ix_pipeline_runs_current_stage_created", "current_stage", "created_at", "id"),
+        Index("ix_pipeline_runs_candidate_status", "candidate_id", "status", "created_at", "id"),
+        Index(
+            "ix_pipeline_runs_job_profile_status", "job_profile_id", "status", "created_at", "id"
+        ),
+        Index("ix_pipeline_runs_job_profile_stage_index", "job_profile_id", "current_stage_index"),
+        # Covers conditional GETs: ETag / Last-Modified come from the index alone
+        Index("ix_pipeline_runs_validators", "id", "version", "updated_at"),
     )
+    __mapper_args__ = {"version_id_col": version}
+
+    def __init__(self, **kwargs):
+        # Apply stages before stage_progress regardless of keyword order, so
+        # the stage state rows are laid out from stages
+        stages = kwargs.pop("stages", None)
+        stage_progress = kwargs.pop("stage_progress", None)
+        super().__init__(**kwargs)
+        if stages is not None:
+            self.stages = stages
+        if stage_progress is not None:
+            self.stage_progress = stage_progress
+
+    @validates("stages")
+    def _sync_stages(self, key: str, stages: List[str]) -> List[str]:
+        """Derive stage_count and one stage state row per stage from stages."""
+        stages = list(stages)
+        previous = {stage_state.stage_name: stage_state.state for stage_state in self.stage_states}
+        # Rows are reused by position so their primary keys stay stable
+        for position, stage_name in enumerate(stages):
+            if position < len(self.stage_states):
+                stage_state = self.stage_states[position]
+                if stage_state.stage_name != stage_name:
+                    stage_state.stage_name = stage_name
+                    stage_state.state = previous.get(stage_name, StageState.CREATED)
+            else:
+                self.stage_states.append(
+                    PipelineStageState(
+                        position=position,
+                        stage_name=stage_name,
+                        state=previous.get(stage_name, StageState.CREATED),
+                    )
+                )
+        del self.stage_states[len(stages) :]
+        self.stage_count = len(stages)
+        return stages
+
+    @property
+    def stage_progress(self) -> Dict[str, str]:
+        """Stage states as {stage_name: state}, in stage order."""
+        return {stage_state.stage_name: stage_state.state.value for stage_state in self.stage_states}
+
+    @stage_progress.setter
+    def stage_progress(self, stage_progress: Dict[str, str]) -> None:
+        """
+        Apply a {stage_name: state} mapping to the stages of this run.
+
+        Raises:
+            ValueError: If a stage is not in stages
+        """
+        existing = {stage_state.stage_name: stage_state for stage_state in self.stage_states}
+        for stage_name, state in stage_progress.items():
+            stage_state = existing.get(stage_name)
+            if stage_state is None:
+                raise ValueError(f"Unknown stage: {stage_name}")
+            if stage_state.state != state:
+                stage_state.state = StageState(state)
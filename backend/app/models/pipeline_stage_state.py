@@ -0,0 +1,50 @@
+"""PipelineStageState model."""
+
+from enum import Enum
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, SmallInteger, String, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class StageState(str, Enum):
+    """State of a single stage within a pipeline run."""
+
+    CREATED = "created"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    GATED = "gated"
+
+
+class PipelineStageState(Base):
+    """
+    PipelineStageState entity holding one stage's state for a pipeline run.
+
+    One row per (pipeline run, stage position). Replaces the per-run
+    stage_progress JSON dict so stage states can be indexed and queried.
+    """
+
+    __tablename__ = "pipeline_stage_states"
+
+    pipeline_run_id = Column(
+        Integer, ForeignKey("pipeline_runs.id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(SmallInteger, primary_key=True)  # Index of the stage in PipelineRun.stages
+    stage_name = Column(String(100), nullable=False)
+    state = Column(
+        SQLEnum(StageState, name="stagestate"),
+        nullable=False,
+        default=StageState.CREATED,
+        server_default=text("'CREATED'"),
+    )
+
+    # Relationships
+    pipeline_run = relationship("PipelineRun", back_populates="stage_states")
+
+    # Composite indexes
+    __table_args__ = (
+        # "Which runs have stage X in state Y" (joins to pipeline_runs by PK)
+        Index("ix_pipeline_stage_states_stage_state", "stage_name", "state", "pipeline_run_id"),
+    )
@@ -3,9 +3,13 @@
 from enum import Enum
 
 from sqlalchemy import JSON, Column, DateTime, Enum as SQLEnum, ForeignKey, Integer, String, Text, func, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship, undefer_group
 
-from app.database import Base
+from app.database import Base, utcnow
+
+
+# Deferred column group holding the large per-result payload
+PAYLOAD_GROUP = "payload"
 
 
 class StageDecision(str, Enum):
@@ -42,19 +46,24 @@ class StageResult(Base):
     decision = Column(SQLEnum(StageDecision, name="stagedecision"), nullable=True, index=True)
     
     # Scores and data (flexible JSON)
-    raw_scores = Column(JSON, nullable=True)  # Stage-specific scoring data
+    # raw_scores, artifacts and notes are deferred as the "payload" group:
+    # loaded only by queries that opt in with load_stage_result_payload()
+    raw_scores = deferred(Column(JSON, nullable=True), group=PAYLOAD_GROUP)  # Stage-specific scoring data
     strengths = Column(JSON, nullable=False, default=list, server_default="[]")  # List[str]
     concerns = Column(JSON, nullable=False, default=list, server_default="[]")  # List[str]
     
     # Artifacts (transcripts, code, etc.)
-    artifacts = Column(JSON, nullable=False, default=dict, server_default="{}")  # Dict[artifact_name, data]
-    notes = Column(Text, nullable=True)
+    artifacts = deferred(
+        Column(JSON, nullable=False, default=dict, server_default="{}"), group=PAYLOAD_GROUP
+    )  # Dict[artifact_name, data]
+    notes = deferred(Column(Text, nullable=True), group=PAYLOAD_GROUP)
     
     # Metadata
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
         DateTime(timezone=True),
+        default=utcnow,  # Export time windows compare against it; see utcnow
         server_default=func.now(),
         nullable=False,
     )
@@ -74,3 +83,8 @@ class StageResult(Base):
         Index("ix_stage_results_pipeline_type", "pipeline_run_id", "stage_type"),
         Index("ix_stage_results_pipeline_decision", "pipeline_run_id", "decision"),
     )
+
+
+def load_stage_result_payload():
+    """Loader option that fetches the deferred raw_scores, artifacts and notes."""
+    return undefer_group(PAYLOAD_GROUP)
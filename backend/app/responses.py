@@ -0,0 +1,30 @@
+"""Fast JSON encoding for API responses."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# UTC datetimes end in "Z", as pydantic writes them, so orjson-encoded
+# bodies match the ones FastAPI builds from response models
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode content with orjson (datetimes, enums and dataclasses included)."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    The app's default response class.
+
+    Endpoints that return response models are encoded by orjson instead of
+    the stdlib encoder. Hot read paths return a FastJSONResponse of plain
+    dicts built from Core rows directly, which also skips response-model
+    validation: the data comes straight from the database, in the shape
+    the schema documents.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
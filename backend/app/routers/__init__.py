@@ -1,5 +1,27 @@
 """API routers."""
 
-from app.routers import health, pipeline
+from app.routers import (
+    debrief,
+    export,
+    health,
+    interview,
+    jobs,
+    metrics,
+    oa,
+    pipeline,
+    resume,
+    stage_results,
+)
 
-__all__ = ["health", "pipeline"]
+__all__ = [
+    "debrief",
+    "export",
+    "health",
+    "interview",
+    "jobs",
+    "metrics",
+    "oa",
+    "pipeline",
+    "resume",
+    "stage_results",
+]
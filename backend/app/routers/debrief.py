@@ -0,0 +1,89 @@
+"""Debrief router."""
+
+import time
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import get_async_db, get_async_session_factory
+from app.models import JobProfile
+from app.schemas.debrief import (
+    DebriefRunRequest,
+    DebriefWhatIfRequest,
+    DebriefWhatIfResponse,
+    DebriefWhatIfResult,
+)
+from app.schemas.job import JobResponse
+from app.services.job_queue import enqueue
+
+router = APIRouter(prefix="/debrief", tags=["debrief"])
+
+
+@router.post("/run", response_model=JobResponse, status_code=202)
+async def run_debrief(
+    request: DebriefRunRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Debrief every candidate of a job profile and persist the decisions.
+
+    Runs in the background; each run with a complete set of scorecards
+    gets a debrief StageResult (PASS = hire, HOLD, FAIL = no hire).
+    """
+    if await db.get(JobProfile, request.job_profile_id) is None:
+        raise HTTPException(status_code=404, detail="Job profile not found")
+
+    # The debrief service (and numpy) loads with the job queue, not the router
+    from app.services.debrief import DEBRIEF_JOB
+
+    job = enqueue(db, DEBRIEF_JOB, request.model_dump())
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+@router.post("/what_if", response_model=DebriefWhatIfResponse)
+async def debrief_what_if(
+    request: DebriefWhatIfRequest,
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+):
+    """
+    Compare decision outcomes under alternative policies (nothing is persisted).
+
+    The cohort is loaded once (and cached until its scorecards change);
+    each policy is then a vectorized evaluation over the whole cohort.
+    """
+    import numpy as np
+
+    from app.services.debrief import DebriefPolicy, evaluate, load_cohort
+
+    async with session_factory() as db:
+        if await db.get(JobProfile, request.job_profile_id) is None:
+            raise HTTPException(status_code=404, detail="Job profile not found")
+        cohort = await load_cohort(db, request.job_profile_id)
+
+    start = time.perf_counter()
+    debriefs = {
+        name: evaluate(cohort, DebriefPolicy(**policy.model_dump()))
+        for name, policy in request.policies.items()
+    }
+    evaluation_ms = (time.perf_counter() - start) * 1000
+
+    baseline = next(iter(debriefs.values()))
+    complete = baseline.complete
+    results = {}
+    for name, debrief in debriefs.items():
+        scores = debrief.evidence_scores[complete]
+        results[name] = DebriefWhatIfResult(
+            **debrief.counts(),
+            changed=int(
+                np.count_nonzero(debrief.decisions[complete] != baseline.decisions[complete])
+            ),
+            mean_evidence_score=round(float(scores.mean()), 4) if len(scores) else 0.0,
+        )
+    return DebriefWhatIfResponse(
+        cohort_size=len(cohort),
+        complete=int(np.count_nonzero(complete)),
+        evaluation_ms=round(evaluation_ms, 3),
+        results=results,
+    )
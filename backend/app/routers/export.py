@@ -0,0 +1,212 @@
+"""Bulk export router."""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import get_async_session_factory
+from app.models import PipelineRun, StageResult
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 1000
+
+PIPELINE_COLUMNS = (
+    PipelineRun.id,
+    PipelineRun.candidate_id,
+    PipelineRun.job_profile_id,
+    PipelineRun.status,
+    PipelineRun.current_stage,
+    PipelineRun.current_stage_index,
+    PipelineRun.stage_count,
+    PipelineRun.stages,
+    PipelineRun.version,
+    PipelineRun.started_at,
+    PipelineRun.completed_at,
+    PipelineRun.created_at,
+    PipelineRun.updated_at,
+)
+
+# Artifacts are left out: they are fetched individually
+STAGE_RESULT_COLUMNS = (
+    StageResult.id,
+    StageResult.pipeline_run_id,
+    StageResult.stage_name,
+    StageResult.stage_type,
+    StageResult.decision,
+    StageResult.raw_scores,
+    StageResult.strengths,
+    StageResult.concerns,
+    StageResult.notes,
+    StageResult.started_at,
+    StageResult.completed_at,
+    StageResult.created_at,
+    StageResult.updated_at,
+)
+
+
+class ExportFormat(str, Enum):
+    """Export serialization format."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """
+    A created_at bound as naive UTC, the form timestamps are stored in.
+    SQLite compares them as text and would ignore an offset (asyncpg reads
+    naive values as UTC).
+    """
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_cell(value: Any) -> Any:
+    value = _jsonable(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return "" if value is None else value
+
+
+async def stream_rows(
+    session_factory: async_sessionmaker,
+    stmt: Select,
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Run a query on a server-side cursor and yield it serialized in chunks.
+
+    At most one chunk of rows is held in memory at a time, whatever the
+    size of the result.
+
+    Args:
+        session_factory: Factory for the session owned by this stream
+        stmt: Column-projected select to export
+        columns: Output field names, in select order
+        export_format: NDJSON (one object per line) or CSV (with header row)
+        chunk_size: Rows fetched per round trip and serialized per yield
+
+    Yields:
+        Serialized text, one chunk of rows at a time
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if export_format is ExportFormat.CSV:
+        writer.writerow(columns)
+
+    async with session_factory() as db:
+        result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+        async for partition in result.partitions():
+            for row in partition:
+                if export_format is ExportFormat.CSV:
+                    writer.writerow([_csv_cell(value) for value in row])
+                else:
+                    record: Dict[str, Any] = {
+                        name: _jsonable(value) for name, value in zip(columns, row, strict=True)
+                    }
+                    buffer.write(json.dumps(record, separators=(",", ":")))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _export_response(
+    session_factory: async_sessionmaker,
+    stmt: Select,
+    columns: List[str],
+    export_format: ExportFormat,
+    name: str,
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(session_factory, stmt, columns, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'},
+    )
+
+
+@router.get("/pipelines")
+async def export_pipelines(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson or csv"),
+    job_profile_id: Optional[int] = Query(None, description="Only runs for this job profile"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after (inclusive)"),
+    created_to: Optional[datetime] = Query(None, description="Created before (exclusive)"),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+):
+    """
+    Stream pipeline runs as NDJSON or CSV, oldest first.
+
+    Rows are read through a server-side cursor and written with chunked
+    transfer encoding, so memory stays flat regardless of row count. Use
+    the created_at window for incremental pulls.
+    """
+    stmt = select(*PIPELINE_COLUMNS)
+    if job_profile_id is not None:
+        stmt = stmt.where(PipelineRun.job_profile_id == job_profile_id)
+    if created_from is not None:
+        stmt = stmt.where(PipelineRun.created_at >= _naive_utc(created_from))
+    if created_to is not None:
+        stmt = stmt.where(PipelineRun.created_at < _naive_utc(created_to))
+    stmt = stmt.order_by(PipelineRun.created_at, PipelineRun.id)
+
+    columns = [column.key for column in PIPELINE_COLUMNS]
+    return _export_response(session_factory, stmt, columns, format, "pipelines")
+
+
+@router.get("/stage_results")
+async def export_stage_results(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson or csv"),
+    job_profile_id: Optional[int] = Query(
+        None, description="Only results of runs for this job profile"
+    ),
+    created_from: Optional[datetime] = Query(None, description="Created at or after (inclusive)"),
+    created_to: Optional[datetime] = Query(None, description="Created before (exclusive)"),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+):
+    """
+    Stream stage results (without artifacts) as NDJSON or CSV, in ID order.
+
+    Same streaming and filters as /export/pipelines; the job profile
+    filter applies to the result's pipeline run.
+    """
+    stmt = select(*STAGE_RESULT_COLUMNS)
+    if job_profile_id is not None:
+        stmt = stmt.join(PipelineRun, PipelineRun.id == StageResult.pipeline_run_id).where(
+            PipelineRun.job_profile_id == job_profile_id
+        )
+    if created_from is not None:
+        stmt = stmt.where(StageResult.created_at >= _naive_utc(created_from))
+    if created_to is not None:
+        stmt = stmt.where(StageResult.created_at < _naive_utc(created_to))
+    stmt = stmt.order_by(StageResult.id)
+
+    columns = [column.key for column in STAGE_RESULT_COLUMNS]
+    return _export_response(session_factory, stmt, columns, format, "stage_results")
@@ -2,10 +2,27 @@
 
 from fastapi import APIRouter
 
+from app.database import get_async_engine, get_engine, pool_status
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "interview-system-api"}
+    """
+    Health check endpoint.
+
+    Reports connection pool occupancy and checkout statistics for both
+    database engines without opening a connection. Status is "degraded"
+    while any pool is saturated.
+    """
+    pools = {
+        "sync": pool_status(get_engine()),
+        "async": pool_status(get_async_engine().sync_engine),
+    }
+    saturated = any(pool.get("saturated") for pool in pools.values())
+    return {
+        "status": "degraded" if saturated else "healthy",
+        "service": "interview-system-api",
+        "database": {"pools": pools},
+    }
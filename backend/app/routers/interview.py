@@ -0,0 +1,105 @@
+"""Interview session router."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import PipelineRun
+from app.schemas.interview import (
+    InterviewSessionCreate,
+    InterviewSessionResponse,
+    InterviewTurnRequest,
+    InterviewTurnResponse,
+)
+from app.services.interview_sessions import (
+    HintBudgetExhaustedError,
+    InterviewSessionStore,
+    SessionEndedError,
+    SessionNotFoundError,
+    SessionStoreBackpressureError,
+    get_session_store,
+)
+
+router = APIRouter(prefix="/interview", tags=["interview"])
+
+
+@router.post("/sessions", response_model=InterviewSessionResponse, status_code=201)
+async def create_session(
+    request: InterviewSessionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    store: InterviewSessionStore = Depends(get_session_store),
+):
+    """Start a live interview session; its timer starts now."""
+    if await db.get(PipelineRun, request.pipeline_run_id) is None:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    state = await store.create_session(
+        request.pipeline_run_id,
+        request.stage_name,
+        request.time_limit_seconds,
+        request.hint_budget,
+    )
+    return InterviewSessionResponse.from_state(state)
+
+
+@router.get("/sessions/{session_id}", response_model=InterviewSessionResponse)
+async def get_session(
+    session_id: str,
+    store: InterviewSessionStore = Depends(get_session_store),
+):
+    """Get a live session's state (served from the session store, not the database)."""
+    try:
+        state = await store.get_session(session_id)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail="Session not found") from None
+    return InterviewSessionResponse.from_state(state)
+
+
+@router.post("/next", response_model=InterviewTurnResponse)
+async def next_turn(
+    request: InterviewTurnRequest,
+    store: InterviewSessionStore = Depends(get_session_store),
+):
+    """
+    Record the next turn of a live session.
+
+    The turn updates the session's hot state and is written to
+    interview_turns in the background, batched with other sessions' turns
+    (within INTERVIEW_FLUSH_INTERVAL seconds).
+    """
+    try:
+        state, record = await store.record_turn(
+            request.session_id,
+            request.role,
+            request.content,
+            use_hint=request.use_hint,
+            metadata=request.metadata,
+        )
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail="Session not found") from None
+    except SessionEndedError:
+        raise HTTPException(status_code=409, detail="Session has ended") from None
+    except HintBudgetExhaustedError:
+        raise HTTPException(status_code=409, detail="Hint budget exhausted") from None
+    except SessionStoreBackpressureError:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Interview turns are not being persisted; retry shortly"},
+            headers={"Retry-After": "1"},
+        )
+    return InterviewTurnResponse(
+        turn_index=record.turn_index, session=InterviewSessionResponse.from_state(state)
+    )
+
+
+@router.post("/sessions/{session_id}/end", response_model=InterviewSessionResponse)
+async def end_session(
+    session_id: str,
+    store: InterviewSessionStore = Depends(get_session_store),
+):
+    """Stop the session's timer and write its remaining turns to the database."""
+    try:
+        state = await store.end_session(session_id)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail="Session not found") from None
+    return InterviewSessionResponse.from_state(state)
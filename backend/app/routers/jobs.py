@@ -0,0 +1,42 @@
+"""Jobs router."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import Job
+from app.models.job import JobStatus
+from app.schemas.job import JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    pipeline_run_id: Optional[int] = Query(None, description="Only jobs for this pipeline run"),
+    status: Optional[JobStatus] = Query(None, description="Filter by job status"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of jobs"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """List background jobs, newest first."""
+    stmt = select(Job).order_by(Job.id.desc()).limit(limit)
+    if pipeline_run_id is not None:
+        stmt = stmt.where(Job.pipeline_run_id == pipeline_run_id)
+    if status is not None:
+        stmt = stmt.where(Job.status == status)
+    return (await db.scalars(stmt)).all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get a background job's status, attempts and last error."""
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -0,0 +1,48 @@
+"""Metrics router."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.database import get_async_engine, get_engine, pool_status
+from app.metrics import REGISTRY, Gauge
+from app.services.pipeline_planner import plan_cache
+
+router = APIRouter(tags=["metrics"])
+
+DB_POOL = REGISTRY.register(
+    Gauge("db_pool", "Connection pool occupancy and checkout statistics.", ("engine", "stat"))
+)
+PLAN_CACHE = REGISTRY.register(
+    Gauge("pipeline_plan_cache", "Pipeline plan cache counters.", ("stat",))
+)
+
+POOL_STATS = (
+    "size",
+    "checked_out",
+    "overflow",
+    "checkouts",
+    "timeouts",
+    "connect_errors",
+    "wait_seconds_total",
+    "wait_seconds_max",
+)
+
+
+def _collect() -> None:
+    """Refresh pool and plan cache gauges at scrape time."""
+    for name, pool_engine in (("sync", get_engine()), ("async", get_async_engine().sync_engine)):
+        status = pool_status(pool_engine)
+        for stat in POOL_STATS:
+            if stat in status:
+                DB_POOL.set(name, stat, value=status[stat])
+    for stat, value in plan_cache.stats().items():
+        PLAN_CACHE.set(stat, value=value)
+
+
+REGISTRY.add_collector(_collect)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics in text exposition format."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
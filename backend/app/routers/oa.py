@@ -0,0 +1,91 @@
+"""Online assessment router."""
+
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db, utcnow
+from app.models import PipelineRun, StageResult
+from app.schemas.oa import OASubmitRequest, OASubmitResponse, OATestResultResponse
+from app.services.artifact_store import ArtifactStore, get_artifact_store
+from app.services.oa_execution import (
+    OATestSetRepository,
+    SandboxExecutor,
+    get_oa_executor,
+    get_test_sets,
+)
+from app.services.pipeline_events import PipelineEventBroker, get_event_broker
+
+router = APIRouter(prefix="/oa", tags=["oa"])
+
+
+@router.post("/submit", response_model=OASubmitResponse, status_code=201)
+async def submit_solution(
+    request: OASubmitRequest,
+    db: AsyncSession = Depends(get_async_db),
+    executor: SandboxExecutor = Depends(get_oa_executor),
+    test_sets: OATestSetRepository = Depends(get_test_sets),
+    store: ArtifactStore = Depends(get_artifact_store),
+    broker: PipelineEventBroker = Depends(get_event_broker),
+):
+    """
+    Run a submission against the problem's hidden tests and store the result.
+
+    Tests run in parallel in sandboxed subprocesses with CPU, memory and
+    wall-clock limits. Code already graded against the current test-set
+    version is answered from the cache. The code is kept as an artifact;
+    per-test outcomes and runtimes go to raw_scores.
+    """
+    if await db.get(PipelineRun, request.pipeline_run_id) is None:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    try:
+        test_set = await asyncio.to_thread(test_sets.get, request.problem_id)
+    except LookupError:
+        raise HTTPException(status_code=404, detail="Problem not found") from None
+
+    started_at = utcnow()
+    report = await executor.run(request.code, test_set)
+    scaling_exponent = report.scaling_exponent()
+    artifacts = await asyncio.to_thread(store.put_artifacts, {"code": request.code})
+
+    result = StageResult(
+        pipeline_run_id=request.pipeline_run_id,
+        stage_name="oa",
+        stage_type="oa",
+        raw_scores={
+            **report.to_json(),
+            "passed": report.passed,
+            "total": report.total,
+            "pass_rate": report.pass_rate,
+            "scaling_exponent": scaling_exponent,
+        },
+        artifacts=artifacts,
+        started_at=started_at,
+        completed_at=utcnow(),
+    )
+    db.add(result)
+    await db.commit()
+    broker.publish(
+        request.pipeline_run_id,
+        "stage_result",
+        {
+            "stage_result_id": result.id,
+            "stage_name": result.stage_name,
+            "passed": report.passed,
+            "total": report.total,
+        },
+    )
+
+    return OASubmitResponse(
+        stage_result_id=result.id,
+        problem_id=report.problem_id,
+        test_set_version=report.test_set_version,
+        code_hash=report.code_hash,
+        passed=report.passed,
+        total=report.total,
+        pass_rate=report.pass_rate,
+        scaling_exponent=scaling_exponent,
+        cached=report.cached,
+        results=[OATestResultResponse(**test.to_json()) for test in report.results],
+    )
@@ -1,44 +1,246 @@
 """Pipeline router."""
 
-from datetime import timezone
+import asyncio
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, NoReturn, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, Select, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.background import BackgroundTask
 
-from app.database import get_db
-from app.models import Candidate, JobProfile, PipelineRun
+from app.config import settings
+from app.database import get_async_db, get_async_session_factory
+from app.models import (
+    ArchivedPipelineRun,
+    Candidate,
+    JobProfile,
+    PipelineRun,
+    PipelineStageState,
+)
 from app.models.pipeline_run import PipelineStatus
-from app.schemas.pipeline import PipelineResponse, PipelineStartRequest
+from app.models.pipeline_stage_state import StageState
+from app.responses import FastJSONResponse
+from app.schemas.pipeline import (
+    ArchivedPipelineResponse,
+    PipelineBatchItemResult,
+    PipelineBatchStartRequest,
+    PipelineBatchStartResponse,
+    PipelineListResponse,
+    PipelineResponse,
+    PipelineStartRequest,
+)
+from app.services.archive import RunArchive, get_run_archive
+from app.services.pipeline_events import (
+    PipelineEventBroker,
+    PipelineSubscription,
+    encode_event,
+    get_event_broker,
+)
 from app.services.pipeline_planner import PipelinePlanner
+from app.services.stage_execution import enqueue_stage_execution
 
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
 
+MAX_PAGE_SIZE = 200
+
+# Columns behind PipelineResponse; stage_progress comes from pipeline_stage_states
+PIPELINE_COLUMNS = tuple(
+    getattr(PipelineRun, name) for name in PipelineResponse.model_fields if name != "stage_progress"
+)
+
+
+def encode_cursor(created_at: datetime, pipeline_id: int) -> str:
+    """Encode the (created_at, id) sort key of the last row on a page."""
+    payload = json.dumps([created_at.isoformat(), pipeline_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, pipeline_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(pipeline_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def list_pipelines_query(
+    *,
+    status: Optional[PipelineStatus] = None,
+    job_profile_id: Optional[int] = None,
+    candidate_id: Optional[int] = None,
+    current_stage: Optional[str] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+    limit: int = 50,
+) -> Select:
+    """
+    Build the keyset-paginated listing query, newest first.
+
+    Each filter column has an index ending in (created_at, id), so the
+    query is an ordered index range scan that seeks straight to the cursor
+    instead of skipping OFFSET rows.
+
+    Args:
+        status: Only runs in this status
+        job_profile_id: Only runs for this job profile
+        candidate_id: Only runs for this candidate
+        current_stage: Only runs currently at this stage
+        after: (created_at, id) of the last row of the previous page
+        limit: Maximum number of rows to return
+
+    Returns:
+        Select statement for PIPELINE_COLUMNS rows
+    """
+    stmt = select(*PIPELINE_COLUMNS)
+    if status is not None:
+        stmt = stmt.where(PipelineRun.status == status)
+    if job_profile_id is not None:
+        stmt = stmt.where(PipelineRun.job_profile_id == job_profile_id)
+    if candidate_id is not None:
+        stmt = stmt.where(PipelineRun.candidate_id == candidate_id)
+    if current_stage is not None:
+        stmt = stmt.where(PipelineRun.current_stage == current_stage)
+    if after is not None:
+        # A plain tuple is coerced to the column types, so the cursor binds
+        # exactly like the stored values
+        stmt = stmt.where(tuple_(PipelineRun.created_at, PipelineRun.id) < tuple(after))
+    return stmt.order_by(PipelineRun.created_at.desc(), PipelineRun.id.desc()).limit(limit)
+
+
+def _pipeline_item(row: Row) -> Dict[str, Any]:
+    """A PipelineResponse-shaped dict from a row holding PIPELINE_COLUMNS."""
+    item = {column.key: row._mapping[column.key] for column in PIPELINE_COLUMNS}
+    item["stage_progress"] = {}
+    return item
+
+
+async def load_pipeline(db: AsyncSession, pipeline_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Load one run as a PipelineResponse-shaped dict, in a single query.
+
+    Selects only the response columns, joined to the run's stage states,
+    as Core rows: no ORM identity map, no relationship loading and no
+    pydantic validation of data that comes straight from the database.
+
+    Returns:
+        The run, or None if it does not exist
+    """
+    rows = (
+        await db.execute(
+            select(*PIPELINE_COLUMNS, PipelineStageState.stage_name, PipelineStageState.state)
+            .outerjoin(PipelineStageState, PipelineStageState.pipeline_run_id == PipelineRun.id)
+            .where(PipelineRun.id == pipeline_id)
+            .order_by(PipelineStageState.position)
+        )
+    ).all()
+    if not rows:
+        return None
+    item = _pipeline_item(rows[0])
+    for row in rows:
+        if row.stage_name is not None:
+            item["stage_progress"][row.stage_name] = row.state.value
+    return item
+
+
+@router.get("", response_model=PipelineListResponse)
+async def list_pipelines(
+    status: Optional[PipelineStatus] = Query(None, description="Filter by pipeline status"),
+    job_profile_id: Optional[int] = Query(None, description="Filter by job profile"),
+    candidate_id: Optional[int] = Query(None, description="Filter by candidate"),
+    current_stage: Optional[str] = Query(None, description="Filter by current stage name"),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    List pipeline runs, newest first, with keyset pagination.
+
+    Pass the returned next_cursor back as `cursor` to fetch the next page.
+    Pages stay stable while new runs are created, and the cost of a page
+    does not grow with how deep into the listing it is. The page is read
+    as column-projected rows (plus one query for its stage states) and
+    encoded with orjson.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+    # Fetch one extra row to learn whether another page exists
+    rows = (
+        await db.execute(
+            list_pipelines_query(
+                status=status,
+                job_profile_id=job_profile_id,
+                candidate_id=candidate_id,
+                current_stage=current_stage,
+                after=after,
+                limit=limit + 1,
+            )
+        )
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    items = {row.id: _pipeline_item(row) for row in rows}
+    if items:
+        stage_states = await db.execute(
+            select(
+                PipelineStageState.pipeline_run_id,
+                PipelineStageState.stage_name,
+                PipelineStageState.state,
+            )
+            .where(PipelineStageState.pipeline_run_id.in_(items))
+            .order_by(PipelineStageState.pipeline_run_id, PipelineStageState.position)
+        )
+        for pipeline_run_id, stage_name, state in stage_states:
+            items[pipeline_run_id]["stage_progress"][stage_name] = state.value
+
+    return FastJSONResponse({"items": list(items.values()), "next_cursor": next_cursor})
+
 
 @router.post("/start", response_model=PipelineResponse, status_code=201)
 async def start_pipeline(
     request: PipelineStartRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Start a new pipeline run for a candidate and job profile.
-    
+
     This creates a PipelineRun with planned stages and initializes
     the state machine for tracking progress.
     """
     # Validate candidate exists
-    candidate = db.query(Candidate).filter(Candidate.id == request.candidate_id).first()
+    candidate = await db.get(Candidate, request.candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
-    
+
     # Validate job profile exists
-    job_profile = db.query(JobProfile).filter(JobProfile.id == request.job_profile_id).first()
+    job_profile = await db.get(JobProfile, request.job_profile_id)
     if not job_profile:
         raise HTTPException(status_code=404, detail="Job profile not found")
-    
+
     # Plan the pipeline
     planner = PipelinePlanner()
     stages, stage_progress = planner.plan_pipeline(job_profile, candidate)
-    
+
     # Create pipeline run
     pipeline_run = PipelineRun(
         candidate_id=request.candidate_id,
@@ -47,65 +249,449 @@ async def start_pipeline(
         stages=stages,
         stage_progress=stage_progress,
         current_stage=None,
+        current_stage_index=None,
     )
-    
+
     db.add(pipeline_run)
-    db.commit()
-    db.refresh(pipeline_run)
-    
+    await db.commit()
+    await db.refresh(pipeline_run)
+
     return pipeline_run
 
 
-@router.get("/{pipeline_id}", response_model=PipelineResponse)
+@router.post("/start/batch", response_model=PipelineBatchStartResponse)
+async def start_pipeline_batch(
+    request: PipelineBatchStartRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Start pipeline runs for many candidate/job profile pairs at once.
+
+    IDs are validated with one set-based query per table, each distinct
+    job profile is planned once, and all runs (and their stage state rows)
+    are inserted with one bulk statement per table. Unknown IDs are reported per item (status_code 404)
+    instead of failing the whole batch.
+    """
+    candidate_ids = {item.candidate_id for item in request.items}
+    job_profile_ids = {item.job_profile_id for item in request.items}
+
+    known_candidate_ids = set(
+        await db.scalars(select(Candidate.id).where(Candidate.id.in_(candidate_ids)))
+    )
+    job_profiles = {
+        job_profile.id: job_profile
+        for job_profile in await db.scalars(
+            select(JobProfile).where(JobProfile.id.in_(job_profile_ids))
+        )
+    }
+
+    # Plan once per distinct job profile
+    planner = PipelinePlanner()
+    plans = {
+        job_profile_id: planner.plan_pipeline(job_profile)
+        for job_profile_id, job_profile in job_profiles.items()
+    }
+
+    results: list[PipelineBatchItemResult] = []
+    rows = []
+    for index, item in enumerate(request.items):
+        error = None
+        if item.candidate_id not in known_candidate_ids:
+            error = "Candidate not found"
+        elif item.job_profile_id not in plans:
+            error = "Job profile not found"
+
+        results.append(
+            PipelineBatchItemResult(
+                index=index,
+                candidate_id=item.candidate_id,
+                job_profile_id=item.job_profile_id,
+                status_code=404 if error else 201,
+                error=error,
+            )
+        )
+        if error is None:
+            stages, _ = plans[item.job_profile_id]
+            rows.append(
+                {
+                    "candidate_id": item.candidate_id,
+                    "job_profile_id": item.job_profile_id,
+                    "status": PipelineStatus.CREATED,
+                    "stages": stages,
+                    "current_stage": None,
+                    "current_stage_index": None,
+                }
+            )
+
+    if rows:
+        created_ids = (
+            await db.scalars(
+                insert(PipelineRun).returning(PipelineRun.id, sort_by_parameter_order=True),
+                rows,
+            )
+        ).all()
+        await db.execute(
+            insert(PipelineStageState),
+            [
+                {"pipeline_run_id": run_id, "position": position, "stage_name": stage_name}
+                for run_id, row in zip(created_ids, rows, strict=True)
+                for position, stage_name in enumerate(row["stages"])
+            ],
+        )
+        await db.commit()
+
+        created_runs = {
+            run.id: run
+            for run in await db.scalars(select(PipelineRun).where(PipelineRun.id.in_(created_ids)))
+        }
+        created = iter(created_ids)
+        for result in results:
+            if result.error is None:
+                result.pipeline = PipelineResponse.model_validate(created_runs[next(created)])
+
+    return PipelineBatchStartResponse(
+        created=len(rows),
+        failed=len(results) - len(rows),
+        results=results,
+    )
+
+
+def pipeline_etag(version: int) -> str:
+    """Strong ETag of a run at a version; the same "<version>" advance accepts as If-Match."""
+    return f'"{version}"'
+
+
+def cache_headers(version: int, updated_at: datetime) -> Dict[str, str]:
+    """ETag, Last-Modified and Cache-Control headers for a run's representation."""
+    if updated_at.tzinfo is None:
+        # SQLite returns naive timestamps; they are stored in UTC
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return {
+        "ETag": pipeline_etag(version),
+        "Last-Modified": format_datetime(updated_at.astimezone(timezone.utc), usegmt=True),
+        "Cache-Control": settings.pipeline_cache_control,
+    }
+
+
+def is_not_modified(
+    headers: Dict[str, str], if_none_match: Optional[str], if_modified_since: Optional[str]
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against a run's cache headers.
+
+    If-None-Match takes precedence and uses weak comparison (RFC 9110), so
+    W/"3" matches "3". If-Modified-Since has one-second resolution and is
+    only consulted when there is no If-None-Match.
+    """
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or headers["ETag"] in tags
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return parsedate_to_datetime(headers["Last-Modified"]) <= since
+    return False
+
+
+@router.get(
+    "/{pipeline_id}",
+    response_model=PipelineResponse,
+    responses={304: {"description": "Not modified since the ETag / date the client holds"}},
+)
 async def get_pipeline(
     pipeline_id: int,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    archive: RunArchive = Depends(get_run_archive),
 ):
-    """Get pipeline run by ID."""
-    pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == pipeline_id).first()
-    if not pipeline_run:
+    """
+    Get pipeline run by ID.
+
+    Responses carry a strong ETag (the run's version, as accepted by
+    advance's If-Match) and Last-Modified. A client revalidating with
+    If-None-Match or If-Modified-Since gets a bodiless 304 when the run is
+    unchanged, answered from an index-only lookup of (id, version,
+    updated_at) without loading the run or its stage states.
+    Cache-Control is PIPELINE_CACHE_CONTROL. Otherwise the run is read
+    by load_pipeline and encoded with orjson.
+
+    Runs moved to the cold archive are read back from it, in the same
+    shape (see GET /pipeline/{id}/archive for everything archived).
+    """
+    if if_none_match is not None or if_modified_since is not None:
+        validators = (
+            await db.execute(
+                select(PipelineRun.version, PipelineRun.updated_at).where(
+                    PipelineRun.id == pipeline_id
+                )
+            )
+        ).one_or_none()
+        if validators is None:
+            validators = (
+                await db.execute(
+                    select(ArchivedPipelineRun.version, ArchivedPipelineRun.updated_at).where(
+                        ArchivedPipelineRun.pipeline_run_id == pipeline_id
+                    )
+                )
+            ).one_or_none()
+        if validators is None:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+        headers = cache_headers(*validators)
+        if is_not_modified(headers, if_none_match, if_modified_since):
+            return Response(status_code=304, headers=headers)
+
+    pipeline_run = await load_pipeline(db, pipeline_id)
+    if pipeline_run is not None:
+        return FastJSONResponse(
+            pipeline_run,
+            headers=cache_headers(pipeline_run["version"], pipeline_run["updated_at"]),
+        )
+
+    location = await db.get(ArchivedPipelineRun, pipeline_id)
+    if location is None:
         raise HTTPException(status_code=404, detail="Pipeline run not found")
-    
-    return pipeline_run
+    document = await asyncio.to_thread(archive.read_run, location)
+    return FastJSONResponse(
+        {name: document[name] for name in PipelineResponse.model_fields},
+        headers=cache_headers(location.version, location.updated_at),
+    )
+
+
+@router.get("/{pipeline_id}/archive", response_model=ArchivedPipelineResponse)
+async def get_archived_pipeline(
+    pipeline_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    archive: RunArchive = Depends(get_run_archive),
+):
+    """
+    Get an archived pipeline run with its stage results and interview turns.
+
+    Only runs the archival job has moved out of the live tables are found
+    here; a live run is a 404.
+    """
+    location = await db.get(ArchivedPipelineRun, pipeline_id)
+    if location is None:
+        raise HTTPException(status_code=404, detail="Archived pipeline run not found")
+    document = await asyncio.to_thread(archive.read_run, location)
+    return FastJSONResponse(document, headers=cache_headers(location.version, location.updated_at))
+
+
+@router.get("/{pipeline_id}/events")
+async def pipeline_events(
+    pipeline_id: int,
+    last_event_id: Optional[str] = Header(
+        None, description="ID of the last event received, sent by a reconnecting EventSource"
+    ),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+    broker: PipelineEventBroker = Depends(get_event_broker),
+):
+    """
+    Stream a pipeline run's progress as Server-Sent Events.
+
+    The stream opens with a `snapshot` event (the same body as
+    GET /pipeline/{id}), then pushes `stage_advanced` (the updated run),
+    `stage_execution` and `stage_result` events as they happen, with a
+    keep-alive comment every PIPELINE_EVENTS_HEARTBEAT seconds. A client
+    reconnecting with Last-Event-ID gets the events it missed, or a new
+    snapshot if they are no longer buffered. Watchers share one in-process
+    notification per event; the stream holds no database connection.
+    """
+    # Subscribe first so that nothing published during the read is missed
+    subscription = broker.subscribe(pipeline_id, last_event_id)
+    snapshot = None
+    if subscription.replay is None:
+        try:
+            snapshot = await _snapshot(session_factory, pipeline_id)
+        finally:
+            if snapshot is None:
+                subscription.close()
+        if snapshot is None:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+
+    return StreamingResponse(
+        _event_stream(subscription, session_factory, snapshot),
+        media_type="text/event-stream",
+        # Proxies must neither cache nor buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # Also unsubscribes a client that left before the stream started
+        background=BackgroundTask(subscription.close),
+    )
+
+
+async def _snapshot(session_factory: async_sessionmaker, pipeline_id: int) -> Optional[str]:
+    """The run's current state as a `snapshot` event, or None if it does not exist."""
+    async with session_factory() as db:
+        pipeline_run = await load_pipeline(db, pipeline_id)
+    if pipeline_run is None:
+        return None
+    return encode_event(None, "snapshot", pipeline_run)
+
+
+async def _event_stream(
+    subscription: PipelineSubscription,
+    session_factory: async_sessionmaker,
+    snapshot: Optional[str],
+) -> AsyncIterator[str]:
+    """Yield SSE messages until the client disconnects (which cancels the generator)."""
+    with subscription:
+        yield f"retry: {int(settings.pipeline_events_heartbeat * 1000)}\n\n"
+        if snapshot is not None:
+            yield snapshot
+        for event in subscription.replay or ():
+            yield event.message
+        while True:
+            event = await subscription.get(timeout=settings.pipeline_events_heartbeat)
+            if subscription.resync():
+                # Too slow to keep up: skip the backlog, send the current state
+                snapshot = await _snapshot(session_factory, subscription.pipeline_run_id)
+                if snapshot is None:
+                    return
+                yield snapshot
+            elif event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield event.message
 
 
 @router.post("/{pipeline_id}/advance", response_model=PipelineResponse)
 async def advance_pipeline(
     pipeline_id: int,
-    db: Session = Depends(get_db),
+    http_response: Response,
+    expected_version: Optional[int] = Query(
+        None, description="Only advance if the run is still at this version (else 409)"
+    ),
+    if_match: Optional[str] = Header(
+        None, description='Version precondition as "<version>", or * to advance unconditionally'
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    broker: PipelineEventBroker = Depends(get_event_broker),
 ):
     """
     Advance pipeline to next stage.
-    
+
     This is a helper endpoint for testing stage progression.
     In production, stages advance based on stage results.
+
+    Work for the entered stage is enqueued as a job in the same
+    transaction and runs in the background; the response returns as soon
+    as the cursor has moved (see GET /jobs?pipeline_run_id=...). Watchers
+    of GET /pipeline/{id}/events receive the updated run.
+
+    The cursor step is a single conditional UPDATE ... RETURNING that only
+    matches the version the caller last read (expected_version or If-Match),
+    so of two clients advancing from the same read one gets a 409 instead of
+    moving the run two stages. A request without a precondition gets a 428;
+    If-Match: * opts into an unconditional single-stage increment. The
+    response's ETag is the new version, ready for the next If-Match.
     """
-    pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == pipeline_id).first()
-    if not pipeline_run:
-        raise HTTPException(status_code=404, detail="Pipeline run not found")
-    
+    expected_version = _expected_version(expected_version, if_match)
     planner = PipelinePlanner()
-    
-    # Get next stage
-    next_stage = planner.get_next_stage(pipeline_run.stages, pipeline_run.current_stage)
-    
-    if next_stage is None:
-        raise HTTPException(status_code=400, detail="Pipeline already at final stage")
-    
-    # Update pipeline
-    pipeline_run.current_stage = next_stage
-    pipeline_run.status = PipelineStatus.IN_PROGRESS
-    
+
+    # Mirrors PipelinePlanner.get_next_stage_index, evaluated atomically in SQL
+    next_index = func.coalesce(PipelineRun.current_stage_index, -1) + 1
+    next_stage = (
+        select(PipelineStageState.stage_name)
+        .where(
+            PipelineStageState.pipeline_run_id == PipelineRun.id,
+            PipelineStageState.position == next_index,
+        )
+        .scalar_subquery()
+    )
+    stmt = (
+        update(PipelineRun)
+        .where(PipelineRun.id == pipeline_id, next_index < PipelineRun.stage_count)
+        .values(
+            current_stage_index=next_index,
+            current_stage=next_stage,
+            status=PipelineStatus.IN_PROGRESS,
+            started_at=func.coalesce(PipelineRun.started_at, func.now()),
+            updated_at=func.now(),
+            version=PipelineRun.version + 1,
+        )
+        .returning(*PipelineRun.__table__.columns)
+        .execution_options(synchronize_session=False)
+    )
+    if expected_version is not None:
+        stmt = stmt.where(PipelineRun.version == expected_version)
+
+    pipeline_run = (await db.execute(stmt)).mappings().one_or_none()
+    if pipeline_run is None:
+        await _raise_advance_conflict(db, pipeline_id, expected_version)
+
     # Update stage state to in_progress
-    pipeline_run.stage_progress = planner.update_stage_state(
-        pipeline_run.stage_progress, next_stage, "in_progress"
+    await db.execute(
+        update(PipelineStageState)
+        .where(
+            PipelineStageState.pipeline_run_id == pipeline_id,
+            PipelineStageState.position == pipeline_run["current_stage_index"],
+            PipelineStageState.state.in_(
+                [StageState(state) for state in planner.states_entering("in_progress")]
+            ),
+        )
+        .values(state=StageState.IN_PROGRESS)
+        .execution_options(synchronize_session=False)
     )
-    
-    if pipeline_run.started_at is None:
-        from datetime import datetime
-        pipeline_run.started_at = datetime.now(timezone.utc)
-    
-    db.commit()
-    db.refresh(pipeline_run)
-    
-    return pipeline_run
+    stage_states = await db.execute(
+        select(PipelineStageState.stage_name, PipelineStageState.state)
+        .where(PipelineStageState.pipeline_run_id == pipeline_id)
+        .order_by(PipelineStageState.position)
+    )
+    # The stage's work runs on the job queue; committed with the advance
+    enqueue_stage_execution(
+        db, pipeline_id, pipeline_run["current_stage"], pipeline_run["current_stage_index"]
+    )
+    await db.commit()
+
+    response = PipelineResponse.model_validate(
+        {
+            **pipeline_run,
+            "stage_progress": {stage_name: state.value for stage_name, state in stage_states},
+        }
+    )
+    broker.publish(pipeline_id, "stage_advanced", response.model_dump(mode="json"))
+    http_response.headers.update(cache_headers(response.version, response.updated_at))
+    return response
+
+
+def _expected_version(expected_version: Optional[int], if_match: Optional[str]) -> Optional[int]:
+    """
+    Resolve the advance precondition from the query parameter or If-Match.
+
+    Returns:
+        The version the run must be at, or None for an unconditional advance
+    """
+    if expected_version is not None:
+        return expected_version
+    if if_match is None:
+        raise HTTPException(
+            status_code=428,
+            detail="Pass expected_version or an If-Match header (If-Match: * to skip the check)",
+        )
+    if if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header") from None
+
+
+async def _raise_advance_conflict(
+    db: AsyncSession, pipeline_id: int, expected_version: Optional[int]
+) -> NoReturn:
+    """Explain why the conditional advance UPDATE matched no row."""
+    current = (
+        await db.execute(select(PipelineRun.version).where(PipelineRun.id == pipeline_id))
+    ).scalar_one_or_none()
+    if current is None:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    if expected_version is not None and current != expected_version:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Pipeline run was modified concurrently (version {current})",
+        )
+    raise HTTPException(status_code=400, detail="Pipeline already at final stage")
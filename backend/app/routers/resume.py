@@ -0,0 +1,36 @@
+"""Resume screening router."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import JobProfile
+from app.schemas.job import JobResponse
+from app.schemas.resume import ResumeScreenRequest
+from app.services.job_queue import enqueue
+
+router = APIRouter(prefix="/resume", tags=["resume"])
+
+
+@router.post("/screen", response_model=JobResponse, status_code=202)
+async def screen_resumes(
+    request: ResumeScreenRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Pre-screen resumes for a job profile in the background.
+
+    Runs the deterministic matcher over every selected run and stores one
+    resume_screen StageResult per run (PROCEED / REJECT, or BORDERLINE for
+    LLM review). Returns the queued job; poll GET /jobs/{id} for progress.
+    """
+    if await db.get(JobProfile, request.job_profile_id) is None:
+        raise HTTPException(status_code=404, detail="Job profile not found")
+
+    # The screening service (and numpy) loads with the job queue, not the router
+    from app.services.resume_screening import SCREEN_JOB
+
+    job = enqueue(db, SCREEN_JOB, request.model_dump())
+    await db.commit()
+    await db.refresh(job)
+    return job
@@ -0,0 +1,175 @@
+"""Stage results router."""
+
+import hashlib
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models import StageResult
+from app.models.stage_result import load_stage_result_payload
+from app.schemas.stage_result import StageResultResponse
+from app.services.artifact_store import (
+    ArtifactRef,
+    ArtifactStore,
+    encode_artifact,
+    get_artifact_store,
+    is_artifact_ref,
+)
+
+router = APIRouter(prefix="/stage_results", tags=["stage_results"])
+
+
+def _to_response(result: StageResult, include_payload: bool) -> StageResultResponse:
+    """Build the response without touching deferred columns unless they were loaded."""
+    response = StageResultResponse(
+        id=result.id,
+        pipeline_run_id=result.pipeline_run_id,
+        stage_name=result.stage_name,
+        stage_type=result.stage_type,
+        decision=result.decision.value if result.decision else None,
+        strengths=result.strengths,
+        concerns=result.concerns,
+        started_at=result.started_at,
+        completed_at=result.completed_at,
+        created_at=result.created_at,
+        updated_at=result.updated_at,
+    )
+    if include_payload:
+        response.raw_scores = result.raw_scores
+        response.notes = result.notes
+        response.artifact_names = sorted(result.artifacts)
+    return response
+
+
+@router.get("", response_model=List[StageResultResponse])
+async def list_stage_results(
+    pipeline_run_id: int = Query(..., description="Pipeline run to list results for"),
+    include_payload: bool = Query(False, description="Also load raw_scores, notes and artifacts"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    List the stage results of a pipeline run, oldest first.
+
+    The large payload columns are deferred; pass include_payload=true to
+    load them.
+    """
+    stmt = (
+        select(StageResult)
+        .where(StageResult.pipeline_run_id == pipeline_run_id)
+        .order_by(StageResult.id)
+    )
+    if include_payload:
+        stmt = stmt.options(load_stage_result_payload())
+    results = (await db.scalars(stmt)).all()
+    return [_to_response(result, include_payload) for result in results]
+
+
+@router.get("/{stage_result_id}", response_model=StageResultResponse)
+async def get_stage_result(
+    stage_result_id: int,
+    include_payload: bool = Query(False, description="Also load raw_scores, notes and artifacts"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get a stage result by ID; the payload columns are opt-in."""
+    options = [load_stage_result_payload()] if include_payload else []
+    result = await db.get(StageResult, stage_result_id, options=options)
+    if not result:
+        raise HTTPException(status_code=404, detail="Stage result not found")
+    return _to_response(result, include_payload)
+
+
+def parse_range(header: str, size: int) -> Tuple[int, int]:
+    """
+    Parse a single-range Range header against a representation size.
+
+    Args:
+        header: e.g. "bytes=0-499", "bytes=500-" or "bytes=-500"
+        size: Total size in bytes
+
+    Returns:
+        Half-open byte range (start, stop)
+
+    Raises:
+        ValueError: If the header is malformed, multi-range or unsatisfiable
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        raise ValueError("Only single byte ranges are supported")
+    first, _, last = spec.strip().partition("-")
+    if not first:
+        suffix = int(last)
+        if suffix <= 0:
+            raise ValueError("Empty suffix range")
+        return max(size - suffix, 0), size
+    start = int(first)
+    stop = min(int(last) + 1, size) if last else size
+    if start >= size or stop <= start:
+        raise ValueError("Range not satisfiable")
+    return start, stop
+
+
+@router.get("/{stage_result_id}/artifacts/{name}")
+async def get_stage_result_artifact(
+    stage_result_id: int,
+    name: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    db: AsyncSession = Depends(get_async_db),
+    store: ArtifactStore = Depends(get_artifact_store),
+):
+    """
+    Stream a single artifact of a stage result, honouring HTTP Range.
+
+    Only the named entry is extracted from the artifacts JSON (in the
+    database on Postgres). Stored artifacts are streamed from the artifact
+    store, decompressing only the blocks the requested range overlaps;
+    entries still inline (written before the artifact store) are served
+    from their serialized value.
+    """
+    row = (
+        await db.execute(
+            select(StageResult.id, StageResult.artifacts[name]).where(
+                StageResult.id == stage_result_id
+            )
+        )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Stage result not found")
+    value = row[1]
+    if value is None:
+        raise HTTPException(status_code=404, detail="Artifact not found")
+
+    if is_artifact_ref(value):
+        ref = ArtifactRef.from_json(value)
+        if not store.exists(ref.digest):
+            raise HTTPException(status_code=404, detail="Artifact content missing from store")
+        media_type, size, etag = ref.media_type, ref.size, ref.digest
+    else:
+        data, media_type = encode_artifact(value)
+        size, etag = len(data), hashlib.sha256(data).hexdigest()
+
+    headers = {"Accept-Ranges": "bytes", "ETag": f'"{etag}"'}
+    start, stop, status_code = 0, size, 200
+    if range_header is not None and size:
+        try:
+            start, stop = parse_range(range_header, size)
+        except ValueError:
+            raise HTTPException(
+                status_code=416,
+                detail="Range not satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            ) from None
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{stop - 1}/{size}"
+    headers["Content-Length"] = str(stop - start)
+
+    if is_artifact_ref(value):
+        body = store.read_range(ref.digest, start, stop)
+    else:
+        body = iter([data[start:stop]])
+    # Set Content-Type directly: media_type= would append a second charset to text types
+    headers["Content-Type"] = media_type
+    return StreamingResponse(body, status_code=status_code, headers=headers)
@@ -0,0 +1,53 @@
+"""Debrief schemas."""
+
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class DebriefPolicySchema(BaseModel):
+    """Debrief weights, thresholds and bar rules (defaults per SRS §14)."""
+
+    weights: Dict[str, float] = Field(
+        default_factory=lambda: {"coding": 1.0, "behavioral": 1.0, "design": 1.0},
+        description="Weight per category (coding, behavioral, design) or stage name",
+    )
+    consistency_weight: float = Field(0.25, ge=0)
+    hire_threshold: float = 2.85
+    no_hire_threshold: float = 2.6
+    min_coding_hire_ratings: int = Field(2, ge=0)
+    min_behavioral_rating: float = 2.0
+
+
+class DebriefRunRequest(BaseModel):
+    """Request to debrief a job profile's cohort and persist the decisions."""
+
+    job_profile_id: int
+    policy: DebriefPolicySchema = Field(default_factory=DebriefPolicySchema)
+    policy_name: str = "default"
+
+
+class DebriefWhatIfRequest(BaseModel):
+    """Evaluate alternative policies on a cohort without persisting anything."""
+
+    job_profile_id: int
+    policies: Dict[str, DebriefPolicySchema] = Field(..., min_length=1, max_length=50)
+
+
+class DebriefWhatIfResult(BaseModel):
+    """Decision counts under one policy."""
+
+    hire: int
+    hold: int
+    no_hire: int
+    changed: int = Field(..., description="Decisions that differ from the first policy")
+    mean_evidence_score: float
+
+
+class DebriefWhatIfResponse(BaseModel):
+    """What-if results per policy name."""
+
+    cohort_size: int
+    complete: int = Field(..., description="Runs with every interview scorecard")
+    evaluation_ms: float
+    results: Dict[str, DebriefWhatIfResult]
@@ -0,0 +1,65 @@
+"""Interview session schemas."""
+
+from typing import Any, Dict, List, Literal
+
+from pydantic import BaseModel, Field
+
+from app.services.interview_sessions import SessionState
+
+
+class InterviewSessionCreate(BaseModel):
+    """Start a live interview session for a pipeline run's stage."""
+
+    pipeline_run_id: int
+    stage_name: str = Field(..., min_length=1, max_length=100)
+    time_limit_seconds: float = Field(2700.0, gt=0)
+    hint_budget: int = Field(0, ge=0)
+
+
+class InterviewTurnRequest(BaseModel):
+    """One turn of a live session."""
+
+    session_id: str
+    role: Literal["interviewer", "candidate"] = "candidate"
+    content: str = Field(..., max_length=50_000)
+    use_hint: bool = False
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class InterviewSessionResponse(BaseModel):
+    """Live session state: timer, hint budget and the most recent turns."""
+
+    session_id: str
+    pipeline_run_id: int
+    stage_name: str
+    time_limit_seconds: float
+    elapsed_seconds: float
+    remaining_seconds: float
+    hint_budget: int
+    hints_used: int
+    turn_count: int
+    ended: bool
+    recent_turns: List[Dict[str, Any]]
+
+    @classmethod
+    def from_state(cls, state: SessionState) -> "InterviewSessionResponse":
+        return cls(
+            session_id=state.session_id,
+            pipeline_run_id=state.pipeline_run_id,
+            stage_name=state.stage_name,
+            time_limit_seconds=state.time_limit_seconds,
+            elapsed_seconds=round(state.elapsed_seconds(), 3),
+            remaining_seconds=round(state.remaining_seconds(), 3),
+            hint_budget=state.hint_budget,
+            hints_used=state.hints_used,
+            turn_count=state.turn_count,
+            ended=state.ended_at is not None,
+            recent_turns=state.recent_turns,
+        )
+
+
+class InterviewTurnResponse(BaseModel):
+    """The recorded turn and the session state after it."""
+
+    turn_index: int
+    session: InterviewSessionResponse
@@ -0,0 +1,28 @@
+"""Job schemas."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from app.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    """Background job status."""
+
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    pipeline_run_id: Optional[int] = None
+    status: JobStatus
+    priority: int
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,42 @@
+"""Online assessment schemas."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.services.oa_execution import OATestStatus
+
+
+class OASubmitRequest(BaseModel):
+    """A candidate's solution to an OA problem (Python, reading stdin, writing stdout)."""
+
+    pipeline_run_id: int
+    problem_id: str = Field(..., min_length=1, max_length=100)
+    code: str = Field(..., min_length=1, max_length=100_000)
+
+
+class OATestResultResponse(BaseModel):
+    """Outcome of one hidden test (its input and expected output stay hidden)."""
+
+    name: str
+    status: OATestStatus
+    runtime_ms: float
+    size: Optional[int] = None
+    stderr: str = ""
+
+
+class OASubmitResponse(BaseModel):
+    """Graded submission, stored as an oa stage result."""
+
+    stage_result_id: int
+    problem_id: str
+    test_set_version: str
+    code_hash: str
+    passed: int
+    total: int
+    pass_rate: float
+    scaling_exponent: Optional[float] = Field(
+        None, description="Fitted k in runtime ~ n^k over passed tests with an input size"
+    )
+    cached: bool
+    results: List[OATestResultResponse]
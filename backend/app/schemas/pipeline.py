@@ -1,7 +1,7 @@
 """Pipeline schemas."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,12 +21,57 @@ class PipelineResponse(BaseModel):
     job_profile_id: int
     status: str
     current_stage: Optional[str] = None
+    current_stage_index: Optional[int] = None
     stages: List[str]
     stage_progress: Dict[str, str]
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
+
+
+class ArchivedPipelineResponse(PipelineResponse):
+    """A pipeline run read back from the cold archive, with everything it owned."""
+
+    stage_results: List[Dict[str, Any]] = Field(
+        ..., description="Stage result rows, raw_scores, artifacts and notes included"
+    )
+    interview_turns: List[Dict[str, Any]] = Field(..., description="Interview turn rows")
+
+
+class PipelineListResponse(BaseModel):
+    """One page of pipeline runs, newest first."""
+
+    items: List[PipelineResponse]
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page; null on the last page"
+    )
+
+
+class PipelineBatchStartRequest(BaseModel):
+    """Request to start pipeline runs for many candidate/job profile pairs."""
+
+    items: List[PipelineStartRequest] = Field(..., min_length=1, max_length=10000)
+
+
+class PipelineBatchItemResult(BaseModel):
+    """Outcome for a single item of a batch start request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    candidate_id: int
+    job_profile_id: int
+    status_code: int = Field(..., description="HTTP-style status for this item (201 or 404)")
+    pipeline: Optional[PipelineResponse] = None
+    error: Optional[str] = None
+
+
+class PipelineBatchStartResponse(BaseModel):
+    """Batch start response with per-item results in request order."""
+
+    created: int
+    failed: int
+    results: List[PipelineBatchItemResult]
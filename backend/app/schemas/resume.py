@@ -0,0 +1,15 @@
+"""Resume screening schemas."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ResumeScreenRequest(BaseModel):
+    """Request to pre-screen the resumes of a job profile's pipeline runs."""
+
+    job_profile_id: int
+    pipeline_run_ids: Optional[List[int]] = Field(
+        None,
+        description="Runs to screen; default is every run currently at the resume_screen stage",
+    )
@@ -0,0 +1,32 @@
+"""Stage result schemas."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class StageResultResponse(BaseModel):
+    """
+    Stage result response.
+
+    raw_scores, notes and artifact_names are only filled in when the
+    request opts into the deferred payload (include_payload=true).
+    """
+
+    id: int
+    pipeline_run_id: int
+    stage_name: str
+    stage_type: str
+    decision: Optional[str] = None
+    strengths: List[str]
+    concerns: List[str]
+    raw_scores: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+    artifact_names: Optional[List[str]] = Field(
+        None, description="Fetch each with GET /stage_results/{id}/artifacts/{name}"
+    )
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
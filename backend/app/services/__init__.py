@@ -1,5 +1,35 @@
-"""Services module."""
+"""
+Services module.
 
-from app.services.pipeline_planner import PipelinePlanner
+Exports are resolved on first access, so importing one service (or a
+router that uses it) does not import the others; the LLM gateway in
+particular is only loaded by code that asks for it.
+"""
 
-__all__ = ["PipelinePlanner"]
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "ArtifactStore": "app.services.artifact_store",
+    "FilesystemArtifactStore": "app.services.artifact_store",
+    "get_artifact_store": "app.services.artifact_store",
+    "JobQueue": "app.services.job_queue",
+    "enqueue": "app.services.job_queue",
+    "get_job_queue": "app.services.job_queue",
+    "job_handler": "app.services.job_queue",
+    "LLMGateway": "app.services.llm_gateway",
+    "LLMRequest": "app.services.llm_gateway",
+    "get_llm_gateway": "app.services.llm_gateway",
+    "PipelinePlanner": "app.services.pipeline_planner",
+    "PlannedPipeline": "app.services.pipeline_planner",
+    "plan_cache": "app.services.pipeline_planner",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
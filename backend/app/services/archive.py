@@ -0,0 +1,335 @@
+"""
+Cold archive of decided pipeline runs.
+
+Runs in a terminal state (COMPLETED, FAILED, CANCELLED) created and
+decided more than archive_after_days ago are rarely read again, yet they
+are most of pipeline_runs, pipeline_stage_states and stage_results and of
+every index on them. archive_runs() moves them out of the database in
+batches; each batch becomes one file under archive_path,
+
+    pipeline_runs/<first id>-<last id>.ndjson.gz
+
+holding one JSON document per run (its columns, stage_progress, stage
+results with their payload and interview turns), each compressed as its
+own gzip member. The file as a whole is plain gzipped NDJSON (zcat reads
+it), and an archived_pipeline_runs row records where each run's member
+starts and how long it is, so reading one run back decompresses only that
+run. Stage result artifacts stay in the artifact store, referenced by the
+archived results.
+
+The file is written and fsynced before the transaction that records the
+archived_pipeline_runs rows and deletes the live rows commits. A failed
+batch leaves at most a file nothing points to, which its retry overwrites.
+
+The "pipeline.archive" job runs archival passes on the job queue: each
+pass also keeps the monthly partitions of the live tables created ahead
+and drops the ones the archive has emptied (Postgres, see
+app.services.partitions), then schedules the next pass.
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import utcnow
+from app.metrics import REGISTRY, Counter
+from app.models import (
+    ArchivedPipelineRun,
+    InterviewTurn,
+    Job,
+    PipelineRun,
+    PipelineStageState,
+    StageResult,
+)
+from app.models.job import JobStatus
+from app.models.pipeline_run import PipelineStatus
+from app.responses import json_dumps
+from app.services.job_queue import JobContext, enqueue, job_handler
+from app.services.partitions import drop_empty_partitions, ensure_partitions
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_JOB = "pipeline.archive"
+
+TERMINAL_STATUSES = (PipelineStatus.COMPLETED, PipelineStatus.FAILED, PipelineStatus.CANCELLED)
+
+# Rows of an archived run in other tables, deleted with it (children first)
+DEPENDENT_MODELS = (StageResult, PipelineStageState, InterviewTurn, Job)
+
+RUNS_ARCHIVED = REGISTRY.register(
+    Counter("pipeline_runs_archived_total", "Pipeline runs moved to the cold archive.")
+)
+
+
+class ArchiveCorruptError(Exception):
+    """An archived run's bytes are missing from its archive file."""
+
+
+class RunArchive:
+    """
+    Archive files on local disk.
+
+    Every document is compressed as a separate gzip member, so a file is
+    readable as a whole by any gzip tool and a single document by its
+    byte range.
+    """
+
+    def __init__(self, root: str | os.PathLike, level: int = 6):
+        self.root = Path(root)
+        self.level = level
+
+    def write(self, name: str, documents: Sequence[Dict[str, Any]]) -> List[Tuple[int, int]]:
+        """
+        Atomically (re)write an archive file.
+
+        Args:
+            name: Path of the file relative to the root
+            documents: JSON-serializable documents, one per line
+
+        Returns:
+            (byte offset, byte length) of each document's gzip member
+        """
+        members = [
+            gzip.compress(json_dumps(document) + b"\n", compresslevel=self.level, mtime=0)
+            for document in documents
+        ]
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"".join(members))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        locations, offset = [], 0
+        for member in members:
+            locations.append((offset, len(member)))
+            offset += len(member)
+        return locations
+
+    def read(self, name: str, offset: int, length: int) -> Dict[str, Any]:
+        """
+        Read one document back from its gzip member.
+
+        Raises:
+            ArchiveCorruptError: If the file is missing or shorter than the member
+        """
+        try:
+            with open(self.root / name, "rb") as f:
+                f.seek(offset)
+                member = f.read(length)
+        except FileNotFoundError:
+            raise ArchiveCorruptError(f"Archive file {name} is missing") from None
+        if len(member) != length:
+            raise ArchiveCorruptError(f"Archive file {name} is truncated")
+        return orjson.loads(gzip.decompress(member))
+
+    def read_run(self, location: ArchivedPipelineRun) -> Dict[str, Any]:
+        """Read the archived document of a run."""
+        return self.read(location.path, location.byte_offset, location.byte_length)
+
+
+@lru_cache(maxsize=1)
+def get_run_archive() -> RunArchive:
+    """Process-wide run archive configured by settings (also a FastAPI dependency)."""
+    return RunArchive(settings.archive_path)
+
+
+async def _documents(db: AsyncSession, run_ids: List[int]) -> List[Dict[str, Any]]:
+    """The archive documents of runs, in run_ids order (all columns, payload included)."""
+    documents = {
+        run["id"]: {**run, "stage_progress": {}, "stage_results": [], "interview_turns": []}
+        for run in (
+            await db.execute(select(PipelineRun.__table__).where(PipelineRun.id.in_(run_ids)))
+        ).mappings()
+    }
+    states = await db.execute(
+        select(
+            PipelineStageState.pipeline_run_id,
+            PipelineStageState.stage_name,
+            PipelineStageState.state,
+        )
+        .where(PipelineStageState.pipeline_run_id.in_(run_ids))
+        .order_by(PipelineStageState.pipeline_run_id, PipelineStageState.position)
+    )
+    for run_id, stage_name, state in states:
+        documents[run_id]["stage_progress"][stage_name] = state.value
+    for model, key in ((StageResult, "stage_results"), (InterviewTurn, "interview_turns")):
+        rows = await db.execute(
+            select(model.__table__)
+            .where(model.pipeline_run_id.in_(run_ids))
+            .order_by(model.pipeline_run_id, model.id)
+        )
+        for row in rows.mappings():
+            documents[row["pipeline_run_id"]][key].append(dict(row))
+    return [documents[run_id] for run_id in run_ids]
+
+
+async def archive_runs(
+    session_factory: async_sessionmaker,
+    archive: RunArchive,
+    older_than: timedelta,
+    batch_size: int,
+    now: Optional[datetime] = None,
+) -> int:
+    """
+    Move one batch of decided runs to the archive.
+
+    Args:
+        session_factory: Sessions on the app's database
+        archive: Where archive files go
+        older_than: Minimum age of a run's creation and of its last update
+        batch_size: Maximum runs to move (one archive file)
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Number of runs archived; 0 when none are due
+    """
+    cutoff = (now or utcnow()) - older_than
+    async with session_factory() as db:
+        # Rows locked by an in-flight write are left for the next pass
+        run_ids = (
+            await db.scalars(
+                select(PipelineRun.id)
+                .where(
+                    PipelineRun.status.in_(TERMINAL_STATUSES),
+                    PipelineRun.created_at < cutoff,
+                    func.coalesce(PipelineRun.completed_at, PipelineRun.updated_at) < cutoff,
+                )
+                .order_by(PipelineRun.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        if not run_ids:
+            return 0
+
+        documents = await _documents(db, run_ids)
+        name = f"pipeline_runs/{run_ids[0]}-{run_ids[-1]}.ndjson.gz"
+        locations = await asyncio.to_thread(archive.write, name, documents)
+
+        archived_at = utcnow()
+        await db.execute(
+            insert(ArchivedPipelineRun),
+            [
+                {
+                    "pipeline_run_id": document["id"],
+                    "candidate_id": document["candidate_id"],
+                    "job_profile_id": document["job_profile_id"],
+                    "status": document["status"],
+                    "version": document["version"],
+                    "path": name,
+                    "byte_offset": offset,
+                    "byte_length": length,
+                    "created_at": document["created_at"],
+                    "updated_at": document["updated_at"],
+                    "completed_at": document["completed_at"],
+                    "archived_at": archived_at,
+                }
+                for document, (offset, length) in zip(documents, locations, strict=True)
+            ],
+        )
+        for model in DEPENDENT_MODELS:
+            await db.execute(
+                delete(model)
+                .where(model.pipeline_run_id.in_(run_ids))
+                .execution_options(synchronize_session=False)
+            )
+        await db.execute(
+            delete(PipelineRun)
+            .where(PipelineRun.id.in_(run_ids))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    RUNS_ARCHIVED.inc(amount=len(run_ids))
+    return len(run_ids)
+
+
+async def maintain_partitions(
+    session_factory: async_sessionmaker, archived_before: datetime
+) -> Tuple[List[str], List[str]]:
+    """
+    Create upcoming month partitions and drop emptied old ones.
+
+    Args:
+        session_factory: Sessions on the app's database
+        archived_before: Months before this one may be dropped once empty
+
+    Returns:
+        (partitions created, partitions dropped); both empty when the
+        tables are not partitioned
+    """
+    async with session_factory() as db:
+        conn = await db.connection()
+        created = await conn.run_sync(ensure_partitions, utcnow(), settings.partition_months_ahead)
+        dropped = await conn.run_sync(drop_empty_partitions, archived_before)
+        await db.commit()
+    if created or dropped:
+        logger.info("Partitions created: %s; dropped: %s", created, dropped)
+    return created, dropped
+
+
+async def schedule_archival(session_factory: async_sessionmaker, delay: float = 0) -> bool:
+    """
+    Enqueue an archival pass unless one is already queued.
+
+    Args:
+        session_factory: Sessions on the app's database
+        delay: Seconds before the pass may run
+
+    Returns:
+        Whether a pass was enqueued
+    """
+    async with session_factory() as db:
+        queued = await db.scalar(
+            select(Job.id).where(Job.kind == ARCHIVE_JOB, Job.status == JobStatus.QUEUED).limit(1)
+        )
+        if queued is not None:
+            return False
+        enqueue(db, ARCHIVE_JOB, delay=delay)
+        await db.commit()
+    return True
+
+
+@job_handler(ARCHIVE_JOB)
+async def run_archival(job: JobContext) -> None:
+    """
+    Archive due runs in batches, maintain partitions and schedule the next pass.
+
+    A pass stops after half the job lease so a long backlog is worked off
+    over several passes instead of outliving its claim.
+    """
+    archive = get_run_archive()
+    older_than = timedelta(days=settings.archive_after_days)
+    deadline = time.monotonic() + settings.job_lease_seconds / 2
+    archived, backlog = 0, False
+    while True:
+        moved = await archive_runs(
+            job.session_factory, archive, older_than, settings.archive_batch_size
+        )
+        archived += moved
+        if moved < settings.archive_batch_size:
+            break
+        if time.monotonic() > deadline:
+            backlog = True
+            break
+    await maintain_partitions(job.session_factory, utcnow() - older_than)
+    if archived:
+        logger.info("Archived %d pipeline runs", archived)
+    await schedule_archival(job.session_factory, delay=0 if backlog else settings.archive_interval)
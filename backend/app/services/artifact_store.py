@@ -0,0 +1,244 @@
+"""
+Content-addressed artifact storage.
+
+Stage artifacts (transcripts, code submissions, audio) live outside the
+database, keyed by the SHA-256 of their bytes; StageResult.artifacts only
+holds references. Identical content is stored once.
+
+Blobs are compressed in fixed-size, independently compressed blocks with an
+offset table, so a byte range can be served by memory-mapping the file and
+decompressing only the blocks it overlaps. Content that does not compress
+(e.g. audio) is stored raw and range reads are plain mmap slices.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.config import settings
+
+# magic, codec, block size, raw size, block count
+_HEADER = struct.Struct("<4sBIQI")
+_OFFSET = struct.Struct("<Q")
+_MAGIC = b"CAS1"
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+
+REF_PREFIX = "sha256:"
+
+
+class ArtifactNotFoundError(KeyError):
+    """No blob is stored under the requested digest."""
+
+
+@dataclass(frozen=True)
+class ArtifactRef:
+    """Reference to a stored blob, as kept in StageResult.artifacts."""
+
+    digest: str
+    size: int
+    media_type: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"ref": REF_PREFIX + self.digest, "size": self.size, "media_type": self.media_type}
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "ArtifactRef":
+        return cls(
+            digest=value["ref"][len(REF_PREFIX) :],
+            size=value["size"],
+            media_type=value["media_type"],
+        )
+
+
+def is_artifact_ref(value: Any) -> bool:
+    """Whether an artifacts entry is a reference rather than inline data."""
+    return isinstance(value, dict) and str(value.get("ref", "")).startswith(REF_PREFIX)
+
+
+def encode_artifact(value: Any) -> Tuple[bytes, str]:
+    """
+    Serialize an inline artifact value to bytes.
+
+    Args:
+        value: bytes (stored as-is), str (UTF-8 text) or any JSON value
+
+    Returns:
+        Tuple of (data, media_type)
+    """
+    if isinstance(value, bytes):
+        return value, "application/octet-stream"
+    if isinstance(value, str):
+        return value.encode("utf-8"), "text/plain; charset=utf-8"
+    return json.dumps(value, separators=(",", ":")).encode("utf-8"), "application/json"
+
+
+def decode_artifact(data: bytes, media_type: str) -> Any:
+    """Inverse of encode_artifact: bytes back to the inline artifact value."""
+    if media_type == "application/json":
+        return json.loads(data)
+    if media_type.startswith("text/"):
+        return data.decode("utf-8")
+    return data
+
+
+class ArtifactStore:
+    """Interface for artifact storage backends."""
+
+    def put(self, data: bytes, media_type: str = "application/octet-stream") -> ArtifactRef:
+        """Store a blob (a no-op if the same content is already stored)."""
+        raise NotImplementedError
+
+    def exists(self, digest: str) -> bool:
+        raise NotImplementedError
+
+    def size(self, digest: str) -> int:
+        """Uncompressed size of a stored blob."""
+        raise NotImplementedError
+
+    def read_range(
+        self, digest: str, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Yield the uncompressed bytes [start, stop) of a blob in chunks."""
+        raise NotImplementedError
+
+    def get(self, digest: str) -> bytes:
+        """Read a whole blob."""
+        return b"".join(self.read_range(digest))
+
+    def put_artifacts(self, artifacts: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Move inline artifact values into the store.
+
+        Args:
+            artifacts: {name: value}; values that are already references are kept
+
+        Returns:
+            {name: reference} suitable for StageResult.artifacts
+        """
+        refs = {}
+        for name, value in artifacts.items():
+            if is_artifact_ref(value):
+                refs[name] = value
+            else:
+                refs[name] = self.put(*encode_artifact(value)).to_json()
+        return refs
+
+
+class FilesystemArtifactStore(ArtifactStore):
+    """
+    Artifact store on a local directory: <root>/<aa>/<bb>/<sha256 hex>.
+
+    Writes go to a temporary file that is atomically renamed into place, so
+    concurrent puts of the same content are safe and readers never see a
+    partial blob.
+    """
+
+    def __init__(self, root: str | os.PathLike, block_size: int = 256 * 1024, level: int = 6):
+        self.root = Path(root)
+        self.block_size = block_size
+        self.level = level
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise ArtifactNotFoundError(digest)
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def put(self, data: bytes, media_type: str = "application/octet-stream") -> ArtifactRef:
+        digest = hashlib.sha256(data).hexdigest()
+        ref = ArtifactRef(digest=digest, size=len(data), media_type=media_type)
+        path = self._path(digest)
+        if path.exists():
+            return ref
+
+        blocks = [
+            zlib.compress(data[offset : offset + self.block_size], self.level)
+            for offset in range(0, len(data), self.block_size)
+        ]
+        compressed_size = sum(len(block) for block in blocks)
+        # Incompressible content (audio, archives) is kept raw
+        codec = _CODEC_ZLIB if compressed_size < 0.9 * len(data) else _CODEC_RAW
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, codec, self.block_size, len(data), len(blocks)))
+                if codec == _CODEC_RAW:
+                    f.write(data)
+                else:
+                    offset = 0
+                    for block in blocks:
+                        f.write(_OFFSET.pack(offset))
+                        offset += len(block)
+                    f.write(_OFFSET.pack(offset))
+                    for block in blocks:
+                        f.write(block)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return ref
+
+    def exists(self, digest: str) -> bool:
+        try:
+            return self._path(digest).exists()
+        except ArtifactNotFoundError:
+            return False
+
+    def _read_header(self, f) -> Tuple[int, int, int, int]:
+        magic, codec, block_size, raw_size, block_count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("Not an artifact blob")
+        return codec, block_size, raw_size, block_count
+
+    def size(self, digest: str) -> int:
+        try:
+            with open(self._path(digest), "rb") as f:
+                return self._read_header(f)[2]
+        except FileNotFoundError:
+            raise ArtifactNotFoundError(digest) from None
+
+    def read_range(
+        self, digest: str, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[bytes]:
+        try:
+            f = open(self._path(digest), "rb")
+        except FileNotFoundError:
+            raise ArtifactNotFoundError(digest) from None
+        with f:
+            codec, block_size, raw_size, block_count = self._read_header(f)
+            stop = raw_size if stop is None else min(stop, raw_size)
+            if start >= stop:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if codec == _CODEC_RAW:
+                    for offset in range(start, stop, block_size):
+                        begin = _HEADER.size + offset
+                        yield mapped[begin : begin + min(block_size, stop - offset)]
+                    return
+
+                table = _HEADER.size
+                data_start = table + (block_count + 1) * _OFFSET.size
+                for index in range(start // block_size, (stop - 1) // block_size + 1):
+                    (begin,) = _OFFSET.unpack_from(mapped, table + index * _OFFSET.size)
+                    (end,) = _OFFSET.unpack_from(mapped, table + (index + 1) * _OFFSET.size)
+                    block = zlib.decompress(mapped[data_start + begin : data_start + end])
+                    block_start = index * block_size
+                    yield block[max(start - block_start, 0) : stop - block_start]
+
+
+@lru_cache(maxsize=1)
+def get_artifact_store() -> ArtifactStore:
+    """Process-wide artifact store configured by settings (also a FastAPI dependency)."""
+    return FilesystemArtifactStore(
+        settings.artifact_store_path, block_size=settings.artifact_block_size
+    )
@@ -0,0 +1,347 @@
+"""
+Hiring debrief engine (SRS §14).
+
+For every candidate of a job profile:
+
+    EvidenceScore = Σ(weight × rating × confidence) − ConsistencyPenalty
+
+over their interview scorecards (StageResult.raw_scores "overall_rating"
+1-4 and "confidence" 0-1), followed by the bar rules and decision
+thresholds. Weights are normalized over the scorecards a candidate has;
+the consistency penalty grows with the spread of their ratings.
+
+A cohort is loaded once into columnar NumPy arrays (candidates x interview
+stages), and a policy (weights, thresholds, bar rules) is evaluated on the
+whole array at once, so calibration "what-if" runs over 100k candidates
+take milliseconds. Loaded cohorts are cached until the profile's stage
+results change. Decisions are persisted as debrief StageResults in bulk.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import utcnow
+from app.models import PipelineRun, StageResult
+from app.models.stage_result import StageDecision
+from app.services.job_queue import JobContext, job_handler
+
+STAGE_NAME = "debrief"
+DEBRIEF_JOB = "debrief.run"
+
+# Interview stage -> rubric category used by weights and bar rules
+STAGE_CATEGORIES: Dict[str, str] = {
+    "onsite_coding_1": "coding",
+    "onsite_coding_2": "coding",
+    "onsite_behavioral": "behavioral",
+    "onsite_design_lite": "design",
+}
+
+# Decision codes in Debrief.decisions
+NO_HIRE, HOLD, HIRE = 0, 1, 2
+DECISION_NAMES = ("no_hire", "hold", "hire")
+STAGE_DECISIONS = (StageDecision.FAIL, StageDecision.HOLD, StageDecision.PASS)
+
+
+@dataclass(frozen=True)
+class DebriefPolicy:
+    """Weights, thresholds and bar rules of a debrief (defaults per SRS §14)."""
+
+    # Keyed by stage name or category; a stage name takes precedence
+    weights: Dict[str, float] = field(
+        default_factory=lambda: {"coding": 1.0, "behavioral": 1.0, "design": 1.0}
+    )
+    consistency_weight: float = 0.25  # Penalty per rating point of standard deviation
+    hire_threshold: float = 2.85
+    no_hire_threshold: float = 2.6
+    min_coding_hire_ratings: int = 2  # Coding interviews rated >= 3
+    min_behavioral_rating: float = 2.0
+
+    def stage_weights(self, stages: Sequence[str]) -> np.ndarray:
+        """Weight of each stage column."""
+        return np.array(
+            [
+                self.weights.get(stage, self.weights.get(STAGE_CATEGORIES.get(stage, ""), 1.0))
+                for stage in stages
+            ],
+            dtype=np.float64,
+        )
+
+
+@dataclass(frozen=True)
+class Cohort:
+    """A job profile's scorecards as columnar arrays (rows: runs, columns: stages)."""
+
+    run_ids: np.ndarray  # (n,) int64, ascending
+    stages: Tuple[str, ...]  # (m,)
+    ratings: np.ndarray  # (n, m) float64, NaN where the scorecard is missing
+    confidence: np.ndarray  # (n, m) float64, 0 where missing
+    killer: np.ndarray  # (n,) bool: any scorecard reported a killer signal
+
+    def __len__(self) -> int:
+        return len(self.run_ids)
+
+    def category_columns(self, category: str) -> np.ndarray:
+        return np.array(
+            [j for j, stage in enumerate(self.stages) if STAGE_CATEGORIES.get(stage) == category],
+            dtype=np.intp,
+        )
+
+
+@dataclass(frozen=True)
+class Debrief:
+    """Vectorized debrief of a cohort under one policy (one entry per run)."""
+
+    evidence_scores: np.ndarray
+    consistency_penalties: np.ndarray
+    bar_met: np.ndarray
+    complete: np.ndarray  # Every interview stage has a scorecard
+    decisions: np.ndarray  # int8 NO_HIRE / HOLD / HIRE
+
+    def counts(self) -> Dict[str, int]:
+        """Decision counts over complete runs."""
+        decided = self.decisions[self.complete]
+        return {
+            name: int(np.count_nonzero(decided == code)) for code, name in enumerate(DECISION_NAMES)
+        }
+
+
+def evaluate(cohort: Cohort, policy: DebriefPolicy = DebriefPolicy()) -> Debrief:
+    """
+    Score a whole cohort under a policy.
+
+    Pure NumPy over the cohort arrays; no database access.
+    """
+    ratings, confidence = cohort.ratings, cohort.confidence
+    present = ~np.isnan(ratings)
+    filled = np.where(present, ratings, 0.0)
+    scorecards = present.sum(axis=1)
+
+    # Weights normalized over the scorecards each candidate has
+    weights = np.where(present, policy.stage_weights(cohort.stages), 0.0)
+    weight_sums = weights.sum(axis=1, keepdims=True)
+    weights = np.divide(weights, weight_sums, out=np.zeros_like(weights), where=weight_sums > 0)
+    weighted = (weights * filled * confidence).sum(axis=1)
+
+    # Standard deviation of the ratings present (0 for fewer than two)
+    mean = np.divide(
+        filled.sum(axis=1), scorecards, out=np.zeros(len(cohort)), where=scorecards > 0
+    )
+    variance = np.divide(
+        (np.where(present, filled - mean[:, None], 0.0) ** 2).sum(axis=1),
+        scorecards,
+        out=np.zeros(len(cohort)),
+        where=scorecards > 0,
+    )
+    penalties = policy.consistency_weight * np.sqrt(variance)
+    evidence = weighted - penalties
+
+    # Bar rules; comparisons with a missing (NaN) rating are False
+    coding = ratings[:, cohort.category_columns("coding")]
+    behavioral = ratings[:, cohort.category_columns("behavioral")]
+    bar_met = (
+        ((coding >= 3).sum(axis=1) >= policy.min_coding_hire_ratings)
+        & ~(coding <= 1).any(axis=1)
+        & (behavioral >= policy.min_behavioral_rating).all(axis=1)
+    )
+
+    decisions = np.select(
+        [
+            cohort.killer | ~bar_met | (evidence < policy.no_hire_threshold),
+            evidence >= policy.hire_threshold,
+        ],
+        [NO_HIRE, HIRE],
+        default=HOLD,
+    ).astype(np.int8)
+    return Debrief(
+        evidence_scores=evidence,
+        consistency_penalties=penalties,
+        bar_met=bar_met,
+        complete=present.all(axis=1),
+        decisions=decisions,
+    )
+
+
+class CohortCache:
+    """
+    Small LRU of loaded cohorts, keyed by job profile and a fingerprint of its
+    stage results (count, max id, max updated_at), so any new or edited
+    scorecard causes a reload.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, Tuple[tuple, Cohort]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_profile_id: int, fingerprint: tuple) -> Optional[Cohort]:
+        with self._lock:
+            entry = self._entries.get(job_profile_id)
+            if entry is None or entry[0] != fingerprint:
+                return None
+            self._entries.move_to_end(job_profile_id)
+            return entry[1]
+
+    def put(self, job_profile_id: int, fingerprint: tuple, cohort: Cohort) -> None:
+        with self._lock:
+            self._entries[job_profile_id] = (fingerprint, cohort)
+            self._entries.move_to_end(job_profile_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+cohort_cache = CohortCache()
+
+
+async def _fingerprint(db: AsyncSession, job_profile_id: int) -> tuple:
+    row = (
+        await db.execute(
+            select(
+                func.count(StageResult.id),
+                func.max(StageResult.id),
+                func.max(StageResult.updated_at),
+            )
+            .join(PipelineRun, PipelineRun.id == StageResult.pipeline_run_id)
+            .where(
+                PipelineRun.job_profile_id == job_profile_id,
+                StageResult.stage_name.in_(list(STAGE_CATEGORIES)),
+            )
+        )
+    ).one()
+    return tuple(row)
+
+
+async def load_cohort(
+    db: AsyncSession, job_profile_id: int, stages: Sequence[str] = tuple(STAGE_CATEGORIES)
+) -> Cohort:
+    """
+    Load a job profile's interview scorecards into a Cohort.
+
+    Only the rating, confidence and killer signals are extracted from
+    raw_scores (in SQL), and rows are streamed into flat arrays that are
+    scattered into the (runs x stages) matrices in one step.
+    """
+    fingerprint = await _fingerprint(db, job_profile_id)
+    cohort = cohort_cache.get(job_profile_id, fingerprint)
+    if cohort is not None:
+        return cohort
+
+    stages = tuple(stages)
+    column = {stage: j for j, stage in enumerate(stages)}
+    stmt = (
+        select(
+            StageResult.pipeline_run_id,
+            StageResult.stage_name,
+            StageResult.raw_scores["overall_rating"].as_float(),
+            StageResult.raw_scores["confidence"].as_float(),
+            StageResult.raw_scores["killer_signals"],
+        )
+        .join(PipelineRun, PipelineRun.id == StageResult.pipeline_run_id)
+        .where(PipelineRun.job_profile_id == job_profile_id, StageResult.stage_name.in_(stages))
+        # Latest scorecard per (run, stage) wins when scattered below
+        .order_by(StageResult.id)
+        .execution_options(yield_per=10000)
+    )
+    run_col: List[int] = []
+    stage_col: List[int] = []
+    rating_col: List[float] = []
+    confidence_col: List[float] = []
+    killer_runs: List[int] = []
+    async for partition in (await db.stream(stmt)).partitions():
+        for run_id, stage_name, rating, conf, killer_signals in partition:
+            run_col.append(run_id)
+            stage_col.append(column[stage_name])
+            rating_col.append(np.nan if rating is None else rating)
+            confidence_col.append(1.0 if conf is None else conf)
+            if killer_signals:
+                killer_runs.append(run_id)
+
+    run_ids = np.unique(np.asarray(run_col, dtype=np.int64))
+    rows = np.searchsorted(run_ids, np.asarray(run_col, dtype=np.int64))
+    cols = np.asarray(stage_col, dtype=np.intp)
+    ratings = np.full((len(run_ids), len(stages)), np.nan)
+    confidence = np.zeros((len(run_ids), len(stages)))
+    ratings[rows, cols] = rating_col
+    confidence[rows, cols] = np.clip(confidence_col, 0.0, 1.0)
+    confidence[np.isnan(ratings)] = 0.0
+    killer = np.isin(run_ids, np.asarray(killer_runs, dtype=np.int64))
+
+    cohort = Cohort(
+        run_ids=run_ids, stages=stages, ratings=ratings, confidence=confidence, killer=killer
+    )
+    cohort_cache.put(job_profile_id, fingerprint, cohort)
+    return cohort
+
+
+async def persist_decisions(
+    db: AsyncSession, cohort: Cohort, debrief: Debrief, policy_name: str = "default"
+) -> int:
+    """
+    Replace the debrief StageResults of the cohort's complete runs.
+
+    One DELETE and one executemany INSERT in the caller's transaction
+    (the caller commits).
+
+    Returns:
+        Number of decisions written
+    """
+    indices = np.flatnonzero(debrief.complete)
+    run_ids = cohort.run_ids[indices].tolist()
+    if not run_ids:
+        return 0
+
+    await db.execute(
+        delete(StageResult)
+        .where(StageResult.stage_name == STAGE_NAME, StageResult.pipeline_run_id.in_(run_ids))
+        .execution_options(synchronize_session=False)
+    )
+    now = utcnow()
+    evidence = debrief.evidence_scores[indices].tolist()
+    penalties = debrief.consistency_penalties[indices].tolist()
+    bar_met = debrief.bar_met[indices].tolist()
+    killer = cohort.killer[indices].tolist()
+    decisions = debrief.decisions[indices].tolist()
+    await db.execute(
+        insert(StageResult),
+        [
+            {
+                "pipeline_run_id": run_ids[i],
+                "stage_name": STAGE_NAME,
+                "stage_type": STAGE_NAME,
+                "decision": STAGE_DECISIONS[decisions[i]],
+                "raw_scores": {
+                    "evidence_score": round(evidence[i], 4),
+                    "consistency_penalty": round(penalties[i], 4),
+                    "bar_met": bar_met[i],
+                    "killer_signal": killer[i],
+                    "decision": DECISION_NAMES[decisions[i]],
+                    "policy": policy_name,
+                },
+                "artifacts": {},
+                "completed_at": now,
+            }
+            for i in range(len(run_ids))
+        ],
+    )
+    return len(run_ids)
+
+
+@job_handler(DEBRIEF_JOB)
+async def run_debrief_job(job: JobContext) -> None:
+    """Debrief a job profile's cohort and persist decisions: payload {"job_profile_id", "policy"}."""
+    policy = DebriefPolicy(**job.payload.get("policy", {}))
+    async with job.session_factory() as db:
+        cohort = await load_cohort(db, job.payload["job_profile_id"])
+        await persist_decisions(
+            db, cohort, evaluate(cohort, policy), job.payload.get("policy_name", "default")
+        )
+        await db.commit()
@@ -0,0 +1,640 @@
+"""
+Hot state for live interview sessions, persisted write-behind.
+
+A live session produces a turn every few seconds, each moving the timer,
+the hint budget and the transcript. Instead of a database transaction per
+turn, session state lives in a SessionBackend (process memory, or a local
+Redis-compatible server shared by the API workers) and every turn is
+appended to a pending queue. A background flusher writes pending turns to
+interview_turns as grouped multi-row inserts, every flush_interval seconds
+or as soon as batch_size turns are waiting.
+
+Data-loss window: with the memory backend, a hard crash loses the turns
+recorded since the last flush, i.e. at most flush_interval seconds' worth
+(INTERVIEW_FLUSH_INTERVAL). max_pending bounds how far the database may
+fall behind; past it, recording a turn flushes inline and fails if the
+database is down, rather than buffering without limit. A clean shutdown
+flushes everything, and turns that still cannot be written are spilled to
+a local JSONL file that the next start replays. With the Redis backend,
+pending turns survive API restarts in Redis itself.
+
+Inserts skip rows whose (session_id, turn_index) already exists, so a
+batch replayed after a partial failure is never duplicated. A batch the
+database refuses outright (an integrity error, e.g. its run was deleted)
+is retried turn by turn and the refused turns are logged and set aside,
+so one bad turn cannot block the queue. Turn indexes
+are assigned under a per-session lock in this process; with several
+workers behind the Redis backend, route each session to one worker.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.database import get_async_session_factory
+from app.metrics import REGISTRY, Counter, Gauge, Histogram
+from app.models import InterviewTurn
+
+logger = logging.getLogger(__name__)
+
+TURNS_PENDING = REGISTRY.register(
+    Gauge("interview_turns_pending", "Interview turns recorded but not yet in the database.")
+)
+TURNS_FLUSHED = REGISTRY.register(
+    Counter("interview_turns_flushed_total", "Interview turns written to the database.")
+)
+TURNS_REJECTED = REGISTRY.register(
+    Counter("interview_turns_rejected_total", "Interview turns the database refused, set aside.")
+)
+FLUSH_DURATION = REGISTRY.register(
+    Histogram("interview_flush_duration_seconds", "Time per interview turn batch insert.")
+)
+
+ROLES = ("interviewer", "candidate")
+
+
+class SessionNotFoundError(LookupError):
+    """No live session with this ID (never started, or expired)."""
+
+
+class SessionEndedError(ValueError):
+    """The session has ended and takes no more turns."""
+
+
+class HintBudgetExhaustedError(ValueError):
+    """The candidate has used every hint the session allows."""
+
+
+class SessionStoreBackpressureError(RuntimeError):
+    """Too many turns are waiting for the database; retry shortly."""
+
+
+@dataclass
+class TurnRecord:
+    """A recorded turn waiting to be written to interview_turns."""
+
+    session_id: str
+    pipeline_run_id: int
+    stage_name: str
+    turn_index: int
+    role: str
+    content: str
+    elapsed_seconds: float
+    hints_used: int
+    recorded_at: float  # Epoch seconds
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "TurnRecord":
+        return cls(**value)
+
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for an interview_turns insert."""
+        row = self.to_json()
+        row["turn_metadata"] = row.pop("metadata")
+        row["recorded_at"] = datetime.fromtimestamp(self.recorded_at, tz=timezone.utc)
+        return row
+
+
+@dataclass
+class SessionState:
+    """Hot state of one interview session."""
+
+    session_id: str
+    pipeline_run_id: int
+    stage_name: str
+    started_at: float  # Epoch seconds
+    time_limit_seconds: float
+    hint_budget: int
+    hints_used: int = 0
+    turn_count: int = 0
+    ended_at: Optional[float] = None
+    recent_turns: List[Dict[str, Any]] = field(default_factory=list)  # Newest last
+
+    def elapsed_seconds(self, now: Optional[float] = None) -> float:
+        end = self.ended_at if self.ended_at is not None else (now or time.time())
+        return max(0.0, end - self.started_at)
+
+    def remaining_seconds(self, now: Optional[float] = None) -> float:
+        return max(0.0, self.time_limit_seconds - self.elapsed_seconds(now))
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "SessionState":
+        return cls(**value)
+
+
+class SessionBackend:
+    """Where hot session state and the pending-turn queue live."""
+
+    # Pending turns survive a restart of this process
+    durable = False
+
+    async def get_state(self, session_id: str) -> Optional[SessionState]:
+        raise NotImplementedError
+
+    async def set_state(self, state: SessionState, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def push_pending(self, records: List[TurnRecord]) -> int:
+        """Append turns to the pending queue; returns the queue length."""
+        raise NotImplementedError
+
+    async def pop_pending(self, limit: int) -> List[TurnRecord]:
+        """Remove and return up to limit of the oldest pending turns."""
+        raise NotImplementedError
+
+    async def requeue_pending(self, records: List[TurnRecord]) -> None:
+        """Put popped turns back at the front of the queue, in order."""
+        raise NotImplementedError
+
+    async def pending_count(self) -> int:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemorySessionBackend(SessionBackend):
+    """Session state and pending turns in this process (no serialization)."""
+
+    def __init__(self):
+        self._states: Dict[str, Tuple[float, SessionState]] = {}
+        self._pending: Deque[TurnRecord] = deque()
+        self._lock = threading.Lock()
+
+    async def get_state(self, session_id: str) -> Optional[SessionState]:
+        with self._lock:
+            entry = self._states.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._states[session_id]
+                return None
+            return entry[1]
+
+    async def set_state(self, state: SessionState, ttl: float) -> None:
+        with self._lock:
+            self._states[state.session_id] = (time.time() + ttl, state)
+
+    async def push_pending(self, records: List[TurnRecord]) -> int:
+        with self._lock:
+            self._pending.extend(records)
+            return len(self._pending)
+
+    async def pop_pending(self, limit: int) -> List[TurnRecord]:
+        with self._lock:
+            return [self._pending.popleft() for _ in range(min(limit, len(self._pending)))]
+
+    async def requeue_pending(self, records: List[TurnRecord]) -> None:
+        with self._lock:
+            self._pending.extendleft(reversed(records))
+
+    async def pending_count(self) -> int:
+        return len(self._pending)
+
+    def expire(self) -> int:
+        """Drop expired sessions; returns how many."""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._states.items() if expires_at <= now]
+            for key in expired:
+                del self._states[key]
+        return len(expired)
+
+
+class RedisSessionBackend(SessionBackend):
+    """
+    Session state and pending turns in a Redis-compatible server (Redis,
+    Valkey, KeyDB, ...), shared by every API worker on the host. Needs the
+    optional redis package.
+    """
+
+    durable = True
+
+    def __init__(self, url: str, prefix: str = "interview:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:
+            raise RuntimeError(
+                "The redis session backend needs the redis package (pip install redis)"
+            ) from exc
+        self.client = redis_asyncio.from_url(url)
+        self.prefix = prefix
+        self._pending_key = f"{prefix}pending"
+
+    async def get_state(self, session_id: str) -> Optional[SessionState]:
+        raw = await self.client.get(f"{self.prefix}session:{session_id}")
+        return SessionState.from_json(json.loads(raw)) if raw is not None else None
+
+    async def set_state(self, state: SessionState, ttl: float) -> None:
+        await self.client.set(
+            f"{self.prefix}session:{state.session_id}",
+            json.dumps(state.to_json(), separators=(",", ":")),
+            ex=max(1, int(ttl)),
+        )
+
+    async def push_pending(self, records: List[TurnRecord]) -> int:
+        return await self.client.rpush(self._pending_key, *map(_dump_record, records))
+
+    async def pop_pending(self, limit: int) -> List[TurnRecord]:
+        # LRANGE + LTRIM in one transaction, so concurrent flushers never share a batch
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.lrange(self._pending_key, 0, limit - 1)
+            pipe.ltrim(self._pending_key, limit, -1)
+            raw, _ = await pipe.execute()
+        return [TurnRecord.from_json(json.loads(item)) for item in raw]
+
+    async def requeue_pending(self, records: List[TurnRecord]) -> None:
+        if records:
+            await self.client.lpush(self._pending_key, *map(_dump_record, reversed(records)))
+
+    async def pending_count(self) -> int:
+        return await self.client.llen(self._pending_key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def _dump_record(record: TurnRecord) -> str:
+    return json.dumps(record.to_json(), separators=(",", ":"))
+
+
+def _insert_turns(dialect: str, rows: List[Dict[str, Any]]):
+    """Multi-row insert that skips turns already written (replayed batches)."""
+    keys = ["session_id", "turn_index"]
+    if dialect == "postgresql":
+        stmt = postgresql.insert(InterviewTurn).on_conflict_do_nothing(index_elements=keys)
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(InterviewTurn).on_conflict_do_nothing(index_elements=keys)
+    else:
+        stmt = insert(InterviewTurn)
+    return stmt.values(rows)
+
+
+class InterviewSessionStore:
+    """
+    Live interview sessions: hot state in a SessionBackend, turns written
+    behind to interview_turns.
+
+    Usage:
+        store = InterviewSessionStore(session_factory)
+        await store.start()
+        state = await store.create_session(run_id, "onsite_coding_1", 2700, hint_budget=3)
+        state, turn = await store.record_turn(state.session_id, "candidate", "...")
+        ...
+        await store.stop()  # Flushes (or spills) every pending turn
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        backend: Optional[SessionBackend] = None,
+        *,
+        flush_interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        session_ttl: Optional[float] = None,
+        spill_path: Optional[str] = None,
+        recent_turns: int = 20,
+    ):
+        """
+        Args:
+            session_factory: Sessions for the batch inserts
+            backend: Hot state and pending queue (default: in memory)
+            flush_interval: Max seconds a turn waits before being written (the
+                data-loss window on a crash)
+            batch_size: Turns per insert; a full batch is flushed right away
+            max_pending: Pending turns past which recording flushes inline
+            session_ttl: Seconds an idle session's state is kept
+            spill_path: JSONL file for turns that could not be written at
+                shutdown; replayed on start. Empty disables spilling.
+            recent_turns: Turns kept in SessionState.recent_turns
+        """
+        self.session_factory = session_factory
+        self.backend = backend or MemorySessionBackend()
+        self.flush_interval = (
+            settings.interview_flush_interval if flush_interval is None else flush_interval
+        )
+        self.batch_size = settings.interview_flush_batch_size if batch_size is None else batch_size
+        self.max_pending = settings.interview_max_pending if max_pending is None else max_pending
+        self.session_ttl = settings.interview_session_ttl if session_ttl is None else session_ttl
+        spill_path = settings.interview_spill_path if spill_path is None else spill_path
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.recent_turns = recent_turns
+
+        self._session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._spill_replayed = False
+
+    async def start(self) -> None:
+        """Replay spilled turns and start the background flusher."""
+        self._bind_loop()
+        self._stopping = False
+        await self._replay_spill()
+        self._flusher = asyncio.create_task(self._flush_loop(), name="interview-flusher")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Stop the flusher and write every pending turn.
+
+        Turns that cannot be written within timeout (e.g. the database is
+        down) are spilled to spill_path when the backend is not durable.
+        """
+        self._stopping = True
+        if self._flusher is not None:
+            self._wakeup.set()
+            await self._flusher
+            self._flusher = None
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except Exception:
+            logger.exception("Final interview turn flush failed")
+            await self._spill()
+        await self.backend.close()
+
+    async def create_session(
+        self,
+        pipeline_run_id: int,
+        stage_name: str,
+        time_limit_seconds: float,
+        hint_budget: int = 0,
+    ) -> SessionState:
+        """Start a session; its timer starts now."""
+        state = SessionState(
+            session_id=uuid.uuid4().hex,
+            pipeline_run_id=pipeline_run_id,
+            stage_name=stage_name,
+            started_at=time.time(),
+            time_limit_seconds=time_limit_seconds,
+            hint_budget=hint_budget,
+        )
+        await self.backend.set_state(state, self.session_ttl)
+        return state
+
+    async def get_session(self, session_id: str) -> SessionState:
+        """
+        Raises:
+            SessionNotFoundError: Unknown or expired session
+        """
+        state = await self.backend.get_state(session_id)
+        if state is None:
+            raise SessionNotFoundError(session_id)
+        return state
+
+    async def record_turn(
+        self,
+        session_id: str,
+        role: str,
+        content: str,
+        *,
+        use_hint: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[SessionState, TurnRecord]:
+        """
+        Record a turn: update the hot state and queue the turn for writing.
+
+        Args:
+            session_id: Live session
+            role: "interviewer" or "candidate"
+            content: Message text
+            use_hint: The turn spends one hint from the budget
+            metadata: Extra data stored with the turn
+
+        Returns:
+            (updated state, queued turn)
+
+        Raises:
+            SessionNotFoundError: Unknown or expired session
+            SessionEndedError: The session has ended
+            HintBudgetExhaustedError: use_hint with no hints left
+            SessionStoreBackpressureError: The database is too far behind
+        """
+        if role not in ROLES:
+            raise ValueError(f"Unknown role: {role}")
+        await self._make_room()
+        async with self._session_lock(session_id):
+            state = await self.get_session(session_id)
+            if state.ended_at is not None:
+                raise SessionEndedError(session_id)
+            if use_hint and state.hints_used >= state.hint_budget:
+                raise HintBudgetExhaustedError(session_id)
+
+            now = time.time()
+            state.hints_used += int(use_hint)
+            record = TurnRecord(
+                session_id=session_id,
+                pipeline_run_id=state.pipeline_run_id,
+                stage_name=state.stage_name,
+                turn_index=state.turn_count,
+                role=role,
+                content=content,
+                elapsed_seconds=round(state.elapsed_seconds(now), 3),
+                hints_used=state.hints_used,
+                recorded_at=now,
+                metadata=metadata or {},
+            )
+            state.turn_count += 1
+            state.recent_turns = [
+                *state.recent_turns[-(self.recent_turns - 1) :],
+                {"turn_index": record.turn_index, "role": role, "content": content},
+            ]
+            await self.backend.set_state(state, self.session_ttl)
+            pending = await self.backend.push_pending([record])
+
+        TURNS_PENDING.set(value=pending)
+        if pending >= self.batch_size:
+            self._wake()
+        return state, record
+
+    async def end_session(self, session_id: str) -> SessionState:
+        """Stop the session's timer and write its pending turns now."""
+        async with self._session_lock(session_id):
+            state = await self.get_session(session_id)
+            if state.ended_at is None:
+                state.ended_at = time.time()
+                await self.backend.set_state(state, self.session_ttl)
+        await self.flush()
+        return state
+
+    async def flush(self) -> int:
+        """
+        Write every pending turn in batch_size inserts; returns how many.
+
+        A failed batch is put back at the front of the queue and the error
+        re-raised. A batch failing with an integrity error is written turn
+        by turn instead, and the turns the database refuses are set aside.
+        """
+        self._bind_loop()
+        written = 0
+        async with self._flush_lock:
+            while batch := await self.backend.pop_pending(self.batch_size):
+                start = time.perf_counter()
+                try:
+                    await self._insert(batch)
+                except IntegrityError:
+                    batch = await self._insert_each(batch)
+                except BaseException:
+                    await self.backend.requeue_pending(batch)
+                    raise
+                FLUSH_DURATION.observe(value=time.perf_counter() - start)
+                TURNS_FLUSHED.inc(amount=len(batch))
+                written += len(batch)
+            if self._spill_replayed:
+                # Everything replayed from the spill file is now in the database
+                self.spill_path.unlink(missing_ok=True)
+                self._spill_replayed = False
+        TURNS_PENDING.set(value=await self.backend.pending_count())
+        return written
+
+    async def _insert(self, records: List[TurnRecord]) -> None:
+        async with self.session_factory() as db:
+            dialect = db.get_bind().dialect.name
+            # One multi-row VALUES statement per batch
+            await db.execute(_insert_turns(dialect, [record.to_row() for record in records]))
+            await db.commit()
+
+    async def _insert_each(self, batch: List[TurnRecord]) -> List[TurnRecord]:
+        """
+        Write a batch the database refused one turn at a time, setting aside
+        (logging) the turns it refuses for good; returns the turns written.
+        On any other error the unwritten rest is requeued.
+        """
+        written, rejected = [], []
+        for position, record in enumerate(batch):
+            try:
+                await self._insert([record])
+            except IntegrityError as exc:
+                rejected.append(record)
+                logger.error(
+                    "Interview turn refused by the database, set aside: %s (%s)",
+                    _dump_record(record),
+                    exc.orig,
+                )
+            except BaseException:
+                await self.backend.requeue_pending(batch[position:])
+                raise
+            else:
+                written.append(record)
+        TURNS_REJECTED.inc(amount=len(rejected))
+        return written
+
+    async def _make_room(self) -> None:
+        if await self.backend.pending_count() < self.max_pending:
+            return
+        try:
+            await self.flush()
+        except Exception as exc:
+            raise SessionStoreBackpressureError("Interview turns are not being persisted") from exc
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+        return lock
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _flush_loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._stopping:
+                return
+            try:
+                await self.flush()
+            except Exception:
+                # e.g. the database is briefly unreachable; the batch was requeued
+                logger.exception("Interview turn flush failed; retrying")
+            if isinstance(self.backend, MemorySessionBackend):
+                self.backend.expire()
+
+    async def _spill(self) -> None:
+        if self.spill_path is None or self.backend.durable:
+            return
+        records = []
+        while batch := await self.backend.pop_pending(self.batch_size):
+            records.extend(batch)
+        if not records:
+            return
+        # Replaces the file: replayed-but-unwritten turns are among the records
+        lines = "".join(_dump_record(record) + "\n" for record in records)
+        await asyncio.to_thread(_write_file, self.spill_path, lines)
+        logger.warning("Spilled %d interview turns to %s", len(records), self.spill_path)
+
+    async def _replay_spill(self) -> None:
+        if self.spill_path is None or not self.spill_path.exists():
+            return
+        text = await asyncio.to_thread(self.spill_path.read_text, encoding="utf-8")
+        records = [TurnRecord.from_json(json.loads(line)) for line in text.splitlines() if line]
+        await self.backend.push_pending(records)
+        # The file is removed once a flush has drained the queue (see flush)
+        self._spill_replayed = True
+        logger.info("Replaying %d spilled interview turns", len(records))
+
+
+def _write_file(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=1)
+def get_session_store() -> InterviewSessionStore:
+    """Process-wide session store configured by settings (also a FastAPI dependency)."""
+    backend = (
+        RedisSessionBackend(settings.interview_redis_url)
+        if settings.interview_redis_url
+        else MemorySessionBackend()
+    )
+    return InterviewSessionStore(get_async_session_factory(), backend)
@@ -0,0 +1,504 @@
+"""
+Durable in-process job queue.
+
+Work is enqueued as a row in the jobs table inside the caller's transaction,
+so it commits (or rolls back) together with the state change that caused it
+and the request returns without waiting for the work. A JobQueue running in
+the app process claims due jobs in priority order and runs their handlers
+with bounded concurrency on one of three executors:
+
+- "async": coroutine handlers on the event loop (I/O-bound work)
+- "thread": blocking handlers in a thread pool
+- "process": CPU-bound handlers in a process pool (arguments must pickle)
+
+Failed jobs are retried with exponential backoff up to max_attempts. Claims
+are leased: a RUNNING job whose worker died is requeued once its lease
+expires, so a crash loses no work and handlers must be idempotent.
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import get_async_session_factory, utcnow
+from app.metrics import REGISTRY, Counter, Gauge, Histogram
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("async", "thread", "process")
+
+MAX_ERROR_LENGTH = 4000
+
+JOB_RUNS = REGISTRY.register(
+    Counter("jobs_total", "Job attempts by kind and outcome.", ("kind", "outcome"))
+)
+JOB_DURATION = REGISTRY.register(
+    Histogram("job_duration_seconds", "Job handler run time.", ("kind",))
+)
+JOB_ACTIVE = REGISTRY.register(Gauge("jobs_active", "Jobs currently running.", ("executor",)))
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    """A registered handler for one job kind."""
+
+    kind: str
+    func: Callable[..., Any]
+    executor: str = "async"
+
+
+@dataclass(frozen=True)
+class JobContext:
+    """Argument passed to async handlers (thread/process handlers get the payload only)."""
+
+    job_id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempt: int
+    session_factory: async_sessionmaker
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """A job row this worker has leased."""
+
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    priority: int
+    attempts: int
+    max_attempts: int
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+# Modules whose job_handler registrations a default queue needs. Routers
+# that only enqueue work import these lazily, so the app starts without
+# loading them (and numpy); a queue imports them when it is created.
+JOB_HANDLER_MODULES = (
+    "app.services.archive",
+    "app.services.debrief",
+    "app.services.resume_screening",
+    "app.services.stage_execution",
+)
+
+
+def job_handler(kind: str, executor: str = "async") -> Callable[[Callable], Callable]:
+    """
+    Register a function as the handler for a job kind.
+
+    Args:
+        kind: Job kind the handler runs
+        executor: "async" (coroutine taking a JobContext), "thread" or
+            "process" (plain function taking the payload dict; process
+            handlers must be importable module-level functions)
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}")
+
+    def register(func: Callable) -> Callable:
+        JOB_HANDLERS[kind] = JobHandler(kind=kind, func=func, executor=executor)
+        return func
+
+    return register
+
+
+def load_job_handlers() -> Dict[str, JobHandler]:
+    """Import every module in JOB_HANDLER_MODULES and return the handler registry."""
+    for module in JOB_HANDLER_MODULES:
+        importlib.import_module(module)
+    return JOB_HANDLERS
+
+
+def default_backoff(attempt: int) -> float:
+    """Seconds to wait before retrying after the given (1-based) failed attempt."""
+    delay = min(settings.job_retry_backoff * 2 ** (attempt - 1), settings.job_retry_backoff_max)
+    # Jitter spreads out retries of jobs that failed together
+    return delay * random.uniform(0.5, 1.0)
+
+
+_running_queues: Set["JobQueue"] = set()
+
+
+def _notify_running_queues(session) -> None:
+    for queue in list(_running_queues):
+        queue.notify()
+
+
+def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: Optional[Dict[str, Any]] = None,
+    *,
+    priority: int = 0,
+    pipeline_run_id: Optional[int] = None,
+    max_attempts: Optional[int] = None,
+    delay: float = 0,
+) -> Job:
+    """
+    Add a job to the caller's transaction.
+
+    The job becomes visible to workers when the caller commits; running
+    queues in this process are woken on commit instead of waiting for
+    their next poll.
+
+    Args:
+        db: Session whose transaction the job is part of
+        kind: Registered job kind
+        payload: JSON-serializable handler arguments
+        priority: Higher runs first
+        pipeline_run_id: Pipeline run the job belongs to, if any
+        max_attempts: Attempts before the job is marked FAILED
+        delay: Seconds before the job may run
+
+    Returns:
+        The pending Job (its id is assigned on flush)
+    """
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        priority=priority,
+        pipeline_run_id=pipeline_run_id,
+        max_attempts=max_attempts or settings.job_max_attempts,
+        run_after=utcnow() + timedelta(seconds=delay),
+    )
+    db.add(job)
+    event.listen(db.sync_session, "after_commit", _notify_running_queues, once=True)
+    return job
+
+
+class JobQueue:
+    """
+    Claims jobs from the jobs table and runs them with bounded concurrency.
+
+    Usage:
+        queue = JobQueue(session_factory)
+        await queue.start()
+        ...
+        await queue.stop()
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        *,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        backoff: Callable[[int], float] = default_backoff,
+        worker_id: Optional[str] = None,
+    ):
+        """
+        Args:
+            session_factory: Sessions for claiming and recording jobs
+            handlers: Job kind -> handler (defaults to the job_handler registry)
+            concurrency: Max concurrently running jobs per executor
+            poll_interval: Seconds between checks for due retries
+            lease_seconds: Age after which a RUNNING job is presumed abandoned
+            backoff: Retry delay in seconds for a failed attempt number
+            worker_id: Name recorded in Job.locked_by
+        """
+        self.session_factory = session_factory
+        self.handlers = load_job_handlers() if handlers is None else handlers
+        self.concurrency = {
+            "async": settings.job_async_concurrency,
+            "thread": settings.job_thread_workers,
+            "process": settings.job_process_workers,
+            **(concurrency or {}),
+        }
+        self.poll_interval = settings.job_poll_interval if poll_interval is None else poll_interval
+        self.lease_seconds = settings.job_lease_seconds if lease_seconds is None else lease_seconds
+        self.backoff = backoff
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+
+        self._active = {executor: 0 for executor in EXECUTORS}
+        self._pools: Dict[str, Executor] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start the dispatcher on the running event loop."""
+        self._bind_loop()
+        self._stopping = False
+        self._dispatcher = asyncio.create_task(self._dispatch_loop(), name="job-dispatcher")
+        _running_queues.add(self)
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Stop claiming jobs and wait for running ones.
+
+        Jobs still running after timeout are cancelled and put back in the
+        queue to run again on the next start.
+        """
+        _running_queues.discard(self)
+        self._stopping = True
+        if self._dispatcher is not None:
+            self.notify()
+            await self._dispatcher
+            self._dispatcher = None
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools.clear()
+
+    async def run_until_idle(self) -> None:
+        """Run jobs until none are due or running (for scripts and tests; no dispatcher)."""
+        self._bind_loop()
+        while True:
+            claimed = await self._fill()
+            if not claimed and not self._tasks:
+                return
+            if self._tasks:
+                await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    def notify(self) -> None:
+        """Wake the dispatcher (safe to call from any thread)."""
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def requeue_expired(self) -> int:
+        """
+        Return RUNNING jobs whose lease has expired to the queue.
+
+        A job that has already used its last attempt is marked FAILED
+        instead, so a job that keeps killing its worker does not loop.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        now = utcnow()
+        expired = (Job.status == JobStatus.RUNNING) & (
+            Job.locked_at < now - timedelta(seconds=self.lease_seconds)
+        )
+        async with self.session_factory() as db:
+            failed = await db.execute(
+                update(Job)
+                .where(expired, Job.attempts >= Job.max_attempts)
+                .values(
+                    status=JobStatus.FAILED,
+                    last_error="Worker lease expired",
+                    locked_by=None,
+                    locked_at=None,
+                    finished_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            requeued = await db.execute(
+                update(Job)
+                .where(expired)
+                .values(status=JobStatus.QUEUED, locked_by=None, locked_at=None, run_after=now)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return failed.rowcount + requeued.rowcount
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+
+    async def _dispatch_loop(self) -> None:
+        # Jobs left RUNNING by a crashed process are requeued on the first pass
+        next_requeue = time.monotonic()
+        while not self._stopping:
+            # Cleared before claiming, so a notify during the claim is not lost
+            self._wakeup.clear()
+            try:
+                if time.monotonic() >= next_requeue:
+                    await self.requeue_expired()
+                    next_requeue = time.monotonic() + self.poll_interval
+                await self._fill()
+            except Exception:
+                # e.g. the database is briefly unreachable; retry on the next poll
+                logger.exception("Job dispatcher failed to claim jobs")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fill(self) -> int:
+        """Claim as many due jobs as there are free slots, per executor."""
+        claimed = 0
+        for executor in EXECUTORS:
+            free = self.concurrency[executor] - self._active[executor]
+            kinds = [
+                kind for kind, handler in self.handlers.items() if handler.executor == executor
+            ]
+            if free <= 0 or not kinds:
+                continue
+            for job in await self._claim(kinds, free):
+                self._spawn(job, self.handlers[job.kind])
+                claimed += 1
+        return claimed
+
+    async def _claim(self, kinds: List[str], limit: int) -> List[ClaimedJob]:
+        """
+        Lease up to limit due jobs of the given kinds, highest priority first.
+
+        One UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+        RETURNING, so concurrent workers (other processes on PostgreSQL)
+        never claim the same row.
+        """
+        now = utcnow()
+        due = (
+            select(Job.id)
+            .where(
+                Job.status == JobStatus.QUEUED,
+                Job.kind.in_(kinds),
+                Job.run_after <= now,
+            )
+            .order_by(Job.priority.desc(), Job.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        async with self.session_factory() as db:
+            rows = (
+                await db.execute(
+                    update(Job)
+                    .where(Job.id.in_(due.scalar_subquery()), Job.status == JobStatus.QUEUED)
+                    .values(
+                        status=JobStatus.RUNNING,
+                        attempts=Job.attempts + 1,
+                        locked_by=self.worker_id,
+                        locked_at=now,
+                    )
+                    .returning(
+                        Job.id,
+                        Job.kind,
+                        Job.payload,
+                        Job.priority,
+                        Job.attempts,
+                        Job.max_attempts,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+            ).all()
+            await db.commit()
+        jobs = [ClaimedJob(*row) for row in rows]
+        # RETURNING order is unspecified; start the most urgent first
+        jobs.sort(key=lambda job: (-job.priority, job.id))
+        return jobs
+
+    def _spawn(self, job: ClaimedJob, handler: JobHandler) -> None:
+        self._active[handler.executor] += 1
+        JOB_ACTIVE.inc(handler.executor)
+        task = asyncio.create_task(self._execute(job, handler), name=f"job-{job.id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _pool(self, executor: str) -> Executor:
+        pool = self._pools.get(executor)
+        if pool is None:
+            workers = max(self.concurrency[executor], 1)
+            if executor == "thread":
+                pool = ThreadPoolExecutor(workers, thread_name_prefix="job-worker")
+            else:
+                # Forking a process that runs an event loop and driver threads is unsafe
+                pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+            self._pools[executor] = pool
+        return pool
+
+    async def _execute(self, job: ClaimedJob, handler: JobHandler) -> None:
+        start = time.perf_counter()
+        outcome = "succeeded"
+        try:
+            if handler.executor == "async":
+                await handler.func(
+                    JobContext(
+                        job_id=job.id,
+                        kind=job.kind,
+                        payload=job.payload,
+                        attempt=job.attempts,
+                        session_factory=self.session_factory,
+                    )
+                )
+            else:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._pool(handler.executor), partial(handler.func, job.payload)
+                )
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            await asyncio.shield(self._release(job))
+            raise
+        except Exception as error:
+            outcome = await self._record_failure(job, error)
+        else:
+            await self._record_success(job)
+        finally:
+            self._active[handler.executor] -= 1
+            JOB_ACTIVE.dec(handler.executor)
+            JOB_RUNS.inc(job.kind, outcome)
+            JOB_DURATION.observe(job.kind, value=time.perf_counter() - start)
+            self.notify()
+
+    def _owned(self, job: ClaimedJob):
+        """Match the job only while this claim still holds it (not requeued and re-claimed)."""
+        return (
+            (Job.id == job.id) & (Job.status == JobStatus.RUNNING) & (Job.attempts == job.attempts)
+        )
+
+    async def _finish(self, job: ClaimedJob, **values: Any) -> None:
+        async with self.session_factory() as db:
+            await db.execute(
+                update(Job)
+                .where(self._owned(job))
+                .values(locked_by=None, locked_at=None, **values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+    async def _record_success(self, job: ClaimedJob) -> None:
+        await self._finish(job, status=JobStatus.SUCCEEDED, finished_at=utcnow())
+
+    async def _record_failure(self, job: ClaimedJob, error: Exception) -> str:
+        message = "".join(traceback.format_exception(error))[-MAX_ERROR_LENGTH:]
+        if job.attempts >= job.max_attempts:
+            logger.error("Job %s (%s) failed permanently: %s", job.id, job.kind, error)
+            await self._finish(
+                job, status=JobStatus.FAILED, last_error=message, finished_at=utcnow()
+            )
+            return "failed"
+        delay = self.backoff(job.attempts)
+        logger.warning("Job %s (%s) failed, retrying in %.1fs: %s", job.id, job.kind, delay, error)
+        await self._finish(
+            job,
+            status=JobStatus.QUEUED,
+            last_error=message,
+            run_after=utcnow() + timedelta(seconds=delay),
+        )
+        return "retried"
+
+    async def _release(self, job: ClaimedJob) -> None:
+        """Put an interrupted job back without charging it an attempt."""
+        await self._finish(job, status=JobStatus.QUEUED, attempts=job.attempts - 1)
+
+
+@lru_cache(maxsize=1)
+def get_job_queue() -> JobQueue:
+    """Process-wide job queue on the app's database."""
+    return JobQueue(get_async_session_factory())
@@ -0,0 +1,71 @@
+"""
+LLM gateway.
+
+Every model call (job ingest, resume screening, interviewer, grader,
+debrief) goes through LLMGateway.complete, which serves a request from the
+response cache, by joining an identical call already in flight, or from the
+configured provider, and records tokens and latency per request. Bulk work
+(e.g. grading a cohort) uses complete_many, which micro-batches provider
+calls.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict
+
+from app.config import settings
+from app.services.llm_gateway.base import (
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    PromptTemplate,
+    cache_key,
+    normalize_prompt,
+)
+from app.services.llm_gateway.cache import ResponseCache
+from app.services.llm_gateway.gateway import CallRecord, LLMGateway, MicroBatcher
+from app.services.llm_gateway.stub import StubProvider
+
+# Provider name (settings.llm_provider) -> factory
+PROVIDERS: Dict[str, Callable[[], LLMProvider]] = {
+    "stub": StubProvider,
+}
+
+
+def register_provider(name: str, factory: Callable[[], LLMProvider]) -> None:
+    """Make a provider selectable with LLM_PROVIDER=<name>."""
+    PROVIDERS[name] = factory
+
+
+@lru_cache(maxsize=1)
+def get_llm_gateway() -> LLMGateway:
+    """Process-wide gateway configured by settings (also a FastAPI dependency)."""
+    factory = PROVIDERS.get(settings.llm_provider)
+    if factory is None:
+        raise ValueError(f"Unknown LLM provider: {settings.llm_provider}")
+    return LLMGateway(
+        factory(),
+        cache=ResponseCache(
+            maxsize=settings.llm_cache_size,
+            ttl=settings.llm_cache_ttl,
+            path=settings.llm_cache_path or None,
+        ),
+        batch_size=settings.llm_batch_size,
+        batch_wait=settings.llm_batch_wait,
+    )
+
+
+__all__ = [
+    "CallRecord",
+    "LLMGateway",
+    "LLMProvider",
+    "LLMRequest",
+    "LLMResponse",
+    "MicroBatcher",
+    "PromptTemplate",
+    "ResponseCache",
+    "StubProvider",
+    "cache_key",
+    "get_llm_gateway",
+    "normalize_prompt",
+    "register_provider",
+]
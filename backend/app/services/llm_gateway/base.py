@@ -0,0 +1,127 @@
+"""Request/response types and the provider interface."""
+
+import hashlib
+import json
+import math
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """One completion request."""
+
+    prompt: str
+    system: Optional[str] = None
+    model: Optional[str] = None  # Provider default when unset
+    template: str = ""  # Name of the prompt template that produced the prompt
+    template_version: str = ""
+    params: Dict[str, Any] = field(default_factory=dict)  # e.g. temperature, max_tokens
+    cache: bool = True  # Set False for requests that must reach the provider
+
+
+@dataclass(frozen=True)
+class LLMResponse:
+    """A completion and what it cost."""
+
+    text: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    latency: float  # Seconds spent in the provider (0 for cache hits)
+    cached: bool = False
+    coalesced: bool = False  # Shared the result of an identical in-flight call
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "latency": self.latency,
+        }
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "LLMResponse":
+        return cls(**value)
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    Versioned prompt template.
+
+    Bump version whenever the wording changes so cached responses for the
+    old wording stop matching.
+    """
+
+    name: str
+    version: str
+    template: str  # str.format placeholders
+    system: Optional[str] = None
+
+    def render(self, params: Optional[Dict[str, Any]] = None, **variables: Any) -> LLMRequest:
+        """Fill in the template and build a request tagged with its name and version."""
+        return LLMRequest(
+            prompt=self.template.format(**variables),
+            system=self.system,
+            template=self.name,
+            template_version=self.version,
+            params=params or {},
+        )
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    Canonical form of a prompt for cache keys.
+
+    Normalizes Unicode (NFC), line endings and trailing whitespace, which
+    vary between callers without changing meaning. Indentation and inner
+    whitespace are kept since they can matter (e.g. code).
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip("\n")
+
+
+def cache_key(request: LLMRequest, model: str) -> str:
+    """Key of a request: normalized prompt and system message, template version, model, params."""
+    payload = json.dumps(
+        [
+            model,
+            request.template,
+            request.template_version,
+            normalize_prompt(request.system or ""),
+            normalize_prompt(request.prompt),
+            request.params,
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token) for providers that report none."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+class LLMProvider:
+    """Interface for model backends."""
+
+    name = "base"
+    default_model = ""
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Run one completion."""
+        raise NotImplementedError
+
+    async def complete_batch(self, requests: List[LLMRequest]) -> List[LLMResponse]:
+        """
+        Run several completions, in request order.
+
+        Providers with a batch endpoint override this to send one call;
+        the default runs them one by one.
+        """
+        return [await self.complete(request) for request in requests]
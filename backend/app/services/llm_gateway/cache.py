@@ -0,0 +1,126 @@
+"""Two-tier (memory LRU + disk) response cache."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.services.llm_gateway.base import LLMResponse
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU of responses with a TTL, backed by an optional disk tier.
+
+    The memory tier is checked first; a disk hit is promoted into memory.
+    Disk entries are one JSON file per key (<root>/<aa>/<key>.json) written
+    atomically, so the cache survives restarts and is shared by worker
+    processes on the same host. Expiry uses wall-clock time so it holds
+    across processes.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 86400.0, path: Optional[str] = None):
+        """
+        Args:
+            maxsize: Max entries kept in memory
+            ttl: Seconds an entry stays valid (both tiers)
+            path: Directory of the disk tier; None keeps the cache in memory only
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.root = Path(path) if path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, LLMResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Memory-tier lookup (marks the entry recently used); None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            if self.root is None:
+                self.misses += 1
+            return None
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store in the memory tier, evicting the least recently used entry when full."""
+        self._remember(key, time.time() + self.ttl, response)
+
+    def load(self, key: str) -> Optional[LLMResponse]:
+        """Disk-tier lookup (blocking file I/O); a hit is promoted into memory."""
+        if self.root is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        if entry["expires_at"] <= time.time():
+            self._path(key).unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+        response = LLMResponse.from_json(entry["response"])
+        self._remember(key, entry["expires_at"], response)
+        with self._lock:
+            self.disk_hits += 1
+        return response
+
+    def persist(self, key: str, response: LLMResponse) -> None:
+        """Write an entry to the disk tier (blocking file I/O)."""
+        if self.root is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"expires_at": time.time() + self.ttl, "response": response.to_json()}
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Drop the memory tier and reset counters (the disk tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current memory size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def _remember(self, key: str, expires_at: float, response: LLMResponse) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
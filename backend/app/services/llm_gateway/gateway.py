@@ -0,0 +1,247 @@
+"""The gateway every model call goes through."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.metrics import REGISTRY, Counter, Histogram
+from app.services.llm_gateway.base import LLMProvider, LLMRequest, LLMResponse, cache_key
+from app.services.llm_gateway.cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+LLM_REQUESTS = REGISTRY.register(
+    Counter(
+        "llm_requests_total",
+        "LLM gateway requests by how they were served (called, cached, coalesced, error).",
+        ("provider", "template", "source"),
+    )
+)
+LLM_TOKENS = REGISTRY.register(
+    Counter(
+        "llm_tokens_total",
+        "Tokens sent to and received from providers (cache hits excluded).",
+        ("provider", "template", "direction"),
+    )
+)
+LLM_LATENCY = REGISTRY.register(
+    Histogram(
+        "llm_request_duration_seconds",
+        "LLM gateway request latency, including cache lookups and batching waits.",
+        ("provider", "template"),
+    )
+)
+
+
+@dataclass(frozen=True)
+class CallRecord:
+    """Per-request accounting kept in LLMGateway.recent_calls."""
+
+    template: str
+    model: str
+    source: str  # "called", "cached", "coalesced" or "error"
+    input_tokens: int
+    output_tokens: int
+    latency: float  # Seconds the caller waited
+
+
+class MicroBatcher:
+    """
+    Groups requests submitted close together into provider batch calls.
+
+    A batch is sent when it reaches max_size or max_wait seconds after its
+    first request, whichever comes first.
+    """
+
+    def __init__(self, provider: LLMProvider, max_size: int = 16, max_wait: float = 0.02):
+        self.provider = provider
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[LLMRequest, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, request: LLMRequest) -> LLMResponse:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._send(batch))
+
+    async def _send(self, batch: List[Tuple[LLMRequest, asyncio.Future]]) -> None:
+        # Runs detached (nobody awaits it): every caller's future must be
+        # resolved whatever happens, or that caller waits forever
+        try:
+            responses = await self.provider.complete_batch([request for request, _ in batch])
+            if len(responses) != len(batch):
+                raise RuntimeError(
+                    f"Provider {self.provider.name!r} returned {len(responses)} responses "
+                    f"for a batch of {len(batch)} requests"
+                )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), response in zip(batch, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
+
+
+class LLMGateway:
+    """
+    Single entry point for model calls.
+
+    Each request is served, in order of preference, from the response cache,
+    by joining an identical call already in flight, or by the provider
+    (directly, or micro-batched for bulk work). Tokens and latency of every
+    request are recorded in metrics and recent_calls.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: Optional[ResponseCache] = None,
+        batch_size: int = 16,
+        batch_wait: float = 0.02,
+        history: int = 1000,
+    ):
+        """
+        Args:
+            provider: Model backend
+            cache: Response cache (None disables caching)
+            batch_size: Max requests per provider batch call
+            batch_wait: Seconds to wait for a batch to fill
+            history: Number of CallRecords kept in recent_calls
+        """
+        self.provider = provider
+        self.cache = cache
+        self.batcher = MicroBatcher(provider, max_size=batch_size, max_wait=batch_wait)
+        self.recent_calls: Deque[CallRecord] = deque(maxlen=history)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def complete(self, request: LLMRequest, *, batch: bool = False) -> LLMResponse:
+        """
+        Complete one request.
+
+        Args:
+            request: The request
+            batch: Send through the micro-batcher (for bulk, latency-tolerant work)
+
+        Returns:
+            The response; cached / coalesced tell how it was served
+        """
+        start = time.perf_counter()
+        model = request.model or self.provider.default_model
+        key = cache_key(request, model)
+        source = "called"
+        try:
+            response = await self._cached(key) if request.cache else None
+            if response is not None:
+                source = "cached"
+                response = replace(response, latency=0.0, cached=True)
+            else:
+                task = self._inflight.get(key)
+                if task is not None:
+                    source = "coalesced"
+                else:
+                    task = asyncio.ensure_future(self._call(key, request, batch))
+                    self._inflight[key] = task
+                    task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+                # Shielded so one caller giving up does not cancel the shared call
+                response = await asyncio.shield(task)
+                if source == "coalesced":
+                    response = replace(response, coalesced=True)
+        except Exception:
+            source = "error"
+            raise
+        finally:
+            self._record(request, model, source, response if source != "error" else None, start)
+        return response
+
+    async def complete_many(self, requests: List[LLMRequest]) -> List[LLMResponse]:
+        """Complete many requests concurrently, micro-batching the provider calls."""
+        return list(await asyncio.gather(*(self.complete(r, batch=True) for r in requests)))
+
+    def usage(self) -> Dict[str, float]:
+        """Totals over recent_calls."""
+        calls = list(self.recent_calls)
+        return {
+            "requests": len(calls),
+            "provider_calls": sum(call.source == "called" for call in calls),
+            "cached": sum(call.source == "cached" for call in calls),
+            "coalesced": sum(call.source == "coalesced" for call in calls),
+            "errors": sum(call.source == "error" for call in calls),
+            "input_tokens": sum(call.input_tokens for call in calls if call.source == "called"),
+            "output_tokens": sum(call.output_tokens for call in calls if call.source == "called"),
+            "latency_seconds": round(sum(call.latency for call in calls), 6),
+        }
+
+    async def _cached(self, key: str) -> Optional[LLMResponse]:
+        if self.cache is None:
+            return None
+        response = self.cache.get(key)
+        if response is None and self.cache.root is not None:
+            response = await asyncio.to_thread(self.cache.load, key)
+        return response
+
+    async def _call(self, key: str, request: LLMRequest, batch: bool) -> LLMResponse:
+        if batch:
+            response = await self.batcher.submit(request)
+        else:
+            response = await self.provider.complete(request)
+        if self.cache is not None and request.cache:
+            self.cache.put(key, response)
+            if self.cache.root is not None:
+                await asyncio.to_thread(self.cache.persist, key, response)
+        return response
+
+    def _record(
+        self,
+        request: LLMRequest,
+        model: str,
+        source: str,
+        response: Optional[LLMResponse],
+        start: float,
+    ) -> None:
+        latency = time.perf_counter() - start
+        record = CallRecord(
+            template=request.template,
+            model=model,
+            source=source,
+            input_tokens=response.input_tokens if response else 0,
+            output_tokens=response.output_tokens if response else 0,
+            latency=latency,
+        )
+        self.recent_calls.append(record)
+
+        provider, template = self.provider.name, request.template or "-"
+        LLM_REQUESTS.inc(provider, template, source)
+        LLM_LATENCY.observe(provider, template, value=latency)
+        if source == "called":
+            LLM_TOKENS.inc(provider, template, "input", amount=record.input_tokens)
+            LLM_TOKENS.inc(provider, template, "output", amount=record.output_tokens)
+            logger.debug(
+                "LLM call template=%s model=%s tokens=%d/%d latency=%.3fs",
+                template,
+                model,
+                record.input_tokens,
+                record.output_tokens,
+                latency,
+            )
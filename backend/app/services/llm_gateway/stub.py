@@ -0,0 +1,65 @@
+"""Deterministic local provider for development and tests."""
+
+import asyncio
+import hashlib
+import time
+from typing import Callable, List, Optional
+
+from app.services.llm_gateway.base import LLMProvider, LLMRequest, LLMResponse, estimate_tokens
+
+
+class StubProvider(LLMProvider):
+    """
+    Provider that answers locally without a model.
+
+    The same request always gets the same text, so cached, coalesced and
+    fresh responses can be compared exactly.
+    """
+
+    name = "stub"
+    default_model = "stub-1"
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[LLMRequest], str]] = None,
+        latency: float = 0.0,
+    ):
+        """
+        Args:
+            responder: Builds the response text (default: a digest of the prompt)
+            latency: Simulated seconds per provider call (a batch is one call)
+        """
+        self.responder = responder or self._default_response
+        self.latency = latency
+        self.calls = 0
+        self.batch_calls = 0
+
+    @staticmethod
+    def _default_response(request: LLMRequest) -> str:
+        digest = hashlib.sha256(request.prompt.encode("utf-8")).hexdigest()[:16]
+        return f"stub response {digest}"
+
+    def _respond(self, request: LLMRequest, latency: float) -> LLMResponse:
+        text = self.responder(request)
+        return LLMResponse(
+            text=text,
+            model=request.model or self.default_model,
+            input_tokens=estimate_tokens((request.system or "") + request.prompt),
+            output_tokens=estimate_tokens(text),
+            latency=latency,
+        )
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        start = time.perf_counter()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(request, time.perf_counter() - start)
+
+    async def complete_batch(self, requests: List[LLMRequest]) -> List[LLMResponse]:
+        self.batch_calls += 1
+        start = time.perf_counter()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        latency = time.perf_counter() - start
+        return [self._respond(request, latency) for request in requests]
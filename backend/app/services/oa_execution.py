@@ -0,0 +1,664 @@
+"""
+Sandboxed execution of online assessment (OA) submissions.
+
+Candidate code never runs in the API process. Each hidden test runs in a
+fresh, locked-down Python subprocess:
+
+- an unprivileged user of its own (oa_sandbox_user) and a new, empty
+  network namespace (oa_sandbox_isolate_network), entered before exec; both
+  need the API to run as root
+- resource limits set before the candidate code is compiled: CPU seconds,
+  address space, no file writes, no child processes, few file descriptors
+  and no core dumps
+- isolated interpreter (-I: no environment variables, user site or cwd on
+  sys.path), an empty environment, and the solution handed over as an
+  inherited file descriptor of a directory only the API can read
+- a wall-clock limit enforced by the parent, which kills the whole process
+  group, and a cap on captured output
+
+Without a sandbox user, candidate code runs as the API's own user and can
+read whatever the API can (its environment via /proc, the hidden tests,
+.env), so that is for development only. With one, the hidden tests and
+.env are made unreadable to other users at startup. Only the last line of
+a failing test's stderr (normally the exception) is reported back.
+
+The subprocesses form a bounded pool (SandboxExecutor.workers), so the tests
+of one submission run in parallel while a burst of submissions queues
+instead of overloading the host.
+
+Reports are cached by (code hash, problem, test-set version), so a
+resubmission of the same code, or regrading against an unchanged test set,
+returns immediately. Changing the tests means bumping the version.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import math
+import os
+import signal
+import stat
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, replace
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.metrics import REGISTRY, Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+OA_TESTS = REGISTRY.register(
+    Counter("oa_tests_total", "OA test executions by outcome.", ("problem", "status"))
+)
+OA_SUBMISSIONS = REGISTRY.register(
+    Counter("oa_submissions_total", "OA submissions by how they were served.", ("source",))
+)
+OA_TEST_DURATION = REGISTRY.register(
+    Histogram("oa_test_duration_seconds", "Wall-clock time per sandboxed test.", ("problem",))
+)
+
+# Exit code the harness uses when the candidate code runs out of memory
+_MEMORY_EXIT = 86
+# Harness trailer on stderr carrying the measured runtime of the candidate code
+_RUNTIME_MARKER = "\n__oa_runtime_ms__="
+# Longest error line reported back to the candidate
+_ERROR_SUMMARY = 300
+_CLONE_NEWNET = 0x40000000
+
+# Runs in the child: lock it down, then run the solution (read from an
+# inherited file descriptor) as __main__ and report how long the candidate
+# code itself took (interpreter startup excluded).
+_HARNESS = f"""
+import os, resource, sys, time
+cpu, memory, solution = int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3])
+resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
+resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+with os.fdopen(solution, encoding="utf-8") as f:
+    code = compile(f.read(), "solution.py", "exec")
+sys.argv = ["solution.py"]
+exit_code = 0
+start = time.perf_counter()
+try:
+    exec(code, {{"__name__": "__main__", "__builtins__": __builtins__}})
+except MemoryError:
+    os._exit({_MEMORY_EXIT})
+except SystemExit as exc:
+    if exc.code is None or isinstance(exc.code, int):
+        exit_code = exc.code or 0
+    else:
+        print(exc.code, file=sys.stderr)
+        exit_code = 1
+elapsed = (time.perf_counter() - start) * 1000
+try:
+    sys.stdout.flush()
+finally:
+    sys.stderr.write({_RUNTIME_MARKER!r} + repr(elapsed) + "\\n")
+    sys.stderr.flush()
+    os._exit(exit_code)
+"""
+
+
+class OATestStatus(str, Enum):
+    """Outcome of one hidden test."""
+
+    PASSED = "PASSED"
+    WRONG_ANSWER = "WRONG_ANSWER"
+    RUNTIME_ERROR = "RUNTIME_ERROR"
+    TIME_LIMIT = "TIME_LIMIT"
+    MEMORY_LIMIT = "MEMORY_LIMIT"
+    OUTPUT_LIMIT = "OUTPUT_LIMIT"
+
+
+@dataclass(frozen=True)
+class SandboxLimits:
+    """Per-test resource limits."""
+
+    cpu_seconds: float = 2.0
+    memory_mb: int = 256
+    wall_seconds: float = 5.0
+    output_bytes: int = 64 * 1024
+
+    @classmethod
+    def from_settings(cls) -> "SandboxLimits":
+        return cls(
+            cpu_seconds=settings.oa_cpu_seconds,
+            memory_mb=settings.oa_memory_mb,
+            wall_seconds=settings.oa_wall_seconds,
+            output_bytes=settings.oa_output_kb * 1024,
+        )
+
+
+@dataclass(frozen=True)
+class OATestCase:
+    """A hidden test: stdin in, expected stdout out."""
+
+    name: str
+    stdin: str
+    expected_stdout: str
+    size: Optional[int] = None  # Input size n, for measuring how runtime scales
+
+
+@dataclass(frozen=True)
+class OATestSet:
+    """A versioned set of hidden tests for one problem."""
+
+    problem_id: str
+    version: str
+    tests: Tuple[OATestCase, ...]
+    limits: SandboxLimits = SandboxLimits()
+
+    @classmethod
+    def from_json(
+        cls, value: Dict[str, Any], limits: SandboxLimits = SandboxLimits()
+    ) -> "OATestSet":
+        """
+        Build from the on-disk format.
+
+        Args:
+            value: {"problem_id", "version", "tests": [{"name", "stdin",
+                "expected_stdout", "size"?}], "limits"?: {SandboxLimits fields}}
+            limits: Defaults for limits the test set does not override
+        """
+        return cls(
+            problem_id=str(value["problem_id"]),
+            version=str(value["version"]),
+            tests=tuple(OATestCase(**test) for test in value["tests"]),
+            limits=replace(limits, **value.get("limits", {})),
+        )
+
+
+class OATestSetRepository:
+    """
+    Test sets stored as <root>/<problem_id>.json, kept out of the API schema
+    so they stay hidden. Parsed sets are cached until the file changes.
+    """
+
+    def __init__(self, root: str | os.PathLike, limits: SandboxLimits = SandboxLimits()):
+        self.root = Path(root)
+        self.limits = limits
+        self._cache: Dict[str, Tuple[float, OATestSet]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, problem_id: str) -> OATestSet:
+        """
+        Load a problem's test set.
+
+        Raises:
+            LookupError: No test set for the problem
+        """
+        path = self.root / f"{problem_id}.json"
+        if path.parent != self.root or not problem_id:
+            raise LookupError(f"Invalid problem id: {problem_id!r}")
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            raise LookupError(f"No test set for problem {problem_id!r}") from None
+        with self._lock:
+            cached = self._cache.get(problem_id)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        with open(path, encoding="utf-8") as f:
+            test_set = OATestSet.from_json(json.load(f), self.limits)
+        with self._lock:
+            self._cache[problem_id] = (mtime, test_set)
+        return test_set
+
+
+@dataclass
+class OATestResult:
+    """Outcome and measured runtime of one test."""
+
+    name: str
+    status: OATestStatus
+    runtime_ms: float
+    size: Optional[int] = None
+    stderr: str = ""  # Last line of stderr (normally the exception), for runtime errors
+
+    def to_json(self) -> Dict[str, Any]:
+        return {**asdict(self), "status": self.status.value}
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "OATestResult":
+        return cls(**{**value, "status": OATestStatus(value["status"])})
+
+
+@dataclass
+class ExecutionReport:
+    """Results of one submission against one test-set version."""
+
+    code_hash: str
+    problem_id: str
+    test_set_version: str
+    results: List[OATestResult]
+    cached: bool = field(default=False, compare=False)
+
+    @property
+    def passed(self) -> int:
+        return sum(result.status == OATestStatus.PASSED for result in self.results)
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passed / self.total if self.results else 0.0
+
+    def scaling_exponent(self) -> Optional[float]:
+        """
+        Empirical k in runtime ~ size^k, fitted over passed tests (log-log
+        least squares); None without at least two distinct sizes.
+        """
+        points = [
+            (result.size, result.runtime_ms)
+            for result in self.results
+            if result.status == OATestStatus.PASSED and result.size and result.runtime_ms > 0
+        ]
+        if len({size for size, _ in points}) < 2:
+            return None
+        import numpy as np  # Only graded submissions need it; keeps app import light
+
+        sizes, runtimes = np.log(np.array(points, dtype=float)).T
+        return round(float(np.polyfit(sizes, runtimes, 1)[0]), 3)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "code_hash": self.code_hash,
+            "problem_id": self.problem_id,
+            "test_set_version": self.test_set_version,
+            "results": [result.to_json() for result in self.results],
+        }
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "ExecutionReport":
+        return cls(
+            code_hash=value["code_hash"],
+            problem_id=value["problem_id"],
+            test_set_version=value["test_set_version"],
+            results=[OATestResult.from_json(result) for result in value["results"]],
+        )
+
+
+def code_hash(code: str) -> str:
+    """SHA-256 of the submitted source (line endings normalized)."""
+    normalized = code.replace("\r\n", "\n").strip() + "\n"
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class ExecutionCache:
+    """
+    LRU of execution reports with an optional disk tier (one JSON file per
+    key, written atomically), so cached grades survive restarts. Entries
+    never expire: a changed test set has a new version and so a new key.
+    """
+
+    def __init__(self, maxsize: int = 2048, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.root = Path(path) if path else None
+        self._entries: OrderedDict[str, ExecutionReport] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(code_digest: str, test_set: OATestSet) -> str:
+        raw = f"{code_digest}:{test_set.problem_id}:{test_set.version}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ExecutionReport]:
+        """Memory-tier lookup."""
+        with self._lock:
+            report = self._entries.get(key)
+            if report is not None:
+                self._entries.move_to_end(key)
+            return report
+
+    def load(self, key: str) -> Optional[ExecutionReport]:
+        """Disk-tier lookup (blocking file I/O); a hit is promoted into memory."""
+        if self.root is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                report = ExecutionReport.from_json(json.load(f))
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+        self.put(key, report)
+        return report
+
+    def put(self, key: str, report: ExecutionReport) -> None:
+        """Store in the memory tier, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = report
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def persist(self, key: str, report: ExecutionReport) -> None:
+        """Write an entry to the disk tier (blocking file I/O)."""
+        if self.root is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(report.to_json(), f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Drop the memory tier (the disk tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+
+def _error_summary(stderr: str) -> str:
+    """The last non-empty line of stderr (a traceback's exception), capped."""
+    lines = stderr.strip().splitlines()
+    return lines[-1][:_ERROR_SUMMARY] if lines else ""
+
+
+def _outputs_match(actual: str, expected: str) -> bool:
+    """Compare ignoring trailing whitespace per line and trailing blank lines."""
+    return [line.rstrip() for line in actual.rstrip().splitlines()] == [
+        line.rstrip() for line in expected.rstrip().splitlines()
+    ]
+
+
+async def _read_capped(
+    stream: asyncio.StreamReader, limit: int, on_overflow: Callable[[], None]
+) -> Tuple[bytes, bool]:
+    """
+    Read a stream to EOF keeping at most limit bytes.
+
+    Past the limit, on_overflow is called once and the rest is drained and
+    discarded; the pipe has to be read to EOF for the process to be reaped.
+    """
+    chunks, size = [], 0
+    while chunk := await stream.read(64 * 1024):
+        if size <= limit:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > limit:
+                on_overflow()
+    return b"".join(chunks)[:limit], size > limit
+
+
+async def _feed(stream: asyncio.StreamWriter, data: bytes) -> None:
+    try:
+        stream.write(data)
+        await stream.drain()
+        stream.close()
+    except (BrokenPipeError, ConnectionResetError):
+        pass  # The program exited without reading all of its input
+
+
+class SandboxExecutor:
+    """Runs submissions against test sets in a bounded pool of sandboxed subprocesses."""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        cache: Optional[ExecutionCache] = None,
+        python: str = sys.executable,
+        user: Optional[str] = None,
+        isolate_network: bool = False,
+    ):
+        """
+        Args:
+            workers: Max sandboxed subprocesses running at once (process-wide)
+            cache: Report cache; None disables caching
+            python: Interpreter used for the sandboxes (must be executable by user)
+            user: Unprivileged user (name or uid) the sandboxes run as; None
+                runs them as the API's own user
+            isolate_network: Give each sandbox a new network namespace with
+                no interfaces up (Linux)
+
+        Raises:
+            ValueError: The user is unknown or root
+            PermissionError: user or isolate_network without running as root
+        """
+        self.workers = workers
+        self.cache = cache
+        self.python = python
+        self._preexec: Optional[Callable[[], None]] = None
+        if user is not None or isolate_network:
+            if os.geteuid() != 0:
+                raise PermissionError(
+                    "Running OA sandboxes as another user or without network needs root"
+                )
+            uid, gid = _resolve_user(user) if user is not None else (None, None)
+            self._preexec = functools.partial(
+                _enter_sandbox, _unshare_function() if isolate_network else None, uid, gid
+            )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def run(self, code: str, test_set: OATestSet) -> ExecutionReport:
+        """
+        Grade a submission, from the cache when this code was already run
+        against this test-set version.
+
+        Tests run in parallel, each in its own sandbox; results keep the
+        order of test_set.tests.
+        """
+        digest = code_hash(code)
+        key = ExecutionCache.key(digest, test_set) if self.cache is not None else None
+        if key is not None:
+            report = self.cache.get(key) or await asyncio.to_thread(self.cache.load, key)
+            if report is not None:
+                OA_SUBMISSIONS.inc("cached")
+                return replace(report, cached=True)
+
+        OA_SUBMISSIONS.inc("executed")
+        with tempfile.TemporaryDirectory(prefix="oa-") as workdir:
+            Path(workdir, "solution.py").write_text(code, encoding="utf-8")
+            results = await asyncio.gather(
+                *(self._run_test(workdir, test, test_set) for test in test_set.tests)
+            )
+        report = ExecutionReport(digest, test_set.problem_id, test_set.version, list(results))
+        if key is not None:
+            self.cache.put(key, report)
+            await asyncio.to_thread(self.cache.persist, key, report)
+        return report
+
+    async def _run_test(self, workdir: str, test: OATestCase, test_set: OATestSet) -> OATestResult:
+        limits = test_set.limits
+        async with self._pool_slot():
+            start = time.perf_counter()
+            status, stdout, stderr = await self._execute(workdir, test.stdin, limits)
+            wall_ms = (time.perf_counter() - start) * 1000
+        OA_TEST_DURATION.observe(test_set.problem_id, value=wall_ms / 1000)
+
+        text = stderr.decode("utf-8", "replace")
+        runtime_ms = wall_ms
+        head, marker, tail = text.rpartition(_RUNTIME_MARKER)
+        if marker:
+            text = head
+            try:
+                runtime_ms = float(tail.strip())
+            except ValueError:
+                pass
+        if status is None:
+            status = (
+                OATestStatus.PASSED
+                if _outputs_match(stdout.decode("utf-8", "replace"), test.expected_stdout)
+                else OATestStatus.WRONG_ANSWER
+            )
+        OA_TESTS.inc(test_set.problem_id, status.value)
+        return OATestResult(
+            name=test.name,
+            status=status,
+            runtime_ms=round(runtime_ms, 3),
+            size=test.size,
+            stderr=_error_summary(text) if status == OATestStatus.RUNTIME_ERROR else "",
+        )
+
+    async def _execute(
+        self, workdir: str, stdin: str, limits: SandboxLimits
+    ) -> Tuple[Optional[OATestStatus], bytes, bytes]:
+        """Run the harness once; returns (failure status or None, stdout, stderr)."""
+        # The sandbox user cannot open workdir; it gets the solution as an open file
+        solution = os.open(os.path.join(workdir, "solution.py"), os.O_RDONLY)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.python,
+                "-I",
+                "-c",
+                _HARNESS,
+                str(max(1, math.ceil(limits.cpu_seconds))),
+                str(limits.memory_mb * 1024 * 1024),
+                str(solution),
+                cwd=workdir,
+                env={"PATH": os.defpath, "LANG": "C.UTF-8"},
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                pass_fds=(solution,),
+                preexec_fn=self._preexec,
+                start_new_session=True,  # Own process group, killed as a whole
+            )
+        finally:
+            os.close(solution)
+        kill = functools.partial(_kill, process)
+        feeder = asyncio.create_task(_feed(process.stdin, stdin.encode("utf-8")))
+        readers = [
+            asyncio.create_task(_read_capped(process.stdout, limits.output_bytes, kill)),
+            asyncio.create_task(_read_capped(process.stderr, limits.output_bytes, kill)),
+        ]
+        try:
+            _, pending = await asyncio.wait(
+                {*readers, asyncio.create_task(process.wait())}, timeout=limits.wall_seconds
+            )
+            if pending:
+                kill()
+            (stdout, stdout_overflow), (stderr, stderr_overflow) = await asyncio.gather(*readers)
+            await process.wait()
+        finally:
+            feeder.cancel()
+            if process.returncode is None:
+                kill()  # Cancelled; never leave a sandbox running
+
+        status: Optional[OATestStatus] = None
+        if stdout_overflow or stderr_overflow:
+            status = OATestStatus.OUTPUT_LIMIT
+        elif pending:
+            status = OATestStatus.TIME_LIMIT
+        elif process.returncode != 0:
+            if process.returncode == _MEMORY_EXIT:
+                status = OATestStatus.MEMORY_LIMIT
+            elif process.returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+                status = OATestStatus.TIME_LIMIT  # CPU limit (soft, then hard)
+            else:
+                status = OATestStatus.RUNTIME_ERROR
+        return status, stdout, stderr
+
+    def _pool_slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.workers)
+        return self._slots
+
+
+def _resolve_user(user: str) -> Tuple[int, int]:
+    """(uid, gid) of a user name or numeric uid."""
+    import pwd
+
+    try:
+        entry = pwd.getpwuid(int(user)) if str(user).isdigit() else pwd.getpwnam(user)
+    except KeyError:
+        raise ValueError(f"Unknown OA sandbox user {user!r}") from None
+    if entry.pw_uid == 0:
+        raise ValueError("The OA sandbox user must not be root")
+    return entry.pw_uid, entry.pw_gid
+
+
+def _unshare_function() -> Callable[[int], None]:
+    """os.unshare (Python 3.12+), or unshare(2) through libc."""
+    if hasattr(os, "unshare"):
+        return os.unshare
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+
+    def unshare(flags: int) -> None:
+        if libc.unshare(flags) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    return unshare
+
+
+def _enter_sandbox(
+    unshare: Optional[Callable[[int], None]], uid: Optional[int], gid: Optional[int]
+) -> None:
+    """
+    Runs in the forked child before exec, still as root: leave the network,
+    then drop every privilege. Any failure aborts the spawn.
+    """
+    if unshare is not None:
+        unshare(_CLONE_NEWNET)
+    if uid is not None:
+        os.setgroups([])
+        os.setgid(gid)
+        os.setuid(uid)
+
+
+def _make_private(path: str) -> None:
+    """Clear the group and other permission bits of path, if it exists."""
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return
+    if mode & 0o077:
+        os.chmod(path, mode & ~0o077)
+        logger.warning("Made %s private to the API user (was mode %o)", path, mode)
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def get_oa_executor() -> SandboxExecutor:
+    """Process-wide sandbox executor configured by settings (also a FastAPI dependency)."""
+    if settings.oa_sandbox_user:
+        # Hidden tests and the API's secrets must stay out of the sandbox user's reach
+        for path in (settings.oa_test_sets_path, ".env"):
+            _make_private(path)
+    else:
+        logger.warning(
+            "OA sandboxes run as the API's own user; set OA_SANDBOX_USER outside development"
+        )
+    return SandboxExecutor(
+        workers=settings.oa_workers,
+        cache=ExecutionCache(settings.oa_cache_size, settings.oa_cache_path or None),
+        user=settings.oa_sandbox_user or None,
+        isolate_network=settings.oa_sandbox_isolate_network,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_test_sets() -> OATestSetRepository:
+    """Process-wide hidden test set repository (also a FastAPI dependency)."""
+    return OATestSetRepository(settings.oa_test_sets_path, SandboxLimits.from_settings())
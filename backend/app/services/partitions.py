@@ -0,0 +1,158 @@
+"""
+Monthly range partitions of pipeline_runs and stage_results (Postgres).
+
+Migration 011 turns both tables into tables partitioned by RANGE
+(created_at): one partition per calendar month (UTC), plus a DEFAULT
+partition for rows outside every month so an insert never fails for want
+of a partition. The archival job keeps partition_months_ahead months
+created ahead of time and drops old month partitions the archive has
+emptied, so the live indexes only span the months still in use.
+
+Everything here is a no-op where the tables are not partitioned (SQLite,
+or Postgres before migration 011).
+"""
+
+import logging
+import re
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = ("pipeline_runs", "stage_results")
+
+_MONTH_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant (UTC) of the month value falls in; naive values are taken as UTC."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """The month start months after (or before, if negative) a month start."""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of a table's partition for a month, e.g. pipeline_runs_p2026_01."""
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """Whether table is a partitioned table in the connection's database."""
+    if conn.dialect.name != "postgresql":
+        return False
+    return conn.execute(
+        text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table p JOIN pg_class c "
+            "ON c.oid = p.partrelid WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+        ),
+        {"table": table},
+    ).scalar_one()
+
+
+def create_default_partition(conn: Connection, table: str) -> str:
+    """Create the partition for rows outside every month partition."""
+    name = f"{table}_default"
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} DEFAULT"))
+    return name
+
+
+def create_month_partitions(
+    conn: Connection, table: str, first_month: datetime, last_month: datetime
+) -> List[str]:
+    """
+    Create the missing month partitions of table from first_month to last_month.
+
+    A month whose rows already sit in the DEFAULT partition cannot get its
+    own partition; it is logged and skipped, and its rows stay in DEFAULT.
+
+    Returns:
+        Names of the partitions created
+    """
+    created = []
+    month, last_month = month_start(first_month), month_start(last_month)
+    while month <= last_month:
+        name = partition_name(table, month)
+        if conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar() is None:
+            try:
+                with conn.begin_nested():
+                    conn.execute(
+                        text(
+                            f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES "
+                            f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                        )
+                    )
+            except DBAPIError:
+                logger.warning("Could not create partition %s", name, exc_info=True)
+            else:
+                created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def ensure_partitions(conn: Connection, now: datetime, months_ahead: int) -> List[str]:
+    """
+    Create the month partitions from now's month to months_ahead months later.
+
+    Returns:
+        Names of the partitions created
+    """
+    created = []
+    for table in PARTITIONED_TABLES:
+        if is_partitioned(conn, table):
+            current = month_start(now)
+            created += create_month_partitions(
+                conn, table, current, add_months(current, months_ahead)
+            )
+    return created
+
+
+def drop_empty_partitions(conn: Connection, before: datetime) -> List[str]:
+    """
+    Drop month partitions that end by before's month and hold no rows.
+
+    Args:
+        conn: Connection in the transaction to drop them in
+        before: Only months entirely before this month are considered
+
+    Returns:
+        Names of the partitions dropped
+    """
+    dropped = []
+    cutoff = month_start(before)
+    for table in PARTITIONED_TABLES:
+        if not is_partitioned(conn, table):
+            continue
+        partitions = (
+            conn.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = :table ORDER BY c.relname"
+                ),
+                {"table": table},
+            )
+            .scalars()
+            .all()
+        )
+        for name in partitions:
+            match = _MONTH_SUFFIX.search(name)
+            if match is None:
+                continue
+            month = datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)
+            if add_months(month, 1) > cutoff:
+                continue
+            if conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar_one():
+                continue
+            conn.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    return dropped
@@ -0,0 +1,248 @@
+"""
+In-process pub/sub for pipeline progress events.
+
+Dashboards watch a run through GET /pipeline/{id}/events (Server-Sent
+Events) instead of polling GET /pipeline/{id}. Code that changes a run
+(advance_pipeline, stage execution jobs, OA submissions) publishes an
+event once; the broker encodes it once and hands the same message to every
+subscriber of that run, so N watchers cost one notification, not N reads.
+
+Each subscriber has a bounded queue. A subscriber that falls behind is not
+allowed to hold memory: its backlog is dropped and it is flagged as lagged,
+and the stream answers with a fresh snapshot from the database. A short
+per-run history lets a reconnecting EventSource resume from Last-Event-ID
+without a snapshot.
+
+The broker lives in the API process, as do the job queue workers that
+publish to it; with several API processes, a watcher only sees events
+published by the process it is connected to, plus the snapshot it gets on
+(re)connect.
+"""
+
+import asyncio
+import itertools
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from app.config import settings
+from app.metrics import REGISTRY, Counter, Gauge
+from app.responses import json_dumps
+
+EVENTS_PUBLISHED = REGISTRY.register(
+    Counter("pipeline_events_published_total", "Pipeline events published.", ("type",))
+)
+EVENT_SUBSCRIBERS = REGISTRY.register(
+    Gauge("pipeline_event_subscribers", "Open pipeline event streams.")
+)
+EVENT_SUBSCRIBERS_LAGGED = REGISTRY.register(
+    Counter(
+        "pipeline_event_subscribers_lagged_total",
+        "Times a slow subscriber's backlog was dropped for a snapshot.",
+    )
+)
+
+
+@dataclass(frozen=True)
+class PipelineEvent:
+    """One event, already encoded as an SSE message."""
+
+    id: str
+    sequence: int
+    pipeline_run_id: int
+    type: str
+    data: Dict[str, Any]
+    message: str
+
+
+def encode_event(event_id: Optional[str], event_type: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    lines = [f"id: {event_id}"] if event_id else []
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json_dumps(data).decode()}")
+    return "\n".join(lines) + "\n\n"
+
+
+class PipelineSubscription:
+    """A watcher of one pipeline run; close it when the stream ends."""
+
+    def __init__(self, broker: "PipelineEventBroker", pipeline_run_id: int, queue_size: int):
+        self.pipeline_run_id = pipeline_run_id
+        self.replay: Optional[List[PipelineEvent]] = None
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self._lagged = False
+
+    def deliver(self, event: PipelineEvent) -> None:
+        """Queue an event without blocking the publisher."""
+        if self._lagged:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The snapshot sent on resync supersedes everything queued
+            self._lagged = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            EVENT_SUBSCRIBERS_LAGGED.inc()
+
+    def resync(self) -> bool:
+        """
+        Check and clear the lagged flag.
+
+        Returns:
+            True if events were dropped and the caller must send a snapshot
+        """
+        lagged, self._lagged = self._lagged, False
+        return lagged
+
+    async def get(self, timeout: float) -> Optional[PipelineEvent]:
+        """Wait for the next event; None if none arrives within timeout seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._broker._unsubscribe(self)
+
+    def __enter__(self) -> "PipelineSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _RunHistory:
+    """Recent events of one run, and the newest sequence number dropped from them."""
+
+    def __init__(self, size: int):
+        self.events: Deque[PipelineEvent] = deque(maxlen=size)
+        self.dropped_through = 0
+
+
+class PipelineEventBroker:
+    """
+    Fan-out of pipeline events to the streams watching each run.
+
+    publish() and subscribe() must be called from the event loop thread;
+    publishing never blocks and never touches the database.
+    """
+
+    def __init__(self, queue_size: int = 100, history: int = 50, history_runs: int = 1024):
+        """
+        Args:
+            queue_size: Events a subscriber may have queued before it is
+                treated as lagged
+            history: Recent events kept per run for Last-Event-ID replay
+            history_runs: Runs with history kept (least recently published dropped)
+        """
+        self.queue_size = queue_size
+        self.history = history
+        self.history_runs = history_runs
+        # Event IDs are "<instance>-<sequence>": IDs from another process
+        # (or before a restart) never match, so they fall back to a snapshot
+        self.instance = uuid.uuid4().hex[:8]
+        self._sequence = itertools.count(1)
+        self._subscribers: Dict[int, Set[PipelineSubscription]] = {}
+        self._histories: "OrderedDict[int, _RunHistory]" = OrderedDict()
+
+    def publish(self, pipeline_run_id: int, event_type: str, data: Dict[str, Any]) -> PipelineEvent:
+        """
+        Publish an event to every subscriber of a run.
+
+        Args:
+            pipeline_run_id: Run the event is about
+            event_type: SSE event name (e.g. "stage_advanced")
+            data: JSON-serializable payload
+
+        Returns:
+            The published event
+        """
+        sequence = next(self._sequence)
+        event_id = f"{self.instance}-{sequence}"
+        event = PipelineEvent(
+            id=event_id,
+            sequence=sequence,
+            pipeline_run_id=pipeline_run_id,
+            type=event_type,
+            data=data,
+            message=encode_event(event_id, event_type, data),
+        )
+        self._remember(event)
+        for subscription in list(self._subscribers.get(pipeline_run_id, ())):
+            subscription.deliver(event)
+        EVENTS_PUBLISHED.inc(event_type)
+        return event
+
+    def subscribe(
+        self, pipeline_run_id: int, last_event_id: Optional[str] = None
+    ) -> PipelineSubscription:
+        """
+        Start watching a run.
+
+        Subscribe before reading the run's snapshot, so that no event
+        published in between is missed.
+
+        Args:
+            pipeline_run_id: Run to watch
+            last_event_id: Last-Event-ID sent by a reconnecting client
+
+        Returns:
+            The subscription; its replay holds the events to resend when the
+            client can resume from last_event_id, else None (send a snapshot)
+        """
+        subscription = PipelineSubscription(self, pipeline_run_id, self.queue_size)
+        subscription.replay = self._replay(pipeline_run_id, last_event_id)
+        self._subscribers.setdefault(pipeline_run_id, set()).add(subscription)
+        EVENT_SUBSCRIBERS.inc()
+        return subscription
+
+    def subscriber_count(self, pipeline_run_id: int) -> int:
+        return len(self._subscribers.get(pipeline_run_id, ()))
+
+    def _unsubscribe(self, subscription: PipelineSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.pipeline_run_id)
+        if subscribers is None or subscription not in subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.pipeline_run_id]
+        EVENT_SUBSCRIBERS.dec()
+
+    def _remember(self, event: PipelineEvent) -> None:
+        history = self._histories.get(event.pipeline_run_id)
+        if history is None:
+            history = self._histories[event.pipeline_run_id] = _RunHistory(self.history)
+            while len(self._histories) > self.history_runs:
+                self._histories.popitem(last=False)
+        else:
+            self._histories.move_to_end(event.pipeline_run_id)
+        if len(history.events) == history.events.maxlen:
+            history.dropped_through = history.events[0].sequence
+        history.events.append(event)
+
+    def _replay(
+        self, pipeline_run_id: int, last_event_id: Optional[str]
+    ) -> Optional[List[PipelineEvent]]:
+        if not last_event_id:
+            return None
+        instance, _, sequence = last_event_id.partition("-")
+        if instance != self.instance or not sequence.isdigit():
+            return None
+        history = self._histories.get(pipeline_run_id)
+        if history is None or int(sequence) < history.dropped_through:
+            # Not sure nothing was missed
+            return None
+        return [event for event in history.events if event.sequence > int(sequence)]
+
+
+@lru_cache(maxsize=1)
+def get_event_broker() -> PipelineEventBroker:
+    """Process-wide pipeline event broker."""
+    return PipelineEventBroker(
+        queue_size=settings.pipeline_events_queue_size,
+        history=settings.pipeline_events_history,
+    )
@@ -1,10 +1,100 @@
 """Pipeline planning service."""
 
-from typing import Dict, List
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Hashable, List, Tuple
 
+from sqlalchemy import event
+
+from app.config import settings
 from app.models.job_profile import JobProfile
 from app.models.candidate import Candidate
 
+# (job_profile.id, job_profile.updated_at, candidate segment)
+PlanKey = Tuple[int, datetime | None, Hashable]
+
+
+@dataclass(frozen=True)
+class PlannedPipeline:
+    """Immutable result of planning; shared between runs through the plan cache."""
+
+    stages: Tuple[str, ...]
+
+    def materialize(self) -> tuple[List[str], Dict[str, str]]:
+        """Copy the plan into fresh (stages, stage_progress) values for a new run."""
+        return list(self.stages), dict.fromkeys(self.stages, "created")
+
+
+class PlanCache:
+    """
+    Process-wide, size-bounded LRU cache of planned pipelines.
+
+    Keys include the job profile's updated_at, so a profile edited by another
+    process simply stops matching its old entries; edits made through the ORM
+    in this process also evict them eagerly (see the JobProfile listeners below).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[PlanKey, PlannedPipeline] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: PlanKey) -> PlannedPipeline | None:
+        """Return the cached plan for key (marking it recently used), or None."""
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key: PlanKey, plan: PlannedPipeline) -> None:
+        """Store a plan, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_job_profile(self, job_profile_id: int) -> None:
+        """Drop every cached plan for a job profile."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == job_profile_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+plan_cache = PlanCache(maxsize=settings.plan_cache_size)
+
+
+@event.listens_for(JobProfile, "after_update")
+@event.listens_for(JobProfile, "after_delete")
+def _invalidate_cached_plans(mapper, connection, target: JobProfile) -> None:
+    """Evict cached plans when a JobProfile row changes."""
+    plan_cache.invalidate_job_profile(target.id)
+
 
 class PipelinePlanner:
     """
@@ -34,33 +124,83 @@ class PipelinePlanner:
     }
 
     def plan_pipeline(
-        self, job_profile: JobProfile, candidate: Candidate
+        self, job_profile: JobProfile, candidate: Candidate | None = None
     ) -> tuple[List[str], Dict[str, str]]:
         """
         Generate ordered stages and initial state for a pipeline run.
         
         Args:
             job_profile: The job profile for the role
-            candidate: The candidate metadata
+            candidate: The candidate metadata (None when planning for a whole cohort)
             
         Returns:
             Tuple of (stages_list, stage_progress_dict)
             - stages_list: ordered list of stage names
             - stage_progress_dict: initial state mapping {stage: "created"}
         """
+        return self.get_plan(job_profile, candidate).materialize()
+
+    def get_plan(
+        self, job_profile: JobProfile, candidate: Candidate | None = None
+    ) -> PlannedPipeline:
+        """
+        Get the immutable plan for a job profile and candidate, using the plan cache.
+        
+        Args:
+            job_profile: The job profile for the role
+            candidate: The candidate metadata (None when planning for a whole cohort)
+            
+        Returns:
+            PlannedPipeline shared with other runs of the same profile version
+        """
+        if job_profile.id is None:
+            # Unsaved profile: no stable identity to cache under
+            return self._build_plan(job_profile, candidate)
+
+        key = (job_profile.id, job_profile.updated_at, self.candidate_segment(candidate))
+        plan = plan_cache.get(key)
+        if plan is None:
+            plan = self._build_plan(job_profile, candidate)
+            plan_cache.put(key, plan)
+        return plan
+
+    def candidate_segment(self, candidate: Candidate | None) -> Hashable:
+        """
+        Bucket a candidate into the segment that determines their plan.
+        
+        All candidates currently share one plan per job profile version.
+        """
+        return "default"
+
+    def _build_plan(
+        self, job_profile: JobProfile, candidate: Candidate | None
+    ) -> PlannedPipeline:
+        """Build a plan from scratch (cache miss)."""
         # For now, use standard pipeline
         # Future: customize based on job_profile.interview_style_bias
-        stages = self.STANDARD_STAGES.copy()
-        
-        # Initialize all stages to "created" state
-        stage_progress = {stage: "created" for stage in stages}
+        return PlannedPipeline(stages=tuple(self.STANDARD_STAGES))
+
+    def get_next_stage_index(self, current_index: int | None, stage_count: int) -> int | None:
+        """
+        Get the position of the next stage from the stored stage cursor.
         
-        return stages, stage_progress
+        Args:
+            current_index: Current stage position (or None if at start)
+            stage_count: Number of stages in the pipeline
+            
+        Returns:
+            Next stage position, or None if at end
+        """
+        next_index = 0 if current_index is None else current_index + 1
+        return next_index if next_index < stage_count else None
 
     def get_next_stage(self, stages: List[str], current_stage: str | None) -> str | None:
         """
         Get the next stage in the pipeline.
         
+        Compatibility wrapper around get_next_stage_index for callers that
+        only have the stage name; prefer the cursor-based method.
+        
         Args:
             stages: List of all stages
             current_stage: Current stage name (or None if at start)
@@ -69,16 +209,14 @@ class PipelinePlanner:
             Next stage name, or None if at end
         """
         if current_stage is None:
-            return stages[0] if stages else None
-        
-        try:
-            current_idx = stages.index(current_stage)
-            if current_idx + 1 < len(stages):
-                return stages[current_idx + 1]
-        except ValueError:
-            pass
+            current_index = None
+        elif current_stage in stages:
+            current_index = stages.index(current_stage)
+        else:
+            return None
         
-        return None
+        next_index = self.get_next_stage_index(current_index, len(stages))
+        return stages[next_index] if next_index is not None else None
 
     def can_progress(
         self, stage_progress: Dict[str, str], stage: str, new_state: str | None = None
@@ -113,7 +251,7 @@ class PipelinePlanner:
             new_state: New state value
             
         Returns:
-            Updated stage_progress dict
+            New stage_progress dict (the input mapping is not modified)
         """
         current_state = stage_progress.get(stage, "created")
         if new_state == current_state:
@@ -127,5 +265,18 @@ class PipelinePlanner:
                 f"Invalid transition for stage '{stage}': {current_state} -> {new_state}"
             )
 
-        stage_progress[stage] = new_state
-        return stage_progress
+        return {**stage_progress, stage: new_state}
+
+    def states_entering(self, new_state: str) -> List[str]:
+        """
+        Get the states a stage may be in to transition to new_state.
+        
+        Args:
+            new_state: Target state
+            
+        Returns:
+            Source states allowed by STATE_TRANSITIONS
+        """
+        return [
+            state for state, targets in self.STATE_TRANSITIONS.items() if new_state in targets
+        ]
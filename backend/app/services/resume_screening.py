@@ -0,0 +1,440 @@
+"""
+Deterministic resume pre-screen.
+
+First pass of the resume screen, cheap enough to run on every applicant of
+a requisition: each JobProfile's requirements are compiled once into a
+single multi-pattern regex (with synonyms), every resume is scanned once
+to build a (resumes x requirements) match-count matrix, and coverage
+scores and decisions are computed on whole batches with NumPy. Large
+batches are split across a process pool and their StageResult rows are
+written with one bulk INSERT per chunk.
+
+Clear passes and clear misses are decided here; BORDERLINE results are the
+ones worth an LLM rubric review.
+"""
+
+import asyncio
+import multiprocessing
+import re
+import unicodedata
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import exists, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.database import utcnow
+from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.models.stage_result import StageDecision
+from app.services.job_queue import JobContext, job_handler
+from app.services.stage_execution import stage_executor
+
+STAGE_NAME = "resume_screen"
+SCREEN_JOB = "resume_screen.batch"
+
+# Canonical term -> aliases. A requirement mentioning any of them matches all of them.
+SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    "python": ("python3", "py"),
+    "javascript": ("js", "ecmascript"),
+    "golang": ("go lang",),
+    "c++": ("cpp", "cplusplus"),
+    "c#": ("csharp", "c sharp"),
+    "postgresql": ("postgres", "psql"),
+    "kubernetes": ("k8s",),
+    "amazon web services": ("aws",),
+    "google cloud platform": ("gcp", "google cloud"),
+    "machine learning": ("ml",),
+    "artificial intelligence": ("ai",),
+    "natural language processing": ("nlp",),
+    "continuous integration": ("ci/cd", "ci cd", "cicd"),
+    "distributed systems": ("distributed computing",),
+    "react": ("reactjs", "react.js"),
+    "node.js": ("nodejs", "node"),
+    "object oriented programming": ("oop", "object-oriented programming"),
+    "data structures": ("data structures and algorithms", "dsa"),
+}
+
+# Characters that continue a term: "c" must not match inside "c++" and vice versa
+_TERM_CHARS = r"\w+#"
+
+
+@dataclass(frozen=True)
+class CompiledRequirements:
+    """A job profile's requirements compiled into one matcher."""
+
+    names: Tuple[str, ...]  # Requirement text, in column order
+    must_have: np.ndarray  # Column indices of each requirement group
+    nice_to_have: np.ndarray
+    core_competency: np.ndarray
+    pattern: re.Pattern
+    columns: Dict[str, FrozenSet[int]] = field(repr=False)  # Matched term -> requirement columns
+
+    def count_matrix(self, texts: Sequence[Optional[str]]) -> np.ndarray:
+        """
+        Count requirement matches per resume.
+
+        Returns:
+            int32 array of shape (len(texts), len(names))
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, text in enumerate(texts):
+            if not text:
+                continue
+            for match in self.pattern.finditer(_normalize(text)):
+                for column in self.columns[" ".join(match.group().split())]:
+                    rows.append(row)
+                    cols.append(column)
+        counts = np.zeros((len(texts), len(self.names)), dtype=np.int32)
+        np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1)
+        return counts
+
+
+@dataclass(frozen=True)
+class ScreenThresholds:
+    """Score cut-offs for the pre-screen decision."""
+
+    proceed: float = settings.resume_screen_proceed_threshold
+    reject: float = settings.resume_screen_reject_threshold
+    min_must_have_coverage: float = settings.resume_screen_min_must_have_coverage
+
+
+@dataclass(frozen=True)
+class ScreenBatch:
+    """Vectorized pre-screen output for a batch of resumes (one entry per resume)."""
+
+    counts: np.ndarray  # (resumes, requirements) match counts
+    must_have_coverage: np.ndarray
+    nice_to_have_coverage: np.ndarray
+    core_competency_coverage: np.ndarray
+    scores: np.ndarray
+    decisions: np.ndarray  # StageDecision values
+
+
+@dataclass
+class ScreenSummary:
+    """What a screening run wrote."""
+
+    screened: int = 0
+    decisions: Dict[str, int] = field(default_factory=dict)
+    borderline_run_ids: List[int] = field(default_factory=list)
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _term_regex(term: str) -> str:
+    # Any run of whitespace between words, e.g. "machine\nlearning"
+    return r"\s+".join(re.escape(word) for word in term.split())
+
+
+def requirement_terms(requirement: str) -> FrozenSet[str]:
+    """Terms that count as evidence for a requirement: its own text plus synonyms."""
+    phrase = " ".join(_normalize(requirement).split())
+    terms = {phrase}
+    for canonical, aliases in SYNONYMS.items():
+        group = (canonical, *aliases)
+        if any(
+            re.search(rf"(?<![{_TERM_CHARS}]){_term_regex(term)}(?![{_TERM_CHARS}])", phrase)
+            for term in group
+        ):
+            terms.update(group)
+    return frozenset(term for term in terms if term)
+
+
+@lru_cache(maxsize=256)
+def compile_requirements(
+    must_haves: Tuple[str, ...],
+    nice_to_haves: Tuple[str, ...] = (),
+    core_competencies: Tuple[str, ...] = (),
+) -> CompiledRequirements:
+    """
+    Compile requirement lists into one matcher (cached per distinct requirement set).
+
+    All terms of all requirements go into a single alternation, longest
+    first, so each resume is scanned once however many requirements there are.
+    """
+    names = (*must_haves, *nice_to_haves, *core_competencies)
+    columns: Dict[str, set] = {}
+    for column, requirement in enumerate(names):
+        for term in requirement_terms(requirement):
+            columns.setdefault(term, set()).add(column)
+
+    alternation = "|".join(_term_regex(term) for term in sorted(columns, key=len, reverse=True))
+    pattern = re.compile(rf"(?<![{_TERM_CHARS}])(?:{alternation or '(?!)'})(?![{_TERM_CHARS}])")
+
+    offsets = np.cumsum([0, len(must_haves), len(nice_to_haves), len(core_competencies)])
+    return CompiledRequirements(
+        names=names,
+        must_have=np.arange(offsets[0], offsets[1]),
+        nice_to_have=np.arange(offsets[1], offsets[2]),
+        core_competency=np.arange(offsets[2], offsets[3]),
+        pattern=pattern,
+        columns={term: frozenset(cols) for term, cols in columns.items()},
+    )
+
+
+def compile_job_profile(job_profile: JobProfile) -> CompiledRequirements:
+    """Compiled matcher for a job profile's must-haves, nice-to-haves and core competencies."""
+    return compile_requirements(
+        tuple(job_profile.must_haves or ()),
+        tuple(job_profile.nice_to_haves or ()),
+        tuple(job_profile.core_competencies or ()),
+    )
+
+
+def _coverage(hits: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Fraction of the given requirement columns each resume matched (1.0 if there are none)."""
+    if len(columns) == 0:
+        return np.ones(hits.shape[0])
+    return hits[:, columns].mean(axis=1)
+
+
+# Weight of each requirement group in the score (renormalized over non-empty groups)
+GROUP_WEIGHTS = {"must_have": 0.6, "core_competency": 0.25, "nice_to_have": 0.15}
+
+
+def screen_batch(
+    compiled: CompiledRequirements,
+    texts: Sequence[Optional[str]],
+    thresholds: ScreenThresholds = ScreenThresholds(),
+) -> ScreenBatch:
+    """
+    Score a batch of resumes against compiled requirements.
+
+    Module-level and free of database access so it can run in a worker
+    process.
+
+    Args:
+        compiled: Output of compile_requirements
+        texts: Resume texts (None for candidates without one)
+        thresholds: Decision cut-offs
+
+    Returns:
+        ScreenBatch with per-resume coverages, scores and decisions
+    """
+    counts = compiled.count_matrix(texts)
+    hits = counts > 0
+    coverage = {group: _coverage(hits, getattr(compiled, group)) for group in GROUP_WEIGHTS}
+    present = [group for group in GROUP_WEIGHTS if len(getattr(compiled, group))]
+    total_weight = sum(GROUP_WEIGHTS[group] for group in present)
+    scores = np.zeros(len(texts))
+    for group in present:
+        scores += coverage[group] * (GROUP_WEIGHTS[group] / total_weight)
+
+    must = coverage["must_have"]
+    decisions = np.select(
+        [
+            (must < thresholds.min_must_have_coverage) | (scores < thresholds.reject),
+            (must >= 1.0) & (scores >= thresholds.proceed),
+        ],
+        [StageDecision.REJECT.value, StageDecision.PROCEED.value],
+        default=StageDecision.BORDERLINE.value,
+    )
+    return ScreenBatch(
+        counts=counts,
+        must_have_coverage=must,
+        nice_to_have_coverage=coverage["nice_to_have"],
+        core_competency_coverage=coverage["core_competency"],
+        scores=scores,
+        decisions=decisions,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_screening_pool() -> Executor:
+    """Process pool shared by screening runs (spawned lazily, sized by settings)."""
+    return ProcessPoolExecutor(
+        settings.resume_screen_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class ResumeScreener:
+    """
+    Screens the resumes of a job profile's pipeline runs and stores the results.
+
+    Resumes are read in keyset-paginated chunks; each chunk is scored in the
+    process pool while the next one is read, and written back with a
+    single bulk INSERT. Runs that already have a resume_screen result are
+    skipped, so a retried screening job only finishes the remainder.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        chunk_size: int = settings.resume_screen_chunk_size,
+        max_in_flight: int = settings.resume_screen_workers,
+        thresholds: ScreenThresholds = ScreenThresholds(),
+    ):
+        """
+        Args:
+            executor: Pool to score chunks in (None scores inline)
+            chunk_size: Resumes per chunk
+            max_in_flight: Chunks submitted to the pool before waiting on the oldest
+            thresholds: Decision cut-offs
+        """
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.max_in_flight = max(max_in_flight, 1)
+        self.thresholds = thresholds
+
+    async def screen(
+        self,
+        session_factory: async_sessionmaker,
+        job_profile_id: int,
+        pipeline_run_ids: Optional[Sequence[int]] = None,
+    ) -> ScreenSummary:
+        """
+        Pre-screen pipeline runs of a job profile.
+
+        Args:
+            session_factory: Session factory for reads and writes
+            job_profile_id: Job profile whose requirements to screen against
+            pipeline_run_ids: Runs to screen (default: all runs currently at
+                the resume_screen stage)
+
+        Returns:
+            ScreenSummary of the results written
+
+        Raises:
+            LookupError: If the job profile does not exist
+        """
+        async with session_factory() as db:
+            job_profile = await db.get(JobProfile, job_profile_id)
+            if job_profile is None:
+                raise LookupError(f"Job profile {job_profile_id} not found")
+            compiled = compile_job_profile(job_profile)
+
+        loop = asyncio.get_running_loop()
+        summary = ScreenSummary()
+        in_flight: deque = deque()
+        async for run_ids, texts in self._chunks(session_factory, job_profile_id, pipeline_run_ids):
+            if self.executor is None:
+                future = loop.create_future()
+                future.set_result(screen_batch(compiled, texts, self.thresholds))
+            else:
+                future = loop.run_in_executor(
+                    self.executor, screen_batch, compiled, texts, self.thresholds
+                )
+            in_flight.append((run_ids, future))
+            if len(in_flight) >= self.max_in_flight:
+                run_ids, future = in_flight.popleft()
+                await self._write(session_factory, compiled, run_ids, await future, summary)
+        while in_flight:
+            run_ids, future = in_flight.popleft()
+            await self._write(session_factory, compiled, run_ids, await future, summary)
+        return summary
+
+    async def _chunks(
+        self,
+        session_factory: async_sessionmaker,
+        job_profile_id: int,
+        pipeline_run_ids: Optional[Sequence[int]],
+    ):
+        """Yield ([run ids], [resume texts]) of unscreened runs, chunk_size at a time."""
+        already_screened = exists().where(
+            StageResult.pipeline_run_id == PipelineRun.id,
+            StageResult.stage_name == STAGE_NAME,
+        )
+        stmt = (
+            select(PipelineRun.id, Candidate.resume_text)
+            .join(Candidate, Candidate.id == PipelineRun.candidate_id)
+            .where(PipelineRun.job_profile_id == job_profile_id, ~already_screened)
+            .order_by(PipelineRun.id)
+            .limit(self.chunk_size)
+        )
+        if pipeline_run_ids is not None:
+            stmt = stmt.where(PipelineRun.id.in_(list(pipeline_run_ids)))
+        else:
+            stmt = stmt.where(PipelineRun.current_stage == STAGE_NAME)
+
+        last_id = 0
+        while True:
+            async with session_factory() as db:
+                rows = (await db.execute(stmt.where(PipelineRun.id > last_id))).all()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [row[0] for row in rows], [row[1] for row in rows]
+            if len(rows) < self.chunk_size:
+                return
+
+    async def _write(
+        self,
+        session_factory: async_sessionmaker,
+        compiled: CompiledRequirements,
+        run_ids: List[int],
+        batch: ScreenBatch,
+        summary: ScreenSummary,
+    ) -> None:
+        """Insert one StageResult per screened run with a single executemany INSERT."""
+        now = utcnow()
+        must_have = set(compiled.must_have.tolist())
+        matched_rows, matched_cols = np.nonzero(batch.counts)
+        matches: List[Dict[str, int]] = [{} for _ in run_ids]
+        for row, col in zip(matched_rows.tolist(), matched_cols.tolist(), strict=True):
+            matches[row][compiled.names[col]] = int(batch.counts[row, col])
+
+        rows = []
+        for i, run_id in enumerate(run_ids):
+            decision = str(batch.decisions[i])
+            rows.append(
+                {
+                    "pipeline_run_id": run_id,
+                    "stage_name": STAGE_NAME,
+                    "stage_type": STAGE_NAME,
+                    "decision": StageDecision(decision),
+                    "raw_scores": {
+                        "method": "prescreen",
+                        "score": round(float(batch.scores[i]), 4),
+                        "must_have_coverage": round(float(batch.must_have_coverage[i]), 4),
+                        "nice_to_have_coverage": round(float(batch.nice_to_have_coverage[i]), 4),
+                        "core_competency_coverage": round(
+                            float(batch.core_competency_coverage[i]), 4
+                        ),
+                        "matches": matches[i],
+                    },
+                    "strengths": [name for name in compiled.names if name in matches[i]],
+                    "concerns": [
+                        f"No evidence of must-have: {compiled.names[col]}"
+                        for col in sorted(must_have)
+                        if compiled.names[col] not in matches[i]
+                    ],
+                    "artifacts": {},
+                    "started_at": now,
+                    "completed_at": now,
+                }
+            )
+            summary.decisions[decision] = summary.decisions.get(decision, 0) + 1
+            if decision == StageDecision.BORDERLINE.value:
+                summary.borderline_run_ids.append(run_id)
+
+        async with session_factory() as db:
+            await db.execute(insert(StageResult), rows)
+            await db.commit()
+        summary.screened += len(rows)
+
+
+@job_handler(SCREEN_JOB)
+async def run_screening_job(job: JobContext) -> None:
+    """Bulk screen: payload {"job_profile_id", "pipeline_run_ids" (optional)}."""
+    await ResumeScreener(executor=get_screening_pool()).screen(
+        job.session_factory, job.payload["job_profile_id"], job.payload.get("pipeline_run_ids")
+    )
+
+
+@stage_executor(STAGE_NAME)
+async def screen_on_stage_entry(job: JobContext) -> None:
+    """Screen a single run when it enters the resume_screen stage (inline, no pool)."""
+    run_id = job.payload["pipeline_run_id"]
+    async with job.session_factory() as db:
+        job_profile_id = (
+            await db.execute(select(PipelineRun.job_profile_id).where(PipelineRun.id == run_id))
+        ).scalar_one()
+    await ResumeScreener().screen(job.session_factory, job_profile_id, [run_id])
@@ -0,0 +1,101 @@
+"""
+Stage execution jobs.
+
+Advancing a pipeline run only moves its stage cursor and enqueues a
+"stage.execute" job in the same transaction; the work a stage does
+(screening, scoring, ...) runs afterwards on the job queue. Stage types
+plug in by registering an executor for their stage name. Each execution
+publishes a "stage_execution" event to the run's watchers.
+"""
+
+from typing import Awaitable, Callable, Dict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import PipelineRun
+from app.models.job import Job
+from app.services.job_queue import JobContext, enqueue, job_handler
+from app.services.pipeline_events import get_event_broker
+
+STAGE_EXECUTE = "stage.execute"
+
+StageExecutor = Callable[[JobContext], Awaitable[None]]
+
+STAGE_EXECUTORS: Dict[str, StageExecutor] = {}
+
+
+def stage_executor(stage_name: str) -> Callable[[StageExecutor], StageExecutor]:
+    """Register the coroutine that does a stage's work when a run enters it."""
+
+    def register(func: StageExecutor) -> StageExecutor:
+        STAGE_EXECUTORS[stage_name] = func
+        return func
+
+    return register
+
+
+def enqueue_stage_execution(
+    db: AsyncSession, pipeline_run_id: int, stage_name: str, stage_index: int, priority: int = 0
+) -> Job:
+    """
+    Enqueue the work for a stage a pipeline run has just entered.
+
+    Args:
+        db: Session of the transaction that advanced the run
+        pipeline_run_id: Pipeline run ID
+        stage_name: Stage the run entered
+        stage_index: Position of the stage (lets the job detect it is stale)
+        priority: Job priority (higher first)
+
+    Returns:
+        The pending Job
+    """
+    return enqueue(
+        db,
+        STAGE_EXECUTE,
+        {"pipeline_run_id": pipeline_run_id, "stage_name": stage_name, "stage_index": stage_index},
+        priority=priority,
+        pipeline_run_id=pipeline_run_id,
+    )
+
+
+@job_handler(STAGE_EXECUTE)
+async def execute_stage(job: JobContext) -> None:
+    """Run the registered executor for the stage, if the run is still at it."""
+    executor = STAGE_EXECUTORS.get(job.payload["stage_name"])
+    if executor is None:
+        # No automated work for this stage; results are submitted externally
+        return
+
+    async with job.session_factory() as db:
+        current_index = (
+            await db.execute(
+                select(PipelineRun.current_stage_index).where(
+                    PipelineRun.id == job.payload["pipeline_run_id"]
+                )
+            )
+        ).scalar_one_or_none()
+    if current_index != job.payload["stage_index"]:
+        # The run moved on (or was deleted) before the job ran
+        return
+
+    event = {
+        "job_id": job.job_id,
+        "stage_name": job.payload["stage_name"],
+        "stage_index": job.payload["stage_index"],
+        "attempt": job.attempt,
+    }
+    broker = get_event_broker()
+    try:
+        await executor(job)
+    except Exception as error:
+        broker.publish(
+            job.payload["pipeline_run_id"],
+            "stage_execution",
+            {**event, "status": "failed", "error": str(error)},
+        )
+        raise
+    broker.publish(
+        job.payload["pipeline_run_id"], "stage_execution", {**event, "status": "succeeded"}
+    )
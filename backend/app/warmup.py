@@ -0,0 +1,131 @@
+"""
+Startup warm-up.
+
+A fresh process pays a one-off cost on its first requests: SQLAlchemy
+configures the ORM mappers, the pool opens connections, statements are
+compiled into the statement cache, every job profile misses the plan cache
+and /openapi.json builds the JSON schema of every route. create_app's
+lifespan runs warm_up() before the server accepts traffic, so on scale-out
+that cost is paid while the instance is not yet in rotation.
+
+Each step is best-effort: a failure is logged and the first requests pay
+for that step instead, as they would without warm-up.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import Dict, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import QueuePool
+
+from app.config import settings
+from app.database import get_async_engine, get_async_session_factory
+from app.metrics import REGISTRY, Gauge
+from app.models import JobProfile
+from app.routers.pipeline import load_pipeline
+from app.services.pipeline_planner import PipelinePlanner, plan_cache
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SECONDS = REGISTRY.register(
+    Gauge("startup_warmup_seconds", "Time spent in each startup warm-up step.", ("step",))
+)
+
+
+async def warm_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Open pooled connections up front and return them to the pool.
+
+    Args:
+        engine: Async engine whose pool to fill
+        connections: Connections to hold open together (capped at the pool size)
+
+    Returns:
+        Number of connections opened
+    """
+    pool = engine.sync_engine.pool
+    # Pools without sizing (e.g. in-memory SQLite) hold a single connection
+    connections = min(connections, pool.size()) if isinstance(pool, QueuePool) else 1
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            connection = await stack.enter_async_context(engine.connect())
+            await connection.execute(text("SELECT 1"))
+    return connections
+
+
+async def warm_plan_cache(session_factory: async_sessionmaker, profiles: int) -> int:
+    """
+    Plan the most recently updated job profiles into the plan cache.
+
+    Args:
+        session_factory: Sessions on the app's database
+        profiles: Job profiles to plan (capped at the cache size)
+
+    Returns:
+        Number of job profiles planned
+    """
+    async with session_factory() as db:
+        job_profiles = (
+            await db.scalars(
+                select(JobProfile)
+                .order_by(JobProfile.updated_at.desc(), JobProfile.id.desc())
+                .limit(min(profiles, plan_cache.maxsize))
+            )
+        ).all()
+        # Compiles the hottest read statement into the statement cache
+        await load_pipeline(db, 0)
+    planner = PipelinePlanner()
+    for job_profile in job_profiles:
+        planner.get_plan(job_profile)
+    return len(job_profiles)
+
+
+async def warm_up(
+    app: FastAPI,
+    engine: Optional[AsyncEngine] = None,
+    session_factory: Optional[async_sessionmaker] = None,
+) -> Dict[str, float]:
+    """
+    Run the warm-up steps enabled in settings.
+
+    Args:
+        app: Application whose OpenAPI schema to pre-render
+        engine: Async engine to warm (defaults to the app's)
+        session_factory: Sessions for the plan cache step (defaults to the app's)
+
+    Returns:
+        Seconds spent per completed step
+    """
+    steps = {"mappers": lambda: asyncio.to_thread(configure_mappers)}
+    if settings.warmup_db_connections > 0:
+        steps["pool"] = lambda: warm_pool(
+            engine or get_async_engine(), settings.warmup_db_connections
+        )
+    if settings.warmup_plan_cache_profiles > 0:
+        steps["plan_cache"] = lambda: warm_plan_cache(
+            session_factory or get_async_session_factory(), settings.warmup_plan_cache_profiles
+        )
+    if settings.warmup_openapi:
+        steps["openapi"] = lambda: asyncio.to_thread(app.openapi)
+
+    timings = {}
+    for step, run in steps.items():
+        start = time.perf_counter()
+        try:
+            await run()
+        except Exception:
+            logger.warning("Startup warm-up step %s failed", step, exc_info=True)
+            continue
+        timings[step] = time.perf_counter() - start
+        WARMUP_SECONDS.set(step, value=timings[step])
+    logger.info(
+        "Startup warm-up: %s",
+        ", ".join(f"{step} {seconds * 1000:.1f}ms" for step, seconds in timings.items()),
+    )
+    return timings
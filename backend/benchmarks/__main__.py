@@ -0,0 +1,45 @@
+"""
+Benchmark suite entry point.
+
+Usage (from backend/):
+    python -m benchmarks micro [--output results/micro.json]
+    python -m benchmarks e2e [--database-url URL] [--concurrency 1 8 32] [--output ...]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import compare, e2e, micro
+from benchmarks.common import write_results
+
+SUITES = {"micro": micro, "e2e": e2e}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, module in SUITES.items():
+        suite_parser = subparsers.add_parser(name, help=module.__doc__.strip().splitlines()[0])
+        module.add_arguments(suite_parser)
+        suite_parser.add_argument("--output", help="Write results JSON to this path")
+
+    compare_parser = subparsers.add_parser("compare", help=compare.__doc__.strip().splitlines()[0])
+    compare.add_arguments(compare_parser)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return compare.run(args)
+
+    results = SUITES[args.command].run(args)
+    config = {key: value for key, value in vars(args).items() if key not in ("command", "output")}
+    if args.output:
+        write_results(args.output, args.command, config, results)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Contention benchmark for POST /pipeline/{id}/advance.
+
+Fires concurrent advances at a handful of pipeline runs and compares:
+
+- read_modify_write: the previous approach (load the row, compute the next
+  stage in Python, write it back, reload it)
+- conditional_update: the current router (one conditional UPDATE ... RETURNING)
+  with If-Match: *, i.e. unconditional single-stage increments
+- versioned_update: the current router with expected_version taken from a
+  GET just before each advance; advances that lost a race get a 409
+
+For each variant it reports throughput, latency, conflicts (409s) and lost
+updates: the number of advances that returned 200 but are not reflected in
+the final stage cursors. Every statement is delayed by --query-latency-ms inside the
+driver's thread to model a network round trip.
+
+Usage (from backend/):
+    python -m benchmarks.advance_contention --runs 4 --advances 400 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.database import Base, get_async_db
+from app.models import Candidate, JobProfile, PipelineRun, PipelineStageState
+from app.models.pipeline_run import PipelineStatus
+from app.routers import pipeline
+from benchmarks.common import add_statement_latency, summarize_latencies
+
+
+async def _seed(session_factory, runs: int, stage_count: int) -> list[int]:
+    async with session_factory() as db:
+        candidate = Candidate(email="bench@example.com", name="Bench")
+        job_profile = JobProfile(role="SWE I", raw_description="bench")
+        db.add_all([candidate, job_profile])
+        await db.flush()
+        stages = [f"stage_{i}" for i in range(stage_count)]
+        pipeline_runs = [
+            PipelineRun(
+                candidate_id=candidate.id,
+                job_profile_id=job_profile.id,
+                stages=stages,
+                stage_progress=dict.fromkeys(stages, "created"),
+            )
+            for _ in range(runs)
+        ]
+        db.add_all(pipeline_runs)
+        await db.commit()
+        return [run.id for run in pipeline_runs]
+
+
+def build_read_modify_write_app(get_db) -> FastAPI:
+    """The pre-change advance: separate read, Python-side step, unconditional write."""
+    app = FastAPI()
+
+    @app.post("/pipeline/{pipeline_id}/advance")
+    async def advance(pipeline_id: int, db: AsyncSession = Depends(get_db)):
+        row = (
+            await db.execute(
+                select(PipelineRun.current_stage_index, PipelineRun.stage_count).where(
+                    PipelineRun.id == pipeline_id
+                )
+            )
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+        next_index = 0 if row.current_stage_index is None else row.current_stage_index + 1
+        if next_index >= row.stage_count:
+            raise HTTPException(status_code=400, detail="Pipeline already at final stage")
+
+        await db.execute(
+            update(PipelineRun)
+            .where(PipelineRun.id == pipeline_id)
+            .values(current_stage_index=next_index, status=PipelineStatus.IN_PROGRESS)
+        )
+        await db.execute(
+            update(PipelineStageState)
+            .where(
+                PipelineStageState.pipeline_run_id == pipeline_id,
+                PipelineStageState.position == next_index,
+            )
+            .values(state="IN_PROGRESS")
+        )
+        await db.commit()
+        await db.execute(select(PipelineRun).where(PipelineRun.id == pipeline_id))
+        return {"current_stage_index": next_index}
+
+    return app
+
+
+async def run_variant(name: str, db_path: str, args: argparse.Namespace) -> dict:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        connect_args={"timeout": 30},
+    )
+    add_statement_latency(engine, args.query_latency_ms / 1000)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    run_ids = await _seed(session_factory, args.runs, args.advances)
+
+    async def get_bench_db():
+        async with session_factory() as db:
+            yield db
+
+    if name == "read_modify_write":
+        app = build_read_modify_write_app(get_bench_db)
+    else:
+        app = FastAPI()
+        app.include_router(pipeline.router)
+        app.dependency_overrides[get_async_db] = get_bench_db
+
+    latencies: list[float] = []
+    succeeded = conflicts = 0
+    targets = iter(run_ids[i % len(run_ids)] for i in range(args.advances))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def worker():
+            nonlocal succeeded, conflicts
+            for run_id in targets:
+                start = time.perf_counter()
+                if name == "versioned_update":
+                    version = (await client.get(f"/pipeline/{run_id}")).json()["version"]
+                    response = await client.post(
+                        f"/pipeline/{run_id}/advance", params={"expected_version": version}
+                    )
+                else:
+                    response = await client.post(
+                        f"/pipeline/{run_id}/advance", headers={"If-Match": "*"}
+                    )
+                latencies.append(time.perf_counter() - start)
+                succeeded += response.status_code == 200
+                conflicts += response.status_code == 409
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    async with session_factory() as db:
+        applied = (
+            await db.execute(
+                select(func.sum(func.coalesce(PipelineRun.current_stage_index, -1) + 1))
+            )
+        ).scalar_one()
+    await engine.dispose()
+
+    return {
+        "succeeded": succeeded,
+        "conflicts": conflicts,
+        "lost_updates": succeeded - applied,
+        **summarize_latencies(latencies, elapsed),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        return {
+            name: await run_variant(name, db_path, args)
+            for name in ("read_modify_write", "conditional_update", "versioned_update")
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=4)
+    parser.add_argument("--advances", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--query-latency-ms", type=float, default=1.0)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,171 @@
+"""
+Cold archival benchmark: live table size and read latency before and after.
+
+Bulk-loads synthetic runs (app.datagen) over --days into a SQLite
+database, then moves the runs decided more than --older-than-days ago to
+the archive and reports:
+
+- archive: runs moved per second and the archive's size on disk
+- size: rows and bytes of pipeline_runs, pipeline_stage_states and
+  stage_results (tables plus their indexes) before and after
+- list / get: GET /pipeline (one page) and GET /pipeline/{id} of live
+  runs, before and after archival
+- get_archived: GET /pipeline/{id} of archived runs (read back from
+  their gzip member)
+
+Usage (from backend/):
+    python -m benchmarks.archive --runs 50000 --days 730 --older-than-days 180 --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, get_async_db
+from app.datagen import DatagenConfig, load
+from app.models import ArchivedPipelineRun, PipelineRun
+from app.responses import FastJSONResponse
+from app.routers import pipeline
+from app.services.archive import RunArchive, archive_runs, get_run_archive
+from benchmarks.common import summarize_latencies
+
+UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SIZED_TABLES = ("pipeline_runs", "pipeline_stage_states", "stage_results")
+
+
+def _sizes(engine) -> dict:
+    """Rows and bytes (table and its indexes, from SQLite's dbstat) per table."""
+    with engine.connect() as conn:
+        sizes = {}
+        for name in SIZED_TABLES:
+            size = conn.exec_driver_sql(
+                "SELECT sum(pgsize) FROM dbstat WHERE name = ? OR name IN "
+                "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?)",
+                (name, name),
+            ).scalar()
+            rows = conn.exec_driver_sql(f"SELECT count(*) FROM {name}").scalar()
+            sizes[name] = {"rows": rows, "mb": round((size or 0) / 1e6, 2)}
+    return sizes
+
+
+async def _phase(client: AsyncClient, paths: list) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for path in paths:
+        start = time.perf_counter()
+        (await client.get(path)).raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return summarize_latencies(latencies, time.perf_counter() - started)
+
+
+async def _reads(client: AsyncClient, run_ids: list, args: argparse.Namespace) -> dict:
+    rng = random.Random(0)
+    paths = [f"/pipeline/{rng.choice(run_ids)}" for _ in range(args.requests)]
+    await _phase(client, paths[:20])  # Warm up
+    return {
+        "get": await _phase(client, paths),
+        "list": await _phase(client, ["/pipeline?limit=50"] * max(1, args.requests // 10)),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = os.path.join(tmp, "bench.db")
+        sync_engine = create_engine(f"sqlite:///{database_path}")
+        Base.metadata.create_all(sync_engine)
+        load(
+            sync_engine,
+            DatagenConfig(
+                candidates=max(1, args.runs * 8 // 10),
+                job_profiles=50,
+                runs=args.runs,
+                days=args.days,
+                until=UNTIL,
+                artifact_scale=0,
+            ),
+        )
+        results["size_before"] = _sizes(sync_engine)
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        archive = RunArchive(Path(tmp) / "archive")
+
+        async def get_bench_db():
+            async with session_factory() as db:
+                yield db
+
+        app = FastAPI(default_response_class=FastJSONResponse)
+        app.include_router(pipeline.router)
+        app.dependency_overrides[get_async_db] = get_bench_db
+        app.dependency_overrides[get_run_archive] = lambda: archive
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench"
+            ) as client:
+                async with session_factory() as db:
+                    all_ids = (await db.scalars(select(PipelineRun.id))).all()
+                results["before"] = await _reads(client, all_ids, args)
+
+                started = time.perf_counter()
+                moved = 0
+                while batch := await archive_runs(
+                    session_factory,
+                    archive,
+                    timedelta(days=args.older_than_days),
+                    args.batch_size,
+                    now=UNTIL,
+                ):
+                    moved += batch
+                elapsed = time.perf_counter() - started
+                archive_bytes = sum(
+                    path.stat().st_size for path in archive.root.rglob("*.ndjson.gz")
+                )
+                results["archive"] = {
+                    "runs": moved,
+                    "runs_per_sec": round(moved / elapsed, 1) if elapsed else None,
+                    "archive_mb": round(archive_bytes / 1e6, 2),
+                }
+
+                async with session_factory() as db:
+                    live_ids = (await db.scalars(select(PipelineRun.id))).all()
+                    archived_ids = (
+                        await db.scalars(select(ArchivedPipelineRun.pipeline_run_id))
+                    ).all()
+                    results["archive"]["live_runs"] = await db.scalar(
+                        select(func.count()).select_from(PipelineRun)
+                    )
+                results["after"] = await _reads(client, live_ids, args)
+                if archived_ids:
+                    archived_reads = await _reads(client, archived_ids, args)
+                    results["after"]["get_archived"] = archived_reads["get"]
+        finally:
+            await engine.dispose()
+        with sync_engine.begin() as conn:
+            conn.exec_driver_sql("VACUUM")
+        results["size_after"] = _sizes(sync_engine)
+        sync_engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=50000)
+    parser.add_argument("--days", type=int, default=730)
+    parser.add_argument("--older-than-days", type=float, default=180.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=500)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
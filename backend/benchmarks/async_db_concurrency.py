@@ -0,0 +1,160 @@
+"""
+Concurrency benchmark: sync Session vs AsyncSession in async handlers.
+
+Runs GET /pipeline/{id} at a fixed concurrency against two handlers that
+share the same SQLite file database:
+
+- sync: the previous implementation, a blocking `Session` inside `async def`
+- async: the current router, backed by `AsyncSession` (aiosqlite)
+
+Every statement is delayed by --query-latency-ms inside the driver's thread to
+model a network round trip to Postgres. With the sync session that delay runs
+on the event loop thread and serializes all requests; with the async session
+it overlaps.
+
+Usage (from backend/):
+    python -m benchmarks.async_db_concurrency --concurrency 32 --requests 640
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.database import Base, get_async_db
+from app.models import Candidate, JobProfile, PipelineRun
+from app.routers import pipeline
+from app.schemas.pipeline import PipelineResponse
+from benchmarks.common import add_statement_latency, summarize_latencies
+
+
+def _seed(sync_engine) -> int:
+    Base.metadata.create_all(bind=sync_engine)
+    with Session(sync_engine) as db:
+        candidate = Candidate(email="bench@example.com", name="Bench")
+        job_profile = JobProfile(role="SWE I", raw_description="bench")
+        db.add_all([candidate, job_profile])
+        db.flush()
+        run = PipelineRun(
+            candidate_id=candidate.id,
+            job_profile_id=job_profile.id,
+            stages=["resume_screen"],
+            stage_progress={"resume_screen": "created"},
+        )
+        db.add(run)
+        db.commit()
+        return run.id
+
+
+def build_apps(db_path: str, latency_s: float, pool_size: int):
+    """Build the sync-session and async-session apps over the same database."""
+
+    def delay(_statement):
+        time.sleep(latency_s)
+
+    sync_engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+
+    @event.listens_for(sync_engine, "connect")
+    def _sync_connect(dbapi_connection, _record):
+        dbapi_connection.set_trace_callback(delay)
+
+    add_statement_latency(async_engine, latency_s)
+
+    pipeline_id = _seed(sync_engine)
+
+    SyncSessionLocal = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+    def get_sync_db():
+        db = SyncSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_bench_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    sync_app = FastAPI()
+
+    @sync_app.get("/pipeline/{pipeline_id}", response_model=PipelineResponse)
+    async def get_pipeline_sync(pipeline_id: int, db: Session = Depends(get_sync_db)):
+        pipeline_run = db.query(PipelineRun).filter(PipelineRun.id == pipeline_id).first()
+        if not pipeline_run:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+        return pipeline_run
+
+    async_app = FastAPI()
+    async_app.include_router(pipeline.router)
+    async_app.dependency_overrides[get_async_db] = get_bench_async_db
+
+    return pipeline_id, {"sync": sync_app, "async": async_app}, (sync_engine, async_engine)
+
+
+async def run_load(app: FastAPI, path: str, concurrency: int, total: int) -> dict:
+    """Issue `total` GETs with `concurrency` workers and summarize latencies."""
+    latencies: list[float] = []
+    remaining = iter(range(total))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await client.get(path)  # warm up the pool and schema
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return summarize_latencies(latencies, elapsed)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline_id, apps, engines = build_apps(
+            os.path.join(tmp, "bench.db"), args.query_latency_ms / 1000, args.concurrency
+        )
+        results = {
+            name: await run_load(app, f"/pipeline/{pipeline_id}", args.concurrency, args.requests)
+            for name, app in apps.items()
+        }
+        engines[0].dispose()
+        await engines[1].dispose()
+
+    results["p99_speedup"] = round(results["sync"]["p99_ms"] / results["async"]["p99_ms"], 2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=640)
+    parser.add_argument("--query-latency-ms", type=float, default=2.0)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
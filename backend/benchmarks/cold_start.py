@@ -0,0 +1,134 @@
+"""
+Cold-start benchmark: import, startup and first-request time of a fresh process.
+
+Every sample is a new Python process (as on scale-out or a test run) that
+imports app.main, runs the lifespan and sends its first requests through
+an in-process client, against a seeded SQLite database, three ways:
+
+- no_warmup: WARMUP_ENABLED=false; the first requests pay for mapper
+  configuration, pool connections, statement compilation and OpenAPI
+- warmup: the default lifespan warm-up (mappers, pool, plan cache)
+- warmup_openapi: warm-up with WARMUP_OPENAPI=true
+
+Reports medians over --samples processes, and which heavy modules the
+import of app.main loaded (numpy, the LLM gateway and the database drivers
+are imported on first use).
+
+Usage (from backend/):
+    python -m benchmarks.cold_start --samples 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Candidate, JobProfile, PipelineRun
+
+MODES = {
+    "no_warmup": {"WARMUP_ENABLED": "false"},
+    "warmup": {"WARMUP_ENABLED": "true"},
+    "warmup_openapi": {"WARMUP_ENABLED": "true", "WARMUP_OPENAPI": "true"},
+}
+
+HEAVY_MODULES = ("numpy", "app.services.llm_gateway", "asyncpg", "psycopg2", "aiosqlite")
+
+# Run with python -c so that nothing is imported before the timed import
+CHILD = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+
+from httpx import ASGITransport, AsyncClient
+
+
+async def main():
+    timings = {{"import_ms": imported - start}}
+    started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        timings["startup_ms"] = time.perf_counter() - started
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            for name, path in (
+                ("first_request_ms", "/pipeline/{run_id}"),
+                ("second_request_ms", "/pipeline/{run_id}"),
+                ("first_openapi_ms", "/openapi.json"),
+            ):
+                sent = time.perf_counter()
+                (await client.get(path)).raise_for_status()
+                timings[name] = time.perf_counter() - sent
+    timings = {{name: seconds * 1000 for name, seconds in timings.items()}}
+    timings["first_response_ms"] = sum(
+        timings[name] for name in ("import_ms", "startup_ms", "first_request_ms")
+    )
+    print(json.dumps({{"timings": timings, "loaded_at_import": loaded}}))
+
+
+asyncio.run(main())
+"""
+
+
+async def _seed(database_path: str) -> int:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        run = PipelineRun(
+            candidate=Candidate(email="bench@example.com", name="Bench"),
+            job_profile=JobProfile(role="SWE I", raw_description="bench"),
+            stages=["resume_screen", "oa", "phone_screen"],
+        )
+        db.add(run)
+        await db.commit()
+        run_id = run.id
+    await engine.dispose()
+    return run_id
+
+
+def _sample(script: str, env: dict) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Cold-start child failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        database_path = os.path.join(tmp, "bench.db")
+        run_id = asyncio.run(_seed(database_path))
+        script = CHILD.format(heavy=HEAVY_MODULES, run_id=run_id)
+        base_env = {
+            **os.environ,
+            "PYTHONPATH": os.getcwd(),
+            "DATABASE_URL": f"sqlite:///{database_path}",
+            "JOB_QUEUE_ENABLED": "false",
+            "INTERVIEW_SPILL_PATH": "",
+            "WARMUP_OPENAPI": "false",
+        }
+        for mode, mode_env in MODES.items():
+            samples = [_sample(script, {**base_env, **mode_env}) for _ in range(args.samples)]
+            results[mode] = {
+                name: round(statistics.median(sample["timings"][name] for sample in samples), 1)
+                for name in samples[0]["timings"]
+            }
+            results[mode]["loaded_at_import"] = samples[0]["loaded_at_import"]
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=5)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,77 @@
+"""Shared helpers for benchmarks: latency stats, statement delay and result files."""
+
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import app
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples."""
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize_latencies(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """Throughput and latency percentiles (ms) for one load phase."""
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def add_statement_latency(engine: AsyncEngine, seconds: float) -> None:
+    """
+    Delay every statement on an aiosqlite engine inside the driver's thread.
+
+    Models a network round trip to Postgres without blocking the event loop.
+    """
+    if seconds <= 0:
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection, _record):
+        dbapi_connection.run_async(
+            lambda conn: conn.set_trace_callback(lambda _statement: time.sleep(seconds))
+        )
+
+
+def write_results(path: str, suite: str, config: Dict[str, Any], results: Dict[str, Any]) -> None:
+    """Store benchmark results as JSON, with enough context to compare runs."""
+    document = {
+        "format": RESULTS_FORMAT_VERSION,
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "app_version": app.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "config": config,
+        "results": results,
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a results file written by write_results."""
+    document = json.loads(Path(path).read_text())
+    if document.get("format") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format in {path}")
+    return document
@@ -0,0 +1,90 @@
+"""
+Compare a benchmark results file against a saved baseline.
+
+Metrics are matched by case and name. Names ending in _ms/_us are
+lower-is-better; _rps/_per_sec are higher-is-better; anything else is
+informational. A change worse than --threshold percent is a regression and
+makes the command exit with status 1.
+
+Usage (from backend/):
+    python -m benchmarks compare results/baseline-micro.json results/micro.json --threshold 10
+"""
+
+import argparse
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import load_results
+
+LOWER_IS_BETTER = ("_ms", "_us")
+HIGHER_IS_BETTER = ("_rps", "_per_sec")
+
+
+def _direction(metric: str) -> Optional[int]:
+    if metric.endswith(LOWER_IS_BETTER):
+        return -1
+    if metric.endswith(HIGHER_IS_BETTER):
+        return 1
+    return None
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold_pct: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare two results documents.
+
+    Args:
+        baseline: Document loaded from the baseline file
+        current: Document loaded from the new results file
+        threshold_pct: Allowed worsening, in percent, before flagging
+
+    Returns:
+        One row per comparable metric with change_pct and a regression flag
+    """
+    rows = []
+    for case, metrics in current["results"].items():
+        base_metrics = baseline["results"].get(case, {})
+        for metric, value in metrics.items():
+            direction = _direction(metric)
+            base_value = base_metrics.get(metric)
+            if direction is None or not base_value:
+                continue
+            change_pct = (value - base_value) / base_value * 100
+            rows.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": base_value,
+                    "current": value,
+                    "change_pct": round(change_pct, 2),
+                    "regression": -direction * change_pct > threshold_pct,
+                }
+            )
+    return rows
+
+
+def run(args: argparse.Namespace) -> int:
+    """Print the comparison table; returns the process exit code."""
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    if baseline["suite"] != current["suite"]:
+        raise SystemExit(f"Suite mismatch: {baseline['suite']} vs {current['suite']}")
+
+    rows = compare(baseline, current, args.threshold)
+    width = max((len(f"{r['case']}.{r['metric']}") for r in rows), default=10)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['case'] + '.' + row['metric']:<{width}}  "
+            f"{row['baseline']:>12}  {row['current']:>12}  {row['change_pct']:>+8.2f}%  {flag}"
+        )
+
+    regressions = [row for row in rows if row["regression"]]
+    print(f"\n{len(regressions)} regression(s) beyond {args.threshold}% in {len(rows)} metrics")
+    return 1 if regressions else 0
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("baseline", help="Saved baseline results JSON")
+    parser.add_argument("current", help="New results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed worsening in %%")
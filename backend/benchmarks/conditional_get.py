@@ -0,0 +1,109 @@
+"""
+Latency benchmark for revalidating pipeline reads with ETags.
+
+Drives GET /pipeline/{id} for an unchanged run through the in-process app
+two ways:
+
+- full: a plain GET, as a poller without validators sends it
+- revalidate: a GET with If-None-Match set to the ETag of the last read,
+  answered with a bodiless 304 from the (id, version, updated_at) lookup
+
+Reports latency percentiles, SQL statements per request and response bytes.
+--statement-ms adds a fixed delay to every statement to mimic a database
+across the network.
+
+Usage (from backend/):
+    python -m benchmarks.conditional_get --requests 500 --stages 12 --statement-ms 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, get_async_db
+from app.main import app as fastapi_app
+from app.models import Candidate, JobProfile, PipelineRun
+from benchmarks.common import add_statement_latency, summarize_latencies
+
+
+async def _seed_run(session_factory, stages: int) -> int:
+    async with session_factory() as db:
+        run = PipelineRun(
+            candidate=Candidate(email="bench@example.com", name="Bench"),
+            job_profile=JobProfile(role="SWE I", raw_description="bench"),
+            stages=[f"stage_{i}" for i in range(stages)],
+        )
+        db.add(run)
+        await db.commit()
+        return run.id
+
+
+async def _phase(client: AsyncClient, path: str, headers: dict, requests: int, statements) -> dict:
+    latencies = []
+    size = 0
+    statements.clear()
+    started = time.perf_counter()
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code not in (200, 304):
+            response.raise_for_status()
+        size += len(response.content)
+    elapsed = time.perf_counter() - started
+    return {
+        **summarize_latencies(latencies, elapsed),
+        "statements_per_request": round(len(statements) / requests, 2),
+        "body_bytes_per_request": round(size / requests),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        run_id = await _seed_run(session_factory, args.stages)
+        add_statement_latency(engine, args.statement_ms / 1000)
+        await engine.dispose()  # Reconnect with the delay installed
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *_: statements.append(1))
+
+        async def get_bench_db():
+            async with session_factory() as db:
+                yield db
+
+        fastapi_app.dependency_overrides[get_async_db] = get_bench_db
+        path = f"/pipeline/{run_id}"
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=fastapi_app), base_url="http://bench"
+            ) as client:
+                etag = (await client.get(path)).headers["ETag"]
+                return {
+                    "full": await _phase(client, path, {}, args.requests, statements),
+                    "revalidate": await _phase(
+                        client, path, {"If-None-Match": etag}, args.requests, statements
+                    ),
+                }
+        finally:
+            fastapi_app.dependency_overrides.pop(get_async_db, None)
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--stages", type=int, default=12)
+    parser.add_argument("--statement-ms", type=float, default=1.0)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
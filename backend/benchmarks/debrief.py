@@ -0,0 +1,118 @@
+"""
+Throughput benchmark for the debrief engine.
+
+Builds a synthetic cohort (four interview scorecards per candidate, a few
+missing, a few killer signals) and scores it under several policies two ways:
+
+- naive: a per-candidate Python loop implementing the same rules
+- vectorized: app.services.debrief.evaluate over the whole cohort
+
+Reports candidates per second for each and checks the decisions agree.
+
+Usage (from backend/):
+    python -m benchmarks.debrief --candidates 100000 --policies 5
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from app.services.debrief import (
+    HIRE,
+    HOLD,
+    NO_HIRE,
+    STAGE_CATEGORIES,
+    Cohort,
+    DebriefPolicy,
+    evaluate,
+)
+
+
+def _cohort(count: int, seed: int = 7) -> Cohort:
+    rng = np.random.default_rng(seed)
+    stages = tuple(STAGE_CATEGORIES)
+    ratings = rng.integers(1, 5, size=(count, len(stages)), endpoint=True).astype(float)
+    ratings[rng.random(ratings.shape) < 0.02] = np.nan
+    return Cohort(
+        run_ids=np.arange(1, count + 1),
+        stages=stages,
+        ratings=ratings,
+        confidence=rng.uniform(0.6, 1.0, size=ratings.shape),
+        killer=rng.random(count) < 0.01,
+    )
+
+
+def _naive(cohort: Cohort, policy: DebriefPolicy) -> list[int]:
+    categories = [STAGE_CATEGORIES[stage] for stage in cohort.stages]
+    stage_weights = policy.stage_weights(cohort.stages).tolist()
+    decisions = []
+    for ratings, confidence, killer in zip(
+        cohort.ratings.tolist(), cohort.confidence.tolist(), cohort.killer.tolist(), strict=False
+    ):
+        present = [j for j, rating in enumerate(ratings) if not math.isnan(rating)]
+        total_weight = sum(stage_weights[j] for j in present)
+        score = sum(stage_weights[j] / total_weight * ratings[j] * confidence[j] for j in present)
+        mean = sum(ratings[j] for j in present) / len(present)
+        std = math.sqrt(sum((ratings[j] - mean) ** 2 for j in present) / len(present))
+        score -= policy.consistency_weight * std
+
+        coding = [ratings[j] for j, category in enumerate(categories) if category == "coding"]
+        behavioral = [
+            r for r, category in zip(ratings, categories, strict=False) if category == "behavioral"
+        ]
+        bar_met = (
+            sum(rating >= 3 for rating in coding) >= policy.min_coding_hire_ratings
+            and not any(rating <= 1 for rating in coding)
+            and all(rating >= policy.min_behavioral_rating for rating in behavioral)
+        )
+        if killer or not bar_met or score < policy.no_hire_threshold:
+            decisions.append(NO_HIRE)
+        elif score >= policy.hire_threshold:
+            decisions.append(HIRE)
+        else:
+            decisions.append(HOLD)
+    return decisions
+
+
+def _timed(fn, count: int) -> tuple[dict, object]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 3), "candidates_per_sec": round(count / elapsed)}, result
+
+
+def main(args: argparse.Namespace) -> dict:
+    cohort = _cohort(args.candidates)
+    policies = [
+        DebriefPolicy(hire_threshold=2.6 + 0.1 * i, weights={"coding": 1.0 + 0.25 * i})
+        for i in range(args.policies)
+    ]
+    evaluated = len(cohort) * len(policies)
+
+    naive, naive_decisions = _timed(
+        lambda: [_naive(cohort, policy) for policy in policies], evaluated
+    )
+    vectorized, debriefs = _timed(
+        lambda: [evaluate(cohort, policy) for policy in policies], evaluated
+    )
+    agree = all(
+        debrief.decisions.tolist() == decisions
+        for debrief, decisions in zip(debriefs, naive_decisions, strict=False)
+    )
+    return {
+        "candidates": len(cohort),
+        "policies": len(policies),
+        "naive": naive,
+        "vectorized": vectorized,
+        "decisions_agree": agree,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", type=int, default=100000)
+    parser.add_argument("--policies", type=int, default=5)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,154 @@
+"""
+Memory/latency benchmark for deferred large columns.
+
+Seeds candidates with large resumes and a pipeline run with large stage
+result payloads, then drives POST /pipeline/start and GET /stage_results
+through the in-process app with two session flavours:
+
+- eager: every ORM query also loads the deferred columns (the behaviour
+  before resume_text / raw_scores / artifacts / notes were deferred)
+- deferred: the current models
+
+For each it reports latency percentiles and the peak traced Python memory
+(tracemalloc) over the phase.
+
+Usage (from backend/):
+    python -m benchmarks.deferred_columns --resume-kb 200 --artifact-kb 512 --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, undefer
+
+from app.database import Base, get_async_db
+from app.main import app as fastapi_app
+from app.models import Candidate, JobProfile, StageResult
+from benchmarks.common import summarize_latencies
+
+
+class EagerSession(Session):
+    """Session that undoes column deferral on every ORM select."""
+
+
+@event.listens_for(EagerSession, "do_orm_execute")
+def _undefer_all(state):
+    if state.is_select:
+        state.statement = state.statement.options(undefer("*"))
+
+
+async def _seed(session_factory, args: argparse.Namespace) -> tuple[list[dict], int]:
+    async with session_factory() as db:
+        resume = "r" * (args.resume_kb * 1024)
+        candidates = [
+            Candidate(email=f"bench-{i}@example.com", name=f"Bench {i}", resume_text=resume)
+            for i in range(args.requests)
+        ]
+        job_profile = JobProfile(role="SWE I", raw_description="bench")
+        db.add_all([*candidates, job_profile])
+        await db.commit()
+        bodies = [{"candidate_id": c.id, "job_profile_id": job_profile.id} for c in candidates]
+
+    async with AsyncClient(transport=ASGITransport(app=fastapi_app), base_url="http://b") as client:
+        pipeline_id = (await client.post("/pipeline/start", json=bodies[0])).json()["id"]
+
+    async with session_factory() as db:
+        artifact = "a" * (args.artifact_kb * 1024)
+        db.add_all(
+            StageResult(
+                pipeline_run_id=pipeline_id,
+                stage_name=f"stage_{i}",
+                stage_type="interview",
+                raw_scores={"score": i},
+                artifacts={"transcript": artifact},
+                notes="n" * 1024,
+            )
+            for i in range(args.stage_results)
+        )
+        await db.commit()
+    return bodies, pipeline_id
+
+
+def _session_dependency(session_factory):
+    async def get_bench_db():
+        async with session_factory() as db:
+            yield db
+
+    return get_bench_db
+
+
+async def _phase(client: AsyncClient, requests: list[tuple]) -> dict:
+    latencies = []
+    tracemalloc.start()
+    started = time.perf_counter()
+    for method, path, body in requests:
+        start = time.perf_counter()
+        response = await client.request(method, path, json=body)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {**summarize_latencies(latencies, elapsed), "peak_mb": round(peak / 2**20, 2)}
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        flavours = {
+            "eager": async_sessionmaker(
+                bind=engine,
+                class_=AsyncSession,
+                sync_session_class=EagerSession,
+                expire_on_commit=False,
+            ),
+            "deferred": async_sessionmaker(
+                bind=engine, class_=AsyncSession, expire_on_commit=False
+            ),
+        }
+        try:
+            for name, session_factory in flavours.items():
+                fastapi_app.dependency_overrides[get_async_db] = _session_dependency(
+                    session_factory
+                )
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.drop_all)
+                    await conn.run_sync(Base.metadata.create_all)
+                bodies, pipeline_id = await _seed(session_factory, args)
+
+                async with AsyncClient(
+                    transport=ASGITransport(app=fastapi_app), base_url="http://bench"
+                ) as client:
+                    results[f"start:{name}"] = await _phase(
+                        client, [("POST", "/pipeline/start", body) for body in bodies]
+                    )
+                    results[f"list_stage_results:{name}"] = await _phase(
+                        client,
+                        [("GET", f"/stage_results?pipeline_run_id={pipeline_id}", None)]
+                        * args.requests,
+                    )
+        finally:
+            fastapi_app.dependency_overrides.pop(get_async_db, None)
+            await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--resume-kb", type=int, default=200)
+    parser.add_argument("--artifact-kb", type=int, default=512)
+    parser.add_argument("--stage-results", type=int, default=8)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
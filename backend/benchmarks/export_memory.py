@@ -0,0 +1,108 @@
+"""
+Memory benchmark for GET /export/pipelines.
+
+Seeds pipeline runs into a throwaway SQLite file and measures peak traced
+Python memory (tracemalloc) and wall time at each row count for:
+
+- load_all: the naive approach (load every run as an ORM object, then
+  serialize the whole list)
+- stream: the export endpoint (server-side cursor, chunked NDJSON), with
+  the response body iterated and discarded chunk by chunk (httpx's ASGI
+  transport buffers whole bodies, so it would hide the difference)
+
+Streaming peak memory should stay flat as the row count grows.
+
+Usage (from backend/):
+    python -m benchmarks.export_memory --rows 10000 50000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Candidate, JobProfile, PipelineRun
+from app.routers import export
+from app.routers.export import PIPELINE_COLUMNS, ExportFormat, _jsonable
+
+STAGES = ["resume_screen", "oa", "phone_screen", "onsite", "debrief"]
+
+
+async def _seed(session_factory, rows: int) -> None:
+    async with session_factory() as db:
+        await db.execute(delete(PipelineRun))
+        candidate = Candidate(email=f"bench-{rows}@example.com", name="Bench")
+        job_profile = JobProfile(role="SWE I", raw_description="bench")
+        db.add_all([candidate, job_profile])
+        await db.flush()
+        row = {"candidate_id": candidate.id, "job_profile_id": job_profile.id, "stages": STAGES}
+        for start in range(0, rows, 5000):
+            await db.execute(insert(PipelineRun), [row] * min(5000, rows - start))
+        await db.commit()
+
+
+async def load_all(session_factory) -> int:
+    async with session_factory() as db:
+        runs = (await db.scalars(select(PipelineRun))).all()
+        body = json.dumps(
+            [
+                {column.key: _jsonable(getattr(run, column.key)) for column in PIPELINE_COLUMNS}
+                for run in runs
+            ]
+        )
+    return len(body)
+
+
+async def stream(session_factory) -> int:
+    response = await export.export_pipelines(
+        format=ExportFormat.NDJSON,
+        job_profile_id=None,
+        created_from=None,
+        created_to=None,
+        session_factory=session_factory,
+    )
+    size = 0
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+    return size
+
+
+async def measure(variant, session_factory) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    await variant(session_factory)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_mb": round(peak / 2**20, 2), "elapsed_ms": round(elapsed * 1000, 1)}
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        for rows in args.rows:
+            await _seed(session_factory, rows)
+            for name, variant in (("load_all", load_all), ("stream", stream)):
+                results[f"{name}@{rows}"] = await measure(variant, session_factory)
+        await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 50000])
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
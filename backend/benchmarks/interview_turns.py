@@ -0,0 +1,126 @@
+"""
+Throughput benchmark for recording interview turns.
+
+Simulates concurrent live sessions, each recording turns back to back,
+two ways:
+
+- commit: one INSERT + COMMIT per turn (what a synchronous endpoint does)
+- write_behind: InterviewSessionStore, with turns flushed in grouped inserts
+
+Reports turns per second and per-turn latency percentiles; the
+write-behind time includes the final flush. --statement-ms adds a fixed
+delay to every statement to mimic a database across the network.
+
+Usage (from backend/):
+    python -m benchmarks.interview_turns --sessions 200 --turns 20 --statement-ms 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.database import Base
+from app.models import Candidate, InterviewTurn, JobProfile, PipelineRun
+from app.services.interview_sessions import InterviewSessionStore
+from benchmarks.common import add_statement_latency, summarize_latencies
+
+
+async def _seed_run(session_factory) -> int:
+    async with session_factory() as db:
+        run = PipelineRun(
+            candidate=Candidate(email="bench@example.com", name="Bench"),
+            job_profile=JobProfile(role="SWE I", raw_description="bench"),
+            stages=["onsite_coding_1"],
+        )
+        db.add(run)
+        await db.commit()
+        return run.id
+
+
+async def _commit_per_turn(session_factory, run_id: int, args: argparse.Namespace) -> dict:
+    latencies = []
+
+    async def session(number: int) -> None:
+        for turn in range(args.turns):
+            start = time.perf_counter()
+            async with session_factory() as db:
+                db.add(
+                    InterviewTurn(
+                        pipeline_run_id=run_id,
+                        session_id=f"commit-{number}",
+                        stage_name="onsite_coding_1",
+                        turn_index=turn,
+                        role="candidate",
+                        content="x" * args.content_bytes,
+                        elapsed_seconds=float(turn),
+                        recorded_at=datetime.now(timezone.utc),
+                    )
+                )
+                await db.commit()
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(args.sessions)))
+    return summarize_latencies(latencies, time.perf_counter() - started)
+
+
+async def _write_behind(session_factory, run_id: int, args: argparse.Namespace) -> dict:
+    latencies = []
+    store = InterviewSessionStore(session_factory, spill_path="")
+    await store.start()
+
+    async def session() -> None:
+        state = await store.create_session(run_id, "onsite_coding_1", 3600)
+        for _ in range(args.turns):
+            start = time.perf_counter()
+            await store.record_turn(state.session_id, "candidate", "x" * args.content_bytes)
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0)  # Yield like a real request would
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(args.sessions)))
+    await store.stop()
+    return summarize_latencies(latencies, time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}",
+            poolclass=AsyncAdaptedQueuePool,
+            # SQLite allows one writer; a single connection avoids "database is locked"
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=120,
+        )
+        if args.statement_ms:
+            add_statement_latency(engine, args.statement_ms / 1000)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        try:
+            run_id = await _seed_run(session_factory)
+            results["commit"] = await _commit_per_turn(session_factory, run_id, args)
+            results["write_behind"] = await _write_behind(session_factory, run_id, args)
+        finally:
+            await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--content-bytes", type=int, default=500)
+    parser.add_argument("--statement-ms", type=float, default=1.0)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
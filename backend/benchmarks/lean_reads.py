@@ -0,0 +1,149 @@
+"""
+Latency/CPU benchmark for the lean pipeline read path.
+
+Drives GET /pipeline/{id} and GET /pipeline (one page) through an
+in-process app two ways:
+
+- orm: the previous read path; ORM entities (stage states loaded by
+  selectin), validated through PipelineResponse (from_attributes) and
+  encoded by the stock JSON response
+- lean: the current endpoints; column-projected Core rows built into
+  plain dicts and encoded with orjson
+
+Reports latency percentiles and process CPU time per request.
+
+Usage (from backend/):
+    python -m benchmarks.lean_reads --runs 200 --stages 12 --requests 500 --page-size 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base, get_async_db
+from app.models import Candidate, JobProfile, PipelineRun, PipelineStageState
+from app.responses import FastJSONResponse
+from app.routers import pipeline
+from app.schemas.pipeline import PipelineListResponse, PipelineResponse
+from benchmarks.common import summarize_latencies
+
+orm_router = APIRouter(prefix="/orm", default_response_class=JSONResponse)
+
+
+@orm_router.get("/pipeline/{pipeline_id}", response_model=PipelineResponse)
+async def orm_get_pipeline(pipeline_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await db.get(PipelineRun, pipeline_id)
+
+
+@orm_router.get("/pipeline", response_model=PipelineListResponse)
+async def orm_list_pipelines(limit: int = 50, db: AsyncSession = Depends(get_async_db)):
+    runs = (
+        await db.scalars(pipeline.list_pipelines_query(limit=limit).with_only_columns(PipelineRun))
+    ).all()
+    return PipelineListResponse(
+        items=[PipelineResponse.model_validate(run) for run in runs], next_cursor=None
+    )
+
+
+async def _seed(session_factory, args: argparse.Namespace) -> list:
+    stages = [f"stage_{i}" for i in range(args.stages)]
+    async with session_factory() as db:
+        candidate = Candidate(email="bench@example.com", name="Bench")
+        job_profile = JobProfile(role="SWE I", raw_description="bench")
+        db.add_all([candidate, job_profile])
+        await db.flush()
+        run_ids = (
+            await db.scalars(
+                insert(PipelineRun).returning(PipelineRun.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "candidate_id": candidate.id,
+                        "job_profile_id": job_profile.id,
+                        "stages": stages,
+                    }
+                    for _ in range(args.runs)
+                ],
+            )
+        ).all()
+        await db.execute(
+            insert(PipelineStageState),
+            [
+                {"pipeline_run_id": run_id, "position": position, "stage_name": stage_name}
+                for run_id in run_ids
+                for position, stage_name in enumerate(stages)
+            ],
+        )
+        await db.commit()
+    return list(run_ids)
+
+
+async def _phase(client: AsyncClient, paths: list) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    for path in paths:
+        start = time.perf_counter()
+        response = await client.get(path)
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    cpu = time.process_time() - cpu_started
+    return {
+        **summarize_latencies(latencies, time.perf_counter() - started),
+        "cpu_us_per_request": round(cpu / len(paths) * 1e6, 1),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        run_ids = await _seed(session_factory, args)
+
+        async def get_bench_db():
+            async with session_factory() as db:
+                yield db
+
+        app = FastAPI(default_response_class=FastJSONResponse)
+        app.include_router(pipeline.router)
+        app.include_router(orm_router)
+        app.dependency_overrides[get_async_db] = get_bench_db
+        get_paths = [f"/pipeline/{run_ids[i % len(run_ids)]}" for i in range(args.requests)]
+        list_paths = [f"/pipeline?limit={args.page_size}"] * max(1, args.requests // 10)
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://bench"
+            ) as client:
+                for name, prefix in (("orm", "/orm"), ("lean", "")):
+                    await _phase(client, [prefix + path for path in get_paths[:20]])  # Warm up
+                    results[f"get:{name}"] = await _phase(
+                        client, [prefix + path for path in get_paths]
+                    )
+                    results[f"list:{name}"] = await _phase(
+                        client, [prefix + path for path in list_paths]
+                    )
+        finally:
+            await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--stages", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=50)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,61 @@
+"""
+Microbenchmarks for PipelinePlanner hot paths.
+
+Each case is timed with timeit (best of --repeat runs) and reported as
+mean microseconds per call and calls per second.
+
+Usage (from backend/):
+    python -m benchmarks micro --output results/micro.json
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Dict
+
+from app.models import JobProfile
+from app.services.pipeline_planner import PipelinePlanner, plan_cache
+
+
+def _time(fn: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    # Scale so each repeat runs for roughly min_time seconds
+    number = max(number, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"mean_us": round(best * 1e6, 4), "ops_per_sec": round(1 / best, 1)}
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """Run all planner microbenchmarks."""
+    planner = PipelinePlanner()
+    saved_profile = JobProfile(
+        id=1, role="SWE I", raw_description="bench", updated_at=datetime.now(timezone.utc)
+    )
+    unsaved_profile = JobProfile(role="SWE I", raw_description="bench")
+    stages, stage_progress = planner.plan_pipeline(saved_profile)
+    last_stage = stages[-2]
+
+    plan_cache.clear()
+    planner.plan_pipeline(saved_profile)  # warm the cache entry
+
+    cases = {
+        "plan_pipeline_cached": lambda: planner.plan_pipeline(saved_profile),
+        "plan_pipeline_uncached": lambda: planner.plan_pipeline(unsaved_profile),
+        "get_next_stage_by_name": lambda: planner.get_next_stage(stages, last_stage),
+        "get_next_stage_index": lambda: planner.get_next_stage_index(len(stages) - 2, len(stages)),
+        "update_stage_state": lambda: planner.update_stage_state(
+            stage_progress, last_stage, "in_progress"
+        ),
+    }
+    return {
+        name: _time(fn, args.repeat, args.min_time)
+        for name, fn in cases.items()
+        if not args.only or name in args.only
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing run")
+    parser.add_argument("--only", nargs="*", help="Run only these cases")
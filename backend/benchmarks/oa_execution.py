@@ -0,0 +1,85 @@
+"""
+Latency benchmark for sandboxed OA grading.
+
+Grades one submission against a synthetic test set (sorting inputs of
+growing size) three ways:
+
+- serial: one sandbox at a time (workers=1)
+- parallel: tests spread over a pool of sandboxes
+- cached: the same submission again, answered from the report cache
+
+Reports seconds per submission and the fitted runtime scaling exponent.
+
+Usage (from backend/):
+    python -m benchmarks.oa_execution --tests 16 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from app.services.oa_execution import (
+    ExecutionCache,
+    OATestCase,
+    OATestSet,
+    SandboxExecutor,
+    SandboxLimits,
+)
+
+SOLUTION = """
+import sys
+values = sorted(map(int, sys.stdin.read().split()))
+print(" ".join(map(str, values)))
+"""
+
+
+def _test_set(count: int, seed: int = 7) -> OATestSet:
+    rng = random.Random(seed)
+    tests = []
+    for i in range(count):
+        size = 1000 * 2 ** (i % 8)
+        values = [rng.randint(-(10**6), 10**6) for _ in range(size)]
+        tests.append(
+            OATestCase(
+                name=f"test-{i}",
+                stdin=" ".join(map(str, values)),
+                expected_stdout=" ".join(map(str, sorted(values))),
+                size=size,
+            )
+        )
+    return OATestSet(
+        problem_id="sort",
+        version="1",
+        tests=tuple(tests),
+        limits=SandboxLimits(output_bytes=4 * 1024 * 1024),
+    )
+
+
+async def _timed(executor: SandboxExecutor, test_set: OATestSet) -> dict:
+    start = time.perf_counter()
+    report = await executor.run(SOLUTION, test_set)
+    return {
+        "seconds": round(time.perf_counter() - start, 4),
+        "passed": report.passed,
+        "scaling_exponent": report.scaling_exponent(),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    test_set = _test_set(args.tests)
+    parallel = SandboxExecutor(workers=args.workers, cache=ExecutionCache())
+    return {
+        "tests": args.tests,
+        "serial": await _timed(SandboxExecutor(workers=1), test_set),
+        f"parallel@{args.workers}": await _timed(parallel, test_set),
+        "cached": await _timed(parallel, test_set),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tests", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,154 @@
+"""
+Benchmark for watching pipeline progress: polling vs pushed events.
+
+Many dashboards watch one run while it advances through its stages, two
+ways:
+
+- polling: every watcher reads the run every --poll-ms, as the frontend
+  does with GET /pipeline/{id}
+- events: every watcher subscribes to the PipelineEventBroker, and each
+  advance publishes the updated run once
+
+Reports the SQL statements executed, how long watchers took to see each
+committed advance, and how many advances they never saw (a poller only
+sees the latest state).
+
+Usage (from backend/):
+    python -m benchmarks.pipeline_events --watchers 200 --advances 8 --poll-ms 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models import Candidate, JobProfile, PipelineRun
+from app.schemas.pipeline import PipelineResponse
+from app.services.pipeline_events import PipelineEventBroker
+from benchmarks.common import summarize_latencies
+
+STAGES = [f"stage_{i}" for i in range(16)]
+
+
+async def _seed_run(session_factory, mode: str) -> int:
+    async with session_factory() as db:
+        run = PipelineRun(
+            candidate=Candidate(email=f"{mode}@example.com", name="Bench"),
+            job_profile=JobProfile(role="SWE I", raw_description="bench"),
+            stages=STAGES,
+        )
+        db.add(run)
+        await db.commit()
+        return run.id
+
+
+async def _read(session_factory, run_id: int) -> dict:
+    async with session_factory() as db:
+        return PipelineResponse.model_validate(await db.get(PipelineRun, run_id)).model_dump(
+            mode="json"
+        )
+
+
+async def _advance(session_factory, run_id: int, index: int, advanced_at: dict) -> dict:
+    version = index + 2
+    async with session_factory() as db:
+        await db.execute(
+            update(PipelineRun)
+            .where(PipelineRun.id == run_id)
+            .values(current_stage_index=index, current_stage=STAGES[index], version=version)
+        )
+        await db.commit()
+    advanced_at[version] = time.perf_counter()
+    return await _read(session_factory, run_id)
+
+
+async def _polling(session_factory, run_id: int, args: argparse.Namespace) -> list:
+    advanced_at = {}
+    latencies = []
+    done = asyncio.Event()
+
+    async def watcher() -> None:
+        seen = 1
+        while not done.is_set():
+            version = (await _read(session_factory, run_id))["version"]
+            if version != seen:
+                now = time.perf_counter()
+                # A poller can read the commit before the advancer resumes
+                latencies.append(now - advanced_at.get(version, now))
+                seen = version
+            await asyncio.sleep(args.poll_ms / 1000)
+
+    watchers = [asyncio.create_task(watcher()) for _ in range(args.watchers)]
+    for index in range(args.advances):
+        await asyncio.sleep(args.advance_ms / 1000)
+        await _advance(session_factory, run_id, index, advanced_at)
+    await asyncio.sleep(args.poll_ms / 1000 * 2)
+    done.set()
+    await asyncio.gather(*watchers)
+    return latencies
+
+
+async def _events(session_factory, run_id: int, args: argparse.Namespace) -> list:
+    broker = PipelineEventBroker()
+    advanced_at = {}
+    latencies = []
+
+    async def watcher(subscription) -> None:
+        with subscription:
+            await _read(session_factory, run_id)  # The stream's opening snapshot
+            for _ in range(args.advances):
+                received = await subscription.get(timeout=60)
+                latencies.append(time.perf_counter() - advanced_at[received.data["version"]])
+
+    watchers = [
+        asyncio.create_task(watcher(broker.subscribe(run_id))) for _ in range(args.watchers)
+    ]
+    for index in range(args.advances):
+        await asyncio.sleep(args.advance_ms / 1000)
+        pipeline_run = await _advance(session_factory, run_id, index, advanced_at)
+        broker.publish(run_id, "stage_advanced", pipeline_run)
+    await asyncio.gather(*watchers)
+    return latencies
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        statements = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *_: statements.append(1))
+        try:
+            for mode, watch in (("polling", _polling), ("events", _events)):
+                run_id = await _seed_run(session_factory, mode)
+                statements.clear()
+                started = time.perf_counter()
+                latencies = await watch(session_factory, run_id, args)
+                elapsed = time.perf_counter() - started
+                results[mode] = {
+                    "statements": len(statements),
+                    "missed": args.watchers * args.advances - len(latencies),
+                    "notify": summarize_latencies(latencies, elapsed),
+                }
+        finally:
+            await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--watchers", type=int, default=200)
+    parser.add_argument("--advances", type=int, default=8)
+    parser.add_argument("--advance-ms", type=float, default=250)
+    parser.add_argument("--poll-ms", type=float, default=500)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,86 @@
+"""
+Throughput benchmark for the resume pre-screen.
+
+Generates synthetic resumes and scores them against a job profile with
+15 requirements three ways:
+
+- naive: one regex search per (resume, requirement term), the obvious loop
+- compiled: the single combined matcher plus NumPy scoring, in-process
+- pool: the same, split into chunks across a process pool
+
+Reports resumes per second for each.
+
+Usage (from backend/):
+    python -m benchmarks.resume_screen --resumes 20000 --workers 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.services.resume_screening import compile_requirements, requirement_terms, screen_batch
+
+MUST_HAVES = ("Python", "Kubernetes", "PostgreSQL", "Distributed systems", "AWS")
+NICE_TO_HAVES = ("Go lang", "Machine learning", "React", "Node.js", "C++")
+CORE = ("Data structures", "System design", "Object oriented programming", "Testing", "CI/CD")
+VOCABULARY = (
+    "python k8s kubernetes postgres aws golang react nodejs cpp ml testing design systems "
+    "distributed led built shipped team scalable services api latency throughput java "
+    "spring docker terraform linux bash git agile mentoring product customers metrics"
+).split()
+
+
+def _resumes(count: int, words: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY, k=words)) for _ in range(count)]
+
+
+def _naive(texts: list[str]) -> int:
+    requirements = [*MUST_HAVES, *NICE_TO_HAVES, *CORE]
+    patterns = [
+        [re.compile(rf"\b{re.escape(term)}\b", re.IGNORECASE) for term in requirement_terms(r)]
+        for r in requirements
+    ]
+    matched = 0
+    for text in texts:
+        for terms in patterns:
+            matched += any(pattern.search(text) for pattern in terms)
+    return matched
+
+
+def _timed(fn, count: int) -> dict:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 3), "resumes_per_sec": round(count / elapsed)}
+
+
+def main(args: argparse.Namespace) -> dict:
+    texts = _resumes(args.resumes, args.words)
+    compiled = compile_requirements(MUST_HAVES, NICE_TO_HAVES, CORE)
+    chunks = [texts[i : i + args.chunk_size] for i in range(0, len(texts), args.chunk_size)]
+
+    results = {
+        "naive": _timed(lambda: _naive(texts), len(texts)),
+        "compiled": _timed(lambda: screen_batch(compiled, texts), len(texts)),
+    }
+    with ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        # Warm the workers (imports) outside the timed section
+        list(pool.map(screen_batch, [compiled] * args.workers, [texts[:1]] * args.workers))
+        results[f"pool@{args.workers}"] = _timed(
+            lambda: list(pool.map(screen_batch, [compiled] * len(chunks), chunks)), len(texts)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=400, help="Words per resume")
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -1,11 +1,19 @@
-"""Seed database with sample data for testing."""
+"""
+Seed database with sample data for testing.
 
+Usage (from backend/):
+    python seed.py                                 # A few hand-written candidates and job profiles
+    python seed.py --synthetic --runs 1000000      # Deterministic synthetic data (app.datagen)
+"""
+
+import argparse
+import json
 from datetime import datetime
 
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal, engine
-from app.models import Base, Candidate, JobProfile, PipelineRun
+from app.database import Base, SessionLocal, engine
+from app.models import Candidate, JobProfile
 
 
 def seed_database():
@@ -103,5 +111,49 @@ def seed_database():
         db.close()
 
 
+def seed_synthetic(args: argparse.Namespace) -> dict:
+    """Bulk-load synthetic data generated from the command line options."""
+    from app.datagen import DatagenConfig, load
+    from app.services.artifact_store import get_artifact_store
+
+    Base.metadata.create_all(bind=engine)
+    config = DatagenConfig(
+        candidates=args.candidates,
+        job_profiles=args.job_profiles,
+        runs=args.runs,
+        seed=args.seed,
+        days=args.days,
+        **({"until": datetime.fromisoformat(args.until)} if args.until else {}),
+        resume_kb=args.resume_kb,
+        artifact_scale=args.artifact_scale,
+        artifact_pool=args.artifact_pool,
+        batch_size=args.batch_size,
+    )
+    return load(
+        engine,
+        config,
+        artifact_store=None if args.no_artifacts else get_artifact_store(),
+        defer_indexes=not args.keep_indexes,
+    )
+
+
 if __name__ == "__main__":
-    seed_database()
+    parser = argparse.ArgumentParser(description="Seed the database configured by DATABASE_URL.")
+    parser.add_argument("--synthetic", action="store_true", help="Generate synthetic data")
+    parser.add_argument("--candidates", type=int, default=1000)
+    parser.add_argument("--job-profiles", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--until", help="ISO date the timeline ends at (default: today, UTC)")
+    parser.add_argument("--resume-kb", type=float, default=2.0)
+    parser.add_argument("--artifact-scale", type=float, default=1.0)
+    parser.add_argument("--artifact-pool", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=20000)
+    parser.add_argument("--no-artifacts", action="store_true", help="Skip the artifact store")
+    parser.add_argument("--keep-indexes", action="store_true", help="Load with indexes in place")
+    args = parser.parse_args()
+    if args.synthetic:
+        print(json.dumps(seed_synthetic(args), indent=2))
+    else:
+        seed_database()
@@ -1,11 +1,17 @@
 """Test configuration and fixtures."""
 
 import pytest
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from app.database import Base
+from app.database import Base, get_async_db, get_async_session_factory
 from app.main import app as fastapi_app
+from app.models import Candidate, JobProfile
+from app.services.archive import RunArchive, get_run_archive
+from app.services.artifact_store import FilesystemArtifactStore, get_artifact_store
 
 
 @pytest.fixture(scope="session")
@@ -22,3 +28,69 @@ def test_db():
 def app():
     """FastAPI app fixture."""
     return fastapi_app
+
+
+@pytest.fixture
+async def async_db(tmp_path):
+    """
+    Create a file-backed async test database (one per test).
+
+    Each session gets its own connection, as in production, so concurrent
+    requests keep separate transactions (a shared in-memory connection
+    would let one request's rollback undo another's writes).
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=AsyncAdaptedQueuePool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestingAsyncSessionLocal = async_sessionmaker(
+        bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    yield TestingAsyncSessionLocal
+    await engine.dispose()
+
+
+@pytest.fixture
+def artifact_store(tmp_path):
+    """Artifact store in a per-test directory, with small blocks to exercise range reads."""
+    return FilesystemArtifactStore(tmp_path / "artifacts", block_size=1024)
+
+
+@pytest.fixture
+def run_archive(tmp_path):
+    """Cold archive of pipeline runs in a per-test directory."""
+    return RunArchive(tmp_path / "archive")
+
+
+@pytest.fixture
+async def client(app, async_db, artifact_store, run_archive):
+    """Async HTTP client with the async session dependency bound to the test database."""
+
+    async def override_get_async_db():
+        async with async_db() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: async_db
+    app.dependency_overrides[get_artifact_store] = lambda: artifact_store
+    app.dependency_overrides[get_run_archive] = lambda: run_archive
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def seeded(async_db):
+    """Insert one candidate and one job profile; returns their IDs."""
+    async with async_db() as db:
+        candidate = Candidate(email="test@example.com", name="Test User", resume_text="Python")
+        job_profile = JobProfile(
+            role="Software Engineer I",
+            company="Test Corp",
+            raw_description="Test description",
+            must_haves=["Python"],
+        )
+        db.add_all([candidate, job_profile])
+        await db.commit()
+        return {"candidate_id": candidate.id, "job_profile_id": job_profile.id}
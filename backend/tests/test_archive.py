@@ -0,0 +1,160 @@
+"""Test cold archival of decided pipeline runs and the partition helpers."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, select
+
+from app.config import settings
+from app.datagen import DatagenConfig, load
+from app.models import ArchivedPipelineRun, Job, PipelineRun, PipelineStageState, StageResult
+from app.models.job import JobStatus
+from app.services import archive as archive_service
+from app.services.archive import (
+    ARCHIVE_JOB,
+    TERMINAL_STATUSES,
+    archive_runs,
+    run_archival,
+    schedule_archival,
+)
+from app.services.job_queue import JobContext
+from app.services.partitions import (
+    add_months,
+    drop_empty_partitions,
+    ensure_partitions,
+    month_start,
+    partition_name,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+OLDER_THAN = timedelta(days=90)
+
+
+def _load(tmp_path, **overrides):
+    config = DatagenConfig(
+        candidates=100, job_profiles=3, runs=200, seed=3, until=NOW, artifact_scale=0
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    load(engine, DatagenConfig(**{**config.__dict__, **overrides}))
+    return engine
+
+
+def _due(engine, cutoff):
+    with engine.connect() as conn:
+        return conn.scalars(
+            select(PipelineRun.id).where(
+                PipelineRun.status.in_(TERMINAL_STATUSES),
+                PipelineRun.created_at < cutoff,
+                func.coalesce(PipelineRun.completed_at, PipelineRun.updated_at) < cutoff,
+            )
+        ).all()
+
+
+async def test_archive_moves_decided_runs(async_db, tmp_path, run_archive):
+    engine = _load(tmp_path)
+    due = _due(engine, NOW - OLDER_THAN)
+    with engine.connect() as conn:
+        runs_before = conn.scalar(select(func.count()).select_from(PipelineRun))
+    assert due
+
+    batches = []
+    while moved := await archive_runs(async_db, run_archive, OLDER_THAN, 50, now=NOW):
+        batches.append(moved)
+
+    assert sum(batches) == len(due)
+    with engine.connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(PipelineRun)) == runs_before - len(due)
+        for model in (StageResult, PipelineStageState):
+            assert not conn.scalar(
+                select(func.count()).select_from(model).where(model.pipeline_run_id.in_(due))
+            )
+        archived = conn.execute(select(ArchivedPipelineRun)).all()
+    assert sorted(row.pipeline_run_id for row in archived) == sorted(due)
+    assert not _due(engine, NOW - OLDER_THAN)
+
+    # Each archive file is plain gzipped NDJSON
+    files = sorted((tmp_path / "archive" / "pipeline_runs").glob("*.ndjson.gz"))
+    assert len(files) == len(batches)
+    with gzip.open(files[0], "rt") as f:
+        documents = [json.loads(line) for line in f]
+    assert [document["id"] for document in documents] == sorted(due)[: len(documents)]
+    assert {document["status"] for document in documents} <= {s.value for s in TERMINAL_STATUSES}
+
+
+async def test_archived_run_is_served(client, async_db, tmp_path, run_archive):
+    engine = _load(tmp_path)
+    run_id = _due(engine, NOW - OLDER_THAN)[0]
+    live = await client.get(f"/pipeline/{run_id}")
+    live_results = (
+        await client.get(
+            "/stage_results", params={"pipeline_run_id": run_id, "include_payload": True}
+        )
+    ).json()
+
+    await archive_runs(async_db, run_archive, OLDER_THAN, 500, now=NOW)
+
+    archived = await client.get(f"/pipeline/{run_id}")
+    assert archived.status_code == 200
+    assert archived.json() == live.json()
+    assert archived.headers["etag"] == live.headers["etag"]
+    revalidated = await client.get(
+        f"/pipeline/{run_id}", headers={"If-None-Match": live.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+    full = await client.get(f"/pipeline/{run_id}/archive")
+    assert full.status_code == 200
+    results = full.json()["stage_results"]
+    assert [result["id"] for result in results] == [result["id"] for result in live_results]
+    assert [result["raw_scores"] for result in results] == [
+        result["raw_scores"] for result in live_results
+    ]
+    assert full.json()["interview_turns"] == []
+
+    with engine.connect() as conn:
+        live_id = conn.scalar(select(PipelineRun.id).limit(1))
+    assert (await client.get(f"/pipeline/{live_id}/archive")).status_code == 404
+    assert (await client.get("/pipeline/999999")).status_code == 404
+
+
+async def test_archival_job_reschedules_itself(async_db, tmp_path, run_archive, monkeypatch):
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    engine = _load(tmp_path, until=today)
+    monkeypatch.setattr(archive_service, "get_run_archive", lambda: run_archive)
+    monkeypatch.setattr(settings, "archive_after_days", 90.0)
+    monkeypatch.setattr(settings, "archive_batch_size", 40)
+    due = _due(engine, datetime.now(timezone.utc) - timedelta(days=90))
+
+    await run_archival(
+        JobContext(job_id=0, kind=ARCHIVE_JOB, payload={}, attempt=1, session_factory=async_db)
+    )
+
+    async with async_db() as db:
+        archived = await db.scalar(select(func.count()).select_from(ArchivedPipelineRun))
+        queued = (
+            await db.scalars(
+                select(Job).where(Job.kind == ARCHIVE_JOB, Job.status == JobStatus.QUEUED)
+            )
+        ).all()
+    assert archived == len(due)
+    assert len(queued) == 1
+    assert queued[0].run_after.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+    assert not await schedule_archival(async_db)
+
+
+def test_partition_months():
+    month = month_start(datetime(2025, 11, 17, 23, 30, tzinfo=timezone(timedelta(hours=-5))))
+    assert month == datetime(2025, 11, 1, tzinfo=timezone.utc)
+    assert month_start(datetime(2025, 11, 30, 23, 30, tzinfo=timezone(timedelta(hours=-5)))) == (
+        datetime(2025, 12, 1, tzinfo=timezone.utc)
+    )
+    assert add_months(month, 2) == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert add_months(month, -11) == datetime(2024, 12, 1, tzinfo=timezone.utc)
+    assert partition_name("pipeline_runs", add_months(month, 2)) == "pipeline_runs_p2026_01"
+
+
+def test_partition_maintenance_is_a_noop_without_partitions():
+    with create_engine("sqlite://").begin() as conn:
+        assert ensure_partitions(conn, NOW, 3) == []
+        assert drop_empty_partitions(conn, NOW) == []
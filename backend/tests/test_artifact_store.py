@@ -0,0 +1,99 @@
+"""Test the content-addressed artifact store."""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from app.database import Base
+from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.services.artifact_store import ArtifactNotFoundError, ArtifactRef, is_artifact_ref
+
+
+def test_put_is_content_addressed_and_deduplicated(artifact_store):
+    """Test that identical content is stored once, compressed."""
+    data = b"def solve():\n    return 42\n" * 500
+    first = artifact_store.put(data, "text/plain")
+    second = artifact_store.put(data, "text/plain")
+    assert first == second
+    assert first.size == len(data)
+
+    blobs = [path for path in artifact_store.root.rglob("*") if path.is_file()]
+    assert len(blobs) == 1
+    assert blobs[0].stat().st_size < len(data) / 4
+    assert artifact_store.get(first.digest) == data
+
+
+@pytest.mark.parametrize("compressible", [True, False])
+def test_range_reads(artifact_store, compressible):
+    """Test range reads across block boundaries, compressed and raw."""
+    data = (b"0123456789" * 1000) if compressible else os.urandom(10_000)
+    ref = artifact_store.put(data)
+
+    for start, stop in [(0, 10_000), (0, 1), (1000, 1024), (1020, 3100), (9999, 20_000)]:
+        assert b"".join(artifact_store.read_range(ref.digest, start, stop)) == data[start:stop]
+    assert list(artifact_store.read_range(ref.digest, 5000, 5000)) == []
+    assert artifact_store.size(ref.digest) == len(data)
+
+
+def test_missing_blob(artifact_store):
+    """Test lookups of unknown or malformed digests."""
+    assert not artifact_store.exists("0" * 64)
+    assert not artifact_store.exists("../../etc/passwd")
+    with pytest.raises(ArtifactNotFoundError):
+        artifact_store.size("0" * 64)
+
+
+def test_put_artifacts_keeps_references(artifact_store):
+    """Test converting an inline artifacts mapping to references."""
+    refs = artifact_store.put_artifacts({"code": "print(1)", "scores": [1, 2]})
+    assert all(is_artifact_ref(value) for value in refs.values())
+    assert refs["scores"]["media_type"] == "application/json"
+    assert artifact_store.put_artifacts(refs) == refs
+
+
+def test_migration_moves_inline_artifacts(artifact_store, tmp_path, monkeypatch):
+    """Test the data migration in both directions."""
+    path = Path(__file__).parents[1] / "alembic/versions/006_move_inline_artifacts_to_store.py"
+    spec = importlib.util.spec_from_file_location("migration_006", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    monkeypatch.setattr(migration, "get_artifact_store", lambda: artifact_store)
+    monkeypatch.setattr(migration, "BATCH_SIZE", 2)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'migration.db'}")
+    Base.metadata.create_all(engine)
+    inline = [{"transcript": f"Q{i}", "rubric": {"score": i}} for i in range(5)]
+    with engine.begin() as conn:
+        conn.execute(Candidate.__table__.insert(), {"email": "a@b.c", "name": "A"})
+        conn.execute(JobProfile.__table__.insert(), {"role": "SWE", "raw_description": "d"})
+        conn.execute(
+            PipelineRun.__table__.insert(),
+            {"candidate_id": 1, "job_profile_id": 1, "stages": ["oa"], "stage_count": 1},
+        )
+        conn.execute(
+            StageResult.__table__.insert(),
+            [
+                {"pipeline_run_id": 1, "stage_name": "oa", "stage_type": "oa", "artifacts": a}
+                for a in inline
+            ],
+        )
+
+    artifacts = StageResult.__table__.c.artifacts
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            migration.upgrade()
+        stored = conn.scalars(select(artifacts).order_by(StageResult.__table__.c.id)).all()
+    assert all(is_artifact_ref(value) for row in stored for value in row.values())
+    ref = ArtifactRef.from_json(stored[3]["transcript"])
+    assert artifact_store.get(ref.digest) == b"Q3"
+
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            migration.downgrade()
+        restored = conn.scalars(select(artifacts).order_by(StageResult.__table__.c.id)).all()
+    assert restored == inline
@@ -0,0 +1,33 @@
+"""Test the benchmark results comparison."""
+
+from benchmarks.compare import compare
+
+
+def _document(results):
+    return {"format": 1, "suite": "micro", "results": results}
+
+
+def test_compare_flags_regressions():
+    """Test that only changes worse than the threshold are flagged, per metric direction."""
+    baseline = _document(
+        {
+            "plan_pipeline": {"mean_us": 10.0, "ops_per_sec": 100000.0},
+            "get@c8": {"p99_ms": 20.0, "throughput_rps": 500.0, "requests": 100},
+        }
+    )
+    current = _document(
+        {
+            "plan_pipeline": {"mean_us": 10.5, "ops_per_sec": 80000.0},
+            "get@c8": {"p99_ms": 30.0, "throughput_rps": 600.0, "requests": 100},
+            "new_case": {"mean_us": 1.0},
+        }
+    )
+
+    rows = {(r["case"], r["metric"]): r for r in compare(baseline, current, threshold_pct=10)}
+    assert not rows[("plan_pipeline", "mean_us")]["regression"]
+    assert rows[("plan_pipeline", "ops_per_sec")]["regression"]
+    assert rows[("get@c8", "p99_ms")]["regression"]
+    assert rows[("get@c8", "p99_ms")]["change_pct"] == 50.0
+    assert not rows[("get@c8", "throughput_rps")]["regression"]
+    assert ("get@c8", "requests") not in rows
+    assert ("new_case", "mean_us") not in rows
@@ -0,0 +1,77 @@
+"""Test connection pool configuration and exhaustion behaviour."""
+
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import (
+    Base,
+    InstrumentedAsyncAdaptedQueuePool,
+    engine_options,
+    get_async_db,
+    pool_status,
+)
+
+
+@pytest.fixture
+async def small_pool(app, tmp_path, monkeypatch):
+    """App bound to a file database whose pool holds a single connection."""
+    monkeypatch.setattr(settings, "db_pool_size", 1)
+    monkeypatch.setattr(settings, "db_max_overflow", 0)
+    monkeypatch.setattr(settings, "db_pool_timeout", 0.2)
+    url = f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}"
+    engine = create_async_engine(url, **engine_options(url, InstrumentedAsyncAdaptedQueuePool))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield engine
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+def test_engine_options_from_settings():
+    """Test that pool settings are applied except for in-memory SQLite."""
+    options = engine_options("postgresql://localhost/db", InstrumentedAsyncAdaptedQueuePool)
+    assert options["pool_size"] == settings.db_pool_size
+    assert options["max_overflow"] == settings.db_max_overflow
+    assert options["pool_timeout"] == settings.db_pool_timeout
+    assert options["pool_recycle"] == settings.db_pool_recycle
+    assert options["pool_pre_ping"] == settings.db_pool_pre_ping
+
+    assert "pool_size" not in engine_options("sqlite://", InstrumentedAsyncAdaptedQueuePool)
+
+
+async def test_pool_exhaustion_times_out_cleanly(app, small_pool):
+    """Test that requests wait for a connection, then fail with 503 instead of hanging."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # Requests queue for the single connection and all complete
+        responses = await asyncio.gather(*(client.get("/pipeline/1") for _ in range(3)))
+        assert [r.status_code for r in responses] == [404] * 3
+
+        # With the only connection held elsewhere, the request times out
+        async with small_pool.connect():
+            status = pool_status(small_pool.sync_engine)
+            assert status["checked_out"] == 1
+            assert status["saturated"] is True
+
+            start = time.perf_counter()
+            response = await client.get("/pipeline/1")
+            assert response.status_code == 503
+            assert response.headers["retry-after"] == "1"
+            assert time.perf_counter() - start < 2
+
+        status = pool_status(small_pool.sync_engine)
+        assert status["timeouts"] == 1
+        assert status["wait_seconds_max"] >= 0.2
+        assert status["checked_out"] == 0
+        assert (await client.get("/pipeline/1")).status_code == 404
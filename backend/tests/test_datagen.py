@@ -0,0 +1,116 @@
+"""Test the synthetic data generator and bulk loader."""
+
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.datagen import STAGES, TABLES, DatagenConfig, load
+from app.models import PipelineRun, StageResult
+from app.models.pipeline_run import PipelineStatus
+from app.services.artifact_store import ArtifactRef
+
+CONFIG = DatagenConfig(
+    candidates=150,
+    job_profiles=5,
+    runs=300,
+    seed=7,
+    until=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    artifact_scale=0.1,
+    artifact_pool=4,
+    batch_size=500,
+)
+
+
+def _engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _dump(engine):
+    with engine.connect() as conn:
+        return {
+            target.name: conn.execute(select(target).order_by(*target.primary_key)).all()
+            for target in TABLES
+        }
+
+
+def test_load_is_deterministic(tmp_path, artifact_store):
+    first, second = _engine(tmp_path / "a.db"), _engine(tmp_path / "b.db")
+
+    summary = load(first, CONFIG, artifact_store)
+    # Batch size changes only how the rows are written
+    load(second, DatagenConfig(**{**CONFIG.__dict__, "batch_size": 64}), artifact_store)
+
+    assert summary["rows"]["pipeline_runs"] == 300
+    assert summary["rows"]["pipeline_stage_states"] == 300 * len(STAGES)
+    assert summary["total_rows"] == sum(summary["rows"].values())
+    assert _dump(first) == _dump(second)
+    assert {index["name"] for index in inspect(first).get_indexes("pipeline_runs")}
+
+
+def test_load_appends_after_existing_rows(tmp_path):
+    engine = _engine(tmp_path / "test.db")
+    small = DatagenConfig(**{**CONFIG.__dict__, "runs": 20, "candidates": 10})
+
+    load(engine, small)
+    load(engine, small)
+
+    with Session(engine) as db:
+        assert db.scalar(select(func.count()).select_from(PipelineRun)) == 40
+        assert db.scalar(select(func.max(PipelineRun.candidate_id))) <= 20
+
+
+def test_generated_runs_are_consistent(tmp_path, artifact_store):
+    engine = _engine(tmp_path / "test.db")
+    load(engine, CONFIG, artifact_store)
+
+    with Session(engine) as db:
+        runs = db.scalars(select(PipelineRun)).all()
+        statuses = Counter(run.status for run in runs)
+        assert {
+            PipelineStatus.CREATED,
+            PipelineStatus.IN_PROGRESS,
+            PipelineStatus.COMPLETED,
+            PipelineStatus.FAILED,
+        } <= set(statuses)
+        # Most candidates are rejected early in the funnel
+        assert statuses[PipelineStatus.FAILED] > statuses[PipelineStatus.COMPLETED]
+        for run in runs:
+            assert run.stages == list(STAGES)
+            assert run.stage_count == len(run.stage_states) == len(STAGES)
+            if run.current_stage_index is None:
+                assert run.version == 1 and run.started_at is None
+            else:
+                assert run.version == run.current_stage_index + 2
+                assert run.current_stage == STAGES[run.current_stage_index]
+                assert run.created_at <= run.started_at <= run.updated_at
+            if run.status in (PipelineStatus.COMPLETED, PipelineStatus.FAILED):
+                assert run.completed_at is not None
+
+        interview = db.scalars(
+            select(StageResult).where(StageResult.stage_type == "interview").limit(1)
+        ).one()
+        assert 1 <= interview.raw_scores["overall_rating"] <= 4
+        assert "confidence" in interview.raw_scores
+        ref = ArtifactRef.from_json(interview.artifacts["transcript"])
+        assert artifact_store.size(ref.digest) == ref.size
+
+
+async def test_generated_data_is_served(client, async_db, tmp_path, artifact_store):
+    load(create_engine(f"sqlite:///{tmp_path / 'test.db'}"), CONFIG, artifact_store)
+
+    listed = await client.get("/pipeline", params={"limit": 50})
+    assert listed.status_code == 200
+    assert len(listed.json()["items"]) == 50
+
+    result_id = (await client.get("/stage_results", params={"pipeline_run_id": 1})).json()[0]["id"]
+    run = await client.get("/pipeline/1")
+    assert run.status_code == 200
+    assert list(run.json()["stage_progress"]) == list(STAGES)
+    result = await client.get(f"/stage_results/{result_id}", params={"include_payload": True})
+    assert result.status_code == 200
+    assert result.json()["raw_scores"]
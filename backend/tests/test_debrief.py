@@ -0,0 +1,194 @@
+"""Test the debrief engine."""
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+
+from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.models.stage_result import StageDecision, load_stage_result_payload
+from app.services.debrief import (
+    DEBRIEF_JOB,
+    HIRE,
+    HOLD,
+    NO_HIRE,
+    Cohort,
+    DebriefPolicy,
+    cohort_cache,
+    evaluate,
+    load_cohort,
+    run_debrief_job,
+)
+from app.services.job_queue import JobContext
+
+STAGES = ("onsite_coding_1", "onsite_coding_2", "onsite_behavioral", "onsite_design_lite")
+
+# Ratings per candidate (coding 1, coding 2, behavioral, design), confidence, killer signals
+SCORECARDS = [
+    ((4, 4, 3, 3), 1.0, []),  # strong: hire
+    ((3, 3, 3, 3), 0.9, []),  # confidence pulls the score into hold
+    ((4, 1, 4, 4), 1.0, []),  # a coding 1 fails the bar
+    ((4, 4, 1, 4), 1.0, []),  # behavioral below 2 fails the bar
+    ((4, 4, 3, 3), 1.0, ["integrity"]),  # killer signal
+]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cohort_cache():
+    cohort_cache.clear()
+
+
+def _cohort(scorecards=SCORECARDS):
+    ratings = np.array([cards for cards, _, _ in scorecards], dtype=float)
+    confidence = np.array([[conf] * len(STAGES) for _, conf, _ in scorecards])
+    return Cohort(
+        run_ids=np.arange(1, len(scorecards) + 1),
+        stages=STAGES,
+        ratings=ratings,
+        confidence=confidence,
+        killer=np.array([bool(signals) for _, _, signals in scorecards]),
+    )
+
+
+def test_evidence_score_bar_rules_and_thresholds():
+    """Test EvidenceScore, the consistency penalty, bar rules and decisions."""
+    debrief = evaluate(_cohort())
+
+    # mean(4, 4, 3, 3) = 3.5 minus 0.25 x std 0.5
+    assert debrief.evidence_scores[0] == pytest.approx(3.375)
+    assert debrief.consistency_penalties[1] == 0.0
+    assert debrief.evidence_scores[1] == pytest.approx(2.7)
+    assert debrief.bar_met.tolist() == [True, True, False, False, True]
+    assert debrief.decisions.tolist() == [HIRE, HOLD, NO_HIRE, NO_HIRE, NO_HIRE]
+    assert debrief.counts() == {"no_hire": 3, "hold": 1, "hire": 1}
+
+
+def test_missing_scorecards_and_what_if_policies():
+    """Test weights renormalized over present scorecards and alternative policies."""
+    cohort = _cohort([((4, 4, 3, np.nan), 1.0, []), ((4, 4, 3, 3), 1.0, [])])
+    debrief = evaluate(cohort)
+    assert debrief.complete.tolist() == [False, True]
+    assert np.isfinite(debrief.evidence_scores).all()
+
+    # Doubling the coding weight lifts the score; a stricter bar drops the hire
+    coding_heavy = evaluate(cohort, DebriefPolicy(weights={"coding": 2.0}))
+    assert coding_heavy.evidence_scores[1] > debrief.evidence_scores[1]
+    strict = evaluate(cohort, DebriefPolicy(hire_threshold=3.5))
+    assert strict.decisions.tolist()[1] == HOLD
+
+
+async def _seed_cohort(async_db, scorecards=SCORECARDS):
+    async with async_db() as db:
+        job_profile = JobProfile(role="SWE I", raw_description="Debrief cohort")
+        runs = []
+        for i, (ratings, confidence, signals) in enumerate(scorecards):
+            run = PipelineRun(
+                candidate=Candidate(email=f"debrief-{i}@example.com", name=f"Candidate {i}"),
+                job_profile=job_profile,
+                stages=[*STAGES, "debrief"],
+            )
+            run.stage_results = [
+                StageResult(
+                    stage_name=stage,
+                    stage_type=stage,
+                    raw_scores={
+                        "overall_rating": rating,
+                        "confidence": confidence,
+                        "killer_signals": signals,
+                    },
+                )
+                for stage, rating in zip(STAGES, ratings, strict=True)
+            ]
+            runs.append(run)
+        db.add_all(runs)
+        await db.commit()
+        return job_profile.id, [run.id for run in runs]
+
+
+async def test_load_cohort_and_persist_decisions(async_db):
+    """Test loading scorecards into arrays, cache invalidation and bulk persistence."""
+    job_profile_id, run_ids = await _seed_cohort(async_db)
+    async with async_db() as db:
+        cohort = await load_cohort(db, job_profile_id)
+        assert cohort.run_ids.tolist() == run_ids
+        assert cohort.ratings[2].tolist() == [4, 1, 4, 4]
+        assert cohort.killer.tolist() == [False, False, False, False, True]
+        assert await load_cohort(db, job_profile_id) is cohort
+
+        # A new scorecard invalidates the cached cohort
+        db.add(
+            StageResult(
+                pipeline_run_id=run_ids[3],
+                stage_name="onsite_behavioral",
+                stage_type="onsite_behavioral",
+                raw_scores={"overall_rating": 3, "confidence": 1.0},
+            )
+        )
+        await db.commit()
+        reloaded = await load_cohort(db, job_profile_id)
+        assert reloaded is not cohort
+        assert reloaded.ratings[3].tolist() == [4, 4, 3, 4]
+
+    context = JobContext(
+        job_id=1,
+        kind=DEBRIEF_JOB,
+        payload={"job_profile_id": job_profile_id, "policy": {}, "policy_name": "srs"},
+        attempt=1,
+        session_factory=async_db,
+    )
+    await run_debrief_job(context)
+    await run_debrief_job(context)  # Re-running replaces, not duplicates
+
+    async with async_db() as db:
+        results = (
+            await db.scalars(
+                select(StageResult)
+                .options(load_stage_result_payload())
+                .where(StageResult.stage_name == "debrief")
+                .order_by(StageResult.pipeline_run_id)
+            )
+        ).all()
+        assert [result.decision for result in results] == [
+            StageDecision.PASS,
+            StageDecision.HOLD,
+            StageDecision.FAIL,
+            StageDecision.PASS,
+            StageDecision.FAIL,
+        ]
+        assert results[0].raw_scores["evidence_score"] == 3.375
+        assert results[4].raw_scores["killer_signal"] is True
+        count = await db.scalar(select(func.count()).where(StageResult.stage_name == "debrief"))
+        assert count == len(run_ids)
+
+
+async def test_debrief_endpoints(client, async_db):
+    """Test the what-if comparison and queuing a persisted run."""
+    job_profile_id, _ = await _seed_cohort(async_db)
+
+    response = await client.post(
+        "/debrief/what_if",
+        json={
+            "job_profile_id": job_profile_id,
+            "policies": {"srs": {}, "lenient": {"hire_threshold": 2.5}},
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["cohort_size"] == 5
+    assert data["complete"] == 5
+    assert data["results"]["srs"] == {
+        "hire": 1,
+        "hold": 1,
+        "no_hire": 3,
+        "changed": 0,
+        "mean_evidence_score": pytest.approx(3.06, abs=1e-3),
+    }
+    assert data["results"]["lenient"]["hire"] == 2
+    assert data["results"]["lenient"]["changed"] == 1
+
+    response = await client.post("/debrief/run", json={"job_profile_id": job_profile_id})
+    assert response.status_code == 202
+    assert response.json()["kind"] == DEBRIEF_JOB
+
+    for path in ("/debrief/run", "/debrief/what_if"):
+        response = await client.post(path, json={"job_profile_id": 999, "policies": {"a": {}}})
+        assert response.status_code == 404
@@ -0,0 +1,114 @@
+"""Test bulk export endpoints."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update
+
+from app.models import JobProfile, PipelineRun, StageResult
+from app.models.stage_result import StageDecision
+from app.routers.export import ExportFormat, stream_rows
+
+
+async def _seed_runs(client, async_db, seeded):
+    """Start three runs (one on a second job profile) with a stage result each."""
+    async with async_db() as db:
+        other_profile = JobProfile(role="Software Engineer II", raw_description="Other")
+        db.add(other_profile)
+        await db.commit()
+        other_profile_id = other_profile.id
+
+    items = [seeded, seeded, {**seeded, "job_profile_id": other_profile_id}]
+    response = await client.post("/pipeline/start/batch", json={"items": items})
+    run_ids = [result["pipeline"]["id"] for result in response.json()["results"]]
+
+    async with async_db() as db:
+        db.add_all(
+            StageResult(
+                pipeline_run_id=run_id,
+                stage_name="resume_screen",
+                stage_type="resume_screen",
+                decision=StageDecision.PROCEED,
+                raw_scores={"match": 0.5},
+                strengths=["Python"],
+                artifacts={"transcript": "x" * 1000},
+            )
+            for run_id in run_ids
+        )
+        await db.commit()
+    return run_ids, other_profile_id
+
+
+async def test_export_pipelines_ndjson(client, async_db, seeded):
+    """Test streaming runs as NDJSON with job profile and time window filters."""
+    run_ids, other_profile_id = await _seed_runs(client, async_db, seeded)
+
+    response = await client.get("/export/pipelines")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == run_ids
+    assert rows[0]["status"] == "CREATED"
+    assert rows[0]["stages"][0] == "resume_screen"
+
+    response = await client.get("/export/pipelines", params={"job_profile_id": other_profile_id})
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == run_ids[2:]
+
+    # Move the first run back a day; a window starting an hour ago excludes it
+    async with async_db() as db:
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        await db.execute(
+            update(PipelineRun).where(PipelineRun.id == run_ids[0]).values(created_at=yesterday)
+        )
+        await db.commit()
+    hour_ago = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    response = await client.get("/export/pipelines", params={"created_from": hour_ago})
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == run_ids[1:]
+    response = await client.get("/export/pipelines", params={"created_to": hour_ago})
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == run_ids[:1]
+
+    # The same window with a UTC offset selects the same runs
+    hour_ago_cest = datetime.fromisoformat(hour_ago).astimezone(timezone(timedelta(hours=2)))
+    response = await client.get(
+        "/export/pipelines", params={"created_from": hour_ago_cest.isoformat()}
+    )
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == run_ids[1:]
+    response = await client.get(
+        "/export/pipelines", params={"created_to": hour_ago_cest.isoformat()}
+    )
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == run_ids[:1]
+
+
+async def test_export_stage_results_csv(client, async_db, seeded):
+    """Test streaming stage results as CSV, without artifacts."""
+    run_ids, _ = await _seed_runs(client, async_db, seeded)
+
+    response = await client.get(
+        "/export/stage_results",
+        params={"format": "csv", "job_profile_id": seeded["job_profile_id"]},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="stage_results.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["pipeline_run_id"]) for row in rows] == run_ids[:2]
+    assert "artifacts" not in rows[0]
+    assert rows[0]["decision"] == "PROCEED"
+    assert json.loads(rows[0]["raw_scores"]) == {"match": 0.5}
+    assert rows[0]["notes"] == ""
+
+
+async def test_export_streams_in_chunks(async_db, seeded):
+    """Test that rows are serialized one cursor partition at a time."""
+    async with async_db() as db:
+        db.add_all(PipelineRun(**seeded, stages=["resume_screen"]) for _ in range(5))
+        await db.commit()
+
+    stmt = select(PipelineRun.id).order_by(PipelineRun.id)
+    chunks = [
+        chunk async for chunk in stream_rows(async_db, stmt, ["id"], ExportFormat.CSV, chunk_size=2)
+    ]
+    assert chunks == ["id\n1\n2\n", "3\n4\n", "5\n"]
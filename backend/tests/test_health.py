@@ -14,6 +14,10 @@ def test_health_check():
     data = response.json()
     assert data["status"] == "healthy"
     assert "service" in data
+    pools = data["database"]["pools"]
+    assert set(pools) == {"sync", "async"}
+    assert pools["async"]["checked_out"] == 0
+    assert "wait_seconds_max" in pools["async"]
 
 
 def test_root():
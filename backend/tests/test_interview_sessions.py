@@ -0,0 +1,213 @@
+"""Test the interview session store and write-behind turn persistence."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.main import app as fastapi_app
+from app.models import Candidate, InterviewTurn, JobProfile, PipelineRun
+from app.services.interview_sessions import (
+    HintBudgetExhaustedError,
+    InterviewSessionStore,
+    SessionEndedError,
+    SessionNotFoundError,
+    SessionStoreBackpressureError,
+    TurnRecord,
+    get_session_store,
+)
+
+
+async def _seed_run(async_db):
+    async with async_db() as db:
+        run = PipelineRun(
+            candidate=Candidate(email="interview@example.com", name="Interview Candidate"),
+            job_profile=JobProfile(role="SWE I", raw_description="Interview"),
+            stages=["onsite_coding_1"],
+        )
+        db.add(run)
+        await db.commit()
+        return run.id
+
+
+async def _turns(async_db):
+    async with async_db() as db:
+        stmt = select(InterviewTurn).order_by(InterviewTurn.session_id, InterviewTurn.turn_index)
+        return (await db.scalars(stmt)).all()
+
+
+def _count_turn_inserts(async_db):
+    inserts = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO interview_turns"):
+            # Rows in one multi-row VALUES statement
+            per_row = statement.split(" VALUES ")[1].split(")")[0].count("?")
+            inserts.append(len(parameters) // per_row)
+
+    event.listen(async_db.kw["bind"].sync_engine, "before_cursor_execute", before_execute)
+    return inserts
+
+
+class _BrokenSessionFactory:
+    """Session factory for a database that is down."""
+
+    def __call__(self):
+        raise ConnectionError("database is down")
+
+
+async def test_session_state_and_turns(async_db):
+    """Test the timer, hint budget, recent turns and ending a session."""
+    run_id = await _seed_run(async_db)
+    store = InterviewSessionStore(async_db, spill_path="", recent_turns=2)
+    state = await store.create_session(run_id, "onsite_coding_1", 60, hint_budget=1)
+
+    state, first = await store.record_turn(state.session_id, "interviewer", "Two sum?")
+    state, _ = await store.record_turn(state.session_id, "candidate", "Hint?", use_hint=True)
+    state, third = await store.record_turn(state.session_id, "candidate", "Hash map")
+    assert (first.turn_index, third.turn_index) == (0, 2)
+    assert third.hints_used == 1
+    assert state.turn_count == 3
+    assert state.remaining_seconds() <= 60
+    assert [turn["content"] for turn in state.recent_turns] == ["Hint?", "Hash map"]
+
+    with pytest.raises(HintBudgetExhaustedError):
+        await store.record_turn(state.session_id, "candidate", "Another", use_hint=True)
+    with pytest.raises(SessionNotFoundError):
+        await store.record_turn("missing", "candidate", "Hello")
+
+    # Nothing is written until a flush; ending the session flushes
+    assert await _turns(async_db) == []
+    ended = await store.end_session(state.session_id)
+    assert ended.ended_at is not None
+    turns = await _turns(async_db)
+    assert [(t.turn_index, t.role, t.hints_used) for t in turns] == [
+        (0, "interviewer", 0),
+        (1, "candidate", 1),
+        (2, "candidate", 1),
+    ]
+    assert turns[0].pipeline_run_id == run_id
+    with pytest.raises(SessionEndedError):
+        await store.record_turn(state.session_id, "candidate", "Late")
+
+
+async def test_write_behind_batches(async_db):
+    """Test grouped inserts: a full batch flushes right away, the rest on stop."""
+    run_id = await _seed_run(async_db)
+    inserts = _count_turn_inserts(async_db)
+    store = InterviewSessionStore(async_db, batch_size=3, flush_interval=60, spill_path="")
+    await store.start()
+
+    sessions = [await store.create_session(run_id, "onsite_coding_1", 600) for _ in range(2)]
+    for i in range(3):
+        await store.record_turn(sessions[i % 2].session_id, "candidate", f"turn {i}")
+    for _ in range(100):
+        if inserts:
+            break
+        await asyncio.sleep(0.01)
+    assert inserts == [3]  # A full batch is written well before the 60s interval
+
+    for i in range(3, 5):
+        await store.record_turn(sessions[i % 2].session_id, "candidate", f"turn {i}")
+    await asyncio.sleep(0.05)
+    assert await store.backend.pending_count() == 2
+
+    await store.stop()
+    assert inserts == [3, 2]
+    assert len(await _turns(async_db)) == 5
+
+
+async def test_unwritten_turns_spill_and_replay(async_db, tmp_path):
+    """Test that turns survive a shutdown with the database down."""
+    run_id = await _seed_run(async_db)
+    spill_path = tmp_path / "spill.jsonl"
+
+    down = InterviewSessionStore(_BrokenSessionFactory(), spill_path=str(spill_path))
+    await down.start()
+    state = await down.create_session(run_id, "onsite_coding_1", 600)
+    for i in range(3):
+        await down.record_turn(state.session_id, "candidate", f"turn {i}")
+    with pytest.raises(ConnectionError):
+        await down.flush()
+    assert await down.backend.pending_count() == 3  # The failed batch was requeued
+    await down.stop(timeout=1)
+    assert len(spill_path.read_text().splitlines()) == 3
+
+    # The next start replays the spill; rows already written are not duplicated
+    up = InterviewSessionStore(async_db, spill_path=str(spill_path))
+    await up.start()
+    assert await up.flush() == 3
+    assert not spill_path.exists()
+    duplicate = TurnRecord(
+        state.session_id, run_id, "onsite_coding_1", 0, "candidate", "dup", 0.0, 0, 0.0
+    )
+    await up.backend.push_pending([duplicate])
+    await up.stop()
+    assert [t.content for t in await _turns(async_db)] == ["turn 0", "turn 1", "turn 2"]
+
+
+async def test_refused_turns_are_set_aside(async_db):
+    """Test that a turn the database refuses does not block the turns behind it."""
+    run_id = await _seed_run(async_db)
+    store = InterviewSessionStore(async_db, batch_size=10, spill_path="")
+    state = await store.create_session(run_id, "onsite_coding_1", 600)
+    await store.record_turn(state.session_id, "candidate", "before")
+    refused = TurnRecord("orphan", None, "onsite_coding_1", 0, "candidate", "x", 0.0, 0, 0.0)
+    await store.backend.push_pending([refused])
+    await store.record_turn(state.session_id, "candidate", "after")
+
+    assert await store.flush() == 2
+    assert await store.backend.pending_count() == 0
+    assert [t.content for t in await _turns(async_db)] == ["before", "after"]
+    await store.record_turn(state.session_id, "candidate", "later")
+    assert await store.flush() == 1
+
+
+async def test_backpressure_when_database_is_behind(async_db):
+    """Test that recording fails fast instead of buffering without limit."""
+    run_id = await _seed_run(async_db)
+    store = InterviewSessionStore(_BrokenSessionFactory(), max_pending=2, spill_path="")
+    state = await store.create_session(run_id, "onsite_coding_1", 600)
+    await store.record_turn(state.session_id, "candidate", "one")
+    await store.record_turn(state.session_id, "candidate", "two")
+    with pytest.raises(SessionStoreBackpressureError):
+        await store.record_turn(state.session_id, "candidate", "three")
+
+
+async def test_interview_endpoints(client, async_db):
+    """Test session creation, turns, errors and ending through the API."""
+    run_id = await _seed_run(async_db)
+    store = InterviewSessionStore(async_db, spill_path="")
+    fastapi_app.dependency_overrides[get_session_store] = lambda: store
+
+    response = await client.post(
+        "/interview/sessions",
+        json={"pipeline_run_id": run_id, "stage_name": "onsite_coding_1", "hint_budget": 1},
+    )
+    assert response.status_code == 201
+    session_id = response.json()["session_id"]
+
+    response = await client.post(
+        "/interview/next", json={"session_id": session_id, "content": "Hi", "use_hint": True}
+    )
+    assert response.status_code == 200
+    assert response.json()["turn_index"] == 0
+    assert response.json()["session"]["hints_used"] == 1
+
+    response = await client.post(
+        "/interview/next", json={"session_id": session_id, "content": "Hi", "use_hint": True}
+    )
+    assert response.status_code == 409
+    response = await client.post("/interview/next", json={"session_id": "nope", "content": "Hi"})
+    assert response.status_code == 404
+    response = await client.post(
+        "/interview/sessions",
+        json={"pipeline_run_id": 999, "stage_name": "onsite_coding_1"},
+    )
+    assert response.status_code == 404
+
+    response = await client.post(f"/interview/sessions/{session_id}/end")
+    assert response.status_code == 200
+    assert response.json()["ended"] is True
+    async with async_db() as db:
+        assert await db.scalar(select(func.count()).select_from(InterviewTurn)) == 1
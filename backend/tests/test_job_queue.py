@@ -0,0 +1,208 @@
+"""Test the durable job queue."""
+
+import asyncio
+import os
+import time
+from datetime import timedelta
+
+from sqlalchemy import select, update
+
+from app.database import utcnow
+from app.models import Job
+from app.models.job import JobStatus
+from app.services.job_queue import JobHandler, JobQueue, enqueue
+from app.services.stage_execution import STAGE_EXECUTE
+
+
+def process_square(payload):
+    """Process-pool handler (module level so the worker process can import it)."""
+    return payload["n"] ** 2, os.getpid()
+
+
+def make_queue(async_db, handlers, **kwargs):
+    return JobQueue(
+        async_db,
+        handlers={
+            kind: JobHandler(kind, func, executor) for kind, (func, executor) in handlers.items()
+        },
+        poll_interval=0.05,
+        backoff=lambda attempt: 0,
+        **kwargs,
+    )
+
+
+async def enqueue_jobs(async_db, *jobs):
+    async with async_db() as db:
+        created = [enqueue(db, kind, payload, **options) for kind, payload, options in jobs]
+        await db.commit()
+        return [job.id for job in created]
+
+
+async def load_jobs(async_db):
+    async with async_db() as db:
+        return {job.id: job for job in (await db.scalars(select(Job))).all()}
+
+
+async def test_advance_enqueues_stage_job(client, seeded, async_db):
+    """Test that advancing commits a stage job and returns without running it."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+    response = await client.post(f"/pipeline/{pipeline_id}/advance", headers={"If-Match": '"1"'})
+    assert response.status_code == 200
+
+    jobs = (await client.get("/jobs", params={"pipeline_run_id": pipeline_id})).json()
+    assert len(jobs) == 1
+    assert jobs[0]["kind"] == STAGE_EXECUTE
+    assert jobs[0]["status"] == "QUEUED"
+    assert jobs[0]["payload"] == {
+        "pipeline_run_id": pipeline_id,
+        "stage_name": "resume_screen",
+        "stage_index": 0,
+    }
+
+    # A rejected advance enqueues nothing
+    response = await client.post(f"/pipeline/{pipeline_id}/advance", headers={"If-Match": '"1"'})
+    assert response.status_code == 409
+    assert len((await client.get("/jobs", params={"pipeline_run_id": pipeline_id})).json()) == 1
+
+    assert (await client.get(f"/jobs/{jobs[0]['id']}")).json()["id"] == jobs[0]["id"]
+    assert (await client.get("/jobs/999")).status_code == 404
+
+
+async def test_runs_jobs_by_priority_on_each_executor(async_db):
+    """Test async, thread and process handlers, highest priority first."""
+    order = []
+
+    async def record(job):
+        order.append(job.payload["name"])
+
+    queue = make_queue(
+        async_db,
+        {"record": (record, "async"), "square": (process_square, "process")},
+        concurrency={"async": 1, "process": 1},
+    )
+    await enqueue_jobs(
+        async_db,
+        ("record", {"name": "low"}, {"priority": 0}),
+        ("record", {"name": "high"}, {"priority": 10}),
+        ("record", {"name": "mid"}, {"priority": 5}),
+        ("square", {"n": 7}, {}),
+    )
+    await queue.run_until_idle()
+    await queue.stop()
+
+    assert order == ["high", "mid", "low"]
+    jobs = await load_jobs(async_db)
+    assert {job.status for job in jobs.values()} == {JobStatus.SUCCEEDED}
+    assert all(job.attempts == 1 and job.finished_at is not None for job in jobs.values())
+
+
+async def test_bounded_thread_concurrency(async_db):
+    """Test that no more jobs run at once than the executor allows."""
+    running = []
+    peak = []
+
+    def blocking(payload):
+        running.append(payload)
+        peak.append(len(running))
+        time.sleep(0.02)
+        running.remove(payload)
+
+    queue = make_queue(async_db, {"block": (blocking, "thread")}, concurrency={"thread": 2})
+    await enqueue_jobs(async_db, *[("block", {"i": i}, {}) for i in range(6)])
+    await queue.run_until_idle()
+    await queue.stop()
+
+    assert max(peak) == 2
+    assert len(peak) == 6
+
+
+async def test_retries_then_fails(async_db):
+    """Test retry with backoff, then FAILED with the last error after max_attempts."""
+    calls = []
+
+    async def flaky(job):
+        calls.append(job.attempt)
+        if job.payload["fail_times"] >= job.attempt:
+            raise RuntimeError(f"attempt {job.attempt} failed")
+
+    queue = make_queue(async_db, {"flaky": (flaky, "async")})
+    recovers, gives_up = await enqueue_jobs(
+        async_db,
+        ("flaky", {"fail_times": 2}, {"max_attempts": 3}),
+        ("flaky", {"fail_times": 5}, {"max_attempts": 2}),
+    )
+    await queue.run_until_idle()
+
+    jobs = await load_jobs(async_db)
+    assert jobs[recovers].status == JobStatus.SUCCEEDED
+    assert jobs[recovers].attempts == 3
+    assert jobs[gives_up].status == JobStatus.FAILED
+    assert jobs[gives_up].attempts == 2
+    assert "attempt 2 failed" in jobs[gives_up].last_error
+    assert len(calls) == 5
+
+
+async def test_backoff_delays_retry(async_db):
+    """Test that a failed job is not claimable again until its backoff elapses."""
+
+    async def failing(job):
+        raise RuntimeError("boom")
+
+    queue = JobQueue(
+        async_db,
+        handlers={"fail": JobHandler("fail", failing)},
+        backoff=lambda attempt: 60 * attempt,
+    )
+    (job_id,) = await enqueue_jobs(async_db, ("fail", {}, {}))
+    before = utcnow()
+    await queue.run_until_idle()
+
+    job = (await load_jobs(async_db))[job_id]
+    assert job.status == JobStatus.QUEUED
+    assert job.attempts == 1
+    assert job.run_after.replace(tzinfo=before.tzinfo) >= before + timedelta(seconds=59)
+
+
+async def test_expired_lease_is_requeued(async_db):
+    """Test that a job left RUNNING by a dead worker runs again."""
+    ran = []
+
+    async def work(job):
+        ran.append(job.attempt)
+
+    queue = make_queue(async_db, {"work": (work, "async")}, lease_seconds=60)
+    stale, fresh = await enqueue_jobs(async_db, ("work", {}, {}), ("work", {}, {}))
+    async with async_db() as db:
+        for job_id, locked_at in ((stale, utcnow() - timedelta(minutes=5)), (fresh, utcnow())):
+            await db.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(status=JobStatus.RUNNING, attempts=1, locked_at=locked_at)
+            )
+        await db.commit()
+
+    assert await queue.requeue_expired() == 1
+    await queue.run_until_idle()
+
+    jobs = await load_jobs(async_db)
+    assert jobs[stale].status == JobStatus.SUCCEEDED
+    assert jobs[fresh].status == JobStatus.RUNNING
+    assert ran == [2]
+
+
+async def test_started_queue_is_woken_on_commit(async_db):
+    """Test that the dispatcher picks up a committed job without waiting for a poll."""
+    done = asyncio.Event()
+
+    async def work(job):
+        done.set()
+
+    queue = make_queue(async_db, {"work": (work, "async")})
+    queue.poll_interval = 30
+    await queue.start()
+    try:
+        await asyncio.sleep(0.05)
+        await enqueue_jobs(async_db, ("work", {}, {}))
+        await asyncio.wait_for(done.wait(), timeout=5)
+    finally:
+        await queue.stop()
@@ -0,0 +1,141 @@
+"""Test the LLM gateway."""
+
+import asyncio
+
+from app.services.llm_gateway import (
+    LLMGateway,
+    LLMRequest,
+    PromptTemplate,
+    ResponseCache,
+    StubProvider,
+    cache_key,
+)
+
+
+def test_cache_key_normalizes_prompt():
+    """Test that formatting noise shares a key but content, version and params do not."""
+    base = LLMRequest(prompt="Grade this:\n  def f(): pass", template="grade", template_version="1")
+    noisy = LLMRequest(
+        prompt="Grade this:  \r\n  def f(): pass\n\n", template="grade", template_version="1"
+    )
+    assert cache_key(base, "m") == cache_key(noisy, "m")
+
+    assert cache_key(base, "m") != cache_key(base, "other-model")
+    for changed in (
+        LLMRequest(prompt="Grade this:\ndef f(): pass", template="grade", template_version="1"),
+        LLMRequest(prompt=base.prompt, template="grade", template_version="2"),
+        LLMRequest(prompt=base.prompt, template="grade", params={"temperature": 0.7}),
+    ):
+        assert cache_key(changed, "m") != cache_key(base, "m")
+
+
+async def test_cache_hit_skips_provider(tmp_path):
+    """Test memory and disk cache tiers."""
+    provider = StubProvider()
+    template = PromptTemplate("summarize", "1", "Summarize: {text}")
+    gateway = LLMGateway(provider, cache=ResponseCache(path=str(tmp_path)))
+
+    first = await gateway.complete(template.render(text="hello"))
+    second = await gateway.complete(template.render(text="hello"))
+    assert provider.calls == 1
+    assert not first.cached and second.cached
+    assert second.text == first.text
+    assert second.latency == 0.0
+
+    # A new process (empty memory tier) is served from disk
+    restarted = LLMGateway(provider, cache=ResponseCache(path=str(tmp_path)))
+    third = await restarted.complete(template.render(text="hello"))
+    assert third.cached and third.text == first.text
+    assert provider.calls == 1
+    assert restarted.cache.stats()["disk_hits"] == 1
+
+    # Opting out always reaches the provider
+    await gateway.complete(LLMRequest(prompt="Summarize: hello", cache=False))
+    assert provider.calls == 2
+
+
+async def test_cache_ttl_and_lru():
+    """Test expiry and least-recently-used eviction in the memory tier."""
+    provider = StubProvider()
+    gateway = LLMGateway(provider, cache=ResponseCache(maxsize=2))
+    for prompt in ("a", "b", "a", "c", "a", "b"):
+        await gateway.complete(LLMRequest(prompt=prompt))
+    # "b" was evicted by "c" while "a" stayed hot
+    assert provider.calls == 4
+
+    expiring = LLMGateway(provider, cache=ResponseCache(ttl=0))
+    await expiring.complete(LLMRequest(prompt="x"))
+    await expiring.complete(LLMRequest(prompt="x"))
+    assert provider.calls == 6
+
+
+async def test_identical_inflight_requests_are_coalesced():
+    """Test that concurrent identical prompts make one provider call."""
+    provider = StubProvider(latency=0.05)
+    gateway = LLMGateway(provider, cache=None)
+
+    responses = await asyncio.gather(
+        *(gateway.complete(LLMRequest(prompt="same")) for _ in range(5)),
+        gateway.complete(LLMRequest(prompt="different")),
+    )
+    assert provider.calls == 2
+    assert len({response.text for response in responses[:5]}) == 1
+    assert sum(response.coalesced for response in responses) == 4
+
+
+async def test_bulk_requests_are_micro_batched():
+    """Test that complete_many groups provider calls and keeps request order."""
+    provider = StubProvider(responder=lambda request: request.prompt.upper())
+    gateway = LLMGateway(provider, cache=None, batch_size=4, batch_wait=0.01)
+
+    requests = [LLMRequest(prompt=f"answer {i}") for i in range(10)]
+    responses = await gateway.complete_many(requests)
+    assert [response.text for response in responses] == [f"ANSWER {i}" for i in range(10)]
+    assert provider.batch_calls == 3
+    assert provider.calls == 0
+
+
+async def test_short_batch_response_fails_every_request():
+    """Test that a provider dropping responses fails the whole batch instead of hanging."""
+
+    class ShortProvider(StubProvider):
+        async def complete_batch(self, requests):
+            return (await super().complete_batch(requests))[:-1]
+
+    gateway = LLMGateway(ShortProvider(), cache=None, batch_size=4, batch_wait=0.01)
+    requests = [LLMRequest(prompt=f"answer {i}") for i in range(4)]
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(gateway.complete(request, batch=True) for request in requests),
+            return_exceptions=True,
+        ),
+        timeout=5,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert "3 responses for a batch of 4" in str(results[0])
+
+
+async def test_usage_tracks_tokens_and_errors():
+    """Test per-call accounting, including failed calls."""
+
+    def responder(request):
+        if request.prompt == "fail":
+            raise RuntimeError("provider down")
+        return "ok"
+
+    gateway = LLMGateway(StubProvider(responder=responder), cache=ResponseCache())
+    await gateway.complete(LLMRequest(prompt="a" * 40, template="grade"))
+    await gateway.complete(LLMRequest(prompt="a" * 40, template="grade"))
+    try:
+        await gateway.complete(LLMRequest(prompt="fail"))
+    except RuntimeError:
+        pass
+
+    usage = gateway.usage()
+    assert usage["requests"] == 3
+    assert usage["provider_calls"] == 1
+    assert usage["cached"] == 1
+    assert usage["errors"] == 1
+    assert usage["input_tokens"] == 10
+    assert usage["output_tokens"] == 1
+    assert gateway.recent_calls[0].template == "grade"
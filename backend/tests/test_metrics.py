@@ -0,0 +1,45 @@
+"""Test request and SQL metrics."""
+
+from app.metrics import HTTP_DB_QUERIES, HTTP_REQUESTS, Histogram, instrument_engine
+
+
+def test_histogram_render():
+    """Test Prometheus histogram exposition."""
+    histogram = Histogram("test_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe("/a", value=0.05)
+    histogram.observe("/a", value=0.5)
+    histogram.observe("/a", value=5)
+
+    lines = histogram.render()
+    assert "# TYPE test_seconds histogram" in lines
+    assert 'test_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'test_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{route="/a"} 3' in lines
+
+
+async def test_request_and_query_metrics(client, async_db, seeded):
+    """Test that requests are counted per route template with their SQL statements."""
+    instrument_engine(async_db.kw["bind"].sync_engine, "test")
+    route = "/pipeline/{pipeline_id}"
+    requests_before = HTTP_REQUESTS.value("GET", route, "404")
+    observed_before = HTTP_DB_QUERIES.count("GET", route)
+
+    response = await client.get("/pipeline/12345")
+    assert response.status_code == 404
+    assert HTTP_REQUESTS.value("GET", route, "404") == requests_before + 1
+    assert HTTP_DB_QUERIES.count("GET", route) == observed_before + 1
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert f'http_requests_total{{method="GET",route="{route}",status="404"}}' in body
+    assert (
+        'http_request_db_queries_bucket{method="GET",route="/pipeline/{pipeline_id}",le="1"}'
+        in body
+    )
+    assert 'db_queries_total{engine="test"}' in body
+    assert "http_requests_in_flight 1" in body
+    assert 'db_pool{engine="async",stat="checked_out"}' in body
+    assert 'pipeline_plan_cache{stat="hits"}' in body
@@ -0,0 +1,216 @@
+"""Test sandboxed OA code execution."""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app.main import app as fastapi_app
+from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.models.stage_result import load_stage_result_payload
+from app.services.oa_execution import (
+    ExecutionCache,
+    ExecutionReport,
+    OATestCase,
+    OATestResult,
+    OATestSet,
+    OATestSetRepository,
+    OATestStatus,
+    SandboxExecutor,
+    SandboxLimits,
+    get_oa_executor,
+    get_test_sets,
+)
+
+SUM_TESTS = {
+    "problem_id": "sum",
+    "version": "1",
+    "tests": [
+        {"name": "small", "stdin": "1 2\n", "expected_stdout": "3\n", "size": 2},
+        {"name": "negative", "stdin": "-5 2\n", "expected_stdout": "-3", "size": 2},
+    ],
+    "limits": {"cpu_seconds": 1, "wall_seconds": 3},
+}
+SOLUTION = "a, b = map(int, input().split())\nprint(a + b)\n"
+
+
+def _test_set(version="1"):
+    return OATestSet.from_json({**SUM_TESTS, "version": version})
+
+
+async def test_outcomes_and_limits():
+    """Test pass, wrong answer, runtime error and each resource limit."""
+    executor = SandboxExecutor(workers=2)
+    cases = {
+        SOLUTION: OATestStatus.PASSED,
+        "print(0)": OATestStatus.WRONG_ANSWER,
+        "raise ValueError('boom')": OATestStatus.RUNTIME_ERROR,
+        "while True:\n    pass": OATestStatus.TIME_LIMIT,
+        "x = bytearray(1024 ** 3)": OATestStatus.MEMORY_LIMIT,
+        "while True:\n    print('x' * 1000)": OATestStatus.OUTPUT_LIMIT,
+        "with open('out.txt', 'w') as f:\n    f.write('x')": OATestStatus.RUNTIME_ERROR,
+        "import sys\nsys.exit(0)": OATestStatus.WRONG_ANSWER,
+    }
+    test_set = OATestSet(
+        problem_id="sum",
+        version="1",
+        tests=(OATestCase(name="small", stdin="1 2\n", expected_stdout="3\n"),),
+        limits=SandboxLimits(cpu_seconds=1, wall_seconds=3, output_bytes=1024),
+    )
+    for code, status in cases.items():
+        report = await executor.run(code, test_set)
+        assert report.results[0].status == status, code
+    report = await executor.run("raise ValueError('boom')", test_set)
+    assert report.results[0].stderr == "ValueError: boom"
+    report = await executor.run("import sys\nsys.exit('bad input')", test_set)
+    assert report.results[0].status == OATestStatus.RUNTIME_ERROR
+    assert report.results[0].stderr == "bad input"
+
+    # Sleeping does not burn CPU, so the wall-clock limit catches it
+    wall = OATestSet(**{**test_set.__dict__, "limits": SandboxLimits(wall_seconds=0.5)})
+    report = await executor.run("import time\ntime.sleep(10)", wall)
+    assert report.results[0].status == OATestStatus.TIME_LIMIT
+
+
+def _python_for_others():
+    """An interpreter other users can run (the harness needs only the stdlib), or None."""
+    for python in (sys.executable, "/usr/bin/python3"):
+        path = Path(os.path.realpath(python))
+        if path.exists() and all(p.stat().st_mode & 0o001 for p in (path, *path.parents)):
+            return str(path)
+    return None
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="network namespaces need root")
+async def test_network_isolation():
+    """Test that an isolated sandbox cannot reach even the host's loopback."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        code = f"import socket\nsocket.create_connection(('127.0.0.1', {port}))\nprint(3)"
+        test_set = _test_set()
+        open_report = await SandboxExecutor().run(code, test_set)
+        isolated = await SandboxExecutor(isolate_network=True).run(code, test_set)
+    assert open_report.results[0].status == OATestStatus.PASSED
+    assert isolated.results[0].status == OATestStatus.RUNTIME_ERROR
+    assert "unreachable" in isolated.results[0].stderr
+
+
+@pytest.mark.skipif(
+    os.geteuid() != 0 or _python_for_others() is None,
+    reason="needs root and a python other users can run",
+)
+async def test_sandbox_user():
+    """Test that a sandbox runs as its own user, unable to read the API's process."""
+    code = "import os\nopen(f'/proc/{os.getppid()}/environ').read()"
+    executor = SandboxExecutor(user="nobody", python=_python_for_others())
+    report = await executor.run(code, _test_set())
+    assert report.results[0].status == OATestStatus.RUNTIME_ERROR
+    assert report.results[0].stderr.startswith("PermissionError")
+
+
+def test_sandbox_user_validation():
+    with pytest.raises(ValueError):
+        SandboxExecutor(user="no-such-oa-user")
+    with pytest.raises(ValueError):
+        SandboxExecutor(user="0")
+
+
+async def test_parallel_tests_and_result_cache(tmp_path):
+    """Test per-test results in order, and caching by code hash and test-set version."""
+    executor = SandboxExecutor(workers=2, cache=ExecutionCache(path=str(tmp_path)))
+    report = await executor.run(SOLUTION, _test_set())
+    assert [r.name for r in report.results] == ["small", "negative"]
+    assert report.passed == report.total == 2
+    assert all(r.runtime_ms > 0 for r in report.results)
+    assert not report.cached
+
+    # Same code (modulo line endings) and version: cached
+    resubmitted = await executor.run(SOLUTION.replace("\n", "\r\n"), _test_set())
+    assert resubmitted.cached
+    assert resubmitted == report
+
+    # A new test-set version is graded again
+    assert not (await executor.run(SOLUTION, _test_set("2"))).cached
+
+    # The disk tier survives a restart
+    restarted = SandboxExecutor(cache=ExecutionCache(path=str(tmp_path)))
+    assert (await restarted.run(SOLUTION, _test_set())).cached
+
+
+def test_scaling_exponent():
+    """Test the fitted runtime ~ n^k exponent."""
+    results = [
+        OATestResult(name=f"n={n}", status=OATestStatus.PASSED, runtime_ms=n * n / 100, size=n)
+        for n in (100, 1000, 10000)
+    ]
+    report = ExecutionReport("hash", "sort", "1", results)
+    assert report.scaling_exponent() == pytest.approx(2.0)
+    assert ExecutionReport("hash", "sort", "1", results[:1]).scaling_exponent() is None
+
+
+def test_test_set_repository(tmp_path):
+    """Test loading, reloading after edits and hidden lookups."""
+    path = tmp_path / "sum.json"
+    path.write_text(json.dumps(SUM_TESTS))
+    repository = OATestSetRepository(tmp_path, SandboxLimits(memory_mb=64))
+    test_set = repository.get("sum")
+    assert test_set.version == "1"
+    assert test_set.limits == SandboxLimits(cpu_seconds=1, memory_mb=64, wall_seconds=3)
+    assert repository.get("sum") is test_set
+
+    path.write_text(json.dumps({**SUM_TESTS, "version": "2"}))
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 1))
+    assert repository.get("sum").version == "2"
+
+    with pytest.raises(LookupError):
+        repository.get("missing")
+    with pytest.raises(LookupError):
+        repository.get("../sum")
+
+
+async def test_submit_endpoint(client, async_db, tmp_path):
+    """Test POST /oa/submit grading and storing an oa stage result."""
+    (tmp_path / "sum.json").write_text(json.dumps(SUM_TESTS))
+    fastapi_app.dependency_overrides[get_test_sets] = lambda: OATestSetRepository(tmp_path)
+    fastapi_app.dependency_overrides[get_oa_executor] = lambda: SandboxExecutor(workers=2)
+    async with async_db() as db:
+        run = PipelineRun(
+            candidate=Candidate(email="oa@example.com", name="OA Candidate"),
+            job_profile=JobProfile(role="SWE I", raw_description="OA"),
+            stages=["oa"],
+        )
+        db.add(run)
+        await db.commit()
+        run_id = run.id
+
+    response = await client.post(
+        "/oa/submit", json={"pipeline_run_id": run_id, "problem_id": "sum", "code": SOLUTION}
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert (data["passed"], data["total"], data["cached"]) == (2, 2, False)
+    assert data["results"][0]["status"] == "PASSED"
+    assert "stdin" not in data["results"][0]
+
+    async with async_db() as db:
+        result = await db.scalar(
+            select(StageResult)
+            .options(load_stage_result_payload())
+            .where(StageResult.id == data["stage_result_id"])
+        )
+        assert result.stage_name == "oa"
+        assert result.raw_scores["pass_rate"] == 1.0
+        assert result.raw_scores["code_hash"] == data["code_hash"]
+        assert set(result.artifacts) == {"code"}
+
+    for body in (
+        {"pipeline_run_id": 999, "problem_id": "sum", "code": SOLUTION},
+        {"pipeline_run_id": run_id, "problem_id": "missing", "code": SOLUTION},
+    ):
+        assert (await client.post("/oa/submit", json=body)).status_code == 404
@@ -0,0 +1,360 @@
+"""Test pipeline API endpoints."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Integer, event, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.models import PipelineRun, PipelineStageState
+from app.models.pipeline_run import PipelineStatus
+from app.models.pipeline_stage_state import StageState
+from app.routers.pipeline import list_pipelines_query
+from app.schemas.pipeline import PipelineResponse
+
+
+async def test_start_pipeline(client, seeded):
+    """Test starting a pipeline run."""
+    response = await client.post("/pipeline/start", json=seeded)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["status"] == "CREATED"
+    assert data["current_stage"] is None
+    assert data["stages"][0] == "resume_screen"
+    assert set(data["stage_progress"].values()) == {"created"}
+
+
+async def test_start_pipeline_not_found(client, seeded):
+    """Test that unknown candidate / job profile IDs return 404."""
+    response = await client.post("/pipeline/start", json={**seeded, "candidate_id": 999})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Candidate not found"
+
+    response = await client.post("/pipeline/start", json={**seeded, "job_profile_id": 999})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Job profile not found"
+
+
+async def test_get_and_advance_pipeline(client, seeded):
+    """Test reading and advancing a pipeline run."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+
+    response = await client.get(f"/pipeline/{pipeline_id}")
+    assert response.status_code == 200
+    assert response.json()["id"] == pipeline_id
+
+    response = await client.post(f"/pipeline/{pipeline_id}/advance")
+    assert response.status_code == 428
+
+    response = await client.post(f"/pipeline/{pipeline_id}/advance", headers={"If-Match": '"1"'})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "IN_PROGRESS"
+    assert data["current_stage"] == "resume_screen"
+    assert data["current_stage_index"] == 0
+    assert data["stage_progress"]["resume_screen"] == "in_progress"
+    assert data["started_at"] is not None
+
+    # Persisted, not just returned
+    data = (await client.get(f"/pipeline/{pipeline_id}")).json()
+    assert data["current_stage"] == "resume_screen"
+    assert data["stage_progress"]["resume_screen"] == "in_progress"
+
+    data = (await client.post(f"/pipeline/{pipeline_id}/advance?expected_version=2")).json()
+    assert data["current_stage"] == "oa"
+    assert data["current_stage_index"] == 1
+
+
+async def test_lean_reads_match_response_model(client, seeded, async_db):
+    """Test that the column-projected read paths produce PipelineResponse bodies."""
+    response = await client.post("/pipeline/start/batch", json={"items": [seeded] * 2})
+    pipeline_ids = [result["pipeline"]["id"] for result in response.json()["results"]]
+    await client.post(f"/pipeline/{pipeline_ids[0]}/advance?expected_version=1")
+
+    async with async_db() as db:
+        expected = {
+            run.id: PipelineResponse.model_validate(run).model_dump(mode="json")
+            for run in await db.scalars(select(PipelineRun))
+        }
+
+    statements = []
+    event.listen(
+        async_db.kw["bind"].sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    for pipeline_id in pipeline_ids:
+        statements.clear()
+        assert (await client.get(f"/pipeline/{pipeline_id}")).json() == expected[pipeline_id]
+        assert len(statements) == 1  # The run joined to its stage states
+
+    items = (await client.get("/pipeline")).json()["items"]
+    assert items == [expected[pipeline_id] for pipeline_id in reversed(pipeline_ids)]
+    assert items[1]["stage_progress"]["resume_screen"] == "in_progress"
+
+
+async def test_conditional_get_pipeline(client, seeded, async_db):
+    """Test ETag / Last-Modified revalidation and cheap 304s on pipeline reads."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+
+    response = await client.get(f"/pipeline/{pipeline_id}")
+    assert response.headers["ETag"] == '"1"'
+    assert response.headers["Cache-Control"] == "no-cache"
+    last_modified = response.headers["Last-Modified"]
+    assert last_modified.endswith(" GMT")
+
+    statements = []
+    event.listen(
+        async_db.kw["bind"].sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    for headers in (
+        {"If-None-Match": '"1"'},
+        {"If-None-Match": 'W/"1"'},
+        {"If-None-Match": '"0", "1"'},
+        {"If-None-Match": "*"},
+        {"If-Modified-Since": last_modified},
+    ):
+        statements.clear()
+        response = await client.get(f"/pipeline/{pipeline_id}", headers=headers)
+        assert response.status_code == 304, headers
+        assert response.content == b""
+        assert response.headers["ETag"] == '"1"'
+        # One lookup of the validators; the run and its stage states are not loaded
+        assert len(statements) == 1
+        assert "pipeline_stage_states" not in statements[0]
+
+    # If-None-Match wins over a matching If-Modified-Since
+    response = await client.get(
+        f"/pipeline/{pipeline_id}",
+        headers={"If-None-Match": '"0"', "If-Modified-Since": last_modified},
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        f"/pipeline/{pipeline_id}/advance", headers={"If-Match": response.headers["ETag"]}
+    )
+    assert response.headers["ETag"] == '"2"'
+    response = await client.get(f"/pipeline/{pipeline_id}", headers={"If-None-Match": '"1"'})
+    assert response.status_code == 200
+    assert response.json()["current_stage"] == "resume_screen"
+    assert response.headers["ETag"] == '"2"'
+
+    response = await client.get("/pipeline/999", headers={"If-None-Match": '"1"'})
+    assert response.status_code == 404
+
+
+async def test_advance_past_final_stage(client, seeded):
+    """Test that advancing beyond the last stage is rejected."""
+    data = (await client.post("/pipeline/start", json=seeded)).json()
+    for _ in data["stages"]:
+        response = await client.post(
+            f"/pipeline/{data['id']}/advance", params={"expected_version": data["version"]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+    response = await client.post(
+        f"/pipeline/{data['id']}/advance", params={"expected_version": data["version"]}
+    )
+    assert response.status_code == 400
+
+    assert (await client.get("/pipeline/999")).status_code == 404
+
+
+async def test_start_pipeline_batch(client, seeded):
+    """Test bulk pipeline creation with inline per-item errors."""
+    items = [
+        seeded,
+        {**seeded, "candidate_id": 999},
+        seeded,
+        {**seeded, "job_profile_id": 999},
+    ]
+    response = await client.post("/pipeline/start/batch", json={"items": items})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+
+    results = data["results"]
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert [r["status_code"] for r in results] == [201, 404, 201, 404]
+    assert results[1]["error"] == "Candidate not found"
+    assert results[3]["error"] == "Job profile not found"
+    assert results[1]["pipeline"] is None
+
+    first, second = results[0]["pipeline"], results[2]["pipeline"]
+    assert first["id"] != second["id"]
+    assert first["status"] == "CREATED"
+    assert first["stages"][0] == "resume_screen"
+
+    # Rows were committed
+    assert (await client.get(f"/pipeline/{second['id']}")).status_code == 200
+
+
+async def test_stage_state_query_is_indexed(client, seeded, async_db):
+    """Test querying runs by a stage's state without decoding JSON."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+    await client.post("/pipeline/start", json=seeded)
+    await client.post(f"/pipeline/{pipeline_id}/advance?expected_version=1")
+
+    stmt = (
+        select(PipelineRun.id)
+        .join(PipelineStageState)
+        .where(
+            PipelineRun.job_profile_id == seeded["job_profile_id"],
+            PipelineStageState.stage_name == "resume_screen",
+            PipelineStageState.state == StageState.IN_PROGRESS,
+        )
+    )
+    async with async_db() as db:
+        assert (await db.scalars(stmt)).all() == [pipeline_id]
+
+        sql = stmt.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        plan = " ".join(row[-1] for row in await db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+        assert "ix_pipeline_stage_states_stage_state" in plan
+
+
+async def test_list_pipelines_keyset_pagination(client, seeded):
+    """Test paging through runs newest first with an opaque cursor."""
+    # Batch-created runs share a created_at, so paging relies on the id tie-breaker
+    response = await client.post("/pipeline/start/batch", json={"items": [seeded] * 7})
+    created_ids = [result["pipeline"]["id"] for result in response.json()["results"]]
+    await client.post(f"/pipeline/{created_ids[0]}/advance?expected_version=1")
+
+    seen, cursor = [], None
+    for _ in range(len(created_ids) + 1):
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/pipeline", params=params)).json()
+        assert len(page["items"]) <= 3
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert cursor is None, "pagination did not terminate"
+    assert seen == sorted(created_ids, reverse=True)
+
+    page = (await client.get("/pipeline", params={"status": "IN_PROGRESS"})).json()
+    assert [item["id"] for item in page["items"]] == [created_ids[0]]
+    assert page["next_cursor"] is None
+
+    page = (
+        await client.get(
+            "/pipeline",
+            params={"job_profile_id": seeded["job_profile_id"], "current_stage": "resume_screen"},
+        )
+    ).json()
+    assert [item["id"] for item in page["items"]] == [created_ids[0]]
+
+    assert (await client.get("/pipeline", params={"candidate_id": 999})).json()["items"] == []
+    assert (await client.get("/pipeline", params={"cursor": "not-a-cursor"})).status_code == 400
+
+
+async def test_list_pipelines_query_is_indexed(client, seeded, async_db):
+    """Test that filtered listings seek the composite indexes without sorting."""
+    response = await client.post("/pipeline/start/batch", json={"items": [seeded] * 3})
+    last = response.json()["results"][-1]["pipeline"]
+    after = (datetime.fromisoformat(last["created_at"]), last["id"])
+
+    cases = [
+        (
+            {"job_profile_id": 1, "status": PipelineStatus.CREATED},
+            "ix_pipeline_runs_job_profile_status",
+        ),
+        (
+            {"candidate_id": 1, "status": PipelineStatus.CREATED},
+            "ix_pipeline_runs_candidate_status",
+        ),
+    ]
+    async with async_db() as db:
+        for filters, index_name in cases:
+            stmt = list_pipelines_query(**filters, after=after, limit=10)
+            assert len((await db.scalars(stmt)).all()) == 2
+
+            sql = stmt.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+            plan = " ".join(row[-1] for row in await db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+            assert index_name in plan
+            assert "TEMP B-TREE" not in plan
+
+
+def test_list_pipelines_cursor_binds_column_types():
+    """Test that cursor values are bound as the sort columns' types on each dialect."""
+    stmt = list_pipelines_query(after=(datetime(2026, 1, 1, tzinfo=timezone.utc), 3))
+    for dialect in (sqlite.dialect(), postgresql.dialect()):
+        compiled = stmt.compile(dialect=dialect)
+        bound_types = {
+            type(bind.type) for bind in compiled.binds.values() if bind.value is not None
+        }
+        assert DateTime in bound_types and Integer in bound_types
+
+
+async def test_advance_expected_version(client, seeded):
+    """Test optimistic concurrency on advance."""
+    data = (await client.post("/pipeline/start", json=seeded)).json()
+    assert data["version"] == 1
+
+    response = await client.post(f"/pipeline/{data['id']}/advance?expected_version=1")
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+
+    # A second advance based on the same read lost the race
+    response = await client.post(f"/pipeline/{data['id']}/advance?expected_version=1")
+    assert response.status_code == 409
+
+    data = (await client.get(f"/pipeline/{data['id']}")).json()
+    assert data["current_stage_index"] == 0
+    assert data["version"] == 2
+
+
+async def test_concurrent_advances_from_one_read_conflict(client, seeded):
+    """Test that of several advances based on the same read only one applies."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+
+    responses = await asyncio.gather(
+        *(client.post(f"/pipeline/{pipeline_id}/advance?expected_version=1") for _ in range(5))
+    )
+    assert sorted(r.status_code for r in responses) == [200, 409, 409, 409, 409]
+
+    data = (await client.get(f"/pipeline/{pipeline_id}")).json()
+    assert data["current_stage_index"] == 0
+    assert data["version"] == 2
+
+
+async def test_concurrent_advances_are_not_lost(client, seeded):
+    """Test that concurrent unconditional advances each apply exactly one stage."""
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+
+    responses = await asyncio.gather(
+        *(
+            client.post(f"/pipeline/{pipeline_id}/advance", headers={"If-Match": "*"})
+            for _ in range(5)
+        )
+    )
+    assert [r.status_code for r in responses] == [200] * 5
+    assert sorted(r.json()["current_stage_index"] for r in responses) == [0, 1, 2, 3, 4]
+
+    data = (await client.get(f"/pipeline/{pipeline_id}")).json()
+    assert data["current_stage_index"] == 4
+    assert data["version"] == 6
+    assert [data["stage_progress"][stage] for stage in data["stages"][:5]] == ["in_progress"] * 5
+
+
+async def test_stage_cursor_is_derived_from_stages(client, seeded, async_db):
+    """Test that ORM-created runs get stage_count and stage rows from stages."""
+    async with async_db() as db:
+        pipeline_run = PipelineRun(
+            **seeded,
+            stage_progress={"oa": "gated", "resume_screen": "created"},
+            stages=["resume_screen", "oa"],
+        )
+        db.add(pipeline_run)
+        await db.commit()
+        assert pipeline_run.stage_count == 2
+        assert [s.stage_name for s in pipeline_run.stage_states] == ["resume_screen", "oa"]
+        assert pipeline_run.stage_progress == {"resume_screen": "created", "oa": "gated"}
+        pipeline_id = pipeline_run.id
+
+    response = await client.post(f"/pipeline/{pipeline_id}/advance?expected_version=1")
+    assert response.status_code == 200
+    assert response.json()["current_stage"] == "resume_screen"
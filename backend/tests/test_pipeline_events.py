@@ -0,0 +1,136 @@
+"""Test the pipeline event broker and the SSE progress stream."""
+
+import json
+
+import pytest
+
+from app.config import settings
+from app.main import app as fastapi_app
+from app.models import PipelineRun
+from app.routers.pipeline import pipeline_events
+from app.services.job_queue import JobContext
+from app.services.pipeline_events import PipelineEventBroker, get_event_broker
+from app.services.stage_execution import STAGE_EXECUTE, STAGE_EXECUTORS, execute_stage
+
+
+def _parse(message: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    return {**fields, "data": json.loads(fields["data"])}
+
+
+async def test_broker_fans_out_one_encoded_event():
+    """Test that every watcher of a run gets the same message, and only that run's."""
+    broker = PipelineEventBroker()
+    watchers = [broker.subscribe(1) for _ in range(3)]
+    other = broker.subscribe(2)
+
+    published = broker.publish(1, "stage_advanced", {"current_stage": "oa"})
+    for watcher in watchers:
+        assert await watcher.get(timeout=0.1) is published
+    assert await other.get(timeout=0.01) is None
+    assert _parse(published.message) == {
+        "id": published.id,
+        "event": "stage_advanced",
+        "data": {"current_stage": "oa"},
+    }
+
+    for watcher in [*watchers, other]:
+        watcher.close()
+    assert broker.subscriber_count(1) == broker.subscriber_count(2) == 0
+
+
+async def test_slow_subscriber_resyncs_instead_of_buffering():
+    """Test that a full queue drops the backlog and asks for a snapshot."""
+    broker = PipelineEventBroker(queue_size=2)
+    with broker.subscribe(1) as watcher:
+        for index in range(3):
+            broker.publish(1, "stage_execution", {"index": index})
+        assert watcher.resync()
+        assert not watcher.resync()
+        assert await watcher.get(timeout=0.01) is None
+
+        # Delivery resumes after the resync
+        broker.publish(1, "stage_execution", {"index": 3})
+        assert (await watcher.get(timeout=0.1)).data == {"index": 3}
+
+
+async def test_last_event_id_replay():
+    """Test resuming from buffered history, and falling back when it is gone."""
+    broker = PipelineEventBroker(history=2)
+    first, second, third, fourth = (broker.publish(1, "stage_result", {"n": n}) for n in range(4))
+
+    with broker.subscribe(1, last_event_id=second.id) as watcher:
+        assert watcher.replay == [third, fourth]
+    with broker.subscribe(1, last_event_id=fourth.id) as watcher:
+        assert watcher.replay == []
+    # `second` is no longer buffered; other instances' IDs are never trusted
+    for last_event_id in (first.id, "other-4", None):
+        with broker.subscribe(1, last_event_id=last_event_id) as watcher:
+            assert watcher.replay is None
+
+
+async def test_event_stream_pushes_advances(client, seeded, async_db, monkeypatch):
+    """Test the snapshot, pushed advances, keep-alives and cleanup of the SSE stream."""
+    broker = PipelineEventBroker()
+    fastapi_app.dependency_overrides[get_event_broker] = lambda: broker
+    monkeypatch.setattr(settings, "pipeline_events_heartbeat", 0.05)
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+
+    response = await pipeline_events(pipeline_id, None, async_db, broker)
+    assert response.media_type == "text/event-stream"
+    stream = response.body_iterator
+    assert await anext(stream) == "retry: 50\n\n"
+    snapshot = _parse(await anext(stream))
+    assert snapshot["event"] == "snapshot"
+    assert snapshot["data"]["current_stage"] is None
+
+    advanced = await client.post(
+        f"/pipeline/{pipeline_id}/advance",
+        headers={"If-Match": f'"{snapshot["data"]["version"]}"'},
+    )
+    event = _parse(await anext(stream))
+    assert event["event"] == "stage_advanced"
+    assert event["data"] == advanced.json()
+    assert await anext(stream) == ": keep-alive\n\n"
+
+    assert broker.subscriber_count(pipeline_id) == 1
+    await stream.aclose()
+    assert broker.subscriber_count(pipeline_id) == 0
+
+    response = await client.get("/pipeline/999/events")
+    assert response.status_code == 404
+    assert broker.subscriber_count(999) == 0
+
+
+async def test_stage_execution_publishes_outcome(async_db, seeded, monkeypatch):
+    """Test that stage jobs report success and failure to the run's watchers."""
+    async with async_db() as db:
+        run = PipelineRun(
+            candidate_id=seeded["candidate_id"],
+            job_profile_id=seeded["job_profile_id"],
+            stages=["custom"],
+            current_stage="custom",
+            current_stage_index=0,
+        )
+        db.add(run)
+        await db.commit()
+
+    outcomes = iter([None, RuntimeError("grader down")])
+
+    async def executor(job):
+        error = next(outcomes)
+        if error is not None:
+            raise error
+
+    monkeypatch.setitem(STAGE_EXECUTORS, "custom", executor)
+    payload = {"pipeline_run_id": run.id, "stage_name": "custom", "stage_index": 0}
+    job = JobContext(1, STAGE_EXECUTE, payload, 1, async_db)
+
+    with get_event_broker().subscribe(run.id) as watcher:
+        await execute_stage(job)
+        with pytest.raises(RuntimeError):
+            await execute_stage(job)
+        succeeded = await watcher.get(timeout=0.1)
+        failed = await watcher.get(timeout=0.1)
+    assert (succeeded.type, succeeded.data["status"]) == ("stage_execution", "succeeded")
+    assert (failed.data["status"], failed.data["error"]) == ("failed", "grader down")
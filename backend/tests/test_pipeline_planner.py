@@ -4,7 +4,7 @@ import pytest
 
 from app.models.candidate import Candidate
 from app.models.job_profile import JobProfile
-from app.services.pipeline_planner import PipelinePlanner
+from app.services.pipeline_planner import PipelinePlanner, PlanCache, PlannedPipeline, plan_cache
 
 
 def test_plan_pipeline():
@@ -60,6 +60,19 @@ def test_get_next_stage():
     # Last stage
     assert planner.get_next_stage(stages, "phone_screen") is None
 
+    # Unknown stage
+    assert planner.get_next_stage(stages, "debrief") is None
+
+
+def test_get_next_stage_index():
+    """Test cursor-based stage progression."""
+    planner = PipelinePlanner()
+
+    assert planner.get_next_stage_index(None, 3) == 0
+    assert planner.get_next_stage_index(0, 3) == 1
+    assert planner.get_next_stage_index(2, 3) is None
+    assert planner.get_next_stage_index(None, 0) is None
+
 
 def test_stage_state_transitions():
     """Test stage state machine."""
@@ -101,3 +114,49 @@ def test_invalid_stage_state_transitions():
 
     with pytest.raises(ValueError, match="Unknown stage state"):
         planner.update_stage_state(stage_progress, "test_stage", "unknown_state")
+
+
+def test_plan_cache_hits_and_copies(test_db):
+    """Test that plans are cached per job profile version and copied into runs."""
+    plan_cache.clear()
+    planner = PipelinePlanner()
+    db = test_db()
+    job_profile = JobProfile(role="SWE I", raw_description="Cache test")
+    db.add(job_profile)
+    db.commit()
+
+    stages, stage_progress = planner.plan_pipeline(job_profile)
+    assert plan_cache.stats()["misses"] == 1
+
+    again_stages, again_progress = planner.plan_pipeline(job_profile)
+    assert plan_cache.stats()["hits"] == 1
+    assert planner.get_plan(job_profile) is planner.get_plan(job_profile)
+
+    # Each run gets its own mutable copies
+    again_stages.append("extra")
+    again_progress["oa"] = "in_progress"
+    assert "extra" not in stages
+    assert stage_progress["oa"] == "created"
+    assert isinstance(planner.get_plan(job_profile).stages, tuple)
+
+    # Updating the row evicts its cached plans
+    job_profile.company_style = "Google-like"
+    db.commit()
+    assert plan_cache.stats()["size"] == 0
+    planner.plan_pipeline(job_profile)
+    assert plan_cache.stats()["misses"] == 2
+    db.close()
+
+
+def test_plan_cache_lru_eviction():
+    """Test that the cache is bounded and evicts least recently used plans."""
+    cache = PlanCache(maxsize=2)
+    plan = PlannedPipeline(stages=("oa",))
+    cache.put((1, None, "default"), plan)
+    cache.put((2, None, "default"), plan)
+    assert cache.get((1, None, "default")) is plan
+
+    cache.put((3, None, "default"), plan)
+    assert cache.get((2, None, "default")) is None
+    assert cache.get((1, None, "default")) is plan
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 2, "maxsize": 2}
@@ -0,0 +1,154 @@
+"""Test the deterministic resume pre-screen."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Candidate, JobProfile, PipelineRun, StageResult
+from app.models.stage_result import StageDecision, load_stage_result_payload
+from app.services.resume_screening import (
+    SCREEN_JOB,
+    ResumeScreener,
+    compile_requirements,
+    screen_batch,
+)
+
+RESUMES = [
+    "Senior engineer: Python, Kubernetes (k8s) and PostgreSQL. Built distributed\nsystems.",
+    "Python and Postgres developer with some ML experience.",
+    "Java developer; JavaScript on the side.",
+    None,
+]
+
+
+def test_matcher_uses_synonyms_and_term_boundaries():
+    """Test synonym expansion, whole-term matching and multi-word terms across lines."""
+    compiled = compile_requirements(("Python", "Kubernetes", "C"), ("C++", "Java"))
+    counts = compiled.count_matrix(
+        [
+            "py, python3 and K8S",
+            "C++ only",
+            "plain C and java",
+            "javascript, numpy, cpython",
+        ]
+    )
+    assert compiled.names == ("Python", "Kubernetes", "C", "C++", "Java")
+    assert counts.tolist() == [
+        [2, 1, 0, 0, 0],
+        [0, 0, 0, 1, 0],
+        [0, 0, 1, 0, 1],
+        [0, 0, 0, 0, 0],
+    ]
+
+    multi_word = compile_requirements(("Experience with distributed systems",))
+    assert multi_word.count_matrix(["Distributed\n  systems at scale"]).tolist() == [[1]]
+
+
+def test_screen_batch_decisions():
+    """Test vectorized coverage, scores and decisions."""
+    compiled = compile_requirements(
+        ("Python", "Kubernetes", "PostgreSQL"), ("Machine learning",), ("Distributed systems",)
+    )
+    batch = screen_batch(compiled, RESUMES)
+
+    assert batch.must_have_coverage.tolist() == pytest.approx([1.0, 2 / 3, 0.0, 0.0])
+    assert batch.nice_to_have_coverage.tolist() == [0.0, 1.0, 0.0, 0.0]
+    assert batch.core_competency_coverage.tolist() == [1.0, 0.0, 0.0, 0.0]
+    assert batch.scores[0] == pytest.approx(0.85)
+    assert batch.decisions.tolist() == ["PROCEED", "BORDERLINE", "REJECT", "REJECT"]
+
+
+async def _seed_runs(async_db, count):
+    async with async_db() as db:
+        job_profile = JobProfile(
+            role="Backend Engineer",
+            raw_description="Backend role",
+            must_haves=["Python", "Kubernetes", "PostgreSQL"],
+            nice_to_haves=["Machine learning"],
+            core_competencies=["Distributed systems"],
+        )
+        runs = [
+            PipelineRun(
+                candidate=Candidate(
+                    email=f"screen-{i}@example.com",
+                    name=f"Candidate {i}",
+                    resume_text=RESUMES[i % len(RESUMES)],
+                ),
+                job_profile=job_profile,
+                stages=["resume_screen", "oa"],
+                current_stage="resume_screen",
+                current_stage_index=0,
+            )
+            for i in range(count)
+        ]
+        db.add_all(runs)
+        await db.commit()
+        return job_profile.id, [run.id for run in runs]
+
+
+async def _results(async_db):
+    async with async_db() as db:
+        stmt = select(StageResult).options(load_stage_result_payload()).order_by(StageResult.id)
+        return {result.pipeline_run_id: result for result in (await db.scalars(stmt)).all()}
+
+
+async def test_screener_writes_results_once(async_db):
+    """Test bulk StageResult writes, chunking and skipping already-screened runs."""
+    job_profile_id, run_ids = await _seed_runs(async_db, 10)
+    screener = ResumeScreener(chunk_size=3)
+
+    summary = await screener.screen(async_db, job_profile_id)
+    assert summary.screened == 10
+    assert summary.decisions == {"PROCEED": 3, "BORDERLINE": 3, "REJECT": 4}
+    assert summary.borderline_run_ids == [run_ids[1], run_ids[5], run_ids[9]]
+
+    results = await _results(async_db)
+    first = results[run_ids[0]]
+    assert first.stage_name == "resume_screen"
+    assert first.decision == StageDecision.PROCEED
+    assert first.strengths == ["Python", "Kubernetes", "PostgreSQL", "Distributed systems"]
+    assert first.raw_scores["matches"]["Kubernetes"] == 2
+    assert results[run_ids[1]].concerns == ["No evidence of must-have: Kubernetes"]
+
+    # A retry only screens what is left
+    assert (await screener.screen(async_db, job_profile_id)).screened == 0
+
+    with pytest.raises(LookupError):
+        await screener.screen(async_db, 999)
+
+
+async def test_process_pool_matches_inline(async_db):
+    """Test that scoring in worker processes gives the same results."""
+    job_profile_id, run_ids = await _seed_runs(async_db, 8)
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        summary = await ResumeScreener(executor=pool, chunk_size=3, max_in_flight=2).screen(
+            async_db, job_profile_id, run_ids[:6]
+        )
+    assert summary.screened == 6
+
+    results = await _results(async_db)
+    inline = screen_batch(
+        compile_requirements(
+            ("Python", "Kubernetes", "PostgreSQL"), ("Machine learning",), ("Distributed systems",)
+        ),
+        [RESUMES[i % len(RESUMES)] for i in range(6)],
+    )
+    assert [results[run_id].decision.value for run_id in run_ids[:6]] == inline.decisions.tolist()
+    assert set(results) == set(run_ids[:6])
+
+
+async def test_screen_endpoint_enqueues_job(client, seeded):
+    """Test that POST /resume/screen queues a screening job."""
+    response = await client.post(
+        "/resume/screen", json={"job_profile_id": seeded["job_profile_id"]}
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["kind"] == SCREEN_JOB
+    assert job["status"] == "QUEUED"
+    assert job["payload"]["job_profile_id"] == seeded["job_profile_id"]
+
+    response = await client.post("/resume/screen", json={"job_profile_id": 999})
+    assert response.status_code == 404
@@ -0,0 +1,120 @@
+"""Test stage result endpoints and deferred payload loading."""
+
+from sqlalchemy import inspect, select
+
+from app.models import Candidate, StageResult
+from app.models.candidate import load_resume_text
+from app.models.stage_result import StageDecision, load_stage_result_payload
+
+
+async def _create_stage_result(client, async_db, seeded) -> int:
+    pipeline_id = (await client.post("/pipeline/start", json=seeded)).json()["id"]
+    async with async_db() as db:
+        result = StageResult(
+            pipeline_run_id=pipeline_id,
+            stage_name="oa",
+            stage_type="oa",
+            decision=StageDecision.PASS,
+            raw_scores={"tests_passed": 9},
+            strengths=["Clean code"],
+            notes="Solid submission",
+            artifacts={"code": "print('hi')", "transcript": ["Q", "A"]},
+        )
+        db.add(result)
+        await db.commit()
+        return result.id
+
+
+async def test_payload_columns_are_deferred(client, async_db, seeded):
+    """Test that large columns load only with the opt-in loaders."""
+    stage_result_id = await _create_stage_result(client, async_db, seeded)
+
+    async with async_db() as db:
+        result = await db.get(StageResult, stage_result_id)
+        assert {"raw_scores", "artifacts", "notes"} <= inspect(result).unloaded
+
+        candidate = await db.get(Candidate, seeded["candidate_id"])
+        assert "resume_text" in inspect(candidate).unloaded
+
+    async with async_db() as db:
+        result = await db.scalar(
+            select(StageResult)
+            .where(StageResult.id == stage_result_id)
+            .options(load_stage_result_payload())
+        )
+        assert result.artifacts["code"] == "print('hi')"
+        assert result.notes == "Solid submission"
+
+        candidate = await db.get(Candidate, seeded["candidate_id"], options=[load_resume_text()])
+        assert candidate.resume_text == "Python"
+
+
+async def test_list_and_get_stage_results(client, async_db, seeded):
+    """Test that the payload is only returned when requested."""
+    stage_result_id = await _create_stage_result(client, async_db, seeded)
+    pipeline_id = (await client.get(f"/stage_results/{stage_result_id}")).json()["pipeline_run_id"]
+
+    response = await client.get("/stage_results", params={"pipeline_run_id": pipeline_id})
+    assert response.status_code == 200
+    [data] = response.json()
+    assert data["decision"] == "PASS"
+    assert data["raw_scores"] is None and data["artifact_names"] is None
+
+    response = await client.get(
+        f"/stage_results/{stage_result_id}", params={"include_payload": True}
+    )
+    data = response.json()
+    assert data["raw_scores"] == {"tests_passed": 9}
+    assert data["notes"] == "Solid submission"
+    assert data["artifact_names"] == ["code", "transcript"]
+
+    assert (await client.get("/stage_results/999")).status_code == 404
+
+
+async def test_get_single_artifact(client, async_db, seeded):
+    """Test fetching one artifact by name, inline or from the artifact store."""
+    stage_result_id = await _create_stage_result(client, async_db, seeded)
+
+    # Inline (pre-artifact-store) entries are served from their JSON value
+    response = await client.get(f"/stage_results/{stage_result_id}/artifacts/transcript")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == ["Q", "A"]
+
+    response = await client.get(f"/stage_results/{stage_result_id}/artifacts/audio")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Artifact not found"
+
+    response = await client.get("/stage_results/999/artifacts/code")
+    assert response.json()["detail"] == "Stage result not found"
+
+
+async def test_stream_stored_artifact_with_range(client, async_db, seeded, artifact_store):
+    """Test Range requests against an artifact held in the artifact store."""
+    stage_result_id = await _create_stage_result(client, async_db, seeded)
+    code = "".join(f"line {i}\n" for i in range(1000))
+    async with async_db() as db:
+        result = await db.get(StageResult, stage_result_id)
+        result.artifacts = artifact_store.put_artifacts({"code": code})
+        await db.commit()
+    url = f"/stage_results/{stage_result_id}/artifacts/code"
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert response.text == code
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={"Range": "bytes=1000-2999"})
+    assert response.status_code == 206
+    assert response.text == code[1000:3000]
+    assert response.headers["content-range"] == f"bytes 1000-2999/{len(code)}"
+    assert response.headers["etag"] == etag
+
+    response = await client.get(url, headers={"Range": "bytes=-10"})
+    assert response.text == code[-10:]
+
+    response = await client.get(url, headers={"Range": f"bytes={len(code)}-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(code)}"
@@ -0,0 +1,66 @@
+"""Test the app factory, startup warm-up and lazy imports."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from app.config import settings
+from app.main import app as fastapi_app
+from app.main import create_app
+from app.services.pipeline_planner import plan_cache
+from app.warmup import warm_up
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def test_create_app_builds_a_new_app():
+    app = create_app()
+    assert app is not fastapi_app
+    assert {route.path for route in app.routes} == {route.path for route in fastapi_app.routes}
+    assert app.dependency_overrides is not fastapi_app.dependency_overrides
+
+
+async def test_warm_up(async_db, seeded, monkeypatch):
+    monkeypatch.setattr(settings, "warmup_db_connections", 2)
+    monkeypatch.setattr(settings, "warmup_openapi", True)
+    plan_cache.clear()
+    engine = async_db.kw["bind"]
+    app = create_app()
+
+    timings = await warm_up(app, engine=engine, session_factory=async_db)
+
+    assert set(timings) == {"mappers", "pool", "plan_cache", "openapi"}
+    assert engine.sync_engine.pool.checkedin() == 2
+    assert plan_cache.stats()["size"] == 1
+    assert app.openapi_schema is not None
+
+
+async def test_warm_up_step_failure_is_not_fatal(async_db, monkeypatch):
+    monkeypatch.setattr(settings, "warmup_openapi", False)
+
+    def broken_session_factory():
+        raise ConnectionError("database unavailable")
+
+    timings = await warm_up(
+        create_app(), engine=async_db.kw["bind"], session_factory=broken_session_factory
+    )
+
+    assert set(timings) == {"mappers", "pool"}
+
+
+def test_app_import_leaves_heavy_modules_unloaded():
+    heavy = ["numpy", "app.services.llm_gateway", "asyncpg", "psycopg2"]
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys; import app.main; "
+            f"print(json.dumps([name for name in {heavy!r} if name in sys.modules]))",
+        ],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(completed.stdout) == []
@@ -23,9 +23,46 @@ export const startPipeline = async (candidateId: number, jobProfileId: number) =
   return response.data
 }
 
+export const startPipelineBatch = async (
+  items: { candidateId: number; jobProfileId: number }[]
+) => {
+  const response = await api.post('/pipeline/start/batch', {
+    items: items.map((item) => ({
+      candidate_id: item.candidateId,
+      job_profile_id: item.jobProfileId,
+    })),
+  })
+  return response.data
+}
+
 export const getPipeline = async (pipelineId: number) => {
   const response = await api.get(`/pipeline/${pipelineId}`)
   return response.data
 }
 
+export type PipelineEventType = 'snapshot' | 'stage_advanced' | 'stage_execution' | 'stage_result'
+
+// Watch a pipeline run over Server-Sent Events instead of polling getPipeline.
+// `snapshot` and `stage_advanced` carry the full run; call the returned
+// function to close the stream. EventSource reconnects on its own and
+// resumes from the last event it received.
+export const subscribePipelineEvents = (
+  pipelineId: number,
+  onEvent: (type: PipelineEventType, data: unknown) => void
+) => {
+  const source = new EventSource(`${API_BASE_URL}/pipeline/${pipelineId}/events`)
+  const types: PipelineEventType[] = [
+    'snapshot',
+    'stage_advanced',
+    'stage_execution',
+    'stage_result',
+  ]
+  types.forEach((type) => {
+    source.addEventListener(type, (event) => {
+      onEvent(type, JSON.parse((event as MessageEvent).data))
+    })
+  })
+  return () => source.close()
+}
+
 export default api